@@ -4,8 +4,7 @@ Created on Fri May  3 18:24:23 2019
 
 @author: Matt Idzik (MidZik)
 """
-from simrunner import SimulationClient, RpcError
-import json
+from simrunner import SimulationClient, StateMirror
 from multiprocessing import Process
 from weakref import WeakValueDictionary
 import pyglet
@@ -71,33 +70,33 @@ def window_app(address, token):
 
     window = WorldWindow()
 
+    # The mirror is kept up to date by the server's state deltas, so refreshing does not fetch anything
+    mirror = StateMirror()
+    mirror.follow(sim_client, ('Position', 'Predation'), max_rate=20)
+
     def update(dt):
-        try:
-            state_json, _ = sim_client.get_state_json()
-            state_obj = json.loads(state_json)
-        except RpcError:
-            # grpc doesn't provide easy-to-use exceptions so for now just handle all grpc errors cleanly
+        if not mirror.is_following():
+            # The delta stream ended, usually because the simulation server went away
             window.close()
             return
         frame_data = {}
 
-        predators = set()
-        for pred in state_obj["components"]["Predation"]:
-            predators.add(pred["EID"])
-
-        for pos in state_obj["components"]["Position"]:
-            eid = pos["EID"]
-            pos_com = pos["Com"]
-            if eid in predators:
-                frame_data[eid] = RenderData(pos_com["x"], pos_com["y"], 'assets/PredatorEntity.png', (255, 0, 0))
-            else:
-                frame_data[eid] = RenderData(pos_com["x"], pos_com["y"], 'assets/DefaultEntity.png', (0, 200, 50))
+        with mirror.lock:
+            for eid, components in mirror.entities.items():
+                pos_com = components.get("Position")
+                if pos_com is None:
+                    continue
+                if "Predation" in components:
+                    frame_data[eid] = RenderData(pos_com["x"], pos_com["y"], 'assets/PredatorEntity.png', (255, 0, 0))
+                else:
+                    frame_data[eid] = RenderData(pos_com["x"], pos_com["y"], 'assets/DefaultEntity.png', (0, 200, 50))
         window.update_frame_data(frame_data)
 
     try:
         pyglet.clock.schedule_interval(update, 1 / 20)
         pyglet.app.run()
     finally:
+        mirror.stop()
         pyglet.app.exit()
         window.close()
 
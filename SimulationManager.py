@@ -5,10 +5,13 @@ from collections import defaultdict, deque, namedtuple
 from pathlib import Path
 import json
 import re
-from threading import Thread, RLock
+from threading import Thread, RLock, Event
+from queue import Queue, Empty
 from typing import Optional, List
 from bisect import insort
-from simrunner import SimulationProcess, SimulationClient
+from simrunner import SimulationProcess, SimulationClient, SimulationProcessPool, ConverterService, \
+    SnapshotOverwrittenError
+from point_cache import PointJsonCache
 from dataclasses import dataclass
 import sys
 from datetime import datetime
@@ -18,12 +21,61 @@ import subprocess
 import os
 import sqlite3
 import gwsignal
-from secrets import token_urlsafe
-from contextlib import contextmanager, closing
+import metrics
+from secrets import token_hex
+from contextlib import contextmanager, closing, ExitStack
+from time import perf_counter
 
 
 LastCommitInfo = namedtuple('LastCommitInfo', ['timestamp'])
 
+EVENTS_INGESTED = metrics.REGISTRY.counter('timeline_events_ingested',
+                                           'Simulation events written to timeline event databases.', ('timeline',))
+POINT_WRITE_SECONDS = metrics.REGISTRY.histogram('timeline_point_write_seconds',
+                                                 'Time to write a point file and add it to its timeline.',
+                                                 ('timeline',))
+
+
+def remove_timeline_metrics(timeline):
+    """
+    Removes the metric series labelled with a timeline, once it is deleted.
+    """
+    EVENTS_INGESTED.remove(timeline.path.name)
+    POINT_WRITE_SECONDS.remove(timeline.path.name)
+
+
+@dataclass(frozen=True)
+class SnapshotPolicy:
+    """
+    When a running timeline simulation saves its state as a new point. A point is saved when any non-zero
+    trigger fires: every tick_interval ticks, every time_interval seconds of running, or spaced out by
+    running time so points add up to about bytes_per_hour bytes per hour.
+    """
+    tick_interval: int = 500000
+    time_interval: float = 0.0
+    bytes_per_hour: int = 0
+
+    def __post_init__(self):
+        if self.tick_interval < 0 or self.time_interval < 0 or self.bytes_per_hour < 0:
+            raise ValueError("Snapshot policy values cannot be negative.")
+
+    @staticmethod
+    def from_json(data):
+        """
+        Values missing from data keep the field defaults.
+        """
+        defaults = SnapshotPolicy()
+        return SnapshotPolicy(int(data.get('tick_interval', defaults.tick_interval)),
+                              float(data.get('time_interval', defaults.time_interval)),
+                              int(data.get('bytes_per_hour', defaults.bytes_per_hour)))
+
+    def to_json(self):
+        return {
+            'tick_interval': self.tick_interval,
+            'time_interval': self.time_interval,
+            'bytes_per_hour': self.bytes_per_hour,
+        }
+
 
 class Timeline:
     """
@@ -42,7 +94,7 @@ class Timeline:
         else:
             return None
 
-    def __init__(self, path: Path, simulation_binary_provider, tags=tuple()):
+    def __init__(self, path: Path, simulation_binary_provider, tags=tuple(), snapshot_policy=None):
         """
         :param path: The folder the timeline data resides in.
         """
@@ -51,6 +103,8 @@ class Timeline:
 
         self.tick_list: List[int] = []
         self.tags = set(tags)
+        self.snapshot_policy: SnapshotPolicy = snapshot_policy or SnapshotPolicy()
+        self.last_commit_timestamp: Optional[str] = None
 
         self.lock = RLock()
 
@@ -75,6 +129,8 @@ class Timeline:
                 last_commit(id, timestamp)
                 VALUES(0,?)
                 ''', (datetime.utcnow().isoformat(),))
+            cursor = db_conn.execute('SELECT timestamp FROM last_commit')
+            self.last_commit_timestamp, = cursor.fetchone()
 
     def get_point_file_path(self, tick):
         return self.path / Timeline.point_file_name(tick)
@@ -95,10 +151,21 @@ class Timeline:
         return self.simulation_binary_provider.get_simulation_binary_path()
 
     def get_last_commit_details(self):
+        return LastCommitInfo(self.last_commit_timestamp)
+
+    def touch_last_commit(self):
+        """
+        Sets the last commit timestamp to now, after the point files were rewritten outside of a commit,
+        so copies of the points cached by clients are no longer used.
+        """
+        commit_timestamp = datetime.utcnow().isoformat()
         with closing(self.get_db_conn()) as db_conn, db_conn:
-            cursor = db_conn.execute('SELECT timestamp FROM last_commit')
-            timestamp, = cursor.fetchone()
-            return LastCommitInfo(timestamp)
+            db_conn.execute('''
+                INSERT OR REPLACE INTO
+                last_commit(id, timestamp)
+                VALUES(0,?)
+                ''', (commit_timestamp,))
+        self.last_commit_timestamp = commit_timestamp
 
     def refresh_tick_list(self):
         self.tick_list = []
@@ -129,12 +196,14 @@ class TimelineSimulation:
     """
     @staticmethod
     def _new_token():
-        return token_urlsafe(32)
+        # hex, since a token starting with "-" would be taken for an option by the server's argument parser
+        return token_hex(32)
 
-    def __init__(self, timeline):
+    def __init__(self, timeline, process_pool: Optional[SimulationProcessPool] = None):
         self.timeline: Timeline = timeline
 
         self._simulation_process: Optional[SimulationProcess] = None
+        self._process_pool = process_pool
 
         self._event_stream_context = None
         self._event_thread = None
@@ -145,7 +214,14 @@ class TimelineSimulation:
         self._edit_lock = RLock()
         self._pending_added_ticks = []
 
+        # Seconds from the start of start_process until the simulation was at its initial tick
+        self.time_to_interactive = None
+
         self.runner_updated = gwsignal.Signal()
+        self.point_added = gwsignal.Signal()
+
+        self._events_ingested = EVENTS_INGESTED.labels(timeline.path.name)
+        self._point_write_seconds = POINT_WRITE_SECONDS.labels(timeline.path.name)
 
     def make_client(self):
         return self._simulation_process.make_client(self._new_token())
@@ -242,18 +318,20 @@ class TimelineSimulation:
             if self._client.get_tick() != self.timeline.head():
                 raise RuntimeError("Cannot commit edits: simulation state at wrong tick.")
 
-            sim_state_binary, _ = self._client.get_state_binary()
-            self._client.set_editor_token(self._editor_token)
-
-            self._save_tick_state_binary(self.timeline.head(), sim_state_binary, overwrite=True)
+            try:
+                self._save_tick_state(self.timeline.head(), self._client.get_state_binary_chunked, overwrite=True)
+            finally:
+                self._client.set_editor_token(self._editor_token)
 
+            commit_timestamp = datetime.utcnow().isoformat()
             with closing(self.timeline.get_db_conn()) as db_conn, db_conn:
                 db_conn.execute('DELETE FROM events')
                 db_conn.execute('''
                     INSERT OR REPLACE INTO
                     last_commit(id, timestamp)
                     VALUES(0,?)
-                    ''', (datetime.utcnow().isoformat(),))
+                    ''', (commit_timestamp,))
+            self.timeline.last_commit_timestamp = commit_timestamp
 
         print(f"LOG: Committed edits")
 
@@ -270,8 +348,7 @@ class TimelineSimulation:
             self._client.set_editor_token(self._owner_token)
 
             head_point_path = self.timeline.get_point_file_path(self.timeline.head())
-            with head_point_path.open('br') as f:
-                self._client.set_state_binary(f.read())
+            self._client.set_state_binary_chunked(head_point_path)
 
             self._client.set_editor_token(self._editor_token)
 
@@ -291,12 +368,11 @@ class TimelineSimulation:
                 if tick not in self.timeline.tick_list:
                     raise ValueError('Point tick is not part of simulation timeline.')
 
-                with self.timeline.get_point_file_path(tick).open('br') as f:
-                    state_binary = f.read()
+                point_file_path = self.timeline.get_point_file_path(tick)
 
             try:
                 self._client.set_editor_token(self._owner_token)
-                self._client.set_state_binary(state_binary)
+                self._client.set_state_binary_chunked(point_file_path)
             finally:
                 self._client.set_editor_token("")
 
@@ -315,7 +391,7 @@ class TimelineSimulation:
             if self._client.get_tick() == self.timeline.head():
                 raise RuntimeError("Cannot save head tick by saving current sim state. Commit from editing instead.")
 
-        state_binary, tick = self._client.get_state_binary()
+        state_binary, tick = self._client.get_state_binary_chunked()
 
         if tick == self.timeline.head():
             raise RuntimeError("Cannot save head tick by saving current sim state. Commit from editing instead.")
@@ -336,21 +412,54 @@ class TimelineSimulation:
         elif initial_tick not in self.timeline.tick_list:
             raise ValueError('Attempted to start timeline simulation at an invalid tick.')
 
-        self._simulation_process = SimulationProcess(self.timeline.get_simulation_binary_path())
+        start_time = perf_counter()
+        simulation_binary_path = self.timeline.get_simulation_binary_path()
+
+        if self._process_pool is not None:
+            self._simulation_process = self._process_pool.acquire(simulation_binary_path)
+        else:
+            self._simulation_process = SimulationProcess(simulation_binary_path)
+            self._simulation_process.start(self._new_token())
+
+        try:
+            self._owner_token = self._simulation_process.get_owner_token()
 
-        self._owner_token = self._new_token()
-        self._simulation_process.start(self._owner_token)
+            self._client = self._simulation_process.make_client(self._owner_token)
 
-        self._client = self._simulation_process.make_client(self._owner_token)
+            self._event_stream_context = self._client.get_event_stream()
+            self._event_thread = Thread(target=self._event_stream_handler)
+            self._event_thread.start()
 
-        self._event_stream_context = self._client.get_event_stream()
-        self._event_thread = Thread(target=self._event_stream_handler)
-        self._event_thread.start()
+            self.move_to_tick(initial_tick)
+            self.apply_snapshot_policy()
+        except BaseException:
+            # the simulation is not registered yet, so nothing else would stop the process
+            self._discard_process()
+            raise
 
-        self.move_to_tick(initial_tick)
+        self.time_to_interactive = perf_counter() - start_time
+        if self._process_pool is not None:
+            self._process_pool.record_time_to_interactive(simulation_binary_path, self.time_to_interactive)
 
         self.runner_updated.emit()
 
+    def _discard_process(self):
+        """
+        Stops a process that failed to start serving the timeline. It is not given back to the pool, as its state
+        is unknown.
+        """
+        if self._event_stream_context is not None:
+            self._event_stream_context.cancel()
+        if self._event_thread is not None:
+            self._event_thread.join()
+        self._simulation_process.stop()
+        self._event_stream_context = None
+        self._event_thread = None
+        self._simulation_process = None
+        self._client = None
+        self._dead = True
+        self._owner_token = None
+
     def stop_process(self):
         """
         This method is used internally by the SimulationManager module, and should not be called outside of it.
@@ -358,7 +467,10 @@ class TimelineSimulation:
         """
         self._event_stream_context.cancel()
         self._event_thread.join()
-        self._simulation_process.stop()
+        if self._process_pool is not None:
+            self._process_pool.release(self._simulation_process)
+        else:
+            self._simulation_process.stop()
         self._event_stream_context = None
         self._event_thread = None
         self._simulation_process = None
@@ -371,6 +483,13 @@ class TimelineSimulation:
     def is_process_running(self):
         return self._simulation_process is not None
 
+    def apply_snapshot_policy(self):
+        """
+        Sends the timeline's snapshot policy to the simulation process.
+        """
+        policy = self.timeline.snapshot_policy
+        self._client.set_snapshot_policy(policy.tick_interval, policy.time_interval, policy.bytes_per_hour)
+
     def _event_stream_handler(self):
         with closing(self.timeline.get_db_conn()) as db_conn:
             # Since many events can occur quite rapidly, enforcing sync with the disk can result
@@ -382,6 +501,7 @@ class TimelineSimulation:
             db_conn.execute('PRAGMA synchronous = OFF')
 
             for (tick, events) in self._event_stream_context:
+                rows = 0
                 with db_conn:
                     for e in events:
                         if e.in_namespace("sim."):
@@ -390,10 +510,31 @@ class TimelineSimulation:
                             events(tick, event_name, event_json)
                             VALUES(?,?,?)
                             ''', (tick, e.name, e.json))
+                            rows += 1
                         elif e.name == "meta.state_bin":
                             self._save_tick_state_binary(tick, e.bin)
+                        elif e.name == "meta.state_ref":
+                            self._save_tick_state_ref(tick, json.loads(e.json))
                         elif e.name == "runner.update":
                             self.runner_updated.emit()
+                if rows:
+                    self._events_ingested.inc(rows)
+
+    def _save_tick_state_ref(self, tick, ref):
+        """
+        Saves a snapshot the simulation process handed over through its snapshot ring, copying it
+        from the ring straight into the point file.
+        """
+        ring = self._simulation_process.get_snapshot_ring()
+        if ring is None:
+            print(f"LOG: Dropped snapshot of tick {tick}: simulation process has no snapshot ring.")
+            return
+
+        try:
+            self._save_tick_state(tick, lambda state_file: ring.copy_to(ref['slot'], ref['sequence'], ref['size'],
+                                                                          state_file))
+        except SnapshotOverwrittenError as e:
+            print(f"LOG: Dropped snapshot of tick {tick}: {e}")
 
     def _save_tick_state_binary(self, tick, state_binary, overwrite=False):
         """
@@ -402,6 +543,14 @@ class TimelineSimulation:
         :param state_binary:
         :return:
         """
+        self._save_tick_state(tick, lambda state_file: state_file.write(state_binary), overwrite)
+
+    def _save_tick_state(self, tick, write_state, overwrite=False):
+        """
+        Saves the state for the given tick to the timeline, if it is not pending and doesn't exist.
+        The state is written to a temporary file first, so a failed write leaves any existing point intact.
+        :param write_state: Called with the open point file to write the state into.
+        """
         with self._edit_lock:
             if (
                 not overwrite and
@@ -412,18 +561,33 @@ class TimelineSimulation:
             ):
                 return
             self._pending_added_ticks.append(tick)
+        start = perf_counter()
         try:
             state_file_path = self.timeline.get_point_file_path(tick)
-            with state_file_path.open('bw') as state_file:
-                state_file.write(state_binary)
+            temp_file_path = state_file_path.with_name(state_file_path.name + '.saving')
+            try:
+                with temp_file_path.open('bw') as state_file:
+                    write_state(state_file)
+                os.replace(temp_file_path, state_file_path)
+            except BaseException:
+                try:
+                    temp_file_path.unlink()
+                except FileNotFoundError:
+                    pass
+                raise
 
             with self.timeline.lock:
-                if tick not in self.timeline.tick_list:
+                added = tick not in self.timeline.tick_list
+                if added:
                     insort(self.timeline.tick_list, tick)
+            self._point_write_seconds.observe(perf_counter() - start)
         finally:
             with self._edit_lock:
                 self._pending_added_ticks.remove(tick)
 
+        if added:
+            self.point_added.emit(tick)
+
 
 class TimelineNode:
     @staticmethod
@@ -527,6 +691,16 @@ class TimelinePoint:
         return f"(ID {self.timeline_id()}, Tick {self.tick}"
 
 
+@dataclass(frozen=True)
+class SimulationStartResult:
+    timeline_id: int
+    simulation: Optional['TimelineSimulation'] = None
+    error: Optional[str] = None
+
+    def succeeded(self):
+        return self.error is None
+
+
 class SimulationSource:
     AM_GIT_ARCHIVE_WORKING = 'git-archive-working'
 
@@ -691,15 +865,22 @@ class TimelinesProject:
         self.timelines_dir_path = self.root_dir_path / 'timelines'
         self.project_file_path = self.root_dir_path / 'timelines.project'
         self.simulation_registry_path = self.root_dir_path / 'sim_registry'
-        self.project_file_handle = None
+        self.runtime_dir_path = self.root_dir_path / 'run'
+        self._project_file_handle = None
         self.root_node = TimelineNode()
         self._next_new_timeline_id = 1
+        # new timeline ids are the ones where id % count == index, see set_timeline_id_shard
+        self._timeline_id_shard = (0, 1)
         self._timeline_nodes = {}
         self._simulation_source_paths = []
         self._simulation_registry = {}
         self._current_simulations = {}
         self._timeline_tags = defaultdict(set)
 
+        self.simulation_process_pool = SimulationProcessPool(runtime_dir=self.runtime_dir_path, snapshot_slots=4)
+        self.converter_service = ConverterService()
+        self.point_json_cache = PointJsonCache(self.root_dir_path / 'cache' / 'point_json.db')
+
         self._timelines_lock = RLock()
         self._sources_lock = RLock()
         self._simulation_registry_lock = RLock()
@@ -711,6 +892,12 @@ class TimelinesProject:
 
         self.timeline_created = gwsignal.Signal()
         self.timeline_deleted = gwsignal.Signal()
+        self.tags_changed = gwsignal.Signal()
+        self.point_added = gwsignal.Signal()
+
+        self.timeline_deleted.connect(self._invalidate_deleted_timeline_cache)
+
+        metrics.REGISTRY.add_collector(self.converter_service.collect_metrics)
 
     def _create_timeline(self,
                          parent_node: TimelineNode,
@@ -718,7 +905,8 @@ class TimelinesProject:
                          initial_tick=0,
                          source_tick_data_path=None,
                          source_tick_data_binary=None,
-                         initial_tags=()):
+                         initial_tags=(),
+                         snapshot_policy=None):
         if source_tick_data_path and source_tick_data_binary:
             raise ValueError("Only one of source_tick_data_path or source_tick_data_binary can be provided.")
 
@@ -734,7 +922,7 @@ class TimelinesProject:
         try:
             timeline_folder_path.mkdir()
 
-            new_timeline = Timeline(timeline_folder_path, sim_binary_provider, initial_tags)
+            new_timeline = Timeline(timeline_folder_path, sim_binary_provider, initial_tags, snapshot_policy)
             self._save_timeline(new_timeline)
 
             initial_point_path = new_timeline.get_point_file_path(initial_tick)
@@ -747,7 +935,7 @@ class TimelinesProject:
                         f.write(source_tick_data_binary)
                 else:
                     sim_path = str(sim_binary_provider.get_simulation_binary_path())
-                    SimulationProcess.create_default(str(initial_point_path), "binary", sim_path)
+                    self.converter_service.create_default(str(initial_point_path), "binary", sim_path)
             else:
                 initial_point_path.touch(exist_ok=False)
 
@@ -759,7 +947,7 @@ class TimelinesProject:
         new_timeline_node = TimelineNode(parent_node, new_timeline_id, new_timeline)
         with self._timelines_lock:
             self._timeline_nodes[new_timeline_id] = new_timeline_node
-            self._next_new_timeline_id += 1
+            self._next_new_timeline_id = self._next_timeline_id_after(new_timeline_id)
         with self._tags_lock:
             for tag in initial_tags:
                 self._timeline_tags[tag].add(new_timeline_node)
@@ -773,7 +961,8 @@ class TimelinesProject:
             return self._create_timeline(derive_from.timeline_node,
                                          derive_from.timeline().simulation_binary_provider,
                                          derive_from.tick,
-                                         derive_from.point_file_path())
+                                         derive_from.point_file_path(),
+                                         snapshot_policy=derive_from.timeline().snapshot_policy)
 
     def create_timeline_from_simulation(self, derive_from_id, as_sibling=False):
         node = self.get_timeline_node(derive_from_id)
@@ -786,7 +975,7 @@ class TimelinesProject:
             raise ValueError(f"Cannot create timeline from sim {derive_from_id}: sim not in edit mode.")
 
         client = sim.make_client()
-        state_binary, tick = client.get_state_binary()
+        state_binary, tick = client.get_state_binary_chunked()
 
         if tick != node.head_point().tick:
             raise RuntimeError(f"Cannot create timeline from sim {derive_from_id}: received binary for wrong tick. "
@@ -800,7 +989,8 @@ class TimelinesProject:
         return self._create_timeline(parent_node,
                                      node.timeline.simulation_binary_provider,
                                      tick,
-                                     source_tick_data_binary=state_binary)
+                                     source_tick_data_binary=state_binary,
+                                     snapshot_policy=node.timeline.snapshot_policy)
 
     def clone_timeline(self, node_to_clone: TimelineNode):
         clone_tags = (tag for tag in node_to_clone.timeline.tags if not tag.startswith('_'))
@@ -808,7 +998,24 @@ class TimelinesProject:
                                      node_to_clone.timeline.simulation_binary_provider,
                                      node_to_clone.head_point().tick,
                                      node_to_clone.head_point().point_file_path(),
-                                     initial_tags=clone_tags)
+                                     initial_tags=clone_tags,
+                                     snapshot_policy=node_to_clone.timeline.snapshot_policy)
+
+    def set_timeline_id_shard(self, index, count):
+        """
+        Makes this project only give new timelines ids where id % count == index, so that several processes
+        serving the same project directory never create timelines with the same id.
+        """
+        if not 0 <= index < count:
+            raise ValueError(f"Shard index {index} is not in range for {count} shards.")
+        with self._timelines_lock:
+            self._timeline_id_shard = (index, count)
+            self._next_new_timeline_id = self._next_timeline_id_after(self._next_new_timeline_id - 1)
+
+    def _next_timeline_id_after(self, timeline_id):
+        index, count = self._timeline_id_shard
+        next_id = timeline_id + 1
+        return next_id + (index - next_id) % count
 
     def delete_timeline(self, node_to_delete: TimelineNode):
         """
@@ -821,12 +1028,16 @@ class TimelinesProject:
 
         def delete_timeline_data(node):
             nonlocal timelines_dir
-            path: Path = node.timeline.path.resolve(True)
-            if path.parent == timelines_dir:
+            path: Path = node.timeline.path.resolve()
+            if not path.exists():
+                # already deleted by another process serving the same project
+                pass
+            elif path.parent == timelines_dir:
                 rmtree(path)
             else:
                 print(f"Attempted to delete a timeline that is not part of this project. Node will be removed, "
                       f"but data on disk will remain. ({path})", file=sys.stderr)
+            remove_timeline_metrics(node.timeline)
             node.timeline = None
             del self._timeline_nodes[node.timeline_id]
 
@@ -847,10 +1058,16 @@ class TimelinesProject:
 
             TimelineNode.traverse(self.root_node, find_max_id)
 
-            self._next_new_timeline_id = max_id + 1
+            self._next_new_timeline_id = self._next_timeline_id_after(max_id)
 
         self.timeline_deleted.emit(node_to_delete)
 
+    def _invalidate_deleted_timeline_cache(self, deleted_node: TimelineNode):
+        deleted_ids = []
+        TimelineNode.traverse(deleted_node, lambda node: deleted_ids.append(node.timeline_id))
+        for timeline_id in deleted_ids:
+            self.point_json_cache.invalidate_timeline(timeline_id)
+
     def load_all_timelines(self):
         with self._timelines_lock:
             timeline_nodes = {}
@@ -891,7 +1108,31 @@ class TimelinesProject:
             self.root_node = root_node
             self._timeline_nodes = timeline_nodes
             self._timeline_tags = timeline_tags
-            self._next_new_timeline_id = largest_loaded_timeline_id + 1
+            self._next_new_timeline_id = self._next_timeline_id_after(largest_loaded_timeline_id)
+
+    def unload_timelines(self, keep):
+        """
+        Forgets the loaded timelines for which keep(timeline_id) is false, leaving their data on disk.
+        Timelines with a kept descendant stay loaded, so that every kept timeline keeps its place in the tree.
+        For processes serving part of a project, which should not hold copies of timelines others change.
+        """
+        with self._tags_lock, self._timelines_lock:
+            nodes = []
+            TimelineNode.traverse(self.root_node, nodes.append)
+
+            kept_nodes = set()
+            # children come after their parents in the traversal, so each node is decided after its children
+            for node in reversed(nodes):
+                if (node.timeline_id is None or keep(node.timeline_id)
+                        or any(child in kept_nodes for child in node.child_nodes)):
+                    kept_nodes.add(node)
+                    node.child_nodes = [child for child in node.child_nodes if child in kept_nodes]
+
+            for node in nodes:
+                if node not in kept_nodes:
+                    del self._timeline_nodes[node.timeline_id]
+                    for tag in node.timeline.tags:
+                        self._timeline_tags[tag].discard(node)
 
     def get_timeline_node(self, timeline_id) -> TimelineNode:
         return self._timeline_nodes[timeline_id]
@@ -1077,8 +1318,30 @@ class TimelinesProject:
             shutil.rmtree(registration.path)
             del self._simulation_registry[uuid]
 
-    def change_timeline_simulation_provider(self, timeline_id, new_simulation_provider):
+    def change_timeline_simulation_provider(self, timeline_id, new_simulation_provider, scope='head',
+                                            progress_callback=None):
+        """
+        Changes the simulation a timeline runs with, converting its point data to the new simulation.
+        :param scope: Which points are converted. 'head' converts only the head point of the timeline,
+        'timeline' converts every point of the timeline, and 'subtree' converts every point of the timeline
+        and of every timeline derived from it (which all get the new simulation).
+        :param progress_callback: For 'timeline' and 'subtree' scopes, called with
+        (completed_count, total_count, result) as each point is converted.
+        """
         node = self.get_timeline_node(timeline_id)
+
+        if scope == 'head':
+            self._change_head_simulation_provider(node, new_simulation_provider)
+        elif scope == 'timeline':
+            self._migrate_timeline_points([node], new_simulation_provider, progress_callback)
+        elif scope == 'subtree':
+            nodes = []
+            TimelineNode.traverse(node, nodes.append)
+            self._migrate_timeline_points(nodes, new_simulation_provider, progress_callback)
+        else:
+            raise ValueError(f"Unknown scope '{scope}'.")
+
+    def _change_head_simulation_provider(self, node: TimelineNode, new_simulation_provider):
         head_point = node.head_point()
         timeline = node.timeline
 
@@ -1086,9 +1349,10 @@ class TimelinesProject:
             if timeline.simulation_binary_provider is None:
                 head_point_path = head_point.point_file_path().resolve(False)
                 new_sim_path = str(new_simulation_provider.get_simulation_binary_path())
-                SimulationProcess.create_default(str(head_point_path), "binary", new_sim_path)
+                self.converter_service.create_default(str(head_point_path), "binary", new_sim_path)
                 timeline.simulation_binary_provider = new_simulation_provider
                 self._save_timeline(timeline)
+                timeline.touch_last_commit()
             else:
                 head_point_path = head_point.point_file_path().resolve(True)
                 backup_path = head_point_path.with_suffix('.tmp')
@@ -1097,8 +1361,8 @@ class TimelinesProject:
                     shutil.copy2(str(head_point_path), str(backup_path))
                     old_sim_path = str(timeline.get_simulation_binary_path())
                     new_sim_path = str(new_simulation_provider.get_simulation_binary_path())
-                    SimulationProcess.simple_convert(str(backup_path), "binary", old_sim_path,
-                                                     str(head_point_path), "binary", new_sim_path)
+                    self.converter_service.convert(str(backup_path), "binary", old_sim_path,
+                                                   str(head_point_path), "binary", new_sim_path)
 
                     timeline.simulation_binary_provider = new_simulation_provider
                     self._save_timeline(timeline)
@@ -1107,6 +1371,102 @@ class TimelinesProject:
                     raise
                 finally:
                     Path(backup_path).unlink()
+                timeline.touch_last_commit()
+
+    def _migrate_timeline_points(self, nodes, new_simulation_provider, progress_callback=None):
+        """
+        Converts every point of the given timelines to the new simulation, in parallel.
+        All points are converted into staging files first, and the original point files are only
+        replaced once every conversion succeeded. If any conversion fails, no timeline is changed.
+        The originals are kept until every point is replaced, and moved back if replacing one fails.
+        """
+        new_sim_path = str(new_simulation_provider.get_simulation_binary_path())
+
+        with ExitStack() as stack:
+            for node in nodes:
+                stack.enter_context(node.timeline.lock)
+
+            with self._simulations_lock:
+                running_ids = [node.timeline_id for node in nodes if node.timeline_id in self._current_simulations]
+            if running_ids:
+                raise RuntimeError(f"Cannot migrate timelines with running simulations: {running_ids}")
+
+            unconfigured_nodes = [node for node in nodes if node.timeline.simulation_binary_provider is None]
+            configured_nodes = [node for node in nodes if node.timeline.simulation_binary_provider is not None]
+
+            # Group the points by the simulation they are converted from, one parallel batch per simulation
+            batches = defaultdict(list)
+            for node in configured_nodes:
+                old_sim_path = str(node.timeline.get_simulation_binary_path())
+                for point in node.points():
+                    point_path = point.point_file_path()
+                    batches[old_sim_path].append((point_path, point_path.with_name(point_path.name + '.migrating')))
+
+            total = sum(len(files) for files in batches.values())
+            completed = 0
+            failures = []
+
+            try:
+                for old_sim_path, files in batches.items():
+                    results = self.converter_service.convert_many(files, "binary", old_sim_path,
+                                                                  "binary", new_sim_path)
+                    for result in results:
+                        completed += 1
+                        if not result.succeeded():
+                            failures.append(result)
+                        if progress_callback is not None:
+                            progress_callback(completed, total, result)
+
+                if failures:
+                    raise RuntimeError(f"{len(failures)} of {total} points failed to convert. "
+                                       f"First failure: {failures[0].input_file}: {failures[0].error}")
+
+                self._replace_migrated_points([pair for files in batches.values() for pair in files])
+            finally:
+                for files in batches.values():
+                    for _, staged_path in files:
+                        try:
+                            staged_path.unlink()
+                        except FileNotFoundError:
+                            pass
+
+            for node in configured_nodes:
+                node.timeline.simulation_binary_provider = new_simulation_provider
+                self._save_timeline(node.timeline)
+                node.timeline.touch_last_commit()
+
+            for node in unconfigured_nodes:
+                self._change_head_simulation_provider(node, new_simulation_provider)
+
+            print(f"LOG: Migrated {total} points of {len(nodes)} timelines to {new_simulation_provider}")
+
+    @staticmethod
+    def _replace_migrated_points(files):
+        """
+        Moves the staged points over the original points, keeping each original as a backup until all of them
+        are replaced. If any replacement fails, the originals already replaced are moved back.
+        :param files: (point_path, staged_path) pairs.
+        """
+        replaced = []
+        try:
+            for point_path, staged_path in files:
+                backup_path = point_path.with_name(point_path.name + '.premigration')
+                os.replace(point_path, backup_path)
+                replaced.append((point_path, backup_path))
+                os.replace(staged_path, point_path)
+        except BaseException:
+            for point_path, backup_path in reversed(replaced):
+                try:
+                    os.replace(backup_path, point_path)
+                except OSError as e:
+                    print(f"LOG: Could not restore {point_path} from {backup_path}: {e}")
+            raise
+
+        for _, backup_path in replaced:
+            try:
+                backup_path.unlink()
+            except OSError as e:
+                print(f"LOG: Could not remove {backup_path}: {e}")
 
     def get_all_simulation_providers(self):
         with self._sources_lock:
@@ -1206,14 +1566,79 @@ class TimelinesProject:
                 return sim
             else:
                 print(f"LOG: Starting simulation {point.timeline_id()}")
-                new_sim = TimelineSimulation(point.timeline())
+                new_sim = TimelineSimulation(point.timeline(), self.simulation_process_pool)
+                new_sim.point_added.connect(self._on_simulation_point_added, point.timeline_node)
                 new_sim.start_process(point.tick)
                 with self._simulations_lock:
                     self._current_simulations[point.timeline_id()] = new_sim
                 self.simulation_started.emit(new_sim, point.timeline_node)
-                print(f"LOG: Started simulation {point.timeline_id()}")
+                print(f"LOG: Started simulation {point.timeline_id()} "
+                      f"(interactive after {new_sim.time_to_interactive:.3f}s)")
                 return new_sim
 
+    def _on_simulation_point_added(self, tick, timeline_node):
+        self.point_added.emit(timeline_node, tick)
+
+    def start_simulations(self, start_specs, max_concurrent=8):
+        """
+        Gets or starts the simulations of many timelines, starting up to max_concurrent at once so process
+        startup and state loading overlap.
+        :param start_specs: An iterable of TimelinePoints, TimelineNodes, or timeline ids, as for get_or_start_simulation.
+        :return: A generator that yields a SimulationStartResult for each spec as its simulation becomes ready.
+        Failures are reported in the results instead of being raised. Closing the generator early stops
+        starting simulations that have not started yet; simulations already started keep running.
+        """
+        pending = Queue()
+        total = 0
+        for start_spec in start_specs:
+            pending.put(start_spec)
+            total += 1
+
+        if total == 0:
+            return
+
+        results = Queue()
+        cancelled = Event()
+
+        def next_spec():
+            if cancelled.is_set():
+                return None
+            try:
+                return pending.get_nowait()
+            except Empty:
+                return None
+
+        def run():
+            start_spec = next_spec()
+            while start_spec is not None:
+                if isinstance(start_spec, TimelinePoint):
+                    timeline_id = start_spec.timeline_id()
+                elif isinstance(start_spec, TimelineNode):
+                    timeline_id = start_spec.timeline_id
+                else:
+                    timeline_id = start_spec
+
+                try:
+                    sim = self.get_or_start_simulation(start_spec)
+                    results.put(SimulationStartResult(timeline_id, sim))
+                except KeyError:
+                    results.put(SimulationStartResult(timeline_id, error=f"Timeline {timeline_id} does not exist."))
+                except Exception as e:
+                    results.put(SimulationStartResult(timeline_id, error=str(e) or type(e).__name__))
+                start_spec = next_spec()
+
+        threads = [Thread(target=run, daemon=True) for _ in range(min(max_concurrent, total))]
+        for thread in threads:
+            thread.start()
+
+        try:
+            for _ in range(total):
+                yield results.get()
+        finally:
+            cancelled.set()
+            for thread in threads:
+                thread.join()
+
     def stop_simulation(self, stop_spec):
         if isinstance(stop_spec, TimelinePoint):
             timeline_node = stop_spec.timeline_node
@@ -1233,6 +1658,26 @@ class TimelinesProject:
                 self.simulation_stopped.emit(sim, timeline_node)
                 print(f"LOG: Stopped simulation {timeline_node.timeline_id}")
 
+    def close(self):
+        """
+        Stops all running simulations, any idle pooled simulation processes, and the converter workers,
+        and closes the point JSON cache.
+        """
+        with self._simulations_lock:
+            timeline_ids = list(self._current_simulations.keys())
+
+        for timeline_id in timeline_ids:
+            self.stop_simulation(timeline_id)
+
+        self.simulation_process_pool.close()
+        metrics.REGISTRY.remove_collector(self.converter_service.collect_metrics)
+        self.converter_service.close()
+        self.point_json_cache.close()
+
+        if self._project_file_handle is not None:
+            self._project_file_handle.close()
+            self._project_file_handle = None
+
     @staticmethod
     def validate_tags(tags):
         invalid_tags = [tag for tag in tags if not tag.isidentifier()]
@@ -1251,6 +1696,8 @@ class TimelinesProject:
                 self._timeline_tags[tag].add(timeline_node)
 
         self._save_timeline(timeline)
+        if tags:
+            self.tags_changed.emit(timeline_node)
 
     def remove_tags(self, timeline_id, tags):
         timeline_node = self.get_timeline_node(timeline_id)
@@ -1263,6 +1710,8 @@ class TimelinesProject:
                 self._timeline_tags[tag].discard(timeline_node)
 
         self._save_timeline(timeline)
+        if tags:
+            self.tags_changed.emit(timeline_node)
 
     def set_tags(self, timeline_id, tags):
         TimelinesProject.validate_tags(tags)
@@ -1281,6 +1730,22 @@ class TimelinesProject:
                 self._timeline_tags[tag].add(timeline_node)
 
         self._save_timeline(timeline)
+        self.tags_changed.emit(timeline_node)
+
+    def set_snapshot_policy(self, timeline_id, snapshot_policy: SnapshotPolicy):
+        """
+        Changes how often the timeline's simulation saves points while running. The policy is saved with
+        the timeline, and applied to its simulation straight away if it is running.
+        """
+        timeline = self.get_timeline_node(timeline_id).timeline
+
+        with timeline.lock:
+            timeline.snapshot_policy = snapshot_policy
+            self._save_timeline(timeline)
+
+            sim = self.get_simulation(timeline_id)
+            if sim is not None:
+                sim.apply_snapshot_policy()
 
     def get_all_timeline_nodes_with_tag(self, tag):
         with self._tags_lock:
@@ -1311,6 +1776,7 @@ class TimelinesProject:
                 elif isinstance(sim_binary_provider, SimulationSource):
                     data['source_path'] = str(sim_binary_provider.source_file_path)
                 data['tags'] = list(timeline.tags)
+                data['snapshot_policy'] = timeline.snapshot_policy.to_json()
                 json.dump(data, f)
 
     def _load_timeline(self, timeline_path):
@@ -1340,4 +1806,9 @@ class TimelinesProject:
             else:
                 tags = ()
 
-        return Timeline(timeline_path, simulation_binary_provider, tags)
+            if 'snapshot_policy' in data:
+                snapshot_policy = SnapshotPolicy.from_json(data['snapshot_policy'])
+            else:
+                snapshot_policy = None
+
+        return Timeline(timeline_path, simulation_binary_provider, tags, snapshot_policy)
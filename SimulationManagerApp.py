@@ -306,10 +306,10 @@ class App(QtCore.QObject):
         return self._ui.convertToSimComboBox.currentData(App._SimulationBinaryProvider)
 
     def _on_application_quitting(self):
-        sims_to_close = [sim for sim in self._simulations.values()]
         self._simulations.clear()
-        for sim in sims_to_close:
-            sim.timeline_simulation.stop_process()
+
+        if self._project is not None:
+            self._project.close()
 
     def _make_timeline_item(self, timeline_node: sm.TimelineNode):
         if timeline_node in self._timeline_tree_widget_map:
@@ -334,9 +334,11 @@ class App(QtCore.QObject):
         if not project_dir:
             return
 
-        self._project = sm.TimelinesProject.load_project(project_dir)
         if self._server is not None:
             self._server.stop()
+        if self._project is not None:
+            self._project.close()
+        self._project = sm.TimelinesProject.load_project(project_dir)
         self._server = Server(self._project)
         self._server.start()
 
@@ -596,6 +598,12 @@ class App(QtCore.QObject):
             sim.remove_dock()
             self._refresh_convert_to_selected_sim_button()
 
+        # Stopped simulation processes may be recycled for other timelines, so visualizers
+        # connected to this one must not keep following the process.
+        visualization = self._visualizations.pop(timeline_node.timeline_id, None)
+        if visualization is not None and visualization.is_alive():
+            visualization.terminate()
+
     @QtCore.Slot()
     def _on_simulation_runner_updated(self, timeline_id):
         selected_timeline_node = self.get_selected_timeline_node()
@@ -41,6 +41,108 @@ namespace SimulationServer
             }
         }
 
+        private static IEnumerable<string> IterateOutputStream()
+        {
+            while (true)
+            {
+                string read_output = Console.ReadLine();
+                if (string.IsNullOrWhiteSpace(read_output))
+                {
+                    yield break;
+                }
+                yield return read_output;
+            }
+        }
+
+        private static void WriteStatus(string status)
+        {
+            // Status lines are always a single line, so multi-line messages are flattened
+            Console.Out.Write(status.Replace('\r', ' ').Replace('\n', ' ') + "\n");
+            Console.Out.Flush();
+        }
+
+        private static void WriteState(SimulationWrapper wrapper, string format, string output_file, bool acknowledge)
+        {
+            byte[] data;
+
+            switch (format)
+            {
+                case "json":
+                    data = Encoding.UTF8.GetBytes(wrapper.GetStateJson().Item1);
+                    break;
+                case "binary":
+                    data = wrapper.GetStateBinary().Item1;
+                    break;
+                default:
+                    throw new ArgumentException($"Unknown output format '{format}'");
+            }
+
+            bool append_newline = format == "json";
+
+            if (!string.IsNullOrWhiteSpace(output_file))
+            {
+                using (FileStream file_stream = new FileStream(output_file, FileMode.Create, FileAccess.Write))
+                {
+                    file_stream.Write(data);
+                    if (append_newline)
+                    {
+                        file_stream.Write(Encoding.UTF8.GetBytes("\r\n"));
+                    }
+                }
+
+                if (acknowledge)
+                {
+                    WriteStatus("ok");
+                }
+            }
+            else
+            {
+                Stream out_stream = Console.OpenStandardOutput();
+
+                if (acknowledge)
+                {
+                    // Acknowledged output is framed by its length, so it is written without a trailing newline
+                    WriteStatus($"ok {data.Length}");
+                    out_stream.Write(data);
+                }
+                else
+                {
+                    out_stream.Write(data);
+                    if (append_newline)
+                    {
+                        out_stream.Write(Encoding.UTF8.GetBytes("\r\n"));
+                    }
+                }
+
+                out_stream.Flush();
+            }
+        }
+
+        private static void ConvertFile(SimulationWrapper input_wrapper, string input_format, string input_file,
+                                        SimulationWrapper output_wrapper, string output_format, string output_file,
+                                        bool acknowledge)
+        {
+            switch (input_format)
+            {
+                case "json":
+                    input_wrapper.SetStateJson(File.ReadAllText(input_file));
+                    break;
+                case "binary":
+                    input_wrapper.SetStateBinary(File.ReadAllBytes(input_file));
+                    break;
+                default:
+                    throw new ArgumentException($"Unknown input format '{input_format}'");
+            }
+
+            if (input_wrapper != output_wrapper)
+            {
+                // Converting versions, the json states are expected to work between versions
+                output_wrapper.SetStateJson(input_wrapper.GetStateJson().Item1);
+            }
+
+            WriteState(output_wrapper, output_format, output_file, acknowledge);
+        }
+
         static int Main(string[] args)
         {
             //System.Diagnostics.Debugger.Launch();
@@ -65,6 +167,10 @@ namespace SimulationServer
                 serveCmd.Description = "Run a server that runs the specified simulation and provides a GRPC interface to it";
                 var port = serveCmd.Option<int>("-p|--port <PORT>", "Port to run server on (automatically selected if not provided)", CommandOptionType.SingleValue)
                     .Accepts(v => v.Range(0, 65535));
+                var unixSocket = serveCmd.Option<string>("-u|--unixSocket <PATH>", "Unix domain socket to run server on instead of a port. Falls back to a port if the socket cannot be bound.", CommandOptionType.SingleValue)
+                    .Accepts(v => v.LegalFilePath());
+                var snapshotRing = serveCmd.Option<string>("-s|--snapshotRing <PATH>", "Snapshot ring file to hand state snapshots over through, instead of the event stream.", CommandOptionType.SingleValue)
+                    .Accepts(v => v.ExistingFile());
                 var ownerToken = serveCmd.Option<string>("-o|--ownerToken <TOKEN>", "The token string that will be used by the 'owner' user. Some server operations can only be done by the owner.", CommandOptionType.SingleValue)
                     .Accepts(s => s.MaxLength(128));
                 var simulation_library_path = serveCmd.Argument<string>("simulation", "The simulation library to serve")
@@ -82,13 +188,46 @@ namespace SimulationServer
                         server_port = port.ParsedValue;
                     }
 
-                    Server server = new Server
+                    SnapshotRing ring = snapshotRing.HasValue() ? new SnapshotRing(snapshotRing.Value()) : null;
+                    var service = new SimulationService(wrapper, ownerToken.Value(), ring);
+                    Server server = null;
+                    string address = null;
+
+                    if (unixSocket.HasValue())
                     {
-                        Services = { PyGridWorld.SimulationServer.Simulation.BindService(new SimulationService(wrapper, ownerToken.Value())) },
-                        Ports = { new ServerPort("localhost", server_port, ServerCredentials.Insecure) }
-                    };
+                        // Grpc.Core always binds "{Host}:{Port}", so the socket is created at "<path>:0",
+                        // and that is the address reported to clients.
+                        ServerPort socket_port = new ServerPort($"unix:{unixSocket.Value()}", 0, ServerCredentials.Insecure);
+                        server = new Server
+                        {
+                            Services = { PyGridWorld.SimulationServer.Simulation.BindService(service) },
+                            Ports = { socket_port }
+                        };
 
-                    server.Start();
+                        try
+                        {
+                            server.Start();
+                            address = $"{socket_port.Host}:{socket_port.Port}";
+                        }
+                        catch (IOException e)
+                        {
+                            Console.Error.WriteLine($"Could not bind unix socket, falling back to a port: {e.Message}");
+                            server.KillAsync().Wait();
+                            server = null;
+                        }
+                    }
+
+                    if (server == null)
+                    {
+                        server = new Server
+                        {
+                            Services = { PyGridWorld.SimulationServer.Simulation.BindService(service) },
+                            Ports = { new ServerPort("localhost", server_port, ServerCredentials.Insecure) }
+                        };
+
+                        server.Start();
+                        address = $"localhost:{server.Ports.First().BoundPort}";
+                    }
 
                     while (true)
                     {
@@ -96,6 +235,8 @@ namespace SimulationServer
 
                         switch (input)
                         {
+                            case null:
+                                // stdin was closed, the owning process is gone
                             case "exit":
                                 server.ShutdownAsync();
                                 server.ShutdownTask.Wait();
@@ -103,6 +244,9 @@ namespace SimulationServer
                             case "port":
                                 Console.WriteLine(server.Ports.First().BoundPort);
                                 break;
+                            case "address":
+                                Console.WriteLine(address);
+                                break;
                             default:
                                 Console.WriteLine("");
                                 break;
@@ -140,6 +284,8 @@ namespace SimulationServer
 
                 var io_from_input = convertBinCmd.Option("-iofi|--io_from_input", "If specified, the input and output files will be read from the input stream in pairs of lines.", CommandOptionType.NoValue);
 
+                var acknowledge = convertBinCmd.Option("-ack|--acknowledge", "If specified, a status line is written after each conversion: 'ok' for file outputs, 'ok <LENGTH>' followed by exactly LENGTH bytes for standard output, or 'error <MESSAGE>'. Failed conversions do not end the process.", CommandOptionType.NoValue);
+
                 convertBinCmd.OnValidate((context) =>
                 {
                     if (io_from_input.HasValue() && (input.HasValue() || output.HasValue()))
@@ -190,57 +336,24 @@ namespace SimulationServer
 
                     foreach ((string input_file, string output_file) in files_iterator)
                     {
-                        switch (input_format.Value())
-                        {
-                            case "json":
-                                input_wrapper.SetStateJson(File.ReadAllText(input_file));
-                                break;
-                            case "binary":
-                                input_wrapper.SetStateBinary(File.ReadAllBytes(input_file));
-                                break;
-                            default:
-                                return 1;
-                        }
-
-                        if (input_wrapper != output_wrapper)
+                        if (!acknowledge.HasValue())
                         {
-                            // Converting versions, the json states are expected to work between versions
-                            output_wrapper.SetStateJson(input_wrapper.GetStateJson().Item1);
+                            ConvertFile(input_wrapper, input_format.Value(), input_file,
+                                        output_wrapper, output_format.Value(), output_file,
+                                        false);
+                            continue;
                         }
 
-                        Stream out_stream;
-
-                        if (!string.IsNullOrWhiteSpace(output_file))
+                        try
                         {
-                            string out_value = output_file;
-                            if (!string.IsNullOrWhiteSpace(out_value))
-                            {
-                                out_stream = new FileStream(out_value, FileMode.Create, FileAccess.Write);
-                            }
-                            else
-                            {
-                                out_stream = Console.OpenStandardOutput();
-                            }
+                            ConvertFile(input_wrapper, input_format.Value(), input_file,
+                                        output_wrapper, output_format.Value(), output_file,
+                                        true);
                         }
-                        else
-                        {
-                            out_stream = Console.OpenStandardOutput();
-                        }
-
-                        switch (output_format.Value())
+                        catch (Exception e)
                         {
-                            case "json":
-                                out_stream.Write(Encoding.UTF8.GetBytes(output_wrapper.GetStateJson().Item1));
-                                out_stream.Write(Encoding.UTF8.GetBytes("\r\n"));
-                                break;
-                            case "binary":
-                                out_stream.Write(output_wrapper.GetStateBinary().Item1);
-                                break;
-                            default:
-                                return 1;
+                            WriteStatus("error " + e.Message);
                         }
-
-                        out_stream.Flush();
                     }
 
                     return 0;
@@ -262,45 +375,48 @@ namespace SimulationServer
                     .IsRequired()
                     .Accepts(v => v.ExistingFile());
 
+                var output_from_input = defaultCmd.Option("-ofi|--output_from_input", "If specified, the output files will be read from the input stream, one per line.", CommandOptionType.NoValue);
+
+                var acknowledge = defaultCmd.Option("-ack|--acknowledge", "If specified, a status line is written after each output file: 'ok' or 'error <MESSAGE>'. Failures do not end the process.", CommandOptionType.NoValue);
+
+                defaultCmd.OnValidate((context) =>
+                {
+                    if (output_from_input.HasValue() && output.HasValue())
+                    {
+                        return new ValidationResult("Cannot combine output_from_input flag with output option.");
+                    }
+
+                    return ValidationResult.Success;
+                });
+
                 defaultCmd.OnExecute(() =>
                 {
                     string simulation_path = Path.GetFullPath(output_sim.Value());
                     SimulationWrapper simulation_wrapper = new SimulationWrapper(simulation_path);
 
-                    Stream out_stream;
+                    if (!output_from_input.HasValue())
+                    {
+                        WriteState(simulation_wrapper, output_format.Value(), output.Value(), acknowledge.HasValue());
+                        return 0;
+                    }
 
-                    string output_file = output.Value();
-                    if (!string.IsNullOrWhiteSpace(output_file))
+                    foreach (string output_file in IterateOutputStream())
                     {
-                        string out_value = output_file;
-                        if (!string.IsNullOrWhiteSpace(out_value))
+                        if (!acknowledge.HasValue())
                         {
-                            out_stream = new FileStream(out_value, FileMode.Create, FileAccess.Write);
+                            WriteState(simulation_wrapper, output_format.Value(), output_file, false);
+                            continue;
                         }
-                        else
+
+                        try
                         {
-                            out_stream = Console.OpenStandardOutput();
+                            WriteState(simulation_wrapper, output_format.Value(), output_file, true);
+                        }
+                        catch (Exception e)
+                        {
+                            WriteStatus("error " + e.Message);
                         }
                     }
-                    else
-                    {
-                        out_stream = Console.OpenStandardOutput();
-                    }
-
-                    switch (output_format.Value())
-                    {
-                        case "json":
-                            out_stream.Write(Encoding.UTF8.GetBytes(simulation_wrapper.GetStateJson().Item1));
-                            out_stream.Write(Encoding.UTF8.GetBytes("\r\n"));
-                            break;
-                        case "binary":
-                            out_stream.Write(simulation_wrapper.GetStateBinary().Item1);
-                            break;
-                        default:
-                            return 1;
-                    }
-
-                    out_stream.Flush();
 
                     return 0;
                 });
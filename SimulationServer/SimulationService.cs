@@ -34,7 +34,60 @@ namespace SimulationServer
             public List<EventMessage> events;
         }
 
+        /// <summary>
+        /// The components of the simulation at one tick, from a single state JSON read. The simulation serializes
+        /// its state under its own lock, so every component is from the same tick, and entities destroyed while
+        /// the snapshot is read cannot be half seen.
+        /// </summary>
+        private class StateSnapshot
+        {
+            private readonly JsonElement components;
+
+            public ulong Tick { get; }
+
+            public StateSnapshot(string state_json, ulong tick)
+            {
+                // The document is not disposed, so the elements handed out stay valid for as long as they are used.
+                JsonElement root = JsonDocument.Parse(state_json).RootElement;
+                if (root.TryGetProperty("components", out JsonElement components))
+                {
+                    this.components = components;
+                }
+                Tick = tick;
+            }
+
+            public IEnumerable<string> GetComponentNames()
+            {
+                if (components.ValueKind != JsonValueKind.Object)
+                {
+                    return Enumerable.Empty<string>();
+                }
+                return components.EnumerateObject().Select(p => p.Name);
+            }
+
+            /// <summary>
+            /// The eid and value of every entity's component of the given name.
+            /// </summary>
+            public IEnumerable<(ulong eid, JsonElement component)> GetComponents(string component_name)
+            {
+                if (components.ValueKind != JsonValueKind.Object || !components.TryGetProperty(component_name, out JsonElement list))
+                {
+                    yield break;
+                }
+
+                foreach (JsonElement entry in list.EnumerateArray())
+                {
+                    yield return (entry.GetProperty("EID").GetUInt64(), entry.GetProperty("Com"));
+                }
+            }
+        }
+
         private SimulationWrapper simulation;
+        // Incremented by every edit, so a snapshot taken before an edit is not reused after it
+        private long stateVersion = 0;
+        private readonly object snapshotLock = new object();
+        private StateSnapshot lastSnapshot = null;
+        private long lastSnapshotVersion = 0;
         private delegate void CommitEventsDelegate(EventsData data);
         private event CommitEventsDelegate events_committed;
         private System.Diagnostics.Stopwatch performanceStopwatch = new System.Diagnostics.Stopwatch();
@@ -43,10 +96,17 @@ namespace SimulationServer
         private string ownerToken = "";
         private string editorToken = "";
 
-        public SimulationService(SimulationWrapper simulation, string ownerToken)
+        private SnapshotRing snapshotRing;
+        private volatile SnapshotPolicy snapshotPolicy = new SnapshotPolicy { TickInterval = 500000 };
+        // Only measures running time, and is only read and restarted by the tick callback
+        private System.Diagnostics.Stopwatch snapshotStopwatch = new System.Diagnostics.Stopwatch();
+        private double adaptiveSnapshotInterval = 0;
+
+        public SimulationService(SimulationWrapper simulation, string ownerToken, SnapshotRing snapshotRing = null)
         {
             this.ownerToken = ownerToken ?? string.Empty;
             this.simulation = simulation;
+            this.snapshotRing = snapshotRing;
             simulation.SetTickEventCallback(TickEventCallback);
         }
 
@@ -68,20 +128,37 @@ namespace SimulationServer
                 simulation.GetEventsLastTick(sim_event_handler);
             }
 
-            // TEMP/TODO: this value will be configurable
-            if (tick % 500000 == 0)
+            SnapshotPolicy policy = snapshotPolicy;
+            if (IsSnapshotDue(policy, tick))
             {
                 (byte[] state_binary, _) = simulation.GetStateBinary();
-                event_messages.Add(new EventMessage()
+                snapshotStopwatch.Restart();
+                if (policy.BytesPerHour > 0)
+                {
+                    adaptiveSnapshotInterval = state_binary.Length * 3600.0 / policy.BytesPerHour;
+                }
+
+                if (snapshotRing != null && snapshotRing.TryWrite(state_binary, out ulong slot, out ulong sequence))
+                {
+                    event_messages.Add(new EventMessage()
+                    {
+                        Name = "meta.state_ref",
+                        Json = $"{{\"slot\": {slot}, \"sequence\": {sequence}, \"size\": {state_binary.Length}}}"
+                    });
+                }
+                else
                 {
-                    Name = "meta.state_bin",
-                    Bin = Google.Protobuf.ByteString.CopyFrom(state_binary)
-                });
+                    event_messages.Add(new EventMessage()
+                    {
+                        Name = "meta.state_bin",
+                        Bin = Google.Protobuf.ByteString.CopyFrom(state_binary)
+                    });
+                }
             }
 
             if (event_messages.Count > 0)
             {
-                events_committed(new EventsData { tick = tick, events = event_messages });
+                events_committed?.Invoke(new EventsData { tick = tick, events = event_messages });
             }
 
             if (stopAtTick > 0 && tick >= stopAtTick)
@@ -91,11 +168,37 @@ namespace SimulationServer
             }
         }
 
+        private bool IsSnapshotDue(SnapshotPolicy policy, ulong tick)
+        {
+            if (policy.TickInterval > 0 && tick % policy.TickInterval == 0)
+            {
+                return true;
+            }
+
+            double elapsed = snapshotStopwatch.Elapsed.TotalSeconds;
+
+            if (policy.TimeInterval > 0 && elapsed >= policy.TimeInterval)
+            {
+                return true;
+            }
+
+            return policy.BytesPerHour > 0 && elapsed >= adaptiveSnapshotInterval;
+        }
+
+        public override Task<SetSnapshotPolicyResponse> SetSnapshotPolicy(SetSnapshotPolicyRequest request, ServerCallContext context)
+        {
+            AssertCalledByOwner(context);
+
+            snapshotPolicy = request.Policy ?? new SnapshotPolicy();
+            return Task.FromResult(new SetSnapshotPolicyResponse { });
+        }
+
         public override Task<AssignComponentResponse> AssignComponent(AssignComponentRequest request, ServerCallContext context)
         {
             AssertCalledByEditor(context);
 
             simulation.AssignComponent(request.Eid, request.ComponentName);
+            StateEdited();
             return Task.FromResult(new AssignComponentResponse { });
         }
 
@@ -104,6 +207,7 @@ namespace SimulationServer
             AssertCalledByEditor(context);
 
             ulong eid = simulation.CreateEntity();
+            StateEdited();
             return Task.FromResult(new CreateEntityResponse { Eid = eid });
         }
 
@@ -112,6 +216,7 @@ namespace SimulationServer
             AssertCalledByEditor(context);
 
             simulation.DestroyEntity(request.Eid);
+            StateEdited();
             return Task.FromResult(new DestroyEntityResponse { });
         }
 
@@ -161,16 +266,22 @@ namespace SimulationServer
 
             events_committed += addToQueueHandler;
 
-            while (!context.CancellationToken.IsCancellationRequested)
+            try
             {
-                EventsData data = await eventsDataQueue.ReceiveAsync(context.CancellationToken);
-                GetEventsResponse response = new GetEventsResponse();
-                response.Tick = data.tick;
-                response.Events.AddRange(data.events);
-                await responseStream.WriteAsync(response);
+                while (!context.CancellationToken.IsCancellationRequested)
+                {
+                    EventsData data = await eventsDataQueue.ReceiveAsync(context.CancellationToken);
+                    GetEventsResponse response = new GetEventsResponse();
+                    response.Tick = data.tick;
+                    response.Events.AddRange(data.events);
+                    await responseStream.WriteAsync(response);
+                }
+            }
+            finally
+            {
+                // Cancelled streams must unsubscribe, since a pooled server outlives many clients.
+                events_committed -= addToQueueHandler;
             }
-
-            events_committed -= addToQueueHandler;
         }
 
         public override Task<GetSingletonJsonResponse> GetSingletonJson(GetSingletonJsonRequest request, ServerCallContext context)
@@ -210,6 +321,7 @@ namespace SimulationServer
             AssertCalledByEditor(context);
 
             simulation.RemoveComponent(request.Eid, request.ComponentName);
+            StateEdited();
             return Task.FromResult(new RemoveComponentResponse { });
         }
 
@@ -218,6 +330,7 @@ namespace SimulationServer
             AssertCalledByEditor(context);
 
             simulation.ReplaceComponent(request.Eid, request.ComponentName, request.Json);
+            StateEdited();
             return Task.FromResult(new ReplaceComponentResponse { });
         }
 
@@ -226,6 +339,7 @@ namespace SimulationServer
             AssertCalledByEditor(context);
 
             simulation.SetSingletonJson(request.SingletonName, request.Json);
+            StateEdited();
             return Task.FromResult(new SetSingletonJsonResponse { });
         }
 
@@ -234,6 +348,7 @@ namespace SimulationServer
             AssertCalledByEditor(context);
 
             simulation.SetStateJson(request.Json);
+            StateEdited();
             return Task.FromResult(new SetStateJsonResponse { });
         }
 
@@ -262,9 +377,85 @@ namespace SimulationServer
             AssertCalledByEditor(context);
 
             simulation.SetStateBinary(request.Binary.ToByteArray());
+            StateEdited();
             return Task.FromResult(new SetStateBinaryResponse { });
         }
 
+        private const int DefaultStateChunkSize = 1024 * 1024;
+
+        public override async Task GetStateBinaryStream(GetStateBinaryStreamRequest request, IServerStreamWriter<StateBinaryChunk> responseStream, ServerCallContext context)
+        {
+            int chunk_size = request.ChunkSize > 0 ? (int)Math.Min(request.ChunkSize, int.MaxValue) : DefaultStateChunkSize;
+
+            (byte[] bin, ulong tick) = simulation.GetStateBinary();
+
+            int offset = 0;
+            do
+            {
+                int count = Math.Min(chunk_size, bin.Length - offset);
+                var chunk = new StateBinaryChunk
+                {
+                    Offset = (ulong)offset,
+                    Data = Google.Protobuf.ByteString.CopyFrom(bin, offset, count)
+                };
+
+                if (offset == 0)
+                {
+                    chunk.TotalSize = (ulong)bin.Length;
+                    chunk.Tick = tick;
+                }
+
+                await responseStream.WriteAsync(chunk);
+                offset += count;
+            }
+            while (offset < bin.Length && !context.CancellationToken.IsCancellationRequested);
+        }
+
+        public override async Task<SetStateBinaryResponse> SetStateBinaryStream(IAsyncStreamReader<StateBinaryChunk> requestStream, ServerCallContext context)
+        {
+            AssertCalledByEditor(context);
+
+            byte[] bin = null;
+            ulong received = 0;
+
+            while (await requestStream.MoveNext())
+            {
+                StateBinaryChunk chunk = requestStream.Current;
+
+                if (bin == null)
+                {
+                    if (chunk.TotalSize > int.MaxValue)
+                    {
+                        string err = $"State of {chunk.TotalSize} bytes is too large.";
+                        context.Status = new Status(StatusCode.InvalidArgument, err);
+                        throw new ArgumentException(err);
+                    }
+                    bin = new byte[chunk.TotalSize];
+                }
+
+                if (chunk.Offset != received || received + (ulong)chunk.Data.Length > (ulong)bin.Length)
+                {
+                    string err = $"Chunk at offset {chunk.Offset} of {chunk.Data.Length} bytes does not follow the {received} bytes received of a {bin.Length} byte state.";
+                    context.Status = new Status(StatusCode.InvalidArgument, err);
+                    throw new ArgumentException(err);
+                }
+
+                chunk.Data.CopyTo(bin, (int)chunk.Offset);
+                received += (ulong)chunk.Data.Length;
+            }
+
+            if (bin == null || received != (ulong)bin.Length)
+            {
+                string err = $"Stream ended after {received} bytes of a {(bin == null ? 0 : bin.Length)} byte state.";
+                context.Status = new Status(StatusCode.InvalidArgument, err);
+                throw new ArgumentException(err);
+            }
+
+            simulation.SetStateBinary(bin);
+            StateEdited();
+            return new SetStateBinaryResponse { };
+        }
+
         public override Task<RunCommandResponse> RunCommand(RunCommandRequest request, ServerCallContext context)
         {
             string err = null;
@@ -291,6 +482,7 @@ namespace SimulationServer
                                 }
 
                                 (err, output) = simulation.RunCommand(args.Skip(1).ToArray());
+                                StateEdited();
                                 break;
                             }
                         case "run":
@@ -403,6 +595,22 @@ namespace SimulationServer
             return Task.FromResult(new SetEditorTokenResponse());
         }
 
+        public override Task<SetOwnerTokenResponse> SetOwnerToken(SetOwnerTokenRequest request, ServerCallContext context)
+        {
+            AssertCalledByOwner(context);
+
+            if (string.IsNullOrEmpty(request.Token))
+            {
+                string err = "The owner token cannot be empty.";
+                context.Status = new Status(StatusCode.InvalidArgument, err);
+                throw new ArgumentException(err);
+            }
+
+            ownerToken = request.Token;
+
+            return Task.FromResult(new SetOwnerTokenResponse());
+        }
+
         public override Task<IsEditingResponse> IsEditing(IsEditingRequest request, ServerCallContext context)
         {
             bool result = false;
@@ -417,6 +625,339 @@ namespace SimulationServer
             return Task.FromResult(new IsEditingResponse { IsEditing = result });
         }
 
+        public override Task<BatchEditResponse> BatchEdit(BatchEditRequest request, ServerCallContext context)
+        {
+            AssertCalledByEditor(context);
+
+            BatchEditResponse response = new BatchEditResponse();
+            bool skip_remaining = false;
+            // one per create operation, null for the ones that failed or were skipped
+            List<ulong?> created_eids = new List<ulong?>();
+
+            foreach (EditOperation operation in request.Operations)
+            {
+                bool is_create = operation.OperationCase == EditOperation.OperationOneofCase.CreateEntity;
+                if (skip_remaining)
+                {
+                    response.Statuses.Add(new EditStatus { Success = false, Error = "Skipped after an earlier operation failed." });
+                    if (is_create)
+                    {
+                        created_eids.Add(null);
+                    }
+                    continue;
+                }
+
+                try
+                {
+                    ApplyEditOperation(operation, created_eids);
+                    response.Statuses.Add(new EditStatus { Success = true });
+                }
+                catch (Exception e)
+                {
+                    response.Statuses.Add(new EditStatus { Success = false, Error = e.Message });
+                    if (is_create)
+                    {
+                        created_eids.Add(null);
+                    }
+                    skip_remaining = request.StopOnError;
+                }
+            }
+
+            StateEdited();
+            response.CreatedEids.AddRange(created_eids.Select(eid => eid ?? 0));
+            return Task.FromResult(response);
+        }
+
+        public override Task<GetComponentColumnsResponse> GetComponentColumns(GetComponentColumnsRequest request, ServerCallContext context)
+        {
+            var columns = new Dictionary<string, (ComponentColumnQuery.Types.Format format, ComponentColumn column, List<JsonElement> components)>();
+            GetComponentColumnsResponse response = new GetComponentColumnsResponse();
+
+            foreach (ComponentColumnQuery query in request.Columns)
+            {
+                if (columns.ContainsKey(query.ComponentName))
+                {
+                    string err = $"Component '{query.ComponentName}' was requested more than once.";
+                    context.Status = new Status(StatusCode.InvalidArgument, err);
+                    throw new ArgumentException(err);
+                }
+
+                ComponentColumn column = new ComponentColumn { ComponentName = query.ComponentName };
+                columns.Add(query.ComponentName, (query.Format, column, new List<JsonElement>()));
+                response.Columns.Add(column);
+            }
+
+            StateSnapshot snapshot = TakeStateSnapshot();
+            response.Tick = snapshot.Tick;
+
+            // Only the lists of the requested components are read, not every entity.
+            foreach ((ComponentColumnQuery.Types.Format format, ComponentColumn column, List<JsonElement> components) in columns.Values)
+            {
+                foreach ((ulong eid, JsonElement component) in snapshot.GetComponents(column.ComponentName))
+                {
+                    column.Eids.Add(eid);
+                    if (format != ComponentColumnQuery.Types.Format.EidsOnly)
+                    {
+                        components.Add(component);
+                    }
+                }
+            }
+
+            foreach ((ComponentColumnQuery.Types.Format format, ComponentColumn column, List<JsonElement> components) in columns.Values)
+            {
+                try
+                {
+                    switch (format)
+                    {
+                        case ComponentColumnQuery.Types.Format.Json:
+                            column.Json = "[" + string.Join(",", components.Select(component => component.GetRawText())) + "]";
+                            break;
+                        case ComponentColumnQuery.Types.Format.Binary:
+                            PackComponentColumn(column, components);
+                            break;
+                    }
+                }
+                catch (Exception e) when (e is ArgumentException || e is InvalidOperationException || e is JsonException)
+                {
+                    string err = $"Component '{column.ComponentName}' cannot be packed as binary: {e.Message}";
+                    context.Status = new Status(StatusCode.InvalidArgument, err);
+                    throw new ArgumentException(err);
+                }
+            }
+
+            return Task.FromResult(response);
+        }
+
+        public override async Task SubscribeStateDeltas(SubscribeStateDeltasRequest request, IServerStreamWriter<StateDelta> responseStream, ServerCallContext context)
+        {
+            HashSet<string> followed = request.ComponentNames.Count > 0 ? new HashSet<string>(request.ComponentNames) : null;
+            double max_rate = request.MaxRate > 0 ? request.MaxRate : 10.0;
+            TimeSpan interval = TimeSpan.FromSeconds(1.0 / max_rate);
+
+            var previous = new Dictionary<ulong, Dictionary<string, string>>();
+            StateSnapshot previous_snapshot = null;
+
+            try
+            {
+                while (!context.CancellationToken.IsCancellationRequested)
+                {
+                    StateSnapshot snapshot = TakeStateSnapshot();
+
+                    // The same snapshot is handed out until the simulation ticks or is edited, so nothing changed.
+                    if (snapshot != previous_snapshot)
+                    {
+                        var current = CollectComponentJsons(snapshot, followed);
+
+                        StateDelta delta = DiffStates(previous, current);
+                        delta.Tick = snapshot.Tick;
+                        delta.Snapshot = previous_snapshot == null;
+
+                        bool changed = delta.CreatedEids.Count > 0 || delta.DestroyedEids.Count > 0 ||
+                                       delta.ChangedComponents.Count > 0 || delta.RemovedComponents.Count > 0;
+
+                        if (delta.Snapshot || changed || snapshot.Tick != previous_snapshot.Tick)
+                        {
+                            await responseStream.WriteAsync(delta);
+                        }
+
+                        previous = current;
+                        previous_snapshot = snapshot;
+                    }
+
+                    await Task.Delay(interval, context.CancellationToken);
+                }
+            }
+            catch (OperationCanceledException)
+            {
+                // The subscriber went away
+            }
+        }
+
+        /// <summary>
+        /// Collects the followed components of a snapshot by entity, as JSON. Only entities that have at least one
+        /// followed component are included.
+        /// </summary>
+        private static Dictionary<ulong, Dictionary<string, string>> CollectComponentJsons(StateSnapshot snapshot, ISet<string> component_names)
+        {
+            var result = new Dictionary<ulong, Dictionary<string, string>>();
+
+            foreach (string name in component_names ?? new HashSet<string>(snapshot.GetComponentNames()))
+            {
+                foreach ((ulong eid, JsonElement component) in snapshot.GetComponents(name))
+                {
+                    if (!result.TryGetValue(eid, out Dictionary<string, string> components))
+                    {
+                        components = new Dictionary<string, string>();
+                        result[eid] = components;
+                    }
+                    components[name] = component.GetRawText();
+                }
+            }
+
+            return result;
+        }
+
+        private static StateDelta DiffStates(Dictionary<ulong, Dictionary<string, string>> previous, Dictionary<ulong, Dictionary<string, string>> current)
+        {
+            StateDelta delta = new StateDelta();
+            var no_components = new Dictionary<string, string>();
+
+            foreach (ulong eid in previous.Keys)
+            {
+                if (!current.ContainsKey(eid))
+                {
+                    delta.DestroyedEids.Add(eid);
+                }
+            }
+
+            foreach (KeyValuePair<ulong, Dictionary<string, string>> entity in current)
+            {
+                if (!previous.TryGetValue(entity.Key, out Dictionary<string, string> previous_components))
+                {
+                    delta.CreatedEids.Add(entity.Key);
+                    previous_components = no_components;
+                }
+
+                foreach (KeyValuePair<string, string> component in entity.Value)
+                {
+                    if (!previous_components.TryGetValue(component.Key, out string previous_json) || previous_json != component.Value)
+                    {
+                        delta.ChangedComponents.Add(new ComponentValue { Eid = entity.Key, ComponentName = component.Key, Json = component.Value });
+                    }
+                }
+
+                foreach (string name in previous_components.Keys)
+                {
+                    if (!entity.Value.ContainsKey(name))
+                    {
+                        delta.RemovedComponents.Add(new RemovedComponent { Eid = entity.Key, ComponentName = name });
+                    }
+                }
+            }
+
+            return delta;
+        }
+
+        /// <summary>
+        /// Gets a snapshot of the current state. The last snapshot is reused while the simulation has neither ticked
+        /// nor been edited since it was taken, so subscribers sampling a paused simulation, or several subscribers
+        /// sampling the same tick, share one state read.
+        /// </summary>
+        private StateSnapshot TakeStateSnapshot()
+        {
+            long version = Interlocked.Read(ref stateVersion);
+            ulong tick = simulation.GetTick();
+
+            lock (snapshotLock)
+            {
+                if (lastSnapshot != null && lastSnapshot.Tick == tick && lastSnapshotVersion == version)
+                {
+                    return lastSnapshot;
+                }
+            }
+
+            (string json, ulong snapshot_tick) = simulation.GetStateJson();
+            StateSnapshot snapshot = new StateSnapshot(json, snapshot_tick);
+
+            lock (snapshotLock)
+            {
+                lastSnapshot = snapshot;
+                lastSnapshotVersion = version;
+            }
+            return snapshot;
+        }
+
+        /// <summary>
+        /// Must be called after every call that changes the state other than ticking, so state snapshots are not reused.
+        /// </summary>
+        private void StateEdited()
+        {
+            Interlocked.Increment(ref stateVersion);
+        }
+
+        private static void PackComponentColumn(ComponentColumn column, List<JsonElement> components)
+        {
+            using (var stream = new System.IO.MemoryStream())
+            using (var writer = new System.IO.BinaryWriter(stream))
+            {
+                foreach (JsonElement component in components)
+                {
+                    if (column.Fields.Count == 0)
+                    {
+                        column.Fields.AddRange(component.EnumerateObject().Select(p => p.Name));
+                    }
+
+                    foreach (string field in column.Fields)
+                    {
+                        if (!component.TryGetProperty(field, out JsonElement value))
+                        {
+                            throw new ArgumentException($"Field '{field}' is missing.");
+                        }
+
+                        switch (value.ValueKind)
+                        {
+                            case JsonValueKind.Number:
+                                writer.Write(value.GetDouble());
+                                break;
+                            case JsonValueKind.True:
+                                writer.Write(1.0);
+                                break;
+                            case JsonValueKind.False:
+                                writer.Write(0.0);
+                                break;
+                            default:
+                                throw new ArgumentException($"Field '{field}' is not a number.");
+                        }
+                    }
+                }
+
+                writer.Flush();
+                column.Binary = Google.Protobuf.ByteString.CopyFrom(stream.ToArray());
+            }
+        }
+
+        private void ApplyEditOperation(EditOperation operation, IList<ulong?> created_eids)
+        {
+            ulong ResolveEid(ulong eid)
+            {
+                if (operation.CreatedEntity == 0)
+                {
+                    return eid;
+                }
+
+                int index = (int)operation.CreatedEntity - 1;
+                if (index >= created_eids.Count)
+                {
+                    throw new ArgumentException($"Entity {operation.CreatedEntity} has not been created in this batch.");
+                }
+                return created_eids[index] ?? throw new ArgumentException($"Entity {operation.CreatedEntity} failed to be created in this batch.");
+            }
+
+            switch (operation.OperationCase)
+            {
+                case EditOperation.OperationOneofCase.CreateEntity:
+                    created_eids.Add(simulation.CreateEntity());
+                    break;
+                case EditOperation.OperationOneofCase.DestroyEntity:
+                    simulation.DestroyEntity(ResolveEid(operation.DestroyEntity.Eid));
+                    break;
+                case EditOperation.OperationOneofCase.AssignComponent:
+                    simulation.AssignComponent(ResolveEid(operation.AssignComponent.Eid), operation.AssignComponent.ComponentName);
+                    break;
+                case EditOperation.OperationOneofCase.RemoveComponent:
+                    simulation.RemoveComponent(ResolveEid(operation.RemoveComponent.Eid), operation.RemoveComponent.ComponentName);
+                    break;
+                case EditOperation.OperationOneofCase.ReplaceComponent:
+                    simulation.ReplaceComponent(ResolveEid(operation.ReplaceComponent.Eid), operation.ReplaceComponent.ComponentName, operation.ReplaceComponent.Json);
+                    break;
+                case EditOperation.OperationOneofCase.SetSingletonJson:
+                    simulation.SetSingletonJson(operation.SetSingletonJson.SingletonName, operation.SetSingletonJson.Json);
+                    break;
+                default:
+                    throw new ArgumentException("Edit operation is empty.");
+            }
+        }
+
         private void SendRunnerUpdateEvent(ulong tick, bool sim_running)
         {
             List<EventMessage> event_messages = new List<EventMessage>();
@@ -430,7 +971,7 @@ namespace SimulationServer
                 })
             });
 
-            events_committed(new EventsData { tick = tick, events = event_messages });
+            events_committed?.Invoke(new EventsData { tick = tick, events = event_messages });
         }
 
         private void StartSimulationImpl(ulong p_stopAtTick = 0)
@@ -440,6 +981,7 @@ namespace SimulationServer
             {
                 performanceStartTick = simulation.GetTick();
                 performanceStopwatch.Restart();
+                snapshotStopwatch.Start();
                 simulation.StartSimulation();
                 SendRunnerUpdateEvent(performanceStartTick, true);
             }
@@ -452,6 +994,7 @@ namespace SimulationServer
                 stopAtTick = 0;
                 simulation.StopSimulation();
                 performanceStopwatch.Stop();
+                snapshotStopwatch.Stop();
                 performanceStopTick = simulation.GetTick();
                 SendRunnerUpdateEvent(performanceStopTick, false);
             }
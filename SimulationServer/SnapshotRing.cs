@@ -0,0 +1,94 @@
+﻿using System;
+using System.IO;
+using System.IO.MemoryMappedFiles;
+using System.Linq;
+using System.Text;
+
+namespace SimulationServer
+{
+    /// <summary>
+    /// Writes state snapshots into a ring of fixed size slots in a memory mapped file created by the
+    /// simulation manager. The layout matches SnapshotRing in simrunner.py.
+    /// </summary>
+    class SnapshotRing : IDisposable
+    {
+        private const long FileHeaderSize = 32;
+        private const long SlotHeaderSize = 16;
+        private const uint Version = 1;
+        private static readonly byte[] Magic = Encoding.ASCII.GetBytes("GWSR");
+
+        private readonly MemoryMappedFile file;
+        private readonly MemoryMappedViewAccessor view;
+        private readonly object writeLock = new object();
+        private readonly uint slotCount;
+        private readonly ulong slotSize;
+        private ulong sequence = 0;
+
+        public SnapshotRing(string path)
+        {
+            // The manager keeps the file open while the server runs, so it must be shared
+            var stream = new FileStream(path, FileMode.Open, FileAccess.ReadWrite, FileShare.ReadWrite);
+            file = MemoryMappedFile.CreateFromFile(stream, null, 0, MemoryMappedFileAccess.ReadWrite, HandleInheritability.None, false);
+            view = file.CreateViewAccessor(0, 0, MemoryMappedFileAccess.ReadWrite);
+
+            byte[] magic = new byte[Magic.Length];
+            view.ReadArray(0, magic, 0, magic.Length);
+            if (!magic.SequenceEqual(Magic) || view.ReadUInt32(4) != Version)
+            {
+                Dispose();
+                throw new InvalidDataException($"{path} is not a version {Version} snapshot ring.");
+            }
+
+            slotCount = view.ReadUInt32(8);
+            slotSize = view.ReadUInt64(12);
+
+            for (uint slot = 0; slot < slotCount; ++slot)
+            {
+                sequence = Math.Max(sequence, view.ReadUInt64(SlotOffset(slot)));
+            }
+        }
+
+        private long SlotOffset(ulong slot)
+        {
+            return FileHeaderSize + (long)slot * (SlotHeaderSize + (long)slotSize);
+        }
+
+        /// <summary>
+        /// Writes a snapshot into the next slot. Returns false if it does not fit in a slot.
+        /// </summary>
+        public bool TryWrite(byte[] data, out ulong slot, out ulong written_sequence)
+        {
+            slot = 0;
+            written_sequence = 0;
+
+            if ((ulong)data.LongLength > slotSize)
+            {
+                return false;
+            }
+
+            lock (writeLock)
+            {
+                sequence += 1;
+                slot = sequence % slotCount;
+                long offset = SlotOffset(slot);
+
+                // A zero sequence marks the slot as being rewritten, for readers still copying the old snapshot
+                view.Write(offset, 0UL);
+                view.Write(offset + 8, 0UL);
+                view.WriteArray(offset + SlotHeaderSize, data, 0, data.Length);
+                view.Write(offset + 8, (ulong)data.LongLength);
+                view.Write(offset, sequence);
+
+                written_sequence = sequence;
+            }
+
+            return true;
+        }
+
+        public void Dispose()
+        {
+            view.Dispose();
+            file.Dispose();
+        }
+    }
+}
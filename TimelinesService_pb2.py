@@ -19,7 +19,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   syntax='proto3',
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n\x16TimelinesService.proto\x12\x0bPyGridWorld\"\x19\n\x08TickList\x12\r\n\x05ticks\x18\x01 \x03(\x03\"1\n\tTickRange\x12\x12\n\nstart_tick\x18\x01 \x01(\x03\x12\x10\n\x08\x65nd_tick\x18\x02 \x01(\x03\"\\\n\x10TimelinesRequest\x12\x0c\n\x04tags\x18\x01 \x03(\t\x12\x11\n\tparent_id\x18\x02 \x01(\x05\x12\x11\n\thead_tick\x18\x03 \x01(\x03\x12\x14\n\x0c\x65xclude_tags\x18\x04 \x03(\t\")\n\x11TimelinesResponse\x12\x14\n\x0ctimeline_ids\x18\x01 \x03(\x03\"+\n\x14TimelineTicksRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\"A\n\x15TimelineTicksResponse\x12(\n\ttick_list\x18\x01 \x01(\x0b\x32\x15.PyGridWorld.TickList\"\x93\x01\n\x13TimelineDataRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\x12*\n\ttick_list\x18\x02 \x01(\x0b\x32\x15.PyGridWorld.TickListH\x00\x12,\n\ntick_range\x18\x03 \x01(\x0b\x32\x16.PyGridWorld.TickRangeH\x00\x42\r\n\x0btick_option\"2\n\x14TimelineDataResponse\x12\x0c\n\x04tick\x18\x01 \x01(\x03\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"\x93\x01\n\x13TimelineJsonRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\x12*\n\ttick_list\x18\x02 \x01(\x0b\x32\x15.PyGridWorld.TickListH\x00\x12,\n\ntick_range\x18\x03 \x01(\x0b\x32\x16.PyGridWorld.TickRangeH\x00\x42\r\n\x0btick_option\"2\n\x14TimelineJsonResponse\x12\x0c\n\x04tick\x18\x01 \x01(\x03\x12\x0c\n\x04json\x18\x02 \x01(\t\"i\n\x15TimelineEventsRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\x12*\n\ntick_range\x18\x02 \x01(\x0b\x32\x16.PyGridWorld.TickRange\x12\x0f\n\x07\x66ilters\x18\x03 \x03(\t\"*\n\x0c\x45ventMessage\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04json\x18\x02 \x01(\t\"f\n\x16TimelineEventsResponse\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\x12\x0c\n\x04tick\x18\x02 \x01(\x03\x12)\n\x06\x65vents\x18\x03 \x03(\x0b\x32\x19.PyGridWorld.EventMessage\"@\n\x1bGetOrStartSimulationRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\x12\x0c\n\x04tick\x18\x02 \x01(\x03\">\n\x1cGetOrStartSimulationResponse\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\r\n\x05token\x18\x02 \x01(\t\",\n\x15StopSimulationRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\"\x18\n\x16StopSimulationResponse\"9\n\x14MoveSimToTickRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\x12\x0c\n\x04tick\x18\x02 \x01(\x03\"\x17\n\x15MoveSimToTickResponse\"\xae\x01\n\x15\x45\x64itSimulationRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\x12;\n\x07\x63ommand\x18\x02 \x01(\x0e\x32*.PyGridWorld.EditSimulationRequest.Command\"C\n\x07\x43ommand\x12\x0b\n\x07UNKNOWN\x10\x00\x12\t\n\x05START\x10\x01\x12\x07\n\x03\x45ND\x10\x02\x12\x0b\n\x07\x44ISCARD\x10\x03\x12\n\n\x06\x43OMMIT\x10\x04\"9\n\x16\x45\x64itSimulationResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0e\n\x06result\x18\x02 \x01(\t\"]\n\x19ModifyTimelineTagsRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\x12\x13\n\x0btags_to_add\x18\x02 \x03(\t\x12\x16\n\x0etags_to_remove\x18\x03 \x03(\t\"\x1c\n\x1aModifyTimelineTagsResponse\"H\n\x15\x43reateTimelineRequest\x12\x1a\n\x12source_timeline_id\x18\x01 \x01(\x05\x12\x13\n\x0bsource_tick\x18\x02 \x01(\x03\"5\n\x16\x43reateTimelineResponse\x12\x1b\n\x13\x63reated_timeline_id\x18\x01 \x01(\x05\"2\n\x14\x43loneTimelineRequest\x12\x1a\n\x12source_timeline_id\x18\x01 \x01(\x05\"4\n\x15\x43loneTimelineResponse\x12\x1b\n\x13\x63reated_timeline_id\x18\x01 \x01(\x05\"U\n#CreateTimelineFromSimulationRequest\x12\x1a\n\x12source_timeline_id\x18\x01 \x01(\x05\x12\x12\n\nas_sibling\x18\x02 \x01(\x08\"C\n$CreateTimelineFromSimulationResponse\x12\x1b\n\x13\x63reated_timeline_id\x18\x01 \x01(\x05\",\n\x15\x44\x65leteTimelineRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\"\x18\n\x16\x44\x65leteTimelineResponse\"0\n\x19GetTimelineDetailsRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\"\x86\x01\n\x1aGetTimelineDetailsResponse\x12\x11\n\tparent_id\x18\x01 \x01(\x05\x12\x11\n\thead_tick\x18\x02 \x01(\x03\x12\x1d\n\x15last_commit_timestamp\x18\x03 \x01(\t\x12\x0c\n\x04tags\x18\x04 \x03(\t\x12\x15\n\rfurthest_tick\x18\x05 \x01(\x03\x32\xce\x0b\n\x0fTimelineService\x12O\n\x0cGetTimelines\x12\x1d.PyGridWorld.TimelinesRequest\x1a\x1e.PyGridWorld.TimelinesResponse\"\x00\x12[\n\x10GetTimelineTicks\x12!.PyGridWorld.TimelineTicksRequest\x1a\".PyGridWorld.TimelineTicksResponse\"\x00\x12Z\n\x0fGetTimelineData\x12 .PyGridWorld.TimelineDataRequest\x1a!.PyGridWorld.TimelineDataResponse\"\x00\x30\x01\x12Z\n\x0fGetTimelineJson\x12 .PyGridWorld.TimelineJsonRequest\x1a!.PyGridWorld.TimelineJsonResponse\"\x00\x30\x01\x12`\n\x11GetTimelineEvents\x12\".PyGridWorld.TimelineEventsRequest\x1a#.PyGridWorld.TimelineEventsResponse\"\x00\x30\x01\x12m\n\x14GetOrStartSimulation\x12(.PyGridWorld.GetOrStartSimulationRequest\x1a).PyGridWorld.GetOrStartSimulationResponse\"\x00\x12[\n\x0eStopSimulation\x12\".PyGridWorld.StopSimulationRequest\x1a#.PyGridWorld.StopSimulationResponse\"\x00\x12X\n\rMoveSimToTick\x12!.PyGridWorld.MoveSimToTickRequest\x1a\".PyGridWorld.MoveSimToTickResponse\"\x00\x12_\n\x0e\x45\x64itSimulation\x12\".PyGridWorld.EditSimulationRequest\x1a#.PyGridWorld.EditSimulationResponse\"\x00(\x01\x30\x01\x12g\n\x12ModifyTimelineTags\x12&.PyGridWorld.ModifyTimelineTagsRequest\x1a\'.PyGridWorld.ModifyTimelineTagsResponse\"\x00\x12[\n\x0e\x43reateTimeline\x12\".PyGridWorld.CreateTimelineRequest\x1a#.PyGridWorld.CreateTimelineResponse\"\x00\x12X\n\rCloneTimeline\x12!.PyGridWorld.CloneTimelineRequest\x1a\".PyGridWorld.CloneTimelineResponse\"\x00\x12\x85\x01\n\x1c\x43reateTimelineFromSimulation\x12\x30.PyGridWorld.CreateTimelineFromSimulationRequest\x1a\x31.PyGridWorld.CreateTimelineFromSimulationResponse\"\x00\x12[\n\x0e\x44\x65leteTimeline\x12\".PyGridWorld.DeleteTimelineRequest\x1a#.PyGridWorld.DeleteTimelineResponse\"\x00\x12g\n\x12GetTimelineDetails\x12&.PyGridWorld.GetTimelineDetailsRequest\x1a\'.PyGridWorld.GetTimelineDetailsResponse\"\x00\x62\x06proto3'
+  serialized_pb=b'\n\x16TimelinesService.proto\x12\x0bPyGridWorld\"\x19\n\x08TickList\x12\r\n\x05ticks\x18\x01 \x03(\x03\"1\n\tTickRange\x12\x12\n\nstart_tick\x18\x01 \x01(\x03\x12\x10\n\x08\x65nd_tick\x18\x02 \x01(\x03\"\\\n\x10TimelinesRequest\x12\x0c\n\x04tags\x18\x01 \x03(\t\x12\x11\n\tparent_id\x18\x02 \x01(\x05\x12\x11\n\thead_tick\x18\x03 \x01(\x03\x12\x14\n\x0c\x65xclude_tags\x18\x04 \x03(\t\")\n\x11TimelinesResponse\x12\x14\n\x0ctimeline_ids\x18\x01 \x03(\x03\"+\n\x14TimelineTicksRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\"A\n\x15TimelineTicksResponse\x12(\n\ttick_list\x18\x01 \x01(\x0b\x32\x15.PyGridWorld.TickList\"\xb6\x01\n\x13TimelineDataRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\x12*\n\ttick_list\x18\x02 \x01(\x0b\x32\x15.PyGridWorld.TickListH\x00\x12,\n\ntick_range\x18\x03 \x01(\x0b\x32\x16.PyGridWorld.TickRangeH\x00\x12\x0e\n\x06stride\x18\x04 \x01(\r\x12\x11\n\tmax_count\x18\x05 \x01(\rB\r\n\x0btick_option\"2\n\x14TimelineDataResponse\x12\x0c\n\x04tick\x18\x01 \x01(\x03\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"\xac\x01\n\x13TimelineJsonRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\x12*\n\ttick_list\x18\x02 \x01(\x0b\x32\x15.PyGridWorld.TickListH\x00\x12,\n\ntick_range\x18\x03 \x01(\x0b\x32\x16.PyGridWorld.TickRangeH\x00\x12\x17\n\x0f\x63ompressed_json\x18\x04 \x01(\x08\x42\r\n\x0btick_option\"E\n\x14TimelineJsonResponse\x12\x0c\n\x04tick\x18\x01 \x01(\x03\x12\x0c\n\x04json\x18\x02 \x01(\t\x12\x11\n\tjson_zlib\x18\x03 \x01(\x0c\"i\n\x15TimelineEventsRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\x12*\n\ntick_range\x18\x02 \x01(\x0b\x32\x16.PyGridWorld.TickRange\x12\x0f\n\x07\x66ilters\x18\x03 \x03(\t\"*\n\x0c\x45ventMessage\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04json\x18\x02 \x01(\t\"f\n\x16TimelineEventsResponse\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\x12\x0c\n\x04tick\x18\x02 \x01(\x03\x12)\n\x06\x65vents\x18\x03 \x03(\x0b\x32\x19.PyGridWorld.EventMessage\"@\n\x1bGetOrStartSimulationRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\x12\x0c\n\x04tick\x18\x02 \x01(\x03\">\n\x1cGetOrStartSimulationResponse\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\r\n\x05token\x18\x02 \x01(\t\"L\n\x1cGetOrStartSimulationsRequest\x12\x14\n\x0ctimeline_ids\x18\x01 \x03(\x05\x12\x16\n\x0emax_concurrent\x18\x02 \x01(\r\"c\n\x1dGetOrStartSimulationsResponse\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\r\n\x05token\x18\x03 \x01(\t\x12\r\n\x05\x65rror\x18\x04 \x01(\t\",\n\x15StopSimulationRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\"\x18\n\x16StopSimulationResponse\"9\n\x14MoveSimToTickRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\x12\x0c\n\x04tick\x18\x02 \x01(\x03\"\x17\n\x15MoveSimToTickResponse\"\xae\x01\n\x15\x45\x64itSimulationRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\x12;\n\x07\x63ommand\x18\x02 \x01(\x0e\x32*.PyGridWorld.EditSimulationRequest.Command\"C\n\x07\x43ommand\x12\x0b\n\x07UNKNOWN\x10\x00\x12\t\n\x05START\x10\x01\x12\x07\n\x03\x45ND\x10\x02\x12\x0b\n\x07\x44ISCARD\x10\x03\x12\n\n\x06\x43OMMIT\x10\x04\"9\n\x16\x45\x64itSimulationResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0e\n\x06result\x18\x02 \x01(\t\"]\n\x19ModifyTimelineTagsRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\x12\x13\n\x0btags_to_add\x18\x02 \x03(\t\x12\x16\n\x0etags_to_remove\x18\x03 \x03(\t\"\x1c\n\x1aModifyTimelineTagsResponse\"H\n\x15\x43reateTimelineRequest\x12\x1a\n\x12source_timeline_id\x18\x01 \x01(\x05\x12\x13\n\x0bsource_tick\x18\x02 \x01(\x03\"5\n\x16\x43reateTimelineResponse\x12\x1b\n\x13\x63reated_timeline_id\x18\x01 \x01(\x05\"2\n\x14\x43loneTimelineRequest\x12\x1a\n\x12source_timeline_id\x18\x01 \x01(\x05\"4\n\x15\x43loneTimelineResponse\x12\x1b\n\x13\x63reated_timeline_id\x18\x01 \x01(\x05\"U\n#CreateTimelineFromSimulationRequest\x12\x1a\n\x12source_timeline_id\x18\x01 \x01(\x05\x12\x12\n\nas_sibling\x18\x02 \x01(\x08\"C\n$CreateTimelineFromSimulationResponse\x12\x1b\n\x13\x63reated_timeline_id\x18\x01 \x01(\x05\",\n\x15\x44\x65leteTimelineRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\"\x18\n\x16\x44\x65leteTimelineResponse\"0\n\x19GetTimelineDetailsRequest\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\"\x86\x01\n\x1aGetTimelineDetailsResponse\x12\x11\n\tparent_id\x18\x01 \x01(\x05\x12\x11\n\thead_tick\x18\x02 \x01(\x03\x12\x1d\n\x15last_commit_timestamp\x18\x03 \x01(\t\x12\x0c\n\x04tags\x18\x04 \x03(\t\x12\x15\n\rfurthest_tick\x18\x05 \x01(\x03\"\xad\x01\n\x13TimelineNodeDetails\x12\x13\n\x0btimeline_id\x18\x01 \x01(\x05\x12\x11\n\tparent_id\x18\x02 \x01(\x05\x12\x11\n\thead_tick\x18\x03 \x01(\x03\x12\x0c\n\x04tags\x18\x04 \x03(\t\x12\x12\n\ntick_count\x18\x05 \x01(\r\x12\x1d\n\x15last_commit_timestamp\x18\x06 \x01(\t\x12\x1a\n\x12simulation_running\x18\x07 \x01(\x08\"6\n\x1eGetTimelineDetailsBatchRequest\x12\x14\n\x0ctimeline_ids\x18\x01 \x03(\x05\"R\n\x1fGetTimelineDetailsBatchResponse\x12/\n\x05nodes\x18\x01 \x03(\x0b\x32 .PyGridWorld.TimelineNodeDetails\",\n\x16GetTimelineTreeRequest\x12\x12\n\nbatch_size\x18\x01 \x01(\r\"J\n\x17GetTimelineTreeResponse\x12/\n\x05nodes\x18\x01 \x03(\x0b\x32 .PyGridWorld.TimelineNodeDetails\"=\n\x13WatchProjectRequest\x12\x0e\n\x06log_id\x18\x01 \x01(\t\x12\x16\n\x0e\x61\x66ter_sequence\x18\x02 \x01(\x04\"\xd3\x02\n\rProjectChange\x12\x10\n\x08sequence\x18\x01 \x01(\x04\x12-\n\x04type\x18\x02 \x01(\x0e\x32\x1f.PyGridWorld.ProjectChange.Type\x12\x13\n\x0btimeline_id\x18\x03 \x01(\x05\x12.\n\x04node\x18\x04 \x01(\x0b\x32 .PyGridWorld.TimelineNodeDetails\x12\x0c\n\x04tick\x18\x05 \x01(\x03\x12\x1c\n\x14\x64\x65leted_timeline_ids\x18\x06 \x03(\x05\"\x8f\x01\n\x04Type\x12\x08\n\x04NONE\x10\x00\x12\x14\n\x10TIMELINE_CREATED\x10\x01\x12\x14\n\x10TIMELINE_DELETED\x10\x02\x12\x10\n\x0cTAGS_CHANGED\x10\x03\x12\x0f\n\x0bPOINT_ADDED\x10\x04\x12\x16\n\x12SIMULATION_STARTED\x10\x05\x12\x16\n\x12SIMULATION_STOPPED\x10\x06\"j\n\x14WatchProjectResponse\x12\x0e\n\x06log_id\x18\x01 \x01(\t\x12\x15\n\rlast_sequence\x18\x02 \x01(\x04\x12+\n\x07\x63hanges\x18\x03 \x03(\x0b\x32\x1a.PyGridWorld.ProjectChange\"\x16\n\x14GetCacheStatsRequest\"\x9d\x01\n\x15GetCacheStatsResponse\x12\x0c\n\x04hits\x18\x01 \x01(\x03\x12\x0e\n\x06misses\x18\x02 \x01(\x03\x12\x11\n\tevictions\x18\x03 \x01(\x03\x12\x15\n\rinvalidations\x18\x04 \x01(\x03\x12\x13\n\x0b\x65ntry_count\x18\x05 \x01(\x03\x12\x14\n\x0cstored_bytes\x18\x06 \x01(\x03\x12\x11\n\tmax_bytes\x18\x07 \x01(\x03\",\n\x11GetMetricsRequest\x12\x17\n\x0fprometheus_text\x18\x01 \x01(\x08\"\x91\x01\n\x0cMetricSample\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x35\n\x06labels\x18\x02 \x03(\x0b\x32%.PyGridWorld.MetricSample.LabelsEntry\x12\r\n\x05value\x18\x03 \x01(\x01\x1a-\n\x0bLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"Y\n\x12GetMetricsResponse\x12*\n\x07samples\x18\x01 \x03(\x0b\x32\x19.PyGridWorld.MetricSample\x12\x17\n\x0fprometheus_text\x18\x02 \x01(\t2\xa0\x10\n\x0fTimelineService\x12O\n\x0cGetTimelines\x12\x1d.PyGridWorld.TimelinesRequest\x1a\x1e.PyGridWorld.TimelinesResponse\"\x00\x12[\n\x10GetTimelineTicks\x12!.PyGridWorld.TimelineTicksRequest\x1a\".PyGridWorld.TimelineTicksResponse\"\x00\x12Z\n\x0fGetTimelineData\x12 .PyGridWorld.TimelineDataRequest\x1a!.PyGridWorld.TimelineDataResponse\"\x00\x30\x01\x12Z\n\x0fGetTimelineJson\x12 .PyGridWorld.TimelineJsonRequest\x1a!.PyGridWorld.TimelineJsonResponse\"\x00\x30\x01\x12`\n\x11GetTimelineEvents\x12\".PyGridWorld.TimelineEventsRequest\x1a#.PyGridWorld.TimelineEventsResponse\"\x00\x30\x01\x12m\n\x14GetOrStartSimulation\x12(.PyGridWorld.GetOrStartSimulationRequest\x1a).PyGridWorld.GetOrStartSimulationResponse\"\x00\x12r\n\x15GetOrStartSimulations\x12).PyGridWorld.GetOrStartSimulationsRequest\x1a*.PyGridWorld.GetOrStartSimulationsResponse\"\x00\x30\x01\x12[\n\x0eStopSimulation\x12\".PyGridWorld.StopSimulationRequest\x1a#.PyGridWorld.StopSimulationResponse\"\x00\x12X\n\rMoveSimToTick\x12!.PyGridWorld.MoveSimToTickRequest\x1a\".PyGridWorld.MoveSimToTickResponse\"\x00\x12_\n\x0e\x45\x64itSimulation\x12\".PyGridWorld.EditSimulationRequest\x1a#.PyGridWorld.EditSimulationResponse\"\x00(\x01\x30\x01\x12g\n\x12ModifyTimelineTags\x12&.PyGridWorld.ModifyTimelineTagsRequest\x1a\'.PyGridWorld.ModifyTimelineTagsResponse\"\x00\x12[\n\x0e\x43reateTimeline\x12\".PyGridWorld.CreateTimelineRequest\x1a#.PyGridWorld.CreateTimelineResponse\"\x00\x12X\n\rCloneTimeline\x12!.PyGridWorld.CloneTimelineRequest\x1a\".PyGridWorld.CloneTimelineResponse\"\x00\x12\x85\x01\n\x1c\x43reateTimelineFromSimulation\x12\x30.PyGridWorld.CreateTimelineFromSimulationRequest\x1a\x31.PyGridWorld.CreateTimelineFromSimulationResponse\"\x00\x12[\n\x0e\x44\x65leteTimeline\x12\".PyGridWorld.DeleteTimelineRequest\x1a#.PyGridWorld.DeleteTimelineResponse\"\x00\x12g\n\x12GetTimelineDetails\x12&.PyGridWorld.GetTimelineDetailsRequest\x1a\'.PyGridWorld.GetTimelineDetailsResponse\"\x00\x12v\n\x17GetTimelineDetailsBatch\x12+.PyGridWorld.GetTimelineDetailsBatchRequest\x1a,.PyGridWorld.GetTimelineDetailsBatchResponse\"\x00\x12`\n\x0fGetTimelineTree\x12#.PyGridWorld.GetTimelineTreeRequest\x1a$.PyGridWorld.GetTimelineTreeResponse\"\x00\x30\x01\x12W\n\x0cWatchProject\x12 .PyGridWorld.WatchProjectRequest\x1a!.PyGridWorld.WatchProjectResponse\"\x00\x30\x01\x12X\n\rGetCacheStats\x12!.PyGridWorld.GetCacheStatsRequest\x1a\".PyGridWorld.GetCacheStatsResponse\"\x00\x12O\n\nGetMetrics\x12\x1e.PyGridWorld.GetMetricsRequest\x1a\x1f.PyGridWorld.GetMetricsResponse\"\x00\x62\x06proto3'
 )
 
 
@@ -59,11 +59,61 @@ _EDITSIMULATIONREQUEST_COMMAND = _descriptor.EnumDescriptor(
   ],
   containing_type=None,
   serialized_options=None,
-  serialized_start=1419,
-  serialized_end=1486,
+  serialized_start=1677,
+  serialized_end=1744,
 )
 _sym_db.RegisterEnumDescriptor(_EDITSIMULATIONREQUEST_COMMAND)
 
+_PROJECTCHANGE_TYPE = _descriptor.EnumDescriptor(
+  name='Type',
+  full_name='PyGridWorld.ProjectChange.Type',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='NONE', index=0, number=0,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='TIMELINE_CREATED', index=1, number=1,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='TIMELINE_DELETED', index=2, number=2,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='TAGS_CHANGED', index=3, number=3,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='POINT_ADDED', index=4, number=4,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='SIMULATION_STARTED', index=5, number=5,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='SIMULATION_STOPPED', index=6, number=6,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=3278,
+  serialized_end=3421,
+)
+_sym_db.RegisterEnumDescriptor(_PROJECTCHANGE_TYPE)
+
 
 _TICKLIST = _descriptor.Descriptor(
   name='TickList',
@@ -314,6 +364,20 @@ _TIMELINEDATAREQUEST = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='stride', full_name='PyGridWorld.TimelineDataRequest.stride', index=3,
+      number=4, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max_count', full_name='PyGridWorld.TimelineDataRequest.max_count', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -332,7 +396,7 @@ _TIMELINEDATAREQUEST = _descriptor.Descriptor(
     fields=[]),
   ],
   serialized_start=367,
-  serialized_end=514,
+  serialized_end=549,
 )
 
 
@@ -370,8 +434,8 @@ _TIMELINEDATARESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=516,
-  serialized_end=566,
+  serialized_start=551,
+  serialized_end=601,
 )
 
 
@@ -404,6 +468,13 @@ _TIMELINEJSONREQUEST = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='compressed_json', full_name='PyGridWorld.TimelineJsonRequest.compressed_json', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -421,8 +492,8 @@ _TIMELINEJSONREQUEST = _descriptor.Descriptor(
       create_key=_descriptor._internal_create_key,
     fields=[]),
   ],
-  serialized_start=569,
-  serialized_end=716,
+  serialized_start=604,
+  serialized_end=776,
 )
 
 
@@ -448,6 +519,13 @@ _TIMELINEJSONRESPONSE = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='json_zlib', full_name='PyGridWorld.TimelineJsonResponse.json_zlib', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -460,8 +538,8 @@ _TIMELINEJSONRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=718,
-  serialized_end=768,
+  serialized_start=778,
+  serialized_end=847,
 )
 
 
@@ -506,8 +584,8 @@ _TIMELINEEVENTSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=770,
-  serialized_end=875,
+  serialized_start=849,
+  serialized_end=954,
 )
 
 
@@ -545,8 +623,8 @@ _EVENTMESSAGE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=877,
-  serialized_end=919,
+  serialized_start=956,
+  serialized_end=998,
 )
 
 
@@ -591,8 +669,8 @@ _TIMELINEEVENTSRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=921,
-  serialized_end=1023,
+  serialized_start=1000,
+  serialized_end=1102,
 )
 
 
@@ -630,8 +708,8 @@ _GETORSTARTSIMULATIONREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1025,
-  serialized_end=1089,
+  serialized_start=1104,
+  serialized_end=1168,
 )
 
 
@@ -669,8 +747,100 @@ _GETORSTARTSIMULATIONRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1091,
-  serialized_end=1153,
+  serialized_start=1170,
+  serialized_end=1232,
+)
+
+
+_GETORSTARTSIMULATIONSREQUEST = _descriptor.Descriptor(
+  name='GetOrStartSimulationsRequest',
+  full_name='PyGridWorld.GetOrStartSimulationsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='timeline_ids', full_name='PyGridWorld.GetOrStartSimulationsRequest.timeline_ids', index=0,
+      number=1, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max_concurrent', full_name='PyGridWorld.GetOrStartSimulationsRequest.max_concurrent', index=1,
+      number=2, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1234,
+  serialized_end=1310,
+)
+
+
+_GETORSTARTSIMULATIONSRESPONSE = _descriptor.Descriptor(
+  name='GetOrStartSimulationsResponse',
+  full_name='PyGridWorld.GetOrStartSimulationsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='timeline_id', full_name='PyGridWorld.GetOrStartSimulationsResponse.timeline_id', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='address', full_name='PyGridWorld.GetOrStartSimulationsResponse.address', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='token', full_name='PyGridWorld.GetOrStartSimulationsResponse.token', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='PyGridWorld.GetOrStartSimulationsResponse.error', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1312,
+  serialized_end=1411,
 )
 
 
@@ -701,8 +871,8 @@ _STOPSIMULATIONREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1155,
-  serialized_end=1199,
+  serialized_start=1413,
+  serialized_end=1457,
 )
 
 
@@ -726,8 +896,8 @@ _STOPSIMULATIONRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1201,
-  serialized_end=1225,
+  serialized_start=1459,
+  serialized_end=1483,
 )
 
 
@@ -765,8 +935,8 @@ _MOVESIMTOTICKREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1227,
-  serialized_end=1284,
+  serialized_start=1485,
+  serialized_end=1542,
 )
 
 
@@ -790,8 +960,8 @@ _MOVESIMTOTICKRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1286,
-  serialized_end=1309,
+  serialized_start=1544,
+  serialized_end=1567,
 )
 
 
@@ -830,8 +1000,8 @@ _EDITSIMULATIONREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1312,
-  serialized_end=1486,
+  serialized_start=1570,
+  serialized_end=1744,
 )
 
 
@@ -869,8 +1039,8 @@ _EDITSIMULATIONRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1488,
-  serialized_end=1545,
+  serialized_start=1746,
+  serialized_end=1803,
 )
 
 
@@ -915,8 +1085,8 @@ _MODIFYTIMELINETAGSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1547,
-  serialized_end=1640,
+  serialized_start=1805,
+  serialized_end=1898,
 )
 
 
@@ -940,8 +1110,8 @@ _MODIFYTIMELINETAGSRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1642,
-  serialized_end=1670,
+  serialized_start=1900,
+  serialized_end=1928,
 )
 
 
@@ -979,8 +1149,8 @@ _CREATETIMELINEREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1672,
-  serialized_end=1744,
+  serialized_start=1930,
+  serialized_end=2002,
 )
 
 
@@ -1011,8 +1181,8 @@ _CREATETIMELINERESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1746,
-  serialized_end=1799,
+  serialized_start=2004,
+  serialized_end=2057,
 )
 
 
@@ -1043,8 +1213,8 @@ _CLONETIMELINEREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1801,
-  serialized_end=1851,
+  serialized_start=2059,
+  serialized_end=2109,
 )
 
 
@@ -1075,8 +1245,8 @@ _CLONETIMELINERESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1853,
-  serialized_end=1905,
+  serialized_start=2111,
+  serialized_end=2163,
 )
 
 
@@ -1114,8 +1284,8 @@ _CREATETIMELINEFROMSIMULATIONREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1907,
-  serialized_end=1992,
+  serialized_start=2165,
+  serialized_end=2250,
 )
 
 
@@ -1146,8 +1316,8 @@ _CREATETIMELINEFROMSIMULATIONRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1994,
-  serialized_end=2061,
+  serialized_start=2252,
+  serialized_end=2319,
 )
 
 
@@ -1178,8 +1348,8 @@ _DELETETIMELINEREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2063,
-  serialized_end=2107,
+  serialized_start=2321,
+  serialized_end=2365,
 )
 
 
@@ -1203,8 +1373,8 @@ _DELETETIMELINERESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2109,
-  serialized_end=2133,
+  serialized_start=2367,
+  serialized_end=2391,
 )
 
 
@@ -1235,8 +1405,8 @@ _GETTIMELINEDETAILSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2135,
-  serialized_end=2183,
+  serialized_start=2393,
+  serialized_end=2441,
 )
 
 
@@ -1295,74 +1465,707 @@ _GETTIMELINEDETAILSRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2186,
-  serialized_end=2320,
+  serialized_start=2444,
+  serialized_end=2578,
 )
 
-_TIMELINETICKSRESPONSE.fields_by_name['tick_list'].message_type = _TICKLIST
-_TIMELINEDATAREQUEST.fields_by_name['tick_list'].message_type = _TICKLIST
-_TIMELINEDATAREQUEST.fields_by_name['tick_range'].message_type = _TICKRANGE
-_TIMELINEDATAREQUEST.oneofs_by_name['tick_option'].fields.append(
-  _TIMELINEDATAREQUEST.fields_by_name['tick_list'])
-_TIMELINEDATAREQUEST.fields_by_name['tick_list'].containing_oneof = _TIMELINEDATAREQUEST.oneofs_by_name['tick_option']
-_TIMELINEDATAREQUEST.oneofs_by_name['tick_option'].fields.append(
-  _TIMELINEDATAREQUEST.fields_by_name['tick_range'])
-_TIMELINEDATAREQUEST.fields_by_name['tick_range'].containing_oneof = _TIMELINEDATAREQUEST.oneofs_by_name['tick_option']
-_TIMELINEJSONREQUEST.fields_by_name['tick_list'].message_type = _TICKLIST
-_TIMELINEJSONREQUEST.fields_by_name['tick_range'].message_type = _TICKRANGE
-_TIMELINEJSONREQUEST.oneofs_by_name['tick_option'].fields.append(
-  _TIMELINEJSONREQUEST.fields_by_name['tick_list'])
-_TIMELINEJSONREQUEST.fields_by_name['tick_list'].containing_oneof = _TIMELINEJSONREQUEST.oneofs_by_name['tick_option']
-_TIMELINEJSONREQUEST.oneofs_by_name['tick_option'].fields.append(
-  _TIMELINEJSONREQUEST.fields_by_name['tick_range'])
-_TIMELINEJSONREQUEST.fields_by_name['tick_range'].containing_oneof = _TIMELINEJSONREQUEST.oneofs_by_name['tick_option']
-_TIMELINEEVENTSREQUEST.fields_by_name['tick_range'].message_type = _TICKRANGE
-_TIMELINEEVENTSRESPONSE.fields_by_name['events'].message_type = _EVENTMESSAGE
-_EDITSIMULATIONREQUEST.fields_by_name['command'].enum_type = _EDITSIMULATIONREQUEST_COMMAND
-_EDITSIMULATIONREQUEST_COMMAND.containing_type = _EDITSIMULATIONREQUEST
-DESCRIPTOR.message_types_by_name['TickList'] = _TICKLIST
-DESCRIPTOR.message_types_by_name['TickRange'] = _TICKRANGE
-DESCRIPTOR.message_types_by_name['TimelinesRequest'] = _TIMELINESREQUEST
-DESCRIPTOR.message_types_by_name['TimelinesResponse'] = _TIMELINESRESPONSE
-DESCRIPTOR.message_types_by_name['TimelineTicksRequest'] = _TIMELINETICKSREQUEST
-DESCRIPTOR.message_types_by_name['TimelineTicksResponse'] = _TIMELINETICKSRESPONSE
-DESCRIPTOR.message_types_by_name['TimelineDataRequest'] = _TIMELINEDATAREQUEST
-DESCRIPTOR.message_types_by_name['TimelineDataResponse'] = _TIMELINEDATARESPONSE
-DESCRIPTOR.message_types_by_name['TimelineJsonRequest'] = _TIMELINEJSONREQUEST
-DESCRIPTOR.message_types_by_name['TimelineJsonResponse'] = _TIMELINEJSONRESPONSE
-DESCRIPTOR.message_types_by_name['TimelineEventsRequest'] = _TIMELINEEVENTSREQUEST
-DESCRIPTOR.message_types_by_name['EventMessage'] = _EVENTMESSAGE
-DESCRIPTOR.message_types_by_name['TimelineEventsResponse'] = _TIMELINEEVENTSRESPONSE
-DESCRIPTOR.message_types_by_name['GetOrStartSimulationRequest'] = _GETORSTARTSIMULATIONREQUEST
-DESCRIPTOR.message_types_by_name['GetOrStartSimulationResponse'] = _GETORSTARTSIMULATIONRESPONSE
-DESCRIPTOR.message_types_by_name['StopSimulationRequest'] = _STOPSIMULATIONREQUEST
-DESCRIPTOR.message_types_by_name['StopSimulationResponse'] = _STOPSIMULATIONRESPONSE
-DESCRIPTOR.message_types_by_name['MoveSimToTickRequest'] = _MOVESIMTOTICKREQUEST
-DESCRIPTOR.message_types_by_name['MoveSimToTickResponse'] = _MOVESIMTOTICKRESPONSE
-DESCRIPTOR.message_types_by_name['EditSimulationRequest'] = _EDITSIMULATIONREQUEST
-DESCRIPTOR.message_types_by_name['EditSimulationResponse'] = _EDITSIMULATIONRESPONSE
-DESCRIPTOR.message_types_by_name['ModifyTimelineTagsRequest'] = _MODIFYTIMELINETAGSREQUEST
-DESCRIPTOR.message_types_by_name['ModifyTimelineTagsResponse'] = _MODIFYTIMELINETAGSRESPONSE
-DESCRIPTOR.message_types_by_name['CreateTimelineRequest'] = _CREATETIMELINEREQUEST
-DESCRIPTOR.message_types_by_name['CreateTimelineResponse'] = _CREATETIMELINERESPONSE
-DESCRIPTOR.message_types_by_name['CloneTimelineRequest'] = _CLONETIMELINEREQUEST
-DESCRIPTOR.message_types_by_name['CloneTimelineResponse'] = _CLONETIMELINERESPONSE
-DESCRIPTOR.message_types_by_name['CreateTimelineFromSimulationRequest'] = _CREATETIMELINEFROMSIMULATIONREQUEST
-DESCRIPTOR.message_types_by_name['CreateTimelineFromSimulationResponse'] = _CREATETIMELINEFROMSIMULATIONRESPONSE
-DESCRIPTOR.message_types_by_name['DeleteTimelineRequest'] = _DELETETIMELINEREQUEST
-DESCRIPTOR.message_types_by_name['DeleteTimelineResponse'] = _DELETETIMELINERESPONSE
-DESCRIPTOR.message_types_by_name['GetTimelineDetailsRequest'] = _GETTIMELINEDETAILSREQUEST
-DESCRIPTOR.message_types_by_name['GetTimelineDetailsResponse'] = _GETTIMELINEDETAILSRESPONSE
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
-TickList = _reflection.GeneratedProtocolMessageType('TickList', (_message.Message,), {
-  'DESCRIPTOR' : _TICKLIST,
-  '__module__' : 'TimelinesService_pb2'
-  # @@protoc_insertion_point(class_scope:PyGridWorld.TickList)
-  })
-_sym_db.RegisterMessage(TickList)
+_TIMELINENODEDETAILS = _descriptor.Descriptor(
+  name='TimelineNodeDetails',
+  full_name='PyGridWorld.TimelineNodeDetails',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='timeline_id', full_name='PyGridWorld.TimelineNodeDetails.timeline_id', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='parent_id', full_name='PyGridWorld.TimelineNodeDetails.parent_id', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='head_tick', full_name='PyGridWorld.TimelineNodeDetails.head_tick', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='tags', full_name='PyGridWorld.TimelineNodeDetails.tags', index=3,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='tick_count', full_name='PyGridWorld.TimelineNodeDetails.tick_count', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='last_commit_timestamp', full_name='PyGridWorld.TimelineNodeDetails.last_commit_timestamp', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='simulation_running', full_name='PyGridWorld.TimelineNodeDetails.simulation_running', index=6,
+      number=7, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2581,
+  serialized_end=2754,
+)
 
-TickRange = _reflection.GeneratedProtocolMessageType('TickRange', (_message.Message,), {
+
+_GETTIMELINEDETAILSBATCHREQUEST = _descriptor.Descriptor(
+  name='GetTimelineDetailsBatchRequest',
+  full_name='PyGridWorld.GetTimelineDetailsBatchRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='timeline_ids', full_name='PyGridWorld.GetTimelineDetailsBatchRequest.timeline_ids', index=0,
+      number=1, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2756,
+  serialized_end=2810,
+)
+
+
+_GETTIMELINEDETAILSBATCHRESPONSE = _descriptor.Descriptor(
+  name='GetTimelineDetailsBatchResponse',
+  full_name='PyGridWorld.GetTimelineDetailsBatchResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='nodes', full_name='PyGridWorld.GetTimelineDetailsBatchResponse.nodes', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2812,
+  serialized_end=2894,
+)
+
+
+_GETTIMELINETREEREQUEST = _descriptor.Descriptor(
+  name='GetTimelineTreeRequest',
+  full_name='PyGridWorld.GetTimelineTreeRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='batch_size', full_name='PyGridWorld.GetTimelineTreeRequest.batch_size', index=0,
+      number=1, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2896,
+  serialized_end=2940,
+)
+
+
+_GETTIMELINETREERESPONSE = _descriptor.Descriptor(
+  name='GetTimelineTreeResponse',
+  full_name='PyGridWorld.GetTimelineTreeResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='nodes', full_name='PyGridWorld.GetTimelineTreeResponse.nodes', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2942,
+  serialized_end=3016,
+)
+
+
+_WATCHPROJECTREQUEST = _descriptor.Descriptor(
+  name='WatchProjectRequest',
+  full_name='PyGridWorld.WatchProjectRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='log_id', full_name='PyGridWorld.WatchProjectRequest.log_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='after_sequence', full_name='PyGridWorld.WatchProjectRequest.after_sequence', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3018,
+  serialized_end=3079,
+)
+
+
+_PROJECTCHANGE = _descriptor.Descriptor(
+  name='ProjectChange',
+  full_name='PyGridWorld.ProjectChange',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='sequence', full_name='PyGridWorld.ProjectChange.sequence', index=0,
+      number=1, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='PyGridWorld.ProjectChange.type', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='timeline_id', full_name='PyGridWorld.ProjectChange.timeline_id', index=2,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='node', full_name='PyGridWorld.ProjectChange.node', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='tick', full_name='PyGridWorld.ProjectChange.tick', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='deleted_timeline_ids', full_name='PyGridWorld.ProjectChange.deleted_timeline_ids', index=5,
+      number=6, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _PROJECTCHANGE_TYPE,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3082,
+  serialized_end=3421,
+)
+
+
+_WATCHPROJECTRESPONSE = _descriptor.Descriptor(
+  name='WatchProjectResponse',
+  full_name='PyGridWorld.WatchProjectResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='log_id', full_name='PyGridWorld.WatchProjectResponse.log_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='last_sequence', full_name='PyGridWorld.WatchProjectResponse.last_sequence', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='changes', full_name='PyGridWorld.WatchProjectResponse.changes', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3423,
+  serialized_end=3529,
+)
+
+
+_GETCACHESTATSREQUEST = _descriptor.Descriptor(
+  name='GetCacheStatsRequest',
+  full_name='PyGridWorld.GetCacheStatsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3531,
+  serialized_end=3553,
+)
+
+
+_GETCACHESTATSRESPONSE = _descriptor.Descriptor(
+  name='GetCacheStatsResponse',
+  full_name='PyGridWorld.GetCacheStatsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='hits', full_name='PyGridWorld.GetCacheStatsResponse.hits', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='misses', full_name='PyGridWorld.GetCacheStatsResponse.misses', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='evictions', full_name='PyGridWorld.GetCacheStatsResponse.evictions', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='invalidations', full_name='PyGridWorld.GetCacheStatsResponse.invalidations', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='entry_count', full_name='PyGridWorld.GetCacheStatsResponse.entry_count', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='stored_bytes', full_name='PyGridWorld.GetCacheStatsResponse.stored_bytes', index=5,
+      number=6, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max_bytes', full_name='PyGridWorld.GetCacheStatsResponse.max_bytes', index=6,
+      number=7, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3556,
+  serialized_end=3713,
+)
+
+
+_GETMETRICSREQUEST = _descriptor.Descriptor(
+  name='GetMetricsRequest',
+  full_name='PyGridWorld.GetMetricsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='prometheus_text', full_name='PyGridWorld.GetMetricsRequest.prometheus_text', index=0,
+      number=1, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3715,
+  serialized_end=3759,
+)
+
+
+_METRICSAMPLE_LABELSENTRY = _descriptor.Descriptor(
+  name='LabelsEntry',
+  full_name='PyGridWorld.MetricSample.LabelsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='PyGridWorld.MetricSample.LabelsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='PyGridWorld.MetricSample.LabelsEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3862,
+  serialized_end=3907,
+)
+
+_METRICSAMPLE = _descriptor.Descriptor(
+  name='MetricSample',
+  full_name='PyGridWorld.MetricSample',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='PyGridWorld.MetricSample.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='labels', full_name='PyGridWorld.MetricSample.labels', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='PyGridWorld.MetricSample.value', index=2,
+      number=3, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[_METRICSAMPLE_LABELSENTRY, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3762,
+  serialized_end=3907,
+)
+
+
+_GETMETRICSRESPONSE = _descriptor.Descriptor(
+  name='GetMetricsResponse',
+  full_name='PyGridWorld.GetMetricsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='samples', full_name='PyGridWorld.GetMetricsResponse.samples', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='prometheus_text', full_name='PyGridWorld.GetMetricsResponse.prometheus_text', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3909,
+  serialized_end=3998,
+)
+
+_TIMELINETICKSRESPONSE.fields_by_name['tick_list'].message_type = _TICKLIST
+_TIMELINEDATAREQUEST.fields_by_name['tick_list'].message_type = _TICKLIST
+_TIMELINEDATAREQUEST.fields_by_name['tick_range'].message_type = _TICKRANGE
+_TIMELINEDATAREQUEST.oneofs_by_name['tick_option'].fields.append(
+  _TIMELINEDATAREQUEST.fields_by_name['tick_list'])
+_TIMELINEDATAREQUEST.fields_by_name['tick_list'].containing_oneof = _TIMELINEDATAREQUEST.oneofs_by_name['tick_option']
+_TIMELINEDATAREQUEST.oneofs_by_name['tick_option'].fields.append(
+  _TIMELINEDATAREQUEST.fields_by_name['tick_range'])
+_TIMELINEDATAREQUEST.fields_by_name['tick_range'].containing_oneof = _TIMELINEDATAREQUEST.oneofs_by_name['tick_option']
+_TIMELINEJSONREQUEST.fields_by_name['tick_list'].message_type = _TICKLIST
+_TIMELINEJSONREQUEST.fields_by_name['tick_range'].message_type = _TICKRANGE
+_TIMELINEJSONREQUEST.oneofs_by_name['tick_option'].fields.append(
+  _TIMELINEJSONREQUEST.fields_by_name['tick_list'])
+_TIMELINEJSONREQUEST.fields_by_name['tick_list'].containing_oneof = _TIMELINEJSONREQUEST.oneofs_by_name['tick_option']
+_TIMELINEJSONREQUEST.oneofs_by_name['tick_option'].fields.append(
+  _TIMELINEJSONREQUEST.fields_by_name['tick_range'])
+_TIMELINEJSONREQUEST.fields_by_name['tick_range'].containing_oneof = _TIMELINEJSONREQUEST.oneofs_by_name['tick_option']
+_TIMELINEEVENTSREQUEST.fields_by_name['tick_range'].message_type = _TICKRANGE
+_TIMELINEEVENTSRESPONSE.fields_by_name['events'].message_type = _EVENTMESSAGE
+_EDITSIMULATIONREQUEST.fields_by_name['command'].enum_type = _EDITSIMULATIONREQUEST_COMMAND
+_EDITSIMULATIONREQUEST_COMMAND.containing_type = _EDITSIMULATIONREQUEST
+_GETTIMELINEDETAILSBATCHRESPONSE.fields_by_name['nodes'].message_type = _TIMELINENODEDETAILS
+_GETTIMELINETREERESPONSE.fields_by_name['nodes'].message_type = _TIMELINENODEDETAILS
+_PROJECTCHANGE.fields_by_name['type'].enum_type = _PROJECTCHANGE_TYPE
+_PROJECTCHANGE.fields_by_name['node'].message_type = _TIMELINENODEDETAILS
+_PROJECTCHANGE_TYPE.containing_type = _PROJECTCHANGE
+_WATCHPROJECTRESPONSE.fields_by_name['changes'].message_type = _PROJECTCHANGE
+_METRICSAMPLE_LABELSENTRY.containing_type = _METRICSAMPLE
+_METRICSAMPLE.fields_by_name['labels'].message_type = _METRICSAMPLE_LABELSENTRY
+_GETMETRICSRESPONSE.fields_by_name['samples'].message_type = _METRICSAMPLE
+DESCRIPTOR.message_types_by_name['TickList'] = _TICKLIST
+DESCRIPTOR.message_types_by_name['TickRange'] = _TICKRANGE
+DESCRIPTOR.message_types_by_name['TimelinesRequest'] = _TIMELINESREQUEST
+DESCRIPTOR.message_types_by_name['TimelinesResponse'] = _TIMELINESRESPONSE
+DESCRIPTOR.message_types_by_name['TimelineTicksRequest'] = _TIMELINETICKSREQUEST
+DESCRIPTOR.message_types_by_name['TimelineTicksResponse'] = _TIMELINETICKSRESPONSE
+DESCRIPTOR.message_types_by_name['TimelineDataRequest'] = _TIMELINEDATAREQUEST
+DESCRIPTOR.message_types_by_name['TimelineDataResponse'] = _TIMELINEDATARESPONSE
+DESCRIPTOR.message_types_by_name['TimelineJsonRequest'] = _TIMELINEJSONREQUEST
+DESCRIPTOR.message_types_by_name['TimelineJsonResponse'] = _TIMELINEJSONRESPONSE
+DESCRIPTOR.message_types_by_name['TimelineEventsRequest'] = _TIMELINEEVENTSREQUEST
+DESCRIPTOR.message_types_by_name['EventMessage'] = _EVENTMESSAGE
+DESCRIPTOR.message_types_by_name['TimelineEventsResponse'] = _TIMELINEEVENTSRESPONSE
+DESCRIPTOR.message_types_by_name['GetOrStartSimulationRequest'] = _GETORSTARTSIMULATIONREQUEST
+DESCRIPTOR.message_types_by_name['GetOrStartSimulationResponse'] = _GETORSTARTSIMULATIONRESPONSE
+DESCRIPTOR.message_types_by_name['GetOrStartSimulationsRequest'] = _GETORSTARTSIMULATIONSREQUEST
+DESCRIPTOR.message_types_by_name['GetOrStartSimulationsResponse'] = _GETORSTARTSIMULATIONSRESPONSE
+DESCRIPTOR.message_types_by_name['StopSimulationRequest'] = _STOPSIMULATIONREQUEST
+DESCRIPTOR.message_types_by_name['StopSimulationResponse'] = _STOPSIMULATIONRESPONSE
+DESCRIPTOR.message_types_by_name['MoveSimToTickRequest'] = _MOVESIMTOTICKREQUEST
+DESCRIPTOR.message_types_by_name['MoveSimToTickResponse'] = _MOVESIMTOTICKRESPONSE
+DESCRIPTOR.message_types_by_name['EditSimulationRequest'] = _EDITSIMULATIONREQUEST
+DESCRIPTOR.message_types_by_name['EditSimulationResponse'] = _EDITSIMULATIONRESPONSE
+DESCRIPTOR.message_types_by_name['ModifyTimelineTagsRequest'] = _MODIFYTIMELINETAGSREQUEST
+DESCRIPTOR.message_types_by_name['ModifyTimelineTagsResponse'] = _MODIFYTIMELINETAGSRESPONSE
+DESCRIPTOR.message_types_by_name['CreateTimelineRequest'] = _CREATETIMELINEREQUEST
+DESCRIPTOR.message_types_by_name['CreateTimelineResponse'] = _CREATETIMELINERESPONSE
+DESCRIPTOR.message_types_by_name['CloneTimelineRequest'] = _CLONETIMELINEREQUEST
+DESCRIPTOR.message_types_by_name['CloneTimelineResponse'] = _CLONETIMELINERESPONSE
+DESCRIPTOR.message_types_by_name['CreateTimelineFromSimulationRequest'] = _CREATETIMELINEFROMSIMULATIONREQUEST
+DESCRIPTOR.message_types_by_name['CreateTimelineFromSimulationResponse'] = _CREATETIMELINEFROMSIMULATIONRESPONSE
+DESCRIPTOR.message_types_by_name['DeleteTimelineRequest'] = _DELETETIMELINEREQUEST
+DESCRIPTOR.message_types_by_name['DeleteTimelineResponse'] = _DELETETIMELINERESPONSE
+DESCRIPTOR.message_types_by_name['GetTimelineDetailsRequest'] = _GETTIMELINEDETAILSREQUEST
+DESCRIPTOR.message_types_by_name['GetTimelineDetailsResponse'] = _GETTIMELINEDETAILSRESPONSE
+DESCRIPTOR.message_types_by_name['TimelineNodeDetails'] = _TIMELINENODEDETAILS
+DESCRIPTOR.message_types_by_name['GetTimelineDetailsBatchRequest'] = _GETTIMELINEDETAILSBATCHREQUEST
+DESCRIPTOR.message_types_by_name['GetTimelineDetailsBatchResponse'] = _GETTIMELINEDETAILSBATCHRESPONSE
+DESCRIPTOR.message_types_by_name['GetTimelineTreeRequest'] = _GETTIMELINETREEREQUEST
+DESCRIPTOR.message_types_by_name['GetTimelineTreeResponse'] = _GETTIMELINETREERESPONSE
+DESCRIPTOR.message_types_by_name['WatchProjectRequest'] = _WATCHPROJECTREQUEST
+DESCRIPTOR.message_types_by_name['ProjectChange'] = _PROJECTCHANGE
+DESCRIPTOR.message_types_by_name['WatchProjectResponse'] = _WATCHPROJECTRESPONSE
+DESCRIPTOR.message_types_by_name['GetCacheStatsRequest'] = _GETCACHESTATSREQUEST
+DESCRIPTOR.message_types_by_name['GetCacheStatsResponse'] = _GETCACHESTATSRESPONSE
+DESCRIPTOR.message_types_by_name['GetMetricsRequest'] = _GETMETRICSREQUEST
+DESCRIPTOR.message_types_by_name['MetricSample'] = _METRICSAMPLE
+DESCRIPTOR.message_types_by_name['GetMetricsResponse'] = _GETMETRICSRESPONSE
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+TickList = _reflection.GeneratedProtocolMessageType('TickList', (_message.Message,), {
+  'DESCRIPTOR' : _TICKLIST,
+  '__module__' : 'TimelinesService_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.TickList)
+  })
+_sym_db.RegisterMessage(TickList)
+
+TickRange = _reflection.GeneratedProtocolMessageType('TickRange', (_message.Message,), {
   'DESCRIPTOR' : _TICKRANGE,
   '__module__' : 'TimelinesService_pb2'
   # @@protoc_insertion_point(class_scope:PyGridWorld.TickRange)
@@ -1460,6 +2263,20 @@ GetOrStartSimulationResponse = _reflection.GeneratedProtocolMessageType('GetOrSt
   })
 _sym_db.RegisterMessage(GetOrStartSimulationResponse)
 
+GetOrStartSimulationsRequest = _reflection.GeneratedProtocolMessageType('GetOrStartSimulationsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETORSTARTSIMULATIONSREQUEST,
+  '__module__' : 'TimelinesService_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.GetOrStartSimulationsRequest)
+  })
+_sym_db.RegisterMessage(GetOrStartSimulationsRequest)
+
+GetOrStartSimulationsResponse = _reflection.GeneratedProtocolMessageType('GetOrStartSimulationsResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETORSTARTSIMULATIONSRESPONSE,
+  '__module__' : 'TimelinesService_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.GetOrStartSimulationsResponse)
+  })
+_sym_db.RegisterMessage(GetOrStartSimulationsResponse)
+
 StopSimulationRequest = _reflection.GeneratedProtocolMessageType('StopSimulationRequest', (_message.Message,), {
   'DESCRIPTOR' : _STOPSIMULATIONREQUEST,
   '__module__' : 'TimelinesService_pb2'
@@ -1586,7 +2403,107 @@ GetTimelineDetailsResponse = _reflection.GeneratedProtocolMessageType('GetTimeli
   })
 _sym_db.RegisterMessage(GetTimelineDetailsResponse)
 
+TimelineNodeDetails = _reflection.GeneratedProtocolMessageType('TimelineNodeDetails', (_message.Message,), {
+  'DESCRIPTOR' : _TIMELINENODEDETAILS,
+  '__module__' : 'TimelinesService_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.TimelineNodeDetails)
+  })
+_sym_db.RegisterMessage(TimelineNodeDetails)
+
+GetTimelineDetailsBatchRequest = _reflection.GeneratedProtocolMessageType('GetTimelineDetailsBatchRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETTIMELINEDETAILSBATCHREQUEST,
+  '__module__' : 'TimelinesService_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.GetTimelineDetailsBatchRequest)
+  })
+_sym_db.RegisterMessage(GetTimelineDetailsBatchRequest)
+
+GetTimelineDetailsBatchResponse = _reflection.GeneratedProtocolMessageType('GetTimelineDetailsBatchResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETTIMELINEDETAILSBATCHRESPONSE,
+  '__module__' : 'TimelinesService_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.GetTimelineDetailsBatchResponse)
+  })
+_sym_db.RegisterMessage(GetTimelineDetailsBatchResponse)
+
+GetTimelineTreeRequest = _reflection.GeneratedProtocolMessageType('GetTimelineTreeRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETTIMELINETREEREQUEST,
+  '__module__' : 'TimelinesService_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.GetTimelineTreeRequest)
+  })
+_sym_db.RegisterMessage(GetTimelineTreeRequest)
+
+GetTimelineTreeResponse = _reflection.GeneratedProtocolMessageType('GetTimelineTreeResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETTIMELINETREERESPONSE,
+  '__module__' : 'TimelinesService_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.GetTimelineTreeResponse)
+  })
+_sym_db.RegisterMessage(GetTimelineTreeResponse)
+
+WatchProjectRequest = _reflection.GeneratedProtocolMessageType('WatchProjectRequest', (_message.Message,), {
+  'DESCRIPTOR' : _WATCHPROJECTREQUEST,
+  '__module__' : 'TimelinesService_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.WatchProjectRequest)
+  })
+_sym_db.RegisterMessage(WatchProjectRequest)
+
+ProjectChange = _reflection.GeneratedProtocolMessageType('ProjectChange', (_message.Message,), {
+  'DESCRIPTOR' : _PROJECTCHANGE,
+  '__module__' : 'TimelinesService_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.ProjectChange)
+  })
+_sym_db.RegisterMessage(ProjectChange)
+
+WatchProjectResponse = _reflection.GeneratedProtocolMessageType('WatchProjectResponse', (_message.Message,), {
+  'DESCRIPTOR' : _WATCHPROJECTRESPONSE,
+  '__module__' : 'TimelinesService_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.WatchProjectResponse)
+  })
+_sym_db.RegisterMessage(WatchProjectResponse)
+
+GetCacheStatsRequest = _reflection.GeneratedProtocolMessageType('GetCacheStatsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETCACHESTATSREQUEST,
+  '__module__' : 'TimelinesService_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.GetCacheStatsRequest)
+  })
+_sym_db.RegisterMessage(GetCacheStatsRequest)
+
+GetCacheStatsResponse = _reflection.GeneratedProtocolMessageType('GetCacheStatsResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETCACHESTATSRESPONSE,
+  '__module__' : 'TimelinesService_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.GetCacheStatsResponse)
+  })
+_sym_db.RegisterMessage(GetCacheStatsResponse)
+
+GetMetricsRequest = _reflection.GeneratedProtocolMessageType('GetMetricsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETMETRICSREQUEST,
+  '__module__' : 'TimelinesService_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.GetMetricsRequest)
+  })
+_sym_db.RegisterMessage(GetMetricsRequest)
+
+MetricSample = _reflection.GeneratedProtocolMessageType('MetricSample', (_message.Message,), {
+
+  'LabelsEntry' : _reflection.GeneratedProtocolMessageType('LabelsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _METRICSAMPLE_LABELSENTRY,
+    '__module__' : 'TimelinesService_pb2'
+    # @@protoc_insertion_point(class_scope:PyGridWorld.MetricSample.LabelsEntry)
+    })
+  ,
+  'DESCRIPTOR' : _METRICSAMPLE,
+  '__module__' : 'TimelinesService_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.MetricSample)
+  })
+_sym_db.RegisterMessage(MetricSample)
+_sym_db.RegisterMessage(MetricSample.LabelsEntry)
+
+GetMetricsResponse = _reflection.GeneratedProtocolMessageType('GetMetricsResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETMETRICSRESPONSE,
+  '__module__' : 'TimelinesService_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.GetMetricsResponse)
+  })
+_sym_db.RegisterMessage(GetMetricsResponse)
+
 
+_METRICSAMPLE_LABELSENTRY._options = None
 
 _TIMELINESERVICE = _descriptor.ServiceDescriptor(
   name='TimelineService',
@@ -1595,8 +2512,8 @@ _TIMELINESERVICE = _descriptor.ServiceDescriptor(
   index=0,
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=2323,
-  serialized_end=3809,
+  serialized_start=4001,
+  serialized_end=6081,
   methods=[
   _descriptor.MethodDescriptor(
     name='GetTimelines',
@@ -1658,10 +2575,20 @@ _TIMELINESERVICE = _descriptor.ServiceDescriptor(
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='GetOrStartSimulations',
+    full_name='PyGridWorld.TimelineService.GetOrStartSimulations',
+    index=6,
+    containing_service=None,
+    input_type=_GETORSTARTSIMULATIONSREQUEST,
+    output_type=_GETORSTARTSIMULATIONSRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
   _descriptor.MethodDescriptor(
     name='StopSimulation',
     full_name='PyGridWorld.TimelineService.StopSimulation',
-    index=6,
+    index=7,
     containing_service=None,
     input_type=_STOPSIMULATIONREQUEST,
     output_type=_STOPSIMULATIONRESPONSE,
@@ -1671,7 +2598,7 @@ _TIMELINESERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='MoveSimToTick',
     full_name='PyGridWorld.TimelineService.MoveSimToTick',
-    index=7,
+    index=8,
     containing_service=None,
     input_type=_MOVESIMTOTICKREQUEST,
     output_type=_MOVESIMTOTICKRESPONSE,
@@ -1681,7 +2608,7 @@ _TIMELINESERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='EditSimulation',
     full_name='PyGridWorld.TimelineService.EditSimulation',
-    index=8,
+    index=9,
     containing_service=None,
     input_type=_EDITSIMULATIONREQUEST,
     output_type=_EDITSIMULATIONRESPONSE,
@@ -1691,7 +2618,7 @@ _TIMELINESERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='ModifyTimelineTags',
     full_name='PyGridWorld.TimelineService.ModifyTimelineTags',
-    index=9,
+    index=10,
     containing_service=None,
     input_type=_MODIFYTIMELINETAGSREQUEST,
     output_type=_MODIFYTIMELINETAGSRESPONSE,
@@ -1701,7 +2628,7 @@ _TIMELINESERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='CreateTimeline',
     full_name='PyGridWorld.TimelineService.CreateTimeline',
-    index=10,
+    index=11,
     containing_service=None,
     input_type=_CREATETIMELINEREQUEST,
     output_type=_CREATETIMELINERESPONSE,
@@ -1711,7 +2638,7 @@ _TIMELINESERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='CloneTimeline',
     full_name='PyGridWorld.TimelineService.CloneTimeline',
-    index=11,
+    index=12,
     containing_service=None,
     input_type=_CLONETIMELINEREQUEST,
     output_type=_CLONETIMELINERESPONSE,
@@ -1721,7 +2648,7 @@ _TIMELINESERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='CreateTimelineFromSimulation',
     full_name='PyGridWorld.TimelineService.CreateTimelineFromSimulation',
-    index=12,
+    index=13,
     containing_service=None,
     input_type=_CREATETIMELINEFROMSIMULATIONREQUEST,
     output_type=_CREATETIMELINEFROMSIMULATIONRESPONSE,
@@ -1731,7 +2658,7 @@ _TIMELINESERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='DeleteTimeline',
     full_name='PyGridWorld.TimelineService.DeleteTimeline',
-    index=13,
+    index=14,
     containing_service=None,
     input_type=_DELETETIMELINEREQUEST,
     output_type=_DELETETIMELINERESPONSE,
@@ -1741,13 +2668,63 @@ _TIMELINESERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetTimelineDetails',
     full_name='PyGridWorld.TimelineService.GetTimelineDetails',
-    index=14,
+    index=15,
     containing_service=None,
     input_type=_GETTIMELINEDETAILSREQUEST,
     output_type=_GETTIMELINEDETAILSRESPONSE,
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='GetTimelineDetailsBatch',
+    full_name='PyGridWorld.TimelineService.GetTimelineDetailsBatch',
+    index=16,
+    containing_service=None,
+    input_type=_GETTIMELINEDETAILSBATCHREQUEST,
+    output_type=_GETTIMELINEDETAILSBATCHRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetTimelineTree',
+    full_name='PyGridWorld.TimelineService.GetTimelineTree',
+    index=17,
+    containing_service=None,
+    input_type=_GETTIMELINETREEREQUEST,
+    output_type=_GETTIMELINETREERESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='WatchProject',
+    full_name='PyGridWorld.TimelineService.WatchProject',
+    index=18,
+    containing_service=None,
+    input_type=_WATCHPROJECTREQUEST,
+    output_type=_WATCHPROJECTRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetCacheStats',
+    full_name='PyGridWorld.TimelineService.GetCacheStats',
+    index=19,
+    containing_service=None,
+    input_type=_GETCACHESTATSREQUEST,
+    output_type=_GETCACHESTATSRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetMetrics',
+    full_name='PyGridWorld.TimelineService.GetMetrics',
+    index=20,
+    containing_service=None,
+    input_type=_GETMETRICSREQUEST,
+    output_type=_GETMETRICSRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_TIMELINESERVICE)
 
@@ -8,6 +8,9 @@ import TimelinesService_pb2 as TimelinesService__pb2
 class TimelineServiceStub(object):
     """python -m grpc_tools.protoc -I./protos --python_out=. --grpc_python_out=. ./protos/TimelinesService.proto
 
+    The responses of GetTimelineData, GetTimelineJson and GetTimelineEvents are compressed with the algorithm
+    named by the call's x-response-compression metadata: gzip, deflate or none.
+
     """
 
     def __init__(self, channel):
@@ -46,6 +49,11 @@ class TimelineServiceStub(object):
                 request_serializer=TimelinesService__pb2.GetOrStartSimulationRequest.SerializeToString,
                 response_deserializer=TimelinesService__pb2.GetOrStartSimulationResponse.FromString,
                 )
+        self.GetOrStartSimulations = channel.unary_stream(
+                '/PyGridWorld.TimelineService/GetOrStartSimulations',
+                request_serializer=TimelinesService__pb2.GetOrStartSimulationsRequest.SerializeToString,
+                response_deserializer=TimelinesService__pb2.GetOrStartSimulationsResponse.FromString,
+                )
         self.StopSimulation = channel.unary_unary(
                 '/PyGridWorld.TimelineService/StopSimulation',
                 request_serializer=TimelinesService__pb2.StopSimulationRequest.SerializeToString,
@@ -91,11 +99,39 @@ class TimelineServiceStub(object):
                 request_serializer=TimelinesService__pb2.GetTimelineDetailsRequest.SerializeToString,
                 response_deserializer=TimelinesService__pb2.GetTimelineDetailsResponse.FromString,
                 )
+        self.GetTimelineDetailsBatch = channel.unary_unary(
+                '/PyGridWorld.TimelineService/GetTimelineDetailsBatch',
+                request_serializer=TimelinesService__pb2.GetTimelineDetailsBatchRequest.SerializeToString,
+                response_deserializer=TimelinesService__pb2.GetTimelineDetailsBatchResponse.FromString,
+                )
+        self.GetTimelineTree = channel.unary_stream(
+                '/PyGridWorld.TimelineService/GetTimelineTree',
+                request_serializer=TimelinesService__pb2.GetTimelineTreeRequest.SerializeToString,
+                response_deserializer=TimelinesService__pb2.GetTimelineTreeResponse.FromString,
+                )
+        self.WatchProject = channel.unary_stream(
+                '/PyGridWorld.TimelineService/WatchProject',
+                request_serializer=TimelinesService__pb2.WatchProjectRequest.SerializeToString,
+                response_deserializer=TimelinesService__pb2.WatchProjectResponse.FromString,
+                )
+        self.GetCacheStats = channel.unary_unary(
+                '/PyGridWorld.TimelineService/GetCacheStats',
+                request_serializer=TimelinesService__pb2.GetCacheStatsRequest.SerializeToString,
+                response_deserializer=TimelinesService__pb2.GetCacheStatsResponse.FromString,
+                )
+        self.GetMetrics = channel.unary_unary(
+                '/PyGridWorld.TimelineService/GetMetrics',
+                request_serializer=TimelinesService__pb2.GetMetricsRequest.SerializeToString,
+                response_deserializer=TimelinesService__pb2.GetMetricsResponse.FromString,
+                )
 
 
 class TimelineServiceServicer(object):
     """python -m grpc_tools.protoc -I./protos --python_out=. --grpc_python_out=. ./protos/TimelinesService.proto
 
+    The responses of GetTimelineData, GetTimelineJson and GetTimelineEvents are compressed with the algorithm
+    named by the call's x-response-compression metadata: gzip, deflate or none.
+
     """
 
     def GetTimelines(self, request, context):
@@ -134,6 +170,12 @@ class TimelineServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetOrStartSimulations(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def StopSimulation(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -188,6 +230,36 @@ class TimelineServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetTimelineDetailsBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetTimelineTree(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WatchProject(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetCacheStats(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetMetrics(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_TimelineServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -221,6 +293,11 @@ def add_TimelineServiceServicer_to_server(servicer, server):
                     request_deserializer=TimelinesService__pb2.GetOrStartSimulationRequest.FromString,
                     response_serializer=TimelinesService__pb2.GetOrStartSimulationResponse.SerializeToString,
             ),
+            'GetOrStartSimulations': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetOrStartSimulations,
+                    request_deserializer=TimelinesService__pb2.GetOrStartSimulationsRequest.FromString,
+                    response_serializer=TimelinesService__pb2.GetOrStartSimulationsResponse.SerializeToString,
+            ),
             'StopSimulation': grpc.unary_unary_rpc_method_handler(
                     servicer.StopSimulation,
                     request_deserializer=TimelinesService__pb2.StopSimulationRequest.FromString,
@@ -266,6 +343,31 @@ def add_TimelineServiceServicer_to_server(servicer, server):
                     request_deserializer=TimelinesService__pb2.GetTimelineDetailsRequest.FromString,
                     response_serializer=TimelinesService__pb2.GetTimelineDetailsResponse.SerializeToString,
             ),
+            'GetTimelineDetailsBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetTimelineDetailsBatch,
+                    request_deserializer=TimelinesService__pb2.GetTimelineDetailsBatchRequest.FromString,
+                    response_serializer=TimelinesService__pb2.GetTimelineDetailsBatchResponse.SerializeToString,
+            ),
+            'GetTimelineTree': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetTimelineTree,
+                    request_deserializer=TimelinesService__pb2.GetTimelineTreeRequest.FromString,
+                    response_serializer=TimelinesService__pb2.GetTimelineTreeResponse.SerializeToString,
+            ),
+            'WatchProject': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchProject,
+                    request_deserializer=TimelinesService__pb2.WatchProjectRequest.FromString,
+                    response_serializer=TimelinesService__pb2.WatchProjectResponse.SerializeToString,
+            ),
+            'GetCacheStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetCacheStats,
+                    request_deserializer=TimelinesService__pb2.GetCacheStatsRequest.FromString,
+                    response_serializer=TimelinesService__pb2.GetCacheStatsResponse.SerializeToString,
+            ),
+            'GetMetrics': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetMetrics,
+                    request_deserializer=TimelinesService__pb2.GetMetricsRequest.FromString,
+                    response_serializer=TimelinesService__pb2.GetMetricsResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'PyGridWorld.TimelineService', rpc_method_handlers)
@@ -276,6 +378,9 @@ def add_TimelineServiceServicer_to_server(servicer, server):
 class TimelineService(object):
     """python -m grpc_tools.protoc -I./protos --python_out=. --grpc_python_out=. ./protos/TimelinesService.proto
 
+    The responses of GetTimelineData, GetTimelineJson and GetTimelineEvents are compressed with the algorithm
+    named by the call's x-response-compression metadata: gzip, deflate or none.
+
     """
 
     @staticmethod
@@ -380,6 +485,23 @@ class TimelineService(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def GetOrStartSimulations(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/PyGridWorld.TimelineService/GetOrStartSimulations',
+            TimelinesService__pb2.GetOrStartSimulationsRequest.SerializeToString,
+            TimelinesService__pb2.GetOrStartSimulationsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def StopSimulation(request,
             target,
@@ -532,3 +654,88 @@ class TimelineService(object):
             TimelinesService__pb2.GetTimelineDetailsResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetTimelineDetailsBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/PyGridWorld.TimelineService/GetTimelineDetailsBatch',
+            TimelinesService__pb2.GetTimelineDetailsBatchRequest.SerializeToString,
+            TimelinesService__pb2.GetTimelineDetailsBatchResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetTimelineTree(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/PyGridWorld.TimelineService/GetTimelineTree',
+            TimelinesService__pb2.GetTimelineTreeRequest.SerializeToString,
+            TimelinesService__pb2.GetTimelineTreeResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def WatchProject(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/PyGridWorld.TimelineService/WatchProject',
+            TimelinesService__pb2.WatchProjectRequest.SerializeToString,
+            TimelinesService__pb2.WatchProjectResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetCacheStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/PyGridWorld.TimelineService/GetCacheStats',
+            TimelinesService__pb2.GetCacheStatsRequest.SerializeToString,
+            TimelinesService__pb2.GetCacheStatsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetMetrics(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/PyGridWorld.TimelineService/GetMetrics',
+            TimelinesService__pb2.GetMetricsRequest.SerializeToString,
+            TimelinesService__pb2.GetMetricsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
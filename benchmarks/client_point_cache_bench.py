@@ -0,0 +1,92 @@
+"""
+Measures pulling a timeline's point data through ts_client with and without a ClientPointCache: without a
+cache, with a cold cache that stores what is fetched, and with a warm cache as in a later analysis session.
+
+A throwaway project is created with one timeline of --points random points of --point-size bytes each, and
+served by an AsyncServer in another process.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import SimulationManager as sm
+from point_cache import ClientPointCache
+from ts_client import Client
+from ts_server import AsyncServer
+
+
+def make_project(project_dir, args):
+    project = sm.TimelinesProject.create_new_project(project_dir)
+    try:
+        project.timelines_dir_path.mkdir(exist_ok=True)
+        project.simulation_registry_path.mkdir(exist_ok=True)
+        node = project.create_timeline()
+        for tick in range(args.points):
+            node.timeline.get_point_file_path(tick).write_bytes(os.urandom(args.point_size))
+        return node.timeline_id
+    finally:
+        project.close()
+
+
+def serve(project_dir):
+    project = sm.TimelinesProject.load_project(project_dir)
+    server = AsyncServer(project, 'localhost:0')
+    server.start()
+    print(server.port, flush=True)
+    try:
+        sys.stdin.read()
+    finally:
+        server.stop()
+        project.close()
+
+
+def pull(address, timeline_id, cache=None):
+    with Client(address, cache=cache) as client:
+        start = perf_counter()
+        size = sum(len(data) for _, data in client.get_timeline_data(timeline_id, start_tick=0))
+        return size, perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--points', type=int, default=500, help='Points in the timeline.')
+    parser.add_argument('--point-size', type=int, default=256 * 1024, help='Bytes in each point.')
+    parser.add_argument('--serve', metavar='PROJECT', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve is not None:
+        serve(args.serve)
+        return
+
+    with tempfile.TemporaryDirectory(prefix='gw') as temp_dir:
+        project_dir = Path(temp_dir) / 'project'
+        timeline_id = make_project(project_dir, args)
+
+        server = subprocess.Popen([sys.executable, __file__, '--serve', str(project_dir)],
+                                  stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        cache = ClientPointCache(Path(temp_dir) / 'client_cache' / 'points.db')
+        try:
+            address = f'localhost:{int(server.stdout.readline())}'
+            results = [('no cache', pull(address, timeline_id)),
+                       ('cold cache', pull(address, timeline_id, cache)),
+                       ('warm cache', pull(address, timeline_id, cache))]
+        finally:
+            cache.close()
+            server.stdin.close()
+            server.wait()
+
+    print(f"{args.points} points of {args.point_size} bytes")
+    print(f"{'pull':<12}{'seconds':>9}{'MB/s':>9}")
+    for name, (size, seconds) in results:
+        print(f"{name:<12}{seconds:9.2f}{size / 1e6 / seconds:9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Measures calls per second of SimulationClient (sequential calls) and AsyncSimulationClient
+(concurrent calls with asyncio.gather), using get_component_json.
+
+By default, calls are made against a small in-process server that answers GetComponentJson
+with a fixed component, so the numbers measure client and transport overhead only.
+Pass --address and --token to benchmark against a running simulation server instead.
+"""
+import argparse
+import asyncio
+import sys
+from concurrent import futures
+from pathlib import Path
+from time import perf_counter
+
+import grpc
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import simulation_pb2 as sim
+import simulation_pb2_grpc as sim_grpc
+from simrunner import SimulationClient, AsyncSimulationClient
+
+
+class _ComponentServicer(sim_grpc.SimulationServicer):
+    def GetComponentJson(self, request, context):
+        return sim.GetComponentJsonResponse(json='{"x": 1, "y": 2}', tick=0)
+
+
+def start_local_server():
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=8))
+    sim_grpc.add_SimulationServicer_to_server(_ComponentServicer(), server)
+    port = server.add_insecure_port('localhost:0')
+    server.start()
+    return server, f'localhost:{port}'
+
+
+def bench_sync(address, token, eids, component, rounds):
+    channel = SimulationClient.make_channel(address)
+    client = SimulationClient(channel, token)
+    try:
+        client.get_component_json(eids[0], component)
+
+        start = perf_counter()
+        for _ in range(rounds):
+            for eid in eids:
+                client.get_component_json(eid, component)
+        elapsed = perf_counter() - start
+    finally:
+        channel.close()
+
+    return rounds * len(eids) / elapsed
+
+
+async def bench_async(address, token, eids, component, rounds):
+    async with AsyncSimulationClient(AsyncSimulationClient.make_channel(address), token) as client:
+        await client.get_component_json(eids[0], component)
+
+        start = perf_counter()
+        for _ in range(rounds):
+            await asyncio.gather(*(client.get_component_json(eid, component) for eid in eids))
+        elapsed = perf_counter() - start
+
+    return rounds * len(eids) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--address', help='Address of a running simulation server. A local server is used if omitted.')
+    parser.add_argument('--token', default='', help='User token to make calls with.')
+    parser.add_argument('--entities', type=int, default=200, help='Entities inspected per round.')
+    parser.add_argument('--component', default='Position', help='Component to inspect.')
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    server = None
+    address = args.address
+    if address is None:
+        server, address = start_local_server()
+
+    eids = list(range(args.entities))
+
+    try:
+        sync_rate = bench_sync(address, args.token, eids, args.component, args.rounds)
+        async_rate = asyncio.run(bench_async(address, args.token, eids, args.component, args.rounds))
+    finally:
+        if server is not None:
+            server.stop(0)
+
+    print(f"SimulationClient:      {sync_rate:10.0f} calls/sec")
+    print(f"AsyncSimulationClient: {async_rate:10.0f} calls/sec ({async_rate / sync_rate:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
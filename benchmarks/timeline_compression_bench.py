@@ -0,0 +1,200 @@
+"""
+Measures the throughput and CPU cost of pulling a timeline through ts_client with each response compression
+option, for point binaries through GetTimelineData and point JSON through GetTimelineJson.
+
+A throwaway project is created with --points synthetic points of --entities entities each, with their JSON
+already in the point JSON cache. The client talks to an in-process timeline server through a proxy that
+counts the bytes sent back, so the CPU time covers both compressing and decompressing, and the wire size is
+what actually crossed the connection. The transfer time over a --link-mbps link is estimated from the wire
+size, since the loopback connection itself is not the bottleneck.
+"""
+import argparse
+import json
+import random
+import socket
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from threading import Thread
+from time import perf_counter, process_time
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import SimulationManager as sm
+from ts_client import Client
+from ts_server import Server
+
+COMPONENT_NAMES = ['Position', 'Velocity', 'Health', 'Inventory', 'Brain']
+
+
+class CountingProxy:
+    """
+    Forwards connections to a local port, counting the bytes sent back to the client.
+    """
+    def __init__(self, target_port):
+        self._target_port = target_port
+        self._listener = socket.create_server(('localhost', 0))
+        self.port = self._listener.getsockname()[1]
+        self.received_bytes = 0
+        Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                connection, _ = self._listener.accept()
+            except OSError:
+                return
+            upstream = socket.create_connection(('localhost', self._target_port))
+            Thread(target=self._pipe, args=(connection, upstream, False), daemon=True).start()
+            Thread(target=self._pipe, args=(upstream, connection, True), daemon=True).start()
+
+    def _pipe(self, source, destination, count):
+        try:
+            data = source.recv(1 << 16)
+            while data:
+                if count:
+                    self.received_bytes += len(data)
+                destination.sendall(data)
+                data = source.recv(1 << 16)
+        except OSError:
+            pass
+        finally:
+            try:
+                destination.shutdown(socket.SHUT_WR)
+            except OSError:
+                pass
+
+    def close(self):
+        self._listener.close()
+
+
+def make_entities(rng, count):
+    entities = []
+    for eid in range(count):
+        components = {'Position': {'x': rng.randrange(256), 'y': rng.randrange(256)}}
+        for name in rng.sample(COMPONENT_NAMES[1:], rng.randrange(len(COMPONENT_NAMES))):
+            components[name] = {'value': rng.randrange(1000), 'label': f'{name.lower()}-{rng.randrange(64)}'}
+        entities.append((eid, components))
+    return entities
+
+
+def make_point_binary(entities):
+    data = bytearray()
+    for eid, components in entities:
+        position = components['Position']
+        data += struct.pack('<QHHB', eid, position['x'], position['y'], len(components))
+        for name, component in components.items():
+            if name != 'Position':
+                label = component['label'].encode()
+                data += struct.pack('<BIB', COMPONENT_NAMES.index(name), component['value'], len(label)) + label
+    return bytes(data)
+
+
+def make_point_json(tick, entities):
+    return json.dumps({'tick': tick,
+                       'entities': [{'id': eid, 'components': components} for eid, components in entities]})
+
+
+def make_project(project_dir, args):
+    project = sm.TimelinesProject.create_new_project(project_dir)
+    project.timelines_dir_path.mkdir(exist_ok=True)
+    project.simulation_registry_path.mkdir(exist_ok=True)
+
+    binary_path = project_dir / 'bench_simulation.bin'
+    binary_path.write_bytes(b'bench')
+    source_path = project_dir / 'bench_source.json'
+    source_path.write_text(json.dumps({'name': 'bench', 'binary': binary_path.name,
+                                       'archive_method': sm.SimulationSource.AM_GIT_ARCHIVE_WORKING}))
+
+    node = project.create_timeline()
+    timeline = node.timeline
+    # the JSON is never converted, so the source only needs to provide the binary the cache entries are keyed by
+    timeline.simulation_binary_provider = sm.SimulationSource(source_path)
+
+    rng = random.Random(0)
+    entities = make_entities(rng, args.entities)
+    for tick in range(0, args.points * 100, 100):
+        for _ in range(args.entities // 20):
+            eid, components = rng.choice(entities)
+            components['Position'] = {'x': rng.randrange(256), 'y': rng.randrange(256)}
+
+        point_file_path = timeline.get_point_file_path(tick)
+        point_file_path.write_bytes(make_point_binary(entities))
+        point_json = make_point_json(tick, entities)
+        project.point_json_cache.get_or_convert(point_file_path, binary_path, lambda: point_json, node.timeline_id)
+    timeline.refresh_tick_list()
+
+    return project, node.timeline_id
+
+
+def measure(proxy, pull):
+    proxy.received_bytes = 0
+    start = perf_counter()
+    cpu_start = process_time()
+    payload_bytes = pull()
+    return {
+        'payload': payload_bytes,
+        'wire': proxy.received_bytes,
+        'seconds': perf_counter() - start,
+        'cpu': process_time() - cpu_start,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--points', type=int, default=200, help='Points in the timeline.')
+    parser.add_argument('--entities', type=int, default=2000, help='Entities in each point.')
+    parser.add_argument('--link-mbps', type=float, default=100.0, help='Link speed for the transfer time estimate.')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='gw') as temp_dir:
+        project, timeline_id = make_project(Path(temp_dir) / 'project', args)
+        server = Server(project, 'localhost:0')
+        server.start()
+        proxy = CountingProxy(server.port)
+        client = Client(f'localhost:{proxy.port}')
+        client.open()
+
+        def pull_data(compression):
+            points = client.get_timeline_data(timeline_id, start_tick=0, compression=compression)
+            return sum(len(data) for _, data in points)
+
+        def pull_json(compression, compressed_json=False):
+            points = client.get_timeline_json(timeline_id, start_tick=0, compression=compression,
+                                              compressed_json=compressed_json)
+            return sum(len(point_json) for _, point_json in points)
+
+        cases = []
+        for compression in ('none', 'deflate', 'gzip'):
+            cases.append(('binary', compression, lambda c=compression: pull_data(c)))
+        for compression in ('none', 'deflate', 'gzip'):
+            cases.append(('json', compression, lambda c=compression: pull_json(c)))
+        cases.append(('json', 'cached zlib', lambda: pull_json('none', compressed_json=True)))
+
+        try:
+            results = []
+            for workload, compression, pull in cases:
+                pull()
+                results.append((workload, compression, measure(proxy, pull)))
+        finally:
+            client.close()
+            proxy.close()
+            server.stop()
+            project.close()
+
+    link_bytes_per_second = args.link_mbps * 1e6 / 8
+    print(f"{args.points} points of {args.entities} entities, transfer estimated at {args.link_mbps:g} Mbit/s")
+    print(f"{'workload':<9}{'compression':<13}{'payload MB':>11}{'wire MB':>9}{'ratio':>7}{'MB/s':>8}"
+          f"{'CPU ms/MB':>11}{'link s':>8}")
+    for workload, compression, result in results:
+        payload_mb = result['payload'] / 1e6
+        link_seconds = max(result['seconds'], result['wire'] / link_bytes_per_second)
+        print(f"{workload:<9}{compression:<13}{payload_mb:11.1f}{result['wire'] / 1e6:9.1f}"
+              f"{result['payload'] / result['wire']:7.2f}{payload_mb / result['seconds']:8.1f}"
+              f"{result['cpu'] * 1000 / payload_mb:11.1f}{link_seconds:8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+Compares stepping through a timeline's point JSON with get_timeline_json, parsing each point before the next is
+read, against prefetch_timeline_json, which fetches the next points while the current ones are parsed.
+
+A throwaway project is created with two identical timelines of --points points, each with --entities entities,
+and served by an AsyncServer in another process. Each iteration reads one of them, so the server converts every
+point to JSON as it is read. Points are parsed with json.loads, in --parse-processes processes if given.
+Use --latency-ms to add a round trip time to every response.
+"""
+import argparse
+import json
+import random
+import zlib
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import SimulationManager as sm
+from simrunner import SimulationProcess
+from ts_client import Client
+from timeline_sweep_fetch import LatencyProxy, serve
+
+
+def make_point(rng, tick, entity_count):
+    """
+    :return: A point in the stand-in simulation's binary format, zlib compressed state JSON.
+    """
+    state = {'tick': tick,
+             'next_eid': entity_count,
+             'entities': {str(eid): {'Position': {'x': rng.randrange(256), 'y': rng.randrange(256)},
+                                     'Health': {'value': rng.randrange(1000)}}
+                          for eid in range(entity_count)},
+             'singletons': {}}
+    return zlib.compress(json.dumps(state).encode('utf-8'))
+
+
+def make_project(project_dir, args):
+    project = sm.TimelinesProject.create_new_project(project_dir)
+    try:
+        project.timelines_dir_path.mkdir(exist_ok=True)
+        project.simulation_registry_path.mkdir(exist_ok=True)
+
+        # the stand-in server ignores the simulation binary, it only has to exist
+        binary_path = project_dir / 'bench_simulation.bin'
+        binary_path.write_bytes(b'bench')
+        source_path = project_dir / 'bench_source.json'
+        source_path.write_text(json.dumps({'name': 'bench', 'binary': binary_path.name,
+                                           'archive_method': sm.SimulationSource.AM_GIT_ARCHIVE_WORKING}))
+        project.add_simulation_source_path(source_path)
+
+        source = sm.SimulationSource(source_path)
+
+        rng = random.Random(0)
+        points = {tick: make_point(rng, tick, args.entities) for tick in range(0, args.points * 100, 100)}
+        timeline_ids = []
+        for _ in range(2):
+            node = project.create_timeline()
+            project.change_timeline_simulation_provider(node.timeline_id, source)
+            for tick, point in points.items():
+                node.timeline.get_point_file_path(tick).write_bytes(point)
+            timeline_ids.append(node.timeline_id)
+        return timeline_ids
+    finally:
+        project.close()
+
+
+def step_through(client, timeline_id):
+    start = perf_counter()
+    for _, point_json in client.get_timeline_json(timeline_id, start_tick=0):
+        json.loads(point_json)
+    return perf_counter() - start
+
+
+def prefetch(client, timeline_id, args, parse_executor):
+    start = perf_counter()
+    with client.prefetch_timeline_json(timeline_id, start_tick=0, ahead=args.ahead, chunk_size=args.chunk_size,
+                                       parse=json.loads, parse_executor=parse_executor) as points:
+        for _ in points:
+            pass
+    return perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--points', type=int, default=200, help='Points in the timeline.')
+    parser.add_argument('--entities', type=int, default=5000, help='Entities in each point.')
+    parser.add_argument('--ahead', type=int, default=4, help='Requests the prefetcher keeps in flight.')
+    parser.add_argument('--chunk-size', type=int, default=4, help='Ticks fetched by each prefetch request.')
+    parser.add_argument('--parse-processes', type=int, default=0, help='Processes to parse the JSON in.')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Round trip time added to every response.')
+    parser.add_argument('--serve', metavar='PROJECT', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # gives the timelines their simulation when creating the project, and converts their points in the server
+    SimulationProcess.set_simulation_server_command([sys.executable, str(ROOT / 'sim_standin.py')])
+
+    if args.serve is not None:
+        serve(args.serve)
+        return
+
+    with tempfile.TemporaryDirectory(prefix='gw') as temp_dir:
+        project_dir = Path(temp_dir) / 'project'
+        step_timeline_id, prefetch_timeline_id = make_project(project_dir, args)
+
+        server = subprocess.Popen([sys.executable, __file__, '--serve', str(project_dir)],
+                                  stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        proxy = None
+        parse_executor = ProcessPoolExecutor(args.parse_processes) if args.parse_processes else None
+        try:
+            port = int(server.stdout.readline())
+            if args.latency_ms:
+                proxy = LatencyProxy(port, args.latency_ms / 1000)
+                port = proxy.port
+
+            with Client(f'localhost:{port}') as client:
+                results = [('get_timeline_json', step_through(client, step_timeline_id)),
+                           ('prefetch_timeline_json', prefetch(client, prefetch_timeline_id, args, parse_executor))]
+        finally:
+            if parse_executor is not None:
+                parse_executor.shutdown()
+            if proxy is not None:
+                proxy.close()
+            server.stdin.close()
+            server.wait()
+
+    print(f"{args.points} points of {args.entities} entities, {args.latency_ms:g}ms added round trip time, "
+          f"{args.parse_processes or 'no'} parse processes")
+    print(f"{'iteration':<24}{'seconds':>9}{'points/sec':>12}")
+    for name, seconds in results:
+        print(f"{name:<24}{seconds:9.2f}{args.points / seconds:12.1f}")
+
+
+if __name__ == '__main__':
+    main()
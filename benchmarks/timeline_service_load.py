@@ -0,0 +1,179 @@
+"""
+Compares the latency of GetTimelineDetails on the threaded and the grpc.aio timeline servers while many
+long-lived GetTimelineData streams are held open by clients that have stopped reading.
+
+A throwaway project is created with one timeline whose point is --point-size bytes, and each server is run
+in its own process. --streams streams are opened, each reading a single response before stalling, which
+leaves the server with a response it cannot send. GetTimelineDetails is then called --calls times, and
+calls that take longer than --deadline seconds are counted as timed out.
+
+The servers admit every call by default, to measure how each server copes on its own. With --admission they
+use the default admission budgets instead, which refuse most of the streams and keep the interactive calls fast.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+import grpc
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import SimulationManager as sm
+import TimelinesService_pb2 as ts
+import TimelinesService_pb2_grpc as ts_grpc
+from ts_server import AsyncServer, Server, AdmissionPolicy
+
+STREAMS_PER_CHANNEL = 10
+
+
+def make_project(project_dir, point_size):
+    project = sm.TimelinesProject.create_new_project(project_dir)
+    try:
+        project.timelines_dir_path.mkdir(exist_ok=True)
+        project.simulation_registry_path.mkdir(exist_ok=True)
+        node = project.create_timeline()
+        with node.head_point().point_file_path().open('wb') as point_file:
+            point_file.write(os.urandom(point_size))
+        return node.timeline_id
+    finally:
+        project.close()
+
+
+def serve(kind, project_dir, admission):
+    project = sm.TimelinesProject.load_project(project_dir)
+    admission = AdmissionPolicy() if admission else None
+    server_type = AsyncServer if kind == 'async' else Server
+    server = server_type(project, 'localhost:0', admission=admission)
+    server.start()
+    print(server.port, flush=True)
+    try:
+        sys.stdin.read()
+    finally:
+        server.stop()
+        project.close()
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+async def run_load(port, timeline_id, args):
+    address = f'localhost:{port}'
+    stream_channels = [grpc.aio.insecure_channel(address)
+                       for _ in range((args.streams + STREAMS_PER_CHANNEL - 1) // STREAMS_PER_CHANNEL)]
+    probe_channel = grpc.aio.insecure_channel(address)
+    probe = ts_grpc.TimelineServiceStub(probe_channel)
+
+    request = ts.GetTimelineDetailsRequest(timeline_id=timeline_id)
+    await probe.GetTimelineDetails(request)
+
+    async def open_stream(i):
+        stub = ts_grpc.TimelineServiceStub(stream_channels[i // STREAMS_PER_CHANNEL])
+        call = stub.GetTimelineData(ts.TimelineDataRequest(timeline_id=timeline_id,
+                                                           tick_list=ts.TickList(ticks=[0] * args.ticks)))
+        try:
+            await asyncio.wait_for(call.read(), args.open_timeout)
+            return call, 'serving'
+        except asyncio.TimeoutError:
+            return call, 'stalled'
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.RESOURCE_EXHAUSTED:
+                raise
+            return call, 'refused'
+
+    opened = await asyncio.gather(*(open_stream(i) for i in range(args.streams)))
+    calls = [call for call, _ in opened]
+    serving = sum(1 for _, state in opened if state == 'serving')
+    refused = sum(1 for _, state in opened if state == 'refused')
+
+    latencies = []
+    timeouts = 0
+    for _ in range(args.calls):
+        start = perf_counter()
+        try:
+            await probe.GetTimelineDetails(request, timeout=args.deadline)
+            latencies.append(perf_counter() - start)
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.DEADLINE_EXCEEDED:
+                raise
+            timeouts += 1
+            latencies.append(args.deadline)
+
+    for call in calls:
+        call.cancel()
+    for channel in stream_channels:
+        await channel.close()
+    await probe_channel.close()
+
+    return {
+        'serving': serving,
+        'refused': refused,
+        'p50': statistics.median(latencies) * 1000,
+        'p99': percentile(latencies, 0.99) * 1000,
+        'max': max(latencies) * 1000,
+        'timeouts': timeouts,
+    }
+
+
+async def bench_server(kind, project_dir, timeline_id, args):
+    command = [sys.executable, __file__, '--serve', kind, str(project_dir)]
+    if args.admission:
+        command.append('--admission')
+    server = subprocess.Popen(command,
+                              stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    try:
+        port = int(server.stdout.readline())
+        return await run_load(port, timeline_id, args)
+    finally:
+        server.stdin.close()
+        try:
+            server.wait(10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+            server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--streams', type=int, default=200, help='Stalled GetTimelineData streams held open.')
+    parser.add_argument('--ticks', type=int, default=1000, help='Ticks requested by each stream.')
+    parser.add_argument('--point-size', type=int, default=64 * 1024, help='Bytes in the streamed point.')
+    parser.add_argument('--calls', type=int, default=100, help='GetTimelineDetails calls timed per server.')
+    parser.add_argument('--deadline', type=float, default=1.0, help='Seconds before a call is counted as timed out.')
+    parser.add_argument('--open-timeout', type=float, default=10.0,
+                        help='Seconds to wait for the first response of each stream.')
+    parser.add_argument('--admission', action='store_true', help='Serve with the default admission budgets.')
+    parser.add_argument('--serve', nargs=2, metavar=('KIND', 'PROJECT'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve is not None:
+        serve(*args.serve, args.admission)
+        return
+
+    with tempfile.TemporaryDirectory(prefix='gw') as temp_dir:
+        project_dir = Path(temp_dir) / 'project'
+        timeline_id = make_project(project_dir, args.point_size)
+
+        async def bench_servers():
+            # one event loop for both, grpc.aio does not shut down cleanly between loops
+            return {kind: await bench_server(kind, project_dir, timeline_id, args) for kind in ('sync', 'async')}
+
+        results = asyncio.run(bench_servers())
+
+    print(f"{args.streams} stalled streams, {args.calls} GetTimelineDetails calls, {args.deadline}s deadline")
+    print(f"{'server':<8}{'serving':>9}{'refused':>9}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}{'timeouts':>10}")
+    for kind, result in results.items():
+        print(f"{kind:<8}{result['serving']:>9}{result['refused']:>9}{result['p50']:10.2f}{result['p99']:10.2f}"
+              f"{result['max']:10.2f}{result['timeouts']:>10}")
+
+
+if __name__ == '__main__':
+    main()
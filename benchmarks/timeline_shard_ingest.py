@@ -0,0 +1,117 @@
+"""
+Measures how the rate simulation events are ingested into timeline event databases scales with the number of
+worker processes of a sharded timeline service (ts_shard.ShardedServer).
+
+For each worker count in --workers, a throwaway project is created with --simulations timelines, which are
+spread over the workers by their ids. Every simulation is started through the router and run on the stand-in
+server, publishing --events-per-tick events every tick as fast as it can. The events ingested by all workers
+over --seconds seconds are read from the timeline_events_ingested counters in GetMetrics.
+
+Scaling needs spare cores: every worker and every simulation server is a process of its own. It has only been
+run on a single core so far, where 2 workers ingested at 0.78x the rate of 1, so the scaling is unverified.
+"""
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter, sleep
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import SimulationManager as sm
+from simrunner import SimulationProcess, SimulationClient
+from ts_client import Client
+from ts_shard import ShardedServer
+
+
+def make_project(project_dir, simulation_count):
+    project = sm.TimelinesProject.create_new_project(project_dir)
+    try:
+        project.timelines_dir_path.mkdir(exist_ok=True)
+        project.simulation_registry_path.mkdir(exist_ok=True)
+
+        # the stand-in server ignores the simulation binary, it only has to exist
+        binary_path = project_dir / 'bench_simulation.bin'
+        binary_path.write_bytes(b'bench')
+        source_path = project_dir / 'bench_source.json'
+        source_path.write_text(json.dumps({'name': 'bench', 'binary': binary_path.name,
+                                           'archive_method': sm.SimulationSource.AM_GIT_ARCHIVE_WORKING}))
+        project.add_simulation_source_path(source_path)
+        source = sm.SimulationSource(source_path)
+
+        for _ in range(simulation_count):
+            node = project.create_timeline()
+            project.change_timeline_simulation_provider(node.timeline_id, source)
+    finally:
+        project.close()
+
+
+def events_ingested(client):
+    return sum(sample.value for sample in client.get_metrics() if sample.name == 'timeline_events_ingested_total')
+
+
+def bench_workers(worker_count, server_command, args):
+    with tempfile.TemporaryDirectory(prefix='gw') as temp_dir:
+        project_dir = Path(temp_dir) / 'project'
+        make_project(project_dir, args.simulations)
+
+        server = ShardedServer(project_dir, 'localhost:0', worker_count, server_command)
+        server.start()
+        simulation_clients = []
+        try:
+            with Client(f'localhost:{server.port}') as client:
+                timeline_ids = client.get_timelines()
+                for started in client.get_or_start_simulations(timeline_ids):
+                    if started.error is not None:
+                        raise RuntimeError(f"Could not start simulation {started.timeline_id}: {started.error}")
+                    simulation_client = SimulationClient(SimulationClient.make_channel(started.address),
+                                                         started.token)
+                    simulation_clients.append(simulation_client)
+
+                for simulation_client in simulation_clients:
+                    simulation_client.start_simulation()
+                sleep(args.warmup)
+
+                start_count = events_ingested(client)
+                start = perf_counter()
+                sleep(args.seconds)
+                ingested = events_ingested(client) - start_count
+                elapsed = perf_counter() - start
+
+                for simulation_client in simulation_clients:
+                    simulation_client.stop_simulation()
+                for timeline_id in timeline_ids:
+                    client.stop_simulation(timeline_id)
+        finally:
+            server.stop()
+
+    return ingested / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', default='1,2,4', help='Comma separated worker counts to measure.')
+    parser.add_argument('--simulations', type=int, default=8, help='Simulations running at once.')
+    parser.add_argument('--events-per-tick', type=int, default=20, help='Events published per tick by the stand-in.')
+    parser.add_argument('--seconds', type=float, default=5.0, help='Seconds to measure ingestion for.')
+    parser.add_argument('--warmup', type=float, default=1.0, help='Seconds to run before measuring.')
+    args = parser.parse_args()
+
+    server_command = [sys.executable, str(ROOT / 'sim_standin.py'),
+                      '--tickInterval', '0', '--eventsPerTick', str(args.events_per_tick)]
+    # the project is set up in this process, the simulations are run by the workers
+    SimulationProcess.set_simulation_server_command(server_command)
+
+    worker_counts = [int(worker_count) for worker_count in args.workers.split(',')]
+    results = [(worker_count, bench_workers(worker_count, server_command, args)) for worker_count in worker_counts]
+
+    print(f"{args.simulations} simulations, {args.events_per_tick} events per tick")
+    print(f"{'workers':<9}{'events/sec':>14}{'speedup':>10}")
+    for worker_count, rate in results:
+        print(f"{worker_count:<9}{rate:14.0f}{rate / results[0][1]:10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+"""
+Compares pulling one point from each timeline of a sweep with Client, one timeline at a time, against
+AsyncClient.get_many_timeline_json and get_many_timeline_data, which fetch many timelines at once.
+
+A throwaway project is created with --timelines timelines, each with one point of --point-size bytes whose JSON
+is already in the point JSON cache, and served by an AsyncServer in another process. Use --latency-ms to delay
+every response by a fixed round trip time through a local proxy, as the server would be on another machine.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from threading import Thread
+from time import perf_counter, sleep
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import SimulationManager as sm
+from simrunner import SimulationProcess
+from ts_client import Client, AsyncClient
+from ts_server import AsyncServer
+
+
+class LatencyProxy:
+    """
+    Forwards connections to a local port, holding back the data sent in each direction by a fixed delay.
+    """
+    def __init__(self, target_port, delay):
+        self._target_port = target_port
+        self._delay = delay
+        self._listener = socket.create_server(('localhost', 0))
+        self.port = self._listener.getsockname()[1]
+        Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                connection, _ = self._listener.accept()
+            except OSError:
+                return
+            upstream = socket.create_connection(('localhost', self._target_port))
+            Thread(target=self._pipe, args=(connection, upstream), daemon=True).start()
+            Thread(target=self._pipe, args=(upstream, connection), daemon=True).start()
+
+    def _pipe(self, source, destination):
+        try:
+            data = source.recv(1 << 16)
+            while data:
+                sleep(self._delay / 2)
+                destination.sendall(data)
+                data = source.recv(1 << 16)
+        except OSError:
+            pass
+        finally:
+            try:
+                destination.shutdown(socket.SHUT_WR)
+            except OSError:
+                pass
+
+    def close(self):
+        self._listener.close()
+
+
+def make_project(project_dir, args):
+    project = sm.TimelinesProject.create_new_project(project_dir)
+    try:
+        project.timelines_dir_path.mkdir(exist_ok=True)
+        project.simulation_registry_path.mkdir(exist_ok=True)
+
+        # the stand-in server ignores the simulation binary, it only has to exist
+        binary_path = project_dir / 'bench_simulation.bin'
+        binary_path.write_bytes(b'bench')
+        source_path = project_dir / 'bench_source.json'
+        source_path.write_text(json.dumps({'name': 'bench', 'binary': binary_path.name,
+                                           'archive_method': sm.SimulationSource.AM_GIT_ARCHIVE_WORKING}))
+        project.add_simulation_source_path(source_path)
+        source = sm.SimulationSource(source_path)
+        point_json = json.dumps({'tick': 0, 'entities': [], 'padding': 'x' * args.point_size})
+
+        for _ in range(args.timelines):
+            node = project.create_timeline()
+            project.change_timeline_simulation_provider(node.timeline_id, source)
+            point_file_path = node.timeline.get_point_file_path(0)
+            point_file_path.write_bytes(os.urandom(args.point_size))
+            project.point_json_cache.get_or_convert(point_file_path, binary_path, lambda: point_json,
+                                                    node.timeline_id)
+    finally:
+        project.close()
+
+
+def serve(project_dir):
+    project = sm.TimelinesProject.load_project(project_dir)
+    server = AsyncServer(project, 'localhost:0')
+    server.start()
+    print(server.port, flush=True)
+    try:
+        sys.stdin.read()
+    finally:
+        server.stop()
+        project.close()
+
+
+def fetch_sequentially(address):
+    with Client(address) as client:
+        timeline_ids = client.get_timelines()
+        start = perf_counter()
+        for timeline_id in timeline_ids:
+            list(client.get_timeline_json(timeline_id, ticks=[0]))
+        return len(timeline_ids), perf_counter() - start
+
+
+async def fetch_concurrently(address, many_call, max_concurrent):
+    async with AsyncClient(address) as client:
+        timeline_ids = await client.get_timelines()
+        start = perf_counter()
+        async for result in getattr(client, many_call)(timeline_ids, max_concurrent=max_concurrent, ticks=[0]):
+            if result.error is not None:
+                raise result.error
+        return len(timeline_ids), perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--timelines', type=int, default=1000, help='Timelines in the sweep.')
+    parser.add_argument('--point-size', type=int, default=4096, help='Bytes in each point.')
+    parser.add_argument('--max-concurrent', type=int, default=8, help='Timelines fetched at once by AsyncClient.')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Round trip time added to every response.')
+    parser.add_argument('--serve', metavar='PROJECT', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve is not None:
+        serve(args.serve)
+        return
+
+    # only used to give the timelines their simulation when creating the project
+    SimulationProcess.set_simulation_server_command([sys.executable, str(ROOT / 'sim_standin.py')])
+
+    with tempfile.TemporaryDirectory(prefix='gw') as temp_dir:
+        project_dir = Path(temp_dir) / 'project'
+        make_project(project_dir, args)
+
+        server = subprocess.Popen([sys.executable, __file__, '--serve', str(project_dir)],
+                                  stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        proxy = None
+        try:
+            port = int(server.stdout.readline())
+            if args.latency_ms:
+                proxy = LatencyProxy(port, args.latency_ms / 1000)
+                port = proxy.port
+            address = f'localhost:{port}'
+
+            results = [('Client, one at a time', fetch_sequentially(address))]
+            for many_call in ('get_many_timeline_json', 'get_many_timeline_data'):
+                results.append((f'AsyncClient.{many_call}',
+                                asyncio.run(fetch_concurrently(address, many_call, args.max_concurrent))))
+        finally:
+            if proxy is not None:
+                proxy.close()
+            server.stdin.close()
+            server.wait()
+
+    print(f"One point from each of {args.timelines} timelines, {args.latency_ms:g}ms added round trip time")
+    print(f"{'fetch':<38}{'seconds':>9}{'timelines/sec':>15}")
+    for name, (timeline_count, seconds) in results:
+        print(f"{name:<38}{seconds:9.2f}{timeline_count / seconds:15.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+Compares the TCP and unix domain socket transports between SimulationClient and a simulation server process:
+the rate events are received from a running simulation, and the latency of getting and setting the state binary.
+
+By default, the Python stand-in server is used, publishing --events-per-tick events every tick with a state of
+--entities entities. Pass --server to benchmark the SimulationServer executable with a real simulation library.
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+from secrets import token_hex
+from threading import Thread
+from time import perf_counter, sleep
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from simrunner import SimulationProcess
+
+
+def populate(client, entity_count, payload_size):
+    # Random payloads keep the state from compressing away
+    client.set_editor_token(client.token)
+    try:
+        with client.batch() as batch:
+            for i in range(entity_count):
+                eid = batch.create_entity()
+                batch.assign_component(eid, 'Payload')
+                batch.replace_component(eid, 'Payload', f'{{"id": {i}, "data": "{token_hex(payload_size // 2)}"}}')
+    finally:
+        client.set_editor_token("")
+
+
+def bench_events(client, seconds):
+    stream = client.get_event_stream()
+    counts = [0]
+
+    def receive():
+        for _, events in stream:
+            counts[0] += len(events)
+
+    receiver = Thread(target=receive, daemon=True)
+    receiver.start()
+
+    client.start_simulation()
+    sleep(0.5)
+    counts[0] = 0
+    start = perf_counter()
+    sleep(seconds)
+    received = counts[0]
+    elapsed = perf_counter() - start
+    client.stop_simulation()
+
+    stream.cancel()
+    receiver.join()
+    return received / elapsed
+
+
+def time_calls(call, rounds):
+    call()
+    times = []
+    for _ in range(rounds):
+        start = perf_counter()
+        call()
+        times.append(perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def bench_transport(transport, library, args):
+    with tempfile.TemporaryDirectory(prefix='gw') as runtime_dir:
+        process = SimulationProcess(library, runtime_dir, transport)
+        process.start('owner')
+        try:
+            client = process.make_client('owner')
+            populate(client, args.entities, args.payload_size)
+            state_binary, _ = client.get_state_binary()
+
+            def set_state():
+                client.set_editor_token('owner')
+                client.set_state_binary_chunked(state_binary)
+                client.set_editor_token('')
+
+            result = {
+                'transport': process.get_transport(),
+                'state_size': len(state_binary),
+                'get': time_calls(client.get_state_binary, args.rounds),
+                'get_chunked': time_calls(client.get_state_binary_chunked, args.rounds),
+                'set_chunked': time_calls(set_state, args.rounds),
+            }
+            result['events'] = bench_events(client, args.seconds)
+            return result
+        finally:
+            process.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--server', nargs=2, metavar=('EXECUTABLE', 'LIBRARY'),
+                        help='Benchmark the given SimulationServer executable and simulation library.')
+    parser.add_argument('--events-per-tick', type=int, default=20, help='Events published per tick by the stand-in.')
+    parser.add_argument('--entities', type=int, default=2000, help='Entities created before measuring.')
+    parser.add_argument('--payload-size', type=int, default=1000, help='Characters of data in each entity.')
+    parser.add_argument('--seconds', type=float, default=3.0, help='Seconds to receive events for.')
+    parser.add_argument('--rounds', type=int, default=20, help='State transfers timed per measurement.')
+    args = parser.parse_args()
+
+    if args.server is not None:
+        executable, library = args.server
+        SimulationProcess.set_simulation_server_command([executable])
+    else:
+        SimulationProcess.set_simulation_server_command([
+            sys.executable, str(ROOT / 'sim_standin.py'),
+            '--tickInterval', '0', '--eventsPerTick', str(args.events_per_tick)])
+        library = __file__
+
+    results = [bench_transport(transport, library, args) for transport in ('tcp', 'unix')]
+
+    print(f"State size: {results[0]['state_size']} bytes")
+    print(f"{'transport':<10}{'events/sec':>14}{'get ms':>10}{'get chunked ms':>17}{'set chunked ms':>17}")
+    for result in results:
+        print(f"{result['transport']:<10}{result['events']:14.0f}{result['get']:10.2f}"
+              f"{result['get_chunked']:17.2f}{result['set_chunked']:17.2f}")
+
+
+if __name__ == '__main__':
+    main()
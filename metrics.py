@@ -0,0 +1,576 @@
+import bisect
+from collections import namedtuple
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from threading import Lock, RLock, Thread
+from time import perf_counter
+
+import grpc
+import grpc.aio
+
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+Sample = namedtuple('Sample', ['name', 'labels', 'value'])
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+               for value in labels.values())
+    return '{' + ','.join(f'{name}="{value}"' for name, value in zip(labels, escaped)) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_samples(samples):
+    """
+    :return: The samples in the Prometheus text exposition format, without HELP and TYPE lines.
+    """
+    return ''.join(f"{sample.name}{_format_labels(sample.labels)} {_format_value(sample.value)}\n"
+                   for sample in samples)
+
+
+class _Metric:
+    type_name = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = Lock()
+        self._children = {}
+
+    def labels(self, *values):
+        """
+        :return: The child of this metric for the given label values, created on first use.
+        Callers on hot paths should keep the child instead of looking it up on every update.
+        """
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+        values = tuple(str(value) for value in values)
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._make_child())
+        return child
+
+    def remove(self, *values):
+        """
+        Removes the child for the given label values, for labels that name something that no longer exists.
+        """
+        with self._lock:
+            self._children.pop(tuple(str(value) for value in values), None)
+
+    def _default(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {self.labelnames}, use labels()")
+        return self.labels()
+
+    def _make_child(self):
+        raise NotImplementedError
+
+    def samples(self):
+        with self._lock:
+            children = list(self._children.items())
+        for values, child in children:
+            yield from child.samples(self.name, dict(zip(self.labelnames, values)))
+
+
+class _CounterChild:
+    __slots__ = ('_lock', 'value')
+
+    def __init__(self):
+        self._lock = Lock()
+        self.value = 0
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def samples(self, name, labels):
+        yield Sample(name + '_total', labels, self.value)
+
+
+class Counter(_Metric):
+    """
+    A value that only goes up, such as a count of requests.
+    """
+    type_name = 'counter'
+
+    def _make_child(self):
+        return _CounterChild()
+
+    def inc(self, amount=1):
+        self._default().inc(amount)
+
+
+class _GaugeChild:
+    __slots__ = ('_lock', 'value')
+
+    def __init__(self):
+        self._lock = Lock()
+        self.value = 0
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount=1):
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value):
+        self.value = value
+
+    def samples(self, name, labels):
+        yield Sample(name, labels, self.value)
+
+
+class Gauge(_Metric):
+    """
+    A value that can go up and down, such as the number of open streams.
+    """
+    type_name = 'gauge'
+
+    def _make_child(self):
+        return _GaugeChild()
+
+    def inc(self, amount=1):
+        self._default().inc(amount)
+
+    def dec(self, amount=1):
+        self._default().dec(amount)
+
+    def set(self, value):
+        self._default().set(value)
+
+
+class _HistogramChild:
+    __slots__ = ('_lock', '_bounds', '_counts', '_sum')
+
+    def __init__(self, bounds):
+        self._lock = Lock()
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._sum = 0.0
+
+    def observe(self, value):
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def samples(self, name, labels):
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative = 0
+        for bound, count in zip((*self._bounds, float('inf')), counts):
+            cumulative += count
+            yield Sample(name + '_bucket', {**labels, 'le': _format_value(bound)}, cumulative)
+        yield Sample(name + '_sum', labels, total)
+        yield Sample(name + '_count', labels, cumulative)
+
+
+class Histogram(_Metric):
+    """
+    Counts observed values, such as latencies in seconds, into cumulative buckets.
+    """
+    type_name = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+
+    def _make_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value):
+        self._default().observe(value)
+
+
+class Registry:
+    """
+    A set of metrics, plus collectors that compute samples when the metrics are read.
+    """
+    def __init__(self):
+        self._lock = RLock()
+        self._metrics = {}
+        self._collectors = []
+
+    def _register(self, metric_type, name, documentation, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_type(name, documentation, labelnames, **kwargs)
+            elif type(metric) is not metric_type or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered as a different metric.")
+            return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        """
+        :return: The counter with the given name, registering it if it does not exist yet.
+        """
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name, documentation, labelnames=()):
+        """
+        :return: The gauge with the given name, registering it if it does not exist yet.
+        """
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """
+        :return: The histogram with the given name, registering it if it does not exist yet.
+        """
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def add_collector(self, collector):
+        """
+        :param collector: Called with no arguments whenever the metrics are read. It returns an iterable of
+        (name, type_name, documentation, samples) for the metrics it computes.
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def remove_collector(self, collector):
+        with self._lock:
+            if collector in self._collectors:
+                self._collectors.remove(collector)
+
+    def collect(self):
+        """
+        :return: A list of (name, type_name, documentation, samples) for every metric.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+
+        families = [(metric.name, metric.type_name, metric.documentation, list(metric.samples()))
+                    for metric in metrics]
+        for collector in collectors:
+            try:
+                families.extend(collector())
+            except Exception as e:
+                print(f"LOG: Metrics collector {collector} failed: {e}")
+        return families
+
+    def samples(self):
+        """
+        :return: A list of every Sample.
+        """
+        return [sample for _, _, _, samples in self.collect() for sample in samples]
+
+    def render_prometheus(self, families=None):
+        """
+        :param families: The result of collect() to render, if it was already called.
+        :return: Every metric, in the Prometheus text exposition format.
+        """
+        parts = []
+        for name, type_name, documentation, samples in families if families is not None else self.collect():
+            parts.append(f"# HELP {name} {documentation}\n# TYPE {name} {type_name}\n")
+            parts.append(render_samples(samples))
+        return ''.join(parts)
+
+
+REGISTRY = Registry()
+
+
+class _MethodMetrics:
+    """
+    The metric children of one RPC method, looked up once so recording a call costs no label lookups.
+    """
+    __slots__ = ('_requests', '_method', '_codes', 'duration', 'sent_bytes', 'received_bytes', 'in_flight')
+
+    def __init__(self, rpc_metrics, method):
+        self._requests = rpc_metrics.requests
+        self._method = method
+        self._codes = {}
+        self.duration = rpc_metrics.duration.labels(method)
+        self.sent_bytes = rpc_metrics.sent_bytes.labels(method)
+        self.received_bytes = rpc_metrics.received_bytes.labels(method)
+        self.in_flight = rpc_metrics.in_flight.labels(method)
+
+    def finish(self, start, code):
+        self.duration.observe(perf_counter() - start)
+        counter = self._codes.get(code)
+        if counter is None:
+            counter = self._codes[code] = self._requests.labels(self._method, code)
+        counter.inc()
+
+
+class RpcMetrics:
+    """
+    Request counts, latency, message bytes and in-flight calls for the RPC methods of one side of a gRPC service.
+    """
+    def __init__(self, prefix, registry=REGISTRY):
+        """
+        :param prefix: Prefixed to the metric names, for example 'ts_server'.
+        """
+        self.requests = registry.counter(f'{prefix}_requests', 'RPCs completed, by status code.', ('method', 'code'))
+        self.duration = registry.histogram(f'{prefix}_duration_seconds', 'RPC latency, including streaming.',
+                                           ('method',))
+        self.sent_bytes = registry.counter(f'{prefix}_sent_bytes', 'Serialized bytes of messages sent.', ('method',))
+        self.received_bytes = registry.counter(f'{prefix}_received_bytes', 'Serialized bytes of messages received.',
+                                               ('method',))
+        self.in_flight = registry.gauge(f'{prefix}_in_flight', 'RPCs currently running.', ('method',))
+        self._methods = {}
+
+    def method(self, full_method):
+        metrics = self._methods.get(full_method)
+        if metrics is None:
+            metrics = self._methods[full_method] = _MethodMetrics(self, full_method.rpartition('/')[2])
+        return metrics
+
+
+def _status_name(context, error=None):
+    code = context.code()
+    if isinstance(code, grpc.StatusCode):
+        return code.name
+    if error is None:
+        return 'OK'
+    if isinstance(error, GeneratorExit):
+        return 'CANCELLED'
+    return 'UNKNOWN'
+
+
+def _message_size(message):
+    # messages relayed without deserializing them are bytes
+    if isinstance(message, bytes):
+        return len(message)
+    return message.ByteSize()
+
+
+def _counted(messages, counter):
+    for message in messages:
+        counter.inc(_message_size(message))
+        yield message
+
+
+async def _async_counted(messages, counter):
+    async for message in messages:
+        counter.inc(_message_size(message))
+        yield message
+
+
+def replace_handler_behavior(handler, **behaviors):
+    """
+    :return: A copy of an RPC method handler, with its behavior replaced by the one given for its kind of method.
+    """
+    if handler.unary_unary:
+        return grpc.unary_unary_rpc_method_handler(behaviors['unary_unary'], handler.request_deserializer,
+                                                   handler.response_serializer)
+    if handler.unary_stream:
+        return grpc.unary_stream_rpc_method_handler(behaviors['unary_stream'], handler.request_deserializer,
+                                                    handler.response_serializer)
+    if handler.stream_unary:
+        return grpc.stream_unary_rpc_method_handler(behaviors['stream_unary'], handler.request_deserializer,
+                                                    handler.response_serializer)
+    return grpc.stream_stream_rpc_method_handler(behaviors['stream_stream'], handler.request_deserializer,
+                                                 handler.response_serializer)
+
+
+class ServerMetricsInterceptor(grpc.ServerInterceptor):
+    """
+    Records RpcMetrics for every call handled by a grpc.server.
+    """
+    def __init__(self, rpc_metrics: RpcMetrics):
+        self.rpc_metrics = rpc_metrics
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+        metrics = self.rpc_metrics.method(handler_call_details.method)
+        behavior = handler.unary_unary or handler.unary_stream or handler.stream_unary or handler.stream_stream
+
+        def unary_response(request, context):
+            start = perf_counter()
+            metrics.in_flight.inc()
+            code = 'OK'
+            try:
+                response = behavior(request, context)
+                code = _status_name(context)
+                metrics.sent_bytes.inc(_message_size(response))
+                return response
+            except BaseException as e:
+                code = _status_name(context, e)
+                raise
+            finally:
+                metrics.in_flight.dec()
+                metrics.finish(start, code)
+
+        def stream_response(request, context):
+            start = perf_counter()
+            metrics.in_flight.inc()
+            code = 'OK'
+            try:
+                yield from _counted(behavior(request, context), metrics.sent_bytes)
+                code = _status_name(context)
+            except BaseException as e:
+                code = _status_name(context, e)
+                raise
+            finally:
+                metrics.in_flight.dec()
+                metrics.finish(start, code)
+
+        def unary_unary(request, context):
+            metrics.received_bytes.inc(_message_size(request))
+            return unary_response(request, context)
+
+        def unary_stream(request, context):
+            metrics.received_bytes.inc(_message_size(request))
+            return stream_response(request, context)
+
+        def stream_unary(request_iterator, context):
+            return unary_response(_counted(request_iterator, metrics.received_bytes), context)
+
+        def stream_stream(request_iterator, context):
+            return stream_response(_counted(request_iterator, metrics.received_bytes), context)
+
+        return replace_handler_behavior(handler, unary_unary=unary_unary, unary_stream=unary_stream,
+                                        stream_unary=stream_unary, stream_stream=stream_stream)
+
+
+class AsyncServerMetricsInterceptor(grpc.aio.ServerInterceptor):
+    """
+    Records RpcMetrics for every call handled by a grpc.aio server.
+    """
+    def __init__(self, rpc_metrics: RpcMetrics):
+        self.rpc_metrics = rpc_metrics
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+        metrics = self.rpc_metrics.method(handler_call_details.method)
+        behavior = handler.unary_unary or handler.unary_stream or handler.stream_unary or handler.stream_stream
+
+        async def unary_response(request, context):
+            start = perf_counter()
+            metrics.in_flight.inc()
+            code = 'OK'
+            try:
+                response = await behavior(request, context)
+                code = _status_name(context)
+                metrics.sent_bytes.inc(_message_size(response))
+                return response
+            except BaseException as e:
+                code = _status_name(context, e)
+                raise
+            finally:
+                metrics.in_flight.dec()
+                metrics.finish(start, code)
+
+        async def stream_response(request, context):
+            start = perf_counter()
+            metrics.in_flight.inc()
+            code = 'OK'
+            try:
+                async for response in _async_counted(behavior(request, context), metrics.sent_bytes):
+                    yield response
+                code = _status_name(context)
+            except BaseException as e:
+                code = _status_name(context, e)
+                raise
+            finally:
+                metrics.in_flight.dec()
+                metrics.finish(start, code)
+
+        async def unary_unary(request, context):
+            metrics.received_bytes.inc(_message_size(request))
+            return await unary_response(request, context)
+
+        # grpc.aio tells streaming handlers apart by them being async generator functions
+        async def unary_stream(request, context):
+            metrics.received_bytes.inc(_message_size(request))
+            async for response in stream_response(request, context):
+                yield response
+
+        async def stream_unary(request_iterator, context):
+            return await unary_response(_async_counted(request_iterator, metrics.received_bytes), context)
+
+        async def stream_stream(request_iterator, context):
+            async for response in stream_response(_async_counted(request_iterator, metrics.received_bytes), context):
+                yield response
+
+        return replace_handler_behavior(handler, unary_unary=unary_unary, unary_stream=unary_stream,
+                                        stream_unary=stream_unary, stream_stream=stream_stream)
+
+
+class ClientMetricsInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):
+    """
+    Records RpcMetrics for the calls made through a channel wrapped with grpc.intercept_channel.
+    Only the request bytes are counted on this side, the responses are counted by the server.
+    """
+    def __init__(self, rpc_metrics: RpcMetrics):
+        self.rpc_metrics = rpc_metrics
+
+    def _intercept(self, continuation, client_call_details, request):
+        metrics = self.rpc_metrics.method(client_call_details.method)
+        metrics.sent_bytes.inc(_message_size(request))
+        metrics.in_flight.inc()
+        start = perf_counter()
+
+        def done(call):
+            metrics.in_flight.dec()
+            code = call.code()
+            metrics.finish(start, code.name if code is not None else 'UNKNOWN')
+
+        call = continuation(client_call_details, request)
+        call.add_done_callback(done)
+        return call
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return self._intercept(continuation, client_call_details, request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return self._intercept(continuation, client_call_details, request)
+
+
+class MetricsEndpoint:
+    """
+    Serves a registry in the Prometheus text format over HTTP, at /metrics.
+    """
+    def __init__(self, registry=REGISTRY, address=('127.0.0.1', 9469)):
+        """
+        :param address: The (host, port) to listen on. Port 0 picks a free port.
+        """
+        self.registry = registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(handler):
+                if handler.path.split('?', 1)[0] != '/metrics':
+                    handler.send_error(404)
+                    return
+                body = registry.render_prometheus().encode()
+                handler.send_response(200)
+                handler.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                handler.send_header('Content-Length', str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(address, Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = None
+
+    def start(self):
+        self._thread = Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,447 @@
+import os
+import sqlite3
+import zlib
+from hashlib import blake2b
+from pathlib import Path
+from threading import RLock
+from time import time_ns
+
+
+class _SQLiteLRUStore:
+    """
+    The storage the point caches share: entries in a single SQLite table with their size and last access time.
+    The least recently used entries are evicted to keep the total stored size under the byte budget.
+    Subclasses set _COLUMNS to the definitions of the columns an entry is stored under, _KEY_COLUMNS to the ones
+    that identify it, and _INDEXED_COLUMNS to other columns entries are looked up by. Other tables are created by
+    overriding _create_tables.
+    """
+    _COLUMNS = ''
+    _KEY_COLUMNS = ()
+    _INDEXED_COLUMNS = ()
+
+    def __init__(self, db_path, max_bytes, compress, compression_level):
+        """
+        :param db_path: The database file to store the cache in. Created if it does not exist.
+        :param max_bytes: The budget for the total size of stored entries.
+        :param compress: If true, new entries are stored zlib compressed when that makes them smaller.
+        """
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.compression_level = compression_level
+
+        self._lock = RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+        self._conn = None
+        self._entry_count = 0
+        self._stored_bytes = 0
+        self._key_condition = ' AND '.join(f'{column} = ?' for column in self._KEY_COLUMNS)
+
+    def _connection(self):
+        """
+        :return: The database connection, opening the database on first use.
+        """
+        with self._lock:
+            if self._conn is not None:
+                return self._conn
+
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._create_tables(conn)
+
+            cursor = conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries')
+            self._entry_count, self._stored_bytes = cursor.fetchone()
+            self._conn = conn
+
+            self._evict()
+            return conn
+
+    def _create_tables(self, conn):
+        conn.execute(f'''
+            CREATE TABLE IF NOT EXISTS entries (
+                {self._COLUMNS},
+                compressed INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                last_access INTEGER NOT NULL,
+                data BLOB NOT NULL,
+                PRIMARY KEY({', '.join(self._KEY_COLUMNS)})
+            )''')
+        for column in ('last_access', *self._INDEXED_COLUMNS):
+            conn.execute(f'CREATE INDEX IF NOT EXISTS entries_{column} ON entries({column})')
+
+    def _touch(self, conn, keys):
+        """
+        Marks the entries with the given keys as used now.
+        """
+        now = time_ns()
+        conn.execute('BEGIN')
+        conn.executemany(f'UPDATE entries SET last_access = ? WHERE {self._key_condition}',
+                         [(now, *key) for key in keys])
+        conn.execute('COMMIT')
+
+    def _store(self, columns, data):
+        """
+        Stores an entry, replacing the one with the same key.
+        :param columns: A dict of the entry's column values, by column name.
+        :param data: The bytes of the entry, compressed here if that makes them smaller.
+        """
+        compressed = False
+        if self.compress and self._compressible(data):
+            compressed_data = zlib.compress(data, self.compression_level)
+            if len(compressed_data) < len(data):
+                data = compressed_data
+                compressed = True
+
+        if len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            conn = self._connection()
+            key = tuple(columns[column] for column in self._KEY_COLUMNS)
+            cursor = conn.execute(f'SELECT size FROM entries WHERE {self._key_condition}', key)
+            row = cursor.fetchone()
+            if row is not None:
+                self._entry_count -= 1
+                self._stored_bytes -= row[0]
+
+            names = (*columns, 'compressed', 'size', 'last_access', 'data')
+            conn.execute(f'INSERT OR REPLACE INTO entries({", ".join(names)}) VALUES({",".join("?" * len(names))})',
+                         (*columns.values(), int(compressed), len(data), time_ns(), data))
+            self._entry_count += 1
+            self._stored_bytes += len(data)
+
+            self._evict()
+
+    def _compressible(self, data):
+        """
+        :return: False if compressing the data should not be tried.
+        """
+        return True
+
+    def _delete(self, conn, condition, parameters):
+        cursor = conn.execute(f'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries WHERE {condition}', parameters)
+        count, size = cursor.fetchone()
+        if count:
+            conn.execute(f'DELETE FROM entries WHERE {condition}', parameters)
+            self._entry_count -= count
+            self._stored_bytes -= size
+            self._invalidations += count
+
+    def clear(self):
+        with self._lock:
+            conn = self._connection()
+            conn.execute('DELETE FROM entries')
+            self._invalidations += self._entry_count
+            self._entry_count = 0
+            self._stored_bytes = 0
+
+    def get_stats(self):
+        with self._lock:
+            self._connection()
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+                'entry_count': self._entry_count,
+                'stored_bytes': self._stored_bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _evict(self):
+        with self._lock:
+            conn = self._connection()
+            while self._stored_bytes > self.max_bytes:
+                cursor = conn.execute(f'''
+                    SELECT {', '.join(self._KEY_COLUMNS)}, size FROM entries
+                    ORDER BY last_access LIMIT 64''')
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+
+                conn.execute('BEGIN')
+                for *key, size in rows:
+                    if self._stored_bytes <= self.max_bytes:
+                        break
+                    conn.execute(f'DELETE FROM entries WHERE {self._key_condition}', key)
+                    self._entry_count -= 1
+                    self._stored_bytes -= size
+                    self._evictions += 1
+                conn.execute('COMMIT')
+
+
+class PointJsonCache(_SQLiteLRUStore):
+    """
+    A persistent cache of point states converted to JSON, stored in a single SQLite database.
+    Entries are keyed by the hash of the point file content and the hash of the simulation binary that converted it,
+    so an entry is valid for as long as the same conversion would produce the same result. Identical points of
+    different timelines share an entry, and the timelines using each entry are kept in a table of their own.
+    The least recently used entries are evicted to keep the total stored size under the byte budget.
+    """
+    _HASH_CHUNK_SIZE = 1024 * 1024
+    _COLUMNS = '''
+                point_hash TEXT NOT NULL,
+                simulation_hash TEXT NOT NULL'''
+    _KEY_COLUMNS = ('point_hash', 'simulation_hash')
+
+    def __init__(self, db_path, max_bytes=256 * 1024 * 1024, compress=True, compression_level=6):
+        """
+        :param db_path: The database file to store the cache in. Created if it does not exist.
+        :param max_bytes: The budget for the total size of stored entries.
+        :param compress: If true, new entries are stored zlib compressed.
+        """
+        super().__init__(db_path, max_bytes, compress, compression_level)
+        self._file_hashes = {}
+
+    def file_hash(self, path):
+        """
+        :return: The content hash of the file. Hashes are remembered while the file's size and modification
+        time are unchanged, so repeated lookups of the same file do not read it again.
+        """
+        path = str(path)
+        stat = os.stat(path)
+        # a file replaced by another one of the same size within the modification time resolution, as when
+        # migrating points, is still told apart by its inode and change time
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size)
+
+        with self._lock:
+            known = self._file_hashes.get(path)
+        if known is not None and known[0] == signature:
+            return known[1]
+
+        hasher = blake2b(digest_size=20)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(PointJsonCache._HASH_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+
+        with self._lock:
+            self._file_hashes[path] = (signature, digest)
+        return digest
+
+    def get_or_convert(self, point_file_path, simulation_binary_path, convert, timeline_id=None, compressed=False):
+        """
+        Gets the JSON of a point from the cache, converting and storing it if it is not cached.
+        :param convert: Called with no arguments to produce the JSON string on a cache miss.
+        :param timeline_id: The timeline the point belongs to, see invalidate_timeline.
+        :param compressed: If true, the JSON is returned as zlib compressed UTF-8, as in get_compressed.
+        """
+        point_hash = self.file_hash(point_file_path)
+        simulation_hash = self.file_hash(simulation_binary_path)
+
+        if compressed:
+            data = self.get_compressed(point_hash, simulation_hash)
+            if data is None:
+                json = convert()
+                self.put(point_hash, simulation_hash, json, timeline_id)
+                data = zlib.compress(json.encode('utf-8'), self.compression_level)
+            else:
+                self._add_timeline(point_hash, simulation_hash, timeline_id)
+            return data
+
+        json = self.get(point_hash, simulation_hash)
+        if json is None:
+            json = convert()
+            self.put(point_hash, simulation_hash, json, timeline_id)
+        else:
+            self._add_timeline(point_hash, simulation_hash, timeline_id)
+        return json
+
+    def get(self, point_hash, simulation_hash):
+        """
+        :return: The cached JSON string, or None if it is not cached.
+        """
+        entry = self._lookup(point_hash, simulation_hash)
+        if entry is None:
+            return None
+
+        compressed, data = entry
+        if compressed:
+            data = zlib.decompress(data)
+        return data.decode('utf-8')
+
+    def get_compressed(self, point_hash, simulation_hash):
+        """
+        :return: The cached JSON as zlib compressed UTF-8, or None if it is not cached.
+        Entries stored compressed are returned as stored, without decompressing them.
+        """
+        entry = self._lookup(point_hash, simulation_hash)
+        if entry is None:
+            return None
+
+        compressed, data = entry
+        if not compressed:
+            data = zlib.compress(data, self.compression_level)
+        return data
+
+    def _lookup(self, point_hash, simulation_hash):
+        """
+        :return: The (compressed, data) of the entry, or None if it is not cached.
+        """
+        with self._lock:
+            conn = self._connection()
+            cursor = conn.execute(
+                'SELECT compressed, data FROM entries WHERE point_hash = ? AND simulation_hash = ?',
+                (point_hash, simulation_hash))
+            row = cursor.fetchone()
+
+            if row is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._touch(conn, [(point_hash, simulation_hash)])
+
+        return row
+
+    def _create_tables(self, conn):
+        super()._create_tables(conn)
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS entry_timelines (
+                point_hash TEXT NOT NULL,
+                simulation_hash TEXT NOT NULL,
+                timeline_id INTEGER NOT NULL,
+                PRIMARY KEY(point_hash, simulation_hash, timeline_id)
+            )''')
+        conn.execute('CREATE INDEX IF NOT EXISTS entry_timelines_timeline_id ON entry_timelines(timeline_id)')
+        # replacing an entry does not fire the trigger, so the timelines using it are kept
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS entries_deleted AFTER DELETE ON entries
+            BEGIN
+                DELETE FROM entry_timelines
+                WHERE point_hash = OLD.point_hash AND simulation_hash = OLD.simulation_hash;
+            END''')
+
+    def put(self, point_hash, simulation_hash, json, timeline_id=None):
+        """
+        :param timeline_id: A timeline that uses the entry, see invalidate_timeline.
+        """
+        with self._lock:
+            self._store({'point_hash': point_hash, 'simulation_hash': simulation_hash}, json.encode('utf-8'))
+            self._add_timeline(point_hash, simulation_hash, timeline_id)
+
+    def _add_timeline(self, point_hash, simulation_hash, timeline_id):
+        """
+        Records that the timeline uses the entry, if the entry is stored.
+        """
+        if timeline_id is None:
+            return
+        with self._lock:
+            self._connection().execute('''
+                INSERT OR IGNORE INTO entry_timelines(point_hash, simulation_hash, timeline_id)
+                SELECT point_hash, simulation_hash, ? FROM entries
+                WHERE point_hash = ? AND simulation_hash = ?
+                ''', (timeline_id, point_hash, simulation_hash))
+
+    def invalidate_timeline(self, timeline_id):
+        """
+        Removes the entries stored for points of the given timeline that no other timeline uses.
+        """
+        with self._lock:
+            conn = self._connection()
+            self._delete(conn, '''
+                (point_hash, simulation_hash) IN (
+                    SELECT point_hash, simulation_hash FROM entry_timelines WHERE timeline_id = ?
+                    EXCEPT
+                    SELECT point_hash, simulation_hash FROM entry_timelines WHERE timeline_id != ?)
+                ''', (timeline_id, timeline_id))
+            conn.execute('DELETE FROM entry_timelines WHERE timeline_id = ?', (timeline_id,))
+
+    def clear(self):
+        with self._lock:
+            super().clear()
+            self._file_hashes.clear()
+
+
+class ClientPointCache(_SQLiteLRUStore):
+    """
+    A persistent cache of point data and point JSON fetched from timeline services, for clients.
+    A point never changes once written unless its timeline's head is committed again, so entries are keyed by
+    the server, the timeline, the tick, the timeline's last commit timestamp and the format. Entries of a timeline
+    from before its last commit are dropped once the newer commit is seen. The least recently used entries are
+    evicted to keep the total stored size under the byte budget.
+    """
+    _COMPRESSION_SAMPLE_SIZE = 16 * 1024
+    _COLUMNS = '''
+                server TEXT NOT NULL,
+                timeline_id INTEGER NOT NULL,
+                tick INTEGER NOT NULL,
+                commit_timestamp TEXT NOT NULL,
+                format TEXT NOT NULL'''
+    _KEY_COLUMNS = ('server', 'timeline_id', 'tick', 'commit_timestamp', 'format')
+
+    def __init__(self, db_path, max_bytes=1024 * 1024 * 1024, compress=True, compression_level=1):
+        """
+        :param db_path: The database file to store the cache in. Created if it does not exist.
+        :param max_bytes: The budget for the total size of stored entries.
+        :param compress: If true, new entries are stored zlib compressed when that makes them smaller.
+        Entries are stored while points are fetched, so the default level favours speed.
+        """
+        super().__init__(db_path, max_bytes, compress, compression_level)
+
+    def get_many(self, server, timeline_id, commit_timestamp, format, ticks):
+        """
+        :param format: The name of the point format, such as 'data' or 'json'.
+        :return: A dict of tick to the cached bytes, for the given ticks that are cached.
+        """
+        ticks = set(ticks)
+        with self._lock:
+            conn = self._connection()
+            self._drop_older_commits(conn, server, timeline_id, commit_timestamp)
+            rows = []
+            # in chunks, to stay under SQLite's limit on the number of parameters
+            tick_list = sorted(ticks)
+            for i in range(0, len(tick_list), 500):
+                chunk = tick_list[i:i + 500]
+                cursor = conn.execute(f'''
+                    SELECT tick, compressed, data FROM entries
+                    WHERE server = ? AND timeline_id = ? AND commit_timestamp = ? AND format = ?
+                    AND tick IN ({','.join('?' * len(chunk))})
+                    ''', (server, timeline_id, commit_timestamp, format, *chunk))
+                rows.extend(cursor.fetchall())
+
+            if rows:
+                self._touch(conn, [(server, timeline_id, tick, commit_timestamp, format) for tick, _, _ in rows])
+            self._hits += len(rows)
+            self._misses += len(ticks) - len(rows)
+
+        return {tick: zlib.decompress(data) if compressed else data for tick, compressed, data in rows}
+
+    def put(self, server, timeline_id, commit_timestamp, format, tick, data):
+        self._store({'server': server, 'timeline_id': timeline_id, 'tick': tick, 'commit_timestamp': commit_timestamp,
+                     'format': format}, data)
+
+    def _compressible(self, data):
+        """
+        :return: False if a sample from the start of the data barely compresses, as with already compressed points.
+        """
+        sample = data[:ClientPointCache._COMPRESSION_SAMPLE_SIZE]
+        return len(zlib.compress(sample, 1)) < len(sample) * 0.9
+
+    def invalidate_timeline(self, server, timeline_id, commit_timestamp=None):
+        """
+        Removes the entries stored for a timeline, or only those stored for one of its commits.
+        """
+        with self._lock:
+            conn = self._connection()
+            if commit_timestamp is None:
+                self._delete(conn, 'server = ? AND timeline_id = ?', (server, timeline_id))
+            else:
+                self._delete(conn, 'server = ? AND timeline_id = ? AND commit_timestamp = ?',
+                             (server, timeline_id, commit_timestamp))
+
+    def _drop_older_commits(self, conn, server, timeline_id, commit_timestamp):
+        self._delete(conn, 'server = ? AND timeline_id = ? AND commit_timestamp != ?',
+                     (server, timeline_id, commit_timestamp))
@@ -0,0 +1,125 @@
+"""
+Serves a timelines project with the timeline service, without the GUI.
+
+    python serve.py PROJECT [options]
+
+Options can also be given in a JSON file with --config, keyed by option name with dashes replaced by
+underscores, e.g. {"address": "[::]:4969", "io_workers": 16}. Options on the command line take precedence.
+
+On SIGINT or SIGTERM the server stops taking calls, gives the calls in progress --grace seconds to finish,
+then stops every running simulation and closes the project, so events and points received so far are written.
+A second signal exits immediately.
+"""
+import argparse
+import json
+import signal
+import sys
+from pathlib import Path
+from threading import Event
+
+import SimulationManager as sm
+from simrunner import SimulationProcess
+from ts_server import Server, AsyncServer, AdmissionPolicy
+
+
+def make_parser():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('project', type=Path, help='The project directory.')
+    parser.add_argument('--config', type=Path, help='A JSON file of option defaults.')
+    parser.add_argument('--address', default='[::]:4969', help='The address to listen on.')
+    parser.add_argument('--server', choices=('async', 'threaded'), default='async',
+                        help='Serve with the grpc.aio server, or the thread per call server.')
+    parser.add_argument('--io-workers', type=int, default=8,
+                        help='Threads for blocking project calls, for the async server.')
+    parser.add_argument('--stream-workers', type=int, default=8,
+                        help='Threads reading points for streamed responses, for the async server.')
+    parser.add_argument('--simulation-workers', type=int, default=4,
+                        help='Threads starting and stopping simulations, for the async server.')
+    parser.add_argument('--no-admission', action='store_true', help='Admit every call instead of budgeting them.')
+    parser.add_argument('--sim-pool-size', type=int,
+                        help='Idle simulation processes kept ready for each simulation binary.')
+    parser.add_argument('--snapshot-slots', type=int, help='Snapshot ring slots of started simulation processes.')
+    parser.add_argument('--converter-workers', type=int,
+                        help='The most converter workers for each pair of formats and simulations.')
+    parser.add_argument('--converter-idle', type=int, help='Idle converter workers kept for each key.')
+    parser.add_argument('--point-cache-mb', type=int, help='The size budget of the point JSON cache, in MiB.')
+    parser.add_argument('--metrics-port', type=int, help='A local port to serve Prometheus metrics on.')
+    parser.add_argument('--simulation-server-command', type=json.loads,
+                        help='The simulation server command, as a JSON list.')
+    parser.add_argument('--grace', type=float, default=5.0,
+                        help='Seconds calls in progress are given to finish when stopping.')
+    return parser
+
+
+def parse_args(argv=None):
+    parser = make_parser()
+    args = parser.parse_args(argv)
+    if args.config is not None:
+        config = json.loads(args.config.read_text())
+        unknown_options = set(config) - set(vars(args))
+        if unknown_options:
+            parser.error(f"Unknown options in {args.config}: {', '.join(sorted(unknown_options))}")
+        parser.set_defaults(**config)
+        args = parser.parse_args(argv)
+    return args
+
+
+def configure_project(project: sm.TimelinesProject, args):
+    """
+    Applies the pool and cache options to a loaded project.
+    """
+    if args.sim_pool_size is not None:
+        project.simulation_process_pool.default_pool_size = args.sim_pool_size
+    if args.snapshot_slots is not None:
+        project.simulation_process_pool.snapshot_slots = args.snapshot_slots
+    if args.converter_workers is not None:
+        project.converter_service.max_workers_per_key = args.converter_workers
+    if args.converter_idle is not None:
+        project.converter_service.max_idle_per_key = args.converter_idle
+    if args.point_cache_mb is not None:
+        project.point_json_cache.max_bytes = args.point_cache_mb * 1024 * 1024
+
+
+def make_server(project: sm.TimelinesProject, args):
+    admission = None if args.no_admission else AdmissionPolicy()
+    if args.server == 'threaded':
+        return Server(project, args.address, args.metrics_port, admission)
+    return AsyncServer(project, args.address, args.io_workers, args.stream_workers, args.simulation_workers,
+                       args.metrics_port, admission)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.simulation_server_command is not None:
+        SimulationProcess.set_simulation_server_command(args.simulation_server_command)
+
+    stop_requested = Event()
+
+    def request_stop(signum, frame):
+        print(f"LOG: Received {signal.Signals(signum).name}, stopping.")
+        stop_requested.set()
+        # a second signal should not wait for the shutdown
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    project = sm.TimelinesProject.load_project(args.project)
+    try:
+        configure_project(project, args)
+        server = make_server(project, args)
+        server.start()
+        try:
+            print(f"LOG: Serving {project.root_dir_path} on port {server.port}.", flush=True)
+            while not stop_requested.wait(1):
+                pass
+        finally:
+            server.stop(args.grace)
+    finally:
+        project.close()
+    print("LOG: Stopped.")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
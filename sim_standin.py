@@ -0,0 +1,880 @@
+"""
+A pure Python stand-in for the SimulationServer executable, for tests and for machines without the .NET server
+or native simulation libraries. It accepts the same command line (serve, convert, create-default) and stdin
+protocol, and serves the Simulation service from a simple in-memory entity store.
+
+To run the simulation manager against it:
+    SimulationProcess.set_simulation_server_command([sys.executable, 'sim_standin.py'])
+
+The simulation library argument must name an existing file, but its content is ignored.
+The --tickInterval, --eventsPerTick and --stateBinInterval options, given before the command, tune how fast the
+served simulation runs and how many events and snapshots it publishes, for tests and benchmarks.
+"""
+import argparse
+import json
+import sys
+import zlib
+from array import array
+from concurrent import futures
+from pathlib import Path
+from queue import Queue, Empty, Full
+from threading import Thread, RLock, Event
+from time import sleep, monotonic
+
+import grpc
+
+import simulation_pb2 as sim
+import simulation_pb2_grpc as sim_grpc
+from simrunner import SnapshotRing
+
+
+class StandInSimulation:
+    """
+    An in-memory simulation of entities with JSON components, and JSON singletons.
+    Running the simulation only advances its tick.
+    """
+    def __init__(self, tick_interval=0.001):
+        self.tick_interval = tick_interval
+        self.tick_callback = None
+
+        self._lock = RLock()
+        self._tick = 0
+        self._next_eid = 0
+        self._entities = {}
+        self._singletons = {}
+
+        self._run_thread = None
+        self._stop_requested = Event()
+        self._stop_at_tick = 0
+
+    def get_tick(self):
+        with self._lock:
+            return self._tick
+
+    def get_stop_at_tick(self):
+        with self._lock:
+            return self._stop_at_tick
+
+    def _state(self):
+        return {
+            'tick': self._tick,
+            'next_eid': self._next_eid,
+            'entities': {str(eid): components for eid, components in self._entities.items()},
+            'singletons': self._singletons,
+        }
+
+    def get_state_json(self):
+        with self._lock:
+            return json.dumps(self._state()), self._tick
+
+    def set_state_json(self, state_json):
+        state = json.loads(state_json) if state_json.strip() else {}
+        with self._lock:
+            self._tick = int(state.get('tick', 0))
+            self._next_eid = int(state.get('next_eid', 0))
+            self._entities = {int(eid): dict(components) for eid, components in state.get('entities', {}).items()}
+            self._singletons = dict(state.get('singletons', {}))
+
+    def get_state_binary(self):
+        with self._lock:
+            return zlib.compress(json.dumps(self._state()).encode('utf-8')), self._tick
+
+    def set_state_binary(self, state_binary):
+        self.set_state_json(zlib.decompress(state_binary).decode('utf-8') if state_binary else '')
+
+    def create_entity(self):
+        with self._lock:
+            eid = self._next_eid
+            self._next_eid += 1
+            self._entities[eid] = {}
+            return eid
+
+    def destroy_entity(self, eid):
+        with self._lock:
+            self._entity(eid)
+            del self._entities[eid]
+
+    def get_all_entities(self):
+        with self._lock:
+            return sorted(self._entities), self._tick
+
+    def assign_component(self, eid, component_name):
+        with self._lock:
+            components = self._entity(eid)
+            if component_name in components:
+                raise ValueError(f"Entity {eid} already has component '{component_name}'.")
+            components[component_name] = {}
+
+    def get_component_json(self, eid, component_name):
+        with self._lock:
+            return json.dumps(self._component(eid, component_name)), self._tick
+
+    def remove_component(self, eid, component_name):
+        with self._lock:
+            self._component(eid, component_name)
+            del self._entities[eid][component_name]
+
+    def replace_component(self, eid, component_name, component_json):
+        value = json.loads(component_json)
+        with self._lock:
+            self._component(eid, component_name)
+            self._entities[eid][component_name] = value
+
+    def get_component_names(self):
+        with self._lock:
+            return sorted({name for components in self._entities.values() for name in components})
+
+    def get_entity_component_names(self, eid):
+        with self._lock:
+            return sorted(self._entity(eid)), self._tick
+
+    def get_singleton_json(self, singleton_name):
+        with self._lock:
+            return json.dumps(self._singletons.get(singleton_name, {})), self._tick
+
+    def set_singleton_json(self, singleton_name, singleton_json):
+        value = json.loads(singleton_json)
+        with self._lock:
+            self._singletons[singleton_name] = value
+
+    def get_singleton_names(self):
+        with self._lock:
+            return sorted(self._singletons)
+
+    def get_component_columns(self, component_names):
+        """
+        :return: A dict mapping each component name to a list of (eid, component) pairs, and the tick.
+        """
+        with self._lock:
+            columns = {name: [] for name in component_names}
+            for eid in sorted(self._entities):
+                for name, component in self._entities[eid].items():
+                    if name in columns:
+                        columns[name].append((eid, component))
+            return columns, self._tick
+
+    def get_component_jsons(self, component_names=None):
+        """
+        :return: A dict mapping the eid of every entity with at least one of the components (or any component if
+        component_names is None) to a dict of those components as JSON strings, and the tick.
+        """
+        with self._lock:
+            result = {}
+            for eid, components in self._entities.items():
+                jsons = {name: json.dumps(component) for name, component in components.items()
+                         if component_names is None or name in component_names}
+                if jsons:
+                    result[eid] = jsons
+            return result, self._tick
+
+    def is_running(self):
+        return self._run_thread is not None and self._run_thread.is_alive()
+
+    def start(self, stop_at_tick=0):
+        with self._lock:
+            self._stop_at_tick = stop_at_tick
+            if self.is_running():
+                return
+            self._stop_requested.clear()
+            self._run_thread = Thread(target=self._run, daemon=True)
+            self._run_thread.start()
+
+    def stop(self):
+        self._stop_requested.set()
+        thread = self._run_thread
+        if thread is not None:
+            thread.join()
+        self._run_thread = None
+
+    def _run(self):
+        while not self._stop_requested.is_set():
+            sleep(self.tick_interval)
+            with self._lock:
+                self._tick += 1
+                tick = self._tick
+                stop_at_tick = self._stop_at_tick
+
+            if self.tick_callback is not None:
+                self.tick_callback(tick)
+
+            if 0 < stop_at_tick <= tick:
+                break
+
+    def _entity(self, eid):
+        try:
+            return self._entities[eid]
+        except KeyError:
+            raise ValueError(f"Entity {eid} does not exist.") from None
+
+    def _component(self, eid, component_name):
+        components = self._entity(eid)
+        try:
+            return components[component_name]
+        except KeyError:
+            raise ValueError(f"Entity {eid} does not have component '{component_name}'.") from None
+
+
+class StandInService(sim_grpc.SimulationServicer):
+    """
+    Serves a StandInSimulation with the same token rules as the SimulationServer's service.
+    """
+    def __init__(self, simulation: StandInSimulation, owner_token="", state_bin_interval=500000, events_per_tick=0,
+                 snapshot_ring: SnapshotRing = None):
+        """
+        :param events_per_tick: The number of 'sim.standin' events published every tick, in place of the events
+        a real simulation would emit.
+        :param snapshot_ring: If given, state snapshots are written into the ring and published as
+        'meta.state_ref' events, unless they do not fit in a slot.
+        """
+        self._simulation = simulation
+        self._owner_token = owner_token or ""
+        self._editor_token = ""
+        self._snapshot_policy = sim.SnapshotPolicy(tick_interval=state_bin_interval)
+        # Running time since the last snapshot, accumulated while the simulation runs
+        self._snapshot_elapsed = 0.0
+        self._snapshot_resumed = None
+        self._adaptive_snapshot_interval = 0.0
+        self._events_per_tick = events_per_tick
+        self._snapshot_ring = snapshot_ring
+        self._subscribers = []
+        self._subscribers_lock = RLock()
+        self._was_running = False
+
+        simulation.tick_callback = self._on_tick
+
+    def _publish(self, tick, events):
+        response = sim.GetEventsResponse(tick=tick, events=events)
+        with self._subscribers_lock:
+            subscribers = list(self._subscribers)
+        for queue in subscribers:
+            try:
+                queue.put(response, timeout=1)
+            except Full:
+                pass
+
+    def _on_tick(self, tick):
+        if self._events_per_tick:
+            self._publish(tick, [sim.EventMessage(name='sim.standin', json=f'{{"index": {i}}}')
+                                 for i in range(self._events_per_tick)])
+
+        policy = self._snapshot_policy
+        if self._is_snapshot_due(policy, tick):
+            state_binary, _ = self._simulation.get_state_binary()
+            self._snapshot_elapsed = 0.0
+            self._snapshot_resumed = monotonic()
+            if policy.bytes_per_hour:
+                self._adaptive_snapshot_interval = len(state_binary) * 3600 / policy.bytes_per_hour
+
+            ref = self._snapshot_ring.write(state_binary) if self._snapshot_ring is not None else None
+            if ref is not None:
+                slot, sequence, size = ref
+                ref_json = json.dumps({'slot': slot, 'sequence': sequence, 'size': size})
+                self._publish(tick, [sim.EventMessage(name='meta.state_ref', json=ref_json)])
+            else:
+                self._publish(tick, [sim.EventMessage(name='meta.state_bin', bin=state_binary)])
+
+        if 0 < self._simulation.get_stop_at_tick() <= tick:
+            self._send_runner_update(tick, False)
+
+    def _is_snapshot_due(self, policy, tick):
+        if policy.tick_interval and tick % policy.tick_interval == 0:
+            return True
+
+        elapsed = self._snapshot_elapsed
+        if self._snapshot_resumed is not None:
+            elapsed += monotonic() - self._snapshot_resumed
+
+        if policy.time_interval > 0 and elapsed >= policy.time_interval:
+            return True
+
+        return bool(policy.bytes_per_hour) and elapsed >= self._adaptive_snapshot_interval
+
+    def _send_runner_update(self, tick, running):
+        if self._was_running == running:
+            return
+        self._was_running = running
+        event = sim.EventMessage(name='runner.update', json=json.dumps({'sim_running': running}))
+        self._publish(tick, [event])
+
+    def _start(self, stop_at_tick=0):
+        if not self._simulation.is_running() and (stop_at_tick == 0 or self._simulation.get_tick() < stop_at_tick):
+            self._send_runner_update(self._simulation.get_tick(), True)
+            self._snapshot_resumed = monotonic()
+            self._simulation.start(stop_at_tick)
+
+    def _stop(self):
+        if self._simulation.is_running():
+            self._simulation.stop()
+            if self._snapshot_resumed is not None:
+                self._snapshot_elapsed += monotonic() - self._snapshot_resumed
+                self._snapshot_resumed = None
+        self._send_runner_update(self._simulation.get_tick(), False)
+
+    @staticmethod
+    def _user_token(context):
+        for key, value in context.invocation_metadata():
+            if key == 'x-user-token':
+                return value
+        return None
+
+    def _is_editing(self):
+        return bool(self._editor_token)
+
+    def _is_editor(self, context):
+        return bool(self._editor_token) and self._user_token(context) == self._editor_token
+
+    def _is_owner(self, context):
+        return bool(self._owner_token) and self._user_token(context) == self._owner_token
+
+    def _assert_editor(self, context):
+        if not self._is_editor(context):
+            context.abort(grpc.StatusCode.PERMISSION_DENIED, "Method can only be called by editor.")
+
+    def _assert_owner(self, context):
+        if not self._owner_token:
+            context.abort(grpc.StatusCode.FAILED_PRECONDITION,
+                          "Method can only be called by owner, and no owner is configured.")
+        if not self._is_owner(context):
+            context.abort(grpc.StatusCode.PERMISSION_DENIED, "Method can only be called by owner.")
+
+    def _assert_not_editing(self, context):
+        if self._is_editing():
+            context.abort(grpc.StatusCode.FAILED_PRECONDITION,
+                          "Method can only be called while the simulation is not being edited.")
+
+    def _assert_not_running(self, context):
+        if self._simulation.is_running():
+            context.abort(grpc.StatusCode.FAILED_PRECONDITION,
+                          "Method can only be called while the simulation is not running.")
+
+    def _call(self, context, func, *args):
+        try:
+            return func(*args)
+        except (ValueError, KeyError) as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+
+    def GetTick(self, request, context):
+        return sim.GetTickResponse(tick=self._simulation.get_tick())
+
+    def GetStateJson(self, request, context):
+        state_json, tick = self._simulation.get_state_json()
+        return sim.GetStateJsonResponse(json=state_json, tick=tick)
+
+    def SetStateJson(self, request, context):
+        self._assert_editor(context)
+        self._call(context, self._simulation.set_state_json, request.json)
+        return sim.SetStateJsonResponse()
+
+    def CreateEntity(self, request, context):
+        self._assert_editor(context)
+        return sim.CreateEntityResponse(eid=self._simulation.create_entity())
+
+    def DestroyEntity(self, request, context):
+        self._assert_editor(context)
+        self._call(context, self._simulation.destroy_entity, request.eid)
+        return sim.DestroyEntityResponse()
+
+    def GetAllEntities(self, request, context):
+        eids, tick = self._simulation.get_all_entities()
+        return sim.GetAllEntitiesResponse(eids=eids, tick=tick)
+
+    def StartSimulation(self, request, context):
+        self._assert_not_editing(context)
+        self._start()
+        return sim.StartSimulationResponse()
+
+    def StopSimulation(self, request, context):
+        self._stop()
+        return sim.StopSimulationResponse()
+
+    def IsRunning(self, request, context):
+        return sim.IsRunningResponse(running=self._simulation.is_running())
+
+    def AssignComponent(self, request, context):
+        self._assert_editor(context)
+        self._call(context, self._simulation.assign_component, request.eid, request.component_name)
+        return sim.AssignComponentResponse()
+
+    def GetComponentJson(self, request, context):
+        component_json, tick = self._call(context, self._simulation.get_component_json,
+                                          request.eid, request.component_name)
+        return sim.GetComponentJsonResponse(json=component_json, tick=tick)
+
+    def RemoveComponent(self, request, context):
+        self._assert_editor(context)
+        self._call(context, self._simulation.remove_component, request.eid, request.component_name)
+        return sim.RemoveComponentResponse()
+
+    def ReplaceComponent(self, request, context):
+        self._assert_editor(context)
+        self._call(context, self._simulation.replace_component, request.eid, request.component_name, request.json)
+        return sim.ReplaceComponentResponse()
+
+    def GetComponentNames(self, request, context):
+        return sim.GetComponentNamesResponse(component_names=self._simulation.get_component_names())
+
+    def GetEntityComponentNames(self, request, context):
+        names, tick = self._call(context, self._simulation.get_entity_component_names, request.eid)
+        return sim.GetEntityComponentNamesResponse(component_names=names, tick=tick)
+
+    def GetSingletonJson(self, request, context):
+        singleton_json, tick = self._simulation.get_singleton_json(request.singleton_name)
+        return sim.GetSingletonJsonResponse(json=singleton_json, tick=tick)
+
+    def SetSingletonJson(self, request, context):
+        self._assert_editor(context)
+        self._call(context, self._simulation.set_singleton_json, request.singleton_name, request.json)
+        return sim.SetSingletonJsonResponse()
+
+    def GetSingletonNames(self, request, context):
+        return sim.GetSingletonNamesResponse(singleton_names=self._simulation.get_singleton_names())
+
+    def GetEvents(self, request, context):
+        queue = Queue(100)
+        with self._subscribers_lock:
+            self._subscribers.append(queue)
+
+        try:
+            while context.is_active():
+                try:
+                    yield queue.get(timeout=0.1)
+                except Empty:
+                    pass
+        finally:
+            with self._subscribers_lock:
+                self._subscribers.remove(queue)
+
+    def GetStateBinary(self, request, context):
+        state_binary, tick = self._simulation.get_state_binary()
+        return sim.GetStateBinaryResponse(binary=state_binary, tick=tick)
+
+    def SetStateBinary(self, request, context):
+        self._assert_editor(context)
+        self._call(context, self._simulation.set_state_binary, request.binary)
+        return sim.SetStateBinaryResponse()
+
+    def GetStateBinaryStream(self, request, context):
+        chunk_size = request.chunk_size or 1024 * 1024
+        state_binary, tick = self._simulation.get_state_binary()
+        view = memoryview(state_binary)
+
+        offset = 0
+        while True:
+            chunk = sim.StateBinaryChunk(offset=offset, data=bytes(view[offset:offset + chunk_size]))
+            if offset == 0:
+                chunk.total_size = len(state_binary)
+                chunk.tick = tick
+            yield chunk
+            offset += chunk_size
+            if offset >= len(state_binary):
+                break
+
+    def SetStateBinaryStream(self, request_iterator, context):
+        self._assert_editor(context)
+
+        state_binary = None
+        received = 0
+        for chunk in request_iterator:
+            if state_binary is None:
+                state_binary = bytearray(chunk.total_size)
+            end = received + len(chunk.data)
+            if chunk.offset != received or end > len(state_binary):
+                context.abort(grpc.StatusCode.INVALID_ARGUMENT,
+                              f"Chunk at offset {chunk.offset} of {len(chunk.data)} bytes does not follow "
+                              f"the {received} bytes received of a {len(state_binary)} byte state.")
+            state_binary[received:end] = chunk.data
+            received = end
+
+        if state_binary is None or received != len(state_binary):
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT,
+                          f"Stream ended after {received} bytes of a "
+                          f"{0 if state_binary is None else len(state_binary)} byte state.")
+
+        self._call(context, self._simulation.set_state_binary, bytes(state_binary))
+        return sim.SetStateBinaryResponse()
+
+    def RunCommand(self, request, context):
+        args = list(request.args)
+        err = ""
+        output = ""
+
+        if not args:
+            err = "No command provided."
+        elif args[0] == 'sim':
+            if not self._is_editor(context):
+                err = f"'{args[0]}' command only allowed by editor."
+            else:
+                err = "The stand-in simulation has no commands."
+        elif args[0] in ('run', 'run_until', 'run_for'):
+            if self._is_editing():
+                err = f"'{args[0]}' command only allowed while not in edit mode."
+            elif args[0] == 'run':
+                self._start()
+            else:
+                try:
+                    count = int(args[1])
+                except (IndexError, ValueError):
+                    err = f"'{args[0]} <tick>' format was incorrect"
+                else:
+                    if args[0] == 'run_for':
+                        count += self._simulation.get_tick()
+                    self._start(count)
+        elif args[0] == 'tick':
+            output = str(self._simulation.get_tick())
+        else:
+            err = f"Unknown command '{args[0]}'"
+
+        return sim.RunCommandResponse(err=err, output=output)
+
+    def SetSnapshotPolicy(self, request, context):
+        self._assert_owner(context)
+        self._snapshot_policy = request.policy
+        return sim.SetSnapshotPolicyResponse()
+
+    def SetEditorToken(self, request, context):
+        self._assert_owner(context)
+        self._assert_not_running(context)
+        self._editor_token = request.token
+        return sim.SetEditorTokenResponse()
+
+    def SetOwnerToken(self, request, context):
+        self._assert_owner(context)
+        if not request.token:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "The owner token cannot be empty.")
+        self._owner_token = request.token
+        return sim.SetOwnerTokenResponse()
+
+    def IsEditing(self, request, context):
+        if request.check_self_only:
+            return sim.IsEditingResponse(is_editing=self._is_editor(context))
+        return sim.IsEditingResponse(is_editing=self._is_editing())
+
+    def GetComponentColumns(self, request, context):
+        names = [query.component_name for query in request.columns]
+        if len(set(names)) != len(names):
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "A component was requested more than once.")
+
+        columns, tick = self._simulation.get_component_columns(names)
+        response = sim.GetComponentColumnsResponse(tick=tick)
+
+        for query in request.columns:
+            entries = columns[query.component_name]
+            column = response.columns.add(component_name=query.component_name,
+                                          eids=[eid for eid, _ in entries])
+
+            if query.format == sim.ComponentColumnQuery.JSON:
+                column.json = json.dumps([component for _, component in entries])
+            elif query.format == sim.ComponentColumnQuery.BINARY:
+                try:
+                    column.fields[:], column.binary = _pack_components([component for _, component in entries])
+                except (ValueError, TypeError, AttributeError) as e:
+                    context.abort(grpc.StatusCode.INVALID_ARGUMENT,
+                                  f"Component '{query.component_name}' cannot be packed as binary: {e}")
+
+        return response
+
+    def SubscribeStateDeltas(self, request, context):
+        followed = set(request.component_names) or None
+        interval = 1 / (request.max_rate if request.max_rate > 0 else 10.0)
+
+        previous = {}
+        previous_tick = None
+
+        while context.is_active():
+            current, tick = self._simulation.get_component_jsons(followed)
+            delta = _diff_states(previous, current)
+            delta.tick = tick
+            delta.snapshot = previous_tick is None
+
+            changed = delta.created_eids or delta.destroyed_eids or delta.changed_components or delta.removed_components
+            if delta.snapshot or changed or tick != previous_tick:
+                yield delta
+
+            previous = current
+            previous_tick = tick
+            sleep(interval)
+
+    def BatchEdit(self, request, context):
+        self._assert_editor(context)
+
+        response = sim.BatchEditResponse()
+        skip_remaining = False
+        # one per create operation, None for the ones that failed or were skipped
+        created_eids = []
+
+        for operation in request.operations:
+            is_create = operation.WhichOneof('operation') == 'create_entity'
+            if skip_remaining:
+                response.statuses.add(success=False, error="Skipped after an earlier operation failed.")
+                if is_create:
+                    created_eids.append(None)
+                continue
+
+            try:
+                self._apply_edit_operation(operation, created_eids)
+                response.statuses.add(success=True)
+            except (ValueError, KeyError) as e:
+                response.statuses.add(success=False, error=str(e))
+                if is_create:
+                    created_eids.append(None)
+                skip_remaining = request.stop_on_error
+
+        response.created_eids.extend(0 if eid is None else eid for eid in created_eids)
+        return response
+
+    def _apply_edit_operation(self, operation, created_eids):
+        def resolve(eid):
+            if operation.created_entity == 0:
+                return eid
+            index = operation.created_entity - 1
+            if index >= len(created_eids):
+                raise ValueError(f"Entity {operation.created_entity} has not been created in this batch.")
+            if created_eids[index] is None:
+                raise ValueError(f"Entity {operation.created_entity} failed to be created in this batch.")
+            return created_eids[index]
+
+        kind = operation.WhichOneof('operation')
+        simulation = self._simulation
+
+        if kind == 'create_entity':
+            created_eids.append(simulation.create_entity())
+        elif kind == 'destroy_entity':
+            simulation.destroy_entity(resolve(operation.destroy_entity.eid))
+        elif kind == 'assign_component':
+            edit = operation.assign_component
+            simulation.assign_component(resolve(edit.eid), edit.component_name)
+        elif kind == 'remove_component':
+            edit = operation.remove_component
+            simulation.remove_component(resolve(edit.eid), edit.component_name)
+        elif kind == 'replace_component':
+            edit = operation.replace_component
+            simulation.replace_component(resolve(edit.eid), edit.component_name, edit.json)
+        elif kind == 'set_singleton_json':
+            edit = operation.set_singleton_json
+            simulation.set_singleton_json(edit.singleton_name, edit.json)
+        else:
+            raise ValueError("Edit operation is empty.")
+
+
+def _diff_states(previous, current):
+    delta = sim.StateDelta()
+
+    delta.destroyed_eids[:] = [eid for eid in previous if eid not in current]
+
+    for eid, components in current.items():
+        previous_components = previous.get(eid)
+        if previous_components is None:
+            delta.created_eids.append(eid)
+            previous_components = {}
+
+        for name, component_json in components.items():
+            if previous_components.get(name) != component_json:
+                delta.changed_components.add(eid=eid, component_name=name, json=component_json)
+
+        for name in previous_components:
+            if name not in components:
+                delta.removed_components.add(eid=eid, component_name=name)
+
+    return delta
+
+
+def _pack_components(components):
+    fields = list(components[0].keys()) if components else []
+    values = array('d')
+    for component in components:
+        for field in fields:
+            value = component.get(field)
+            if isinstance(value, (bool, int, float)):
+                values.append(float(value))
+            else:
+                raise ValueError(f"Field '{field}' is not a number.")
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return fields, values.tobytes()
+
+
+def _write_status(status):
+    sys.stdout.buffer.write(status.replace('\r', ' ').replace('\n', ' ').encode('utf-8') + b'\n')
+    sys.stdout.buffer.flush()
+
+
+def _write_state(simulation, output_format, output_file, acknowledge):
+    if output_format == 'json':
+        data = simulation.get_state_json()[0].encode('utf-8')
+    else:
+        data = simulation.get_state_binary()[0]
+
+    append_newline = output_format == 'json'
+
+    if output_file:
+        with open(output_file, 'wb') as f:
+            f.write(data)
+            if append_newline:
+                f.write(b'\r\n')
+        if acknowledge:
+            _write_status("ok")
+    else:
+        out = sys.stdout.buffer
+        if acknowledge:
+            _write_status(f"ok {len(data)}")
+            out.write(data)
+        else:
+            out.write(data)
+            if append_newline:
+                out.write(b'\r\n')
+        out.flush()
+
+
+def _read_state(simulation, input_format, input_file):
+    if input_format == 'json':
+        simulation.set_state_json(Path(input_file).read_text())
+    else:
+        simulation.set_state_binary(Path(input_file).read_bytes())
+
+
+def _existing_file(path):
+    if not Path(path).is_file():
+        raise argparse.ArgumentTypeError(f"File '{path}' does not exist.")
+    return path
+
+
+def _serve(args):
+    simulation = StandInSimulation(args.tickInterval)
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=16))
+    snapshot_ring = SnapshotRing(args.snapshotRing) if args.snapshotRing else None
+    service = StandInService(simulation, args.ownerToken, args.stateBinInterval, args.eventsPerTick, snapshot_ring)
+    sim_grpc.add_SimulationServicer_to_server(service, server)
+    address = None
+    if args.unixSocket:
+        try:
+            if server.add_insecure_port(f'unix:{args.unixSocket}'):
+                address = f'unix:{args.unixSocket}'
+        except RuntimeError:
+            pass
+        if address is None:
+            print("Could not bind unix socket, falling back to a port.", file=sys.stderr)
+
+    port = 0
+    if address is None:
+        port = server.add_insecure_port(f'localhost:{args.port}')
+        address = f'localhost:{port}'
+    server.start()
+
+    while True:
+        command = sys.stdin.readline()
+        if not command or command.strip() == 'exit':
+            simulation.stop()
+            server.stop(0).wait()
+            return 0
+        elif command.strip() == 'port':
+            print(port)
+        elif command.strip() == 'address':
+            print(address)
+        else:
+            print("")
+        sys.stdout.flush()
+
+
+def _iterate_lines():
+    while True:
+        line = sys.stdin.readline()
+        if not line.strip():
+            return
+        yield line.rstrip('\r\n')
+
+
+def _convert(args):
+    simulation = StandInSimulation()
+
+    if args.io_from_input:
+        def files():
+            lines = _iterate_lines()
+            for input_file in lines:
+                yield input_file, sys.stdin.readline().rstrip('\r\n')
+    else:
+        if args.output and len(args.output) != len(args.input):
+            print("Number of output files does not match number of input files.")
+            return 1
+
+        def files():
+            for i, input_file in enumerate(args.input):
+                yield input_file, args.output[i] if args.output else None
+
+    for input_file, output_file in files():
+        try:
+            _read_state(simulation, args.input_format, input_file)
+            _write_state(simulation, args.output_format, output_file, args.acknowledge)
+        except Exception as e:
+            if not args.acknowledge:
+                raise
+            _write_status(f"error {e}")
+
+    return 0
+
+
+def _create_default(args):
+    if args.output_from_input:
+        outputs = _iterate_lines()
+    else:
+        outputs = [args.output]
+
+    for output_file in outputs:
+        try:
+            _write_state(StandInSimulation(), args.output_format, output_file, args.acknowledge)
+        except Exception as e:
+            if not args.acknowledge:
+                raise
+            _write_status(f"error {e}")
+
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Python stand-in for the SimulationServer executable.")
+    parser.add_argument('--tickInterval', type=float, default=0.001,
+                        help="Seconds between ticks of a running simulation.")
+    parser.add_argument('--eventsPerTick', type=int, default=0,
+                        help="Number of events a running simulation publishes every tick.")
+    parser.add_argument('--stateBinInterval', type=int, default=500000,
+                        help="Number of ticks between state snapshots of a running simulation.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser('serve')
+    serve.add_argument('-p', '--port', type=int, default=0)
+    serve.add_argument('-u', '--unixSocket')
+    serve.add_argument('-s', '--snapshotRing', type=_existing_file)
+    serve.add_argument('-o', '--ownerToken', default="")
+    serve.add_argument('simulation', type=_existing_file)
+    serve.set_defaults(func=_serve)
+
+    convert = commands.add_parser('convert')
+    convert.add_argument('-if', '--input_format', required=True, choices=('json', 'binary'))
+    convert.add_argument('-i', '--input', action='append', type=_existing_file)
+    convert.add_argument('-is', '--input_sim', required=True, type=_existing_file)
+    convert.add_argument('-of', '--output_format', required=True, choices=('json', 'binary'))
+    convert.add_argument('-o', '--output', action='append')
+    convert.add_argument('-os', '--output_sim', type=_existing_file)
+    convert.add_argument('-iofi', '--io_from_input', action='store_true')
+    convert.add_argument('-ack', '--acknowledge', action='store_true')
+    convert.set_defaults(func=_convert)
+
+    create_default = commands.add_parser('create-default')
+    create_default.add_argument('-o', '--output')
+    create_default.add_argument('-of', '--output_format', required=True, choices=('json', 'binary'))
+    create_default.add_argument('-os', '--output_sim', required=True, type=_existing_file)
+    create_default.add_argument('-ofi', '--output_from_input', action='store_true')
+    create_default.add_argument('-ack', '--acknowledge', action='store_true')
+    create_default.set_defaults(func=_create_default)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'convert' and args.io_from_input == bool(args.input):
+        parser.error("Either --io_from_input or --input must be provided.")
+    if args.command == 'create-default' and args.output_from_input and args.output:
+        parser.error("Cannot combine output_from_input flag with output option.")
+
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,17 +3,323 @@
 """
 from subprocess import Popen, PIPE
 from pathlib import Path
+from collections import defaultdict, deque, namedtuple
+from threading import Thread, RLock, Condition, Event, current_thread
+from queue import Queue, Empty
+from dataclasses import dataclass
+from typing import Optional
+from contextlib import contextmanager
+from secrets import token_hex
+from time import perf_counter
+import os
+import mmap
+import socket
+import asyncio
+import json
+import struct
 
 import grpc
+import grpc.aio
+import metrics
 import simulation_pb2 as sim
 import simulation_pb2_grpc as sim_grpc
 
 RpcError = grpc.RpcError
+SIMULATION_CLIENT_METRICS = metrics.RpcMetrics('simulation_client')
+ComponentColumn = namedtuple('ComponentColumn', 'eids, fields, values')
+
+_COLUMN_FORMATS = {
+    'json': sim.ComponentColumnQuery.JSON,
+    'binary': sim.ComponentColumnQuery.BINARY,
+    'eids': sim.ComponentColumnQuery.EIDS_ONLY,
+}
+
+
+def _make_component_columns_request(columns):
+    if isinstance(columns, dict):
+        items = columns.items()
+    else:
+        items = ((name, 'json') for name in columns)
+
+    request = sim.GetComponentColumnsRequest()
+    for name, column_format in items:
+        try:
+            request.columns.add(component_name=name, format=_COLUMN_FORMATS[column_format])
+        except KeyError:
+            raise ValueError(f"Unknown column format '{column_format}'.") from None
+    return request
+
+
+def _unpack_component_columns(request, response):
+    columns = {}
+    for query, column in zip(request.columns, response.columns):
+        eids = list(column.eids)
+        fields = None
+        values = None
+
+        if query.format == sim.ComponentColumnQuery.JSON:
+            values = json.loads(column.json)
+        elif query.format == sim.ComponentColumnQuery.BINARY:
+            fields = tuple(column.fields)
+            if fields:
+                values = list(struct.iter_unpack('<' + 'd' * len(fields), column.binary))
+            else:
+                values = [() for _ in eids]
+
+        columns[column.component_name] = ComponentColumn(eids, fields, values)
+    return columns, response.tick
+
+
+STATE_CHUNK_SIZE = 1024 * 1024
+
+
+class _StateChunkAssembler:
+    """
+    Assembles a state binary from its chunks, into a buffer allocated once for the whole state.
+    Chunks are added as they arrive, so the same assembly serves both the blocking and the asyncio clients.
+    """
+    def __init__(self):
+        self._state_binary = None
+        self._view = None
+        self._tick = 0
+
+    def add(self, chunk):
+        if self._state_binary is None:
+            self._state_binary = bytearray(chunk.total_size)
+            self._view = memoryview(self._state_binary)
+            self._tick = chunk.tick
+        self._view[chunk.offset:chunk.offset + len(chunk.data)] = chunk.data
+
+    def result(self):
+        """
+        :return: The assembled state as a bytearray, and the tick.
+        """
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        return self._state_binary, self._tick
+
+
+def _assemble_state_chunks(chunks):
+    assembler = _StateChunkAssembler()
+    for chunk in chunks:
+        assembler.add(chunk)
+    return assembler.result()
+
+
+def _write_state_chunks(chunks, f):
+    tick = 0
+    for chunk in chunks:
+        if chunk.offset == 0:
+            tick = chunk.tick
+        f.write(chunk.data)
+    return tick
+
+
+def _buffer_state_chunks(state_binary, chunk_size):
+    view = memoryview(state_binary)
+    offset = 0
+    while True:
+        chunk = sim.StateBinaryChunk(offset=offset, data=bytes(view[offset:offset + chunk_size]))
+        if offset == 0:
+            chunk.total_size = len(view)
+        yield chunk
+        offset += chunk_size
+        if offset >= len(view):
+            break
+
+
+def _file_state_chunks(f, chunk_size):
+    total_size = os.fstat(f.fileno()).st_size
+    offset = 0
+    while True:
+        chunk = sim.StateBinaryChunk(offset=offset, data=f.read(chunk_size))
+        if offset == 0:
+            chunk.total_size = total_size
+        yield chunk
+        offset += len(chunk.data)
+        if not chunk.data or offset >= total_size:
+            break
+
+
+def _binary_signature(simulation_binary_path):
+    # Simulation sources can be rebuilt in place, so long-lived processes are only reused
+    # while the binary they loaded is unchanged on disk.
+    try:
+        stat = os.stat(simulation_binary_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class SnapshotOverwrittenError(RuntimeError):
+    """
+    A snapshot was overwritten in its ring slot before it was read.
+    """
+    pass
+
+
+class SnapshotRing:
+    """
+    A memory mapped file of fixed size slots that a simulation server writes state snapshots into, so that
+    the event stream only has to carry a reference to the slot instead of the snapshot itself.
+
+    The file starts with a header (magic, version, slot count, slot size). Each slot starts with the sequence
+    number and size of the snapshot it holds, followed by the snapshot. Writers zero the sequence number
+    while a slot is being rewritten, so readers detect a slot that was reused while they read it.
+    """
+    MAGIC = b'GWSR'
+    VERSION = 1
+    _FILE_HEADER = struct.Struct('<4sIIQ')
+    _FILE_HEADER_SIZE = 32
+    _SLOT_HEADER = struct.Struct('<QQ')
+
+    @staticmethod
+    def create(path, slot_count=4, slot_size=16 * 1024 * 1024):
+        """
+        Creates the ring file, replacing any existing file, and opens it.
+        """
+        path = Path(path)
+        with open(path, 'wb') as f:
+            f.write(SnapshotRing._FILE_HEADER.pack(SnapshotRing.MAGIC, SnapshotRing.VERSION, slot_count, slot_size))
+            f.truncate(SnapshotRing._FILE_HEADER_SIZE + slot_count * (SnapshotRing._SLOT_HEADER.size + slot_size))
+        return SnapshotRing(path)
+
+    def __init__(self, path):
+        """
+        Opens an existing ring file.
+        """
+        self.path = Path(path)
+        self._file = open(self.path, 'r+b')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0)
+        except BaseException:
+            self._file.close()
+            raise
+
+        magic, version, self.slot_count, self.slot_size = SnapshotRing._FILE_HEADER.unpack_from(self._mmap, 0)
+        if magic != SnapshotRing.MAGIC or version != SnapshotRing.VERSION:
+            self.close()
+            raise ValueError(f"{self.path} is not a version {SnapshotRing.VERSION} snapshot ring.")
+
+        self._lock = RLock()
+        self._sequence = max(self._read_slot_header(slot)[0] for slot in range(self.slot_count))
+
+    def _slot_offset(self, slot):
+        return SnapshotRing._FILE_HEADER_SIZE + slot * (SnapshotRing._SLOT_HEADER.size + self.slot_size)
+
+    def _read_slot_header(self, slot):
+        return SnapshotRing._SLOT_HEADER.unpack_from(self._mmap, self._slot_offset(slot))
+
+    def write(self, data):
+        """
+        Writes a snapshot into the next slot.
+        :return: The (slot, sequence, size) reference to the snapshot, or None if it does not fit in a slot.
+        """
+        size = len(data)
+        if size > self.slot_size:
+            return None
+
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+            slot = sequence % self.slot_count
+            offset = self._slot_offset(slot)
+            data_offset = offset + SnapshotRing._SLOT_HEADER.size
+
+            SnapshotRing._SLOT_HEADER.pack_into(self._mmap, offset, 0, 0)
+            self._mmap[data_offset:data_offset + size] = data
+            SnapshotRing._SLOT_HEADER.pack_into(self._mmap, offset, sequence, size)
+
+        return slot, sequence, size
+
+    def read(self, slot, sequence, size):
+        """
+        :return: A copy of the referenced snapshot.
+        """
+        data_offset = self._checked_data_offset(slot, sequence, size)
+        data = self._mmap[data_offset:data_offset + size]
+        self._checked_data_offset(slot, sequence, size)
+        return data
+
+    def copy_to(self, slot, sequence, size, f):
+        """
+        Writes the referenced snapshot to a binary file at its current position, copying it in the kernel
+        where possible instead of through Python.
+        """
+        data_offset = self._checked_data_offset(slot, sequence, size)
+
+        f.flush()
+        copied = 0
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while copied < size:
+                    count = os.copy_file_range(self._file.fileno(), f.fileno(), size - copied, data_offset + copied)
+                    if count == 0:
+                        break
+                    copied += count
+            except OSError:
+                # Not supported between these files, the rest is copied from the mapping
+                pass
+
+        if copied > 0:
+            # The copy moved the file descriptor's position, resync the file object with it
+            f.seek(os.lseek(f.fileno(), 0, os.SEEK_CUR))
+        if copied < size:
+            f.write(self._mmap[data_offset + copied:data_offset + size])
+
+        self._checked_data_offset(slot, sequence, size)
+
+    def _checked_data_offset(self, slot, sequence, size):
+        if not 0 <= slot < self.slot_count or size > self.slot_size:
+            raise ValueError(f"Invalid snapshot reference: slot {slot}, size {size}.")
+        if self._read_slot_header(slot) != (sequence, size):
+            raise SnapshotOverwrittenError(f"Snapshot {sequence} in slot {slot} was overwritten.")
+        return self._slot_offset(slot) + SnapshotRing._SLOT_HEADER.size
+
+    def close(self):
+        self._mmap.close()
+        self._file.close()
 
 
 class SimulationProcess:
     _simulation_server_path = str(Path(__file__).parent /
                                   r'.\SimulationServer\bin\x64\Release\netcoreapp3.1\SimulationServer.exe')
+    _simulation_server_command = None
+    _default_transport = 'auto'
+    # Unix socket paths are limited to around 108 bytes, longer runtime paths fall back to TCP
+    _max_socket_path_length = 100
+
+    @staticmethod
+    def set_default_transport(transport):
+        """
+        Sets how processes created without an explicit transport are connected to.
+        :param transport: 'tcp' to serve on a localhost port, 'unix' to serve on a unix domain socket in the
+        process's runtime directory, or 'auto' to use 'unix' on POSIX systems and 'tcp' elsewhere.
+        Unix domain sockets fall back to TCP if no runtime directory is given or the socket cannot be bound.
+        """
+        if transport not in ('tcp', 'unix', 'auto'):
+            raise ValueError(f"Unknown transport '{transport}'.")
+        SimulationProcess._default_transport = transport
+
+    @staticmethod
+    def get_default_transport():
+        return SimulationProcess._default_transport
+
+    @staticmethod
+    def set_simulation_server_command(command):
+        """
+        Overrides the command used to run the simulation server, for example
+        [sys.executable, 'sim_standin.py'] to use the Python stand-in server.
+        :param command: The command as a list of arguments, or None to use the SimulationServer executable.
+        """
+        SimulationProcess._simulation_server_command = list(command) if command is not None else None
+
+    @staticmethod
+    def get_simulation_server_command():
+        if SimulationProcess._simulation_server_command is not None:
+            return list(SimulationProcess._simulation_server_command)
+        return [SimulationProcess._simulation_server_path]
 
     @staticmethod
     def simple_convert(input_file: str,
@@ -23,7 +329,7 @@ class SimulationProcess:
                        output_format: str,
                        output_sim_path: str = None):
         args = []
-        args.append(SimulationProcess._simulation_server_path)
+        args.extend(SimulationProcess.get_simulation_server_command())
         args.append('convert')
         args.extend(('-i', input_file))
         args.extend(('-if', input_format))
@@ -45,7 +351,7 @@ class SimulationProcess:
                          output_format: str,
                          output_sim_path: str = None):
         args = []
-        args.append(SimulationProcess._simulation_server_path)
+        args.extend(SimulationProcess.get_simulation_server_command())
         args.append('convert')
         args.extend(('-if', input_format))
         args.extend(('-is', input_sim_path))
@@ -70,7 +376,7 @@ class SimulationProcess:
                                    output_format: str,
                                    output_sim_path: str = None):
         args = []
-        args.append(SimulationProcess._simulation_server_path)
+        args.extend(SimulationProcess.get_simulation_server_command())
         args.append('convert')
         args.extend(('-if', input_format))
         args.extend(('-is', input_sim_path))
@@ -97,7 +403,7 @@ class SimulationProcess:
                        output_format: str,
                        output_sim_path: str):
         args = []
-        args.append(SimulationProcess._simulation_server_path)
+        args.extend(SimulationProcess.get_simulation_server_command())
         args.append('create-default')
         args.extend(('-o', output_file))
         args.extend(('-of', output_format))
@@ -107,159 +413,963 @@ class SimulationProcess:
         if result != 0:
             raise RuntimeError("Creating default state file failed.")
 
-    def __init__(self, simulation_library_path):
+    def __init__(self, simulation_library_path, runtime_dir=None, transport=None,
+                 snapshot_slots=0, snapshot_slot_size=16 * 1024 * 1024):
+        """
+        :param runtime_dir: The directory to create the unix domain socket and snapshot ring in.
+        :param transport: 'tcp', 'unix' or 'auto'. Uses the default transport if None.
+        :param snapshot_slots: If non-zero and runtime_dir is given, the server hands state snapshots
+        over through a SnapshotRing with this many slots, instead of sending them in the event stream.
+        :param snapshot_slot_size: The largest snapshot a slot can hold. Larger snapshots are sent in the
+        event stream.
+        """
         self._simulation_library_path = simulation_library_path
+        self._runtime_dir = Path(runtime_dir) if runtime_dir is not None else None
+        self._transport = transport
+        self._snapshot_slots = snapshot_slots
+        self._snapshot_slot_size = snapshot_slot_size
 
         self._process = None
         self._port = None
+        self._address = None
+        self._socket_path = None
+        self._snapshot_ring = None
         self._channel = None
+        self._owner_token = ""
+
+        if transport is not None and transport not in ('tcp', 'unix', 'auto'):
+            raise ValueError(f"Unknown transport '{transport}'.")
 
     def __del__(self):
         self.stop()
 
+    def _make_socket_path(self):
+        transport = self._transport or SimulationProcess._default_transport
+        if transport == 'tcp' or (transport == 'auto' and os.name != 'posix'):
+            return None
+
+        if self._runtime_dir is None or not hasattr(socket, 'AF_UNIX'):
+            return None
+
+        socket_path = self._runtime_dir / f'sim-{token_hex(6)}.sock'
+        if len(str(socket_path)) > SimulationProcess._max_socket_path_length:
+            return None
+        return socket_path
+
     def start(self, owner_token=""):
-        process = Popen([
-            SimulationProcess._simulation_server_path,
-            'serve',
-            '-o', owner_token,
-            str(self._simulation_library_path)],
-                        stdout=PIPE, stdin=PIPE)
+        self._owner_token = owner_token
+
+        args = [*SimulationProcess.get_simulation_server_command(), 'serve', '-o', owner_token]
+        socket_path = self._make_socket_path()
+        if socket_path is not None:
+            socket_path.parent.mkdir(parents=True, exist_ok=True)
+            args.extend(('-u', str(socket_path)))
+        if self._snapshot_slots and self._runtime_dir is not None:
+            self._runtime_dir.mkdir(parents=True, exist_ok=True)
+            self._snapshot_ring = SnapshotRing.create(self._runtime_dir / f'sim-{token_hex(6)}.ring',
+                                                      self._snapshot_slots, self._snapshot_slot_size)
+            args.extend(('-s', str(self._snapshot_ring.path)))
+        args.append(str(self._simulation_library_path))
+
+        process = Popen(args, stdout=PIPE, stdin=PIPE)
         self._process = process
 
-        process.stdin.write(b"port\n")
+        process.stdin.write(b"address\n")
         process.stdin.flush()
-        self._port = int(process.stdout.readline())
+        self._address = process.stdout.readline().decode().strip()
+
+        if self._address.startswith('unix:'):
+            # the server reports the socket it bound, which is not always the path it was given
+            self._socket_path = Path(self._address[len('unix:'):])
+            self._port = None
+        else:
+            if socket_path is not None:
+                print(f"LOG: Simulation server could not bind {socket_path}, using TCP instead.")
+            self._port = int(self._address.rpartition(':')[2])
 
         self._channel = SimulationClient.make_channel(self.get_server_address())
 
     def stop(self):
-        if self._process.poll() is None:
+        if self._process is not None and self._process.poll() is None:
             self._channel.close()
             self._channel = None
             self._process.stdin.write(b"exit\n")
             self._process.stdin.flush()
             self._process.wait()
 
+        if self._socket_path is not None:
+            try:
+                self._socket_path.unlink()
+            except FileNotFoundError:
+                pass
+            self._socket_path = None
+
+        if self._snapshot_ring is not None:
+            self._snapshot_ring.close()
+            try:
+                self._snapshot_ring.path.unlink()
+            except FileNotFoundError:
+                pass
+            self._snapshot_ring = None
+
+    def is_alive(self):
+        return self._process is not None and self._process.poll() is None
+
+    def get_simulation_library_path(self):
+        return self._simulation_library_path
+
+    def get_owner_token(self):
+        return self._owner_token
+
+    def replace_owner_token(self, owner_token):
+        """
+        Makes owner_token the owner token of the running process. Whoever held the previous token is no longer
+        the owner.
+        """
+        self.make_client(self._owner_token).set_owner_token(owner_token)
+        self._owner_token = owner_token
+
     def get_port(self):
+        """
+        :return: The port the server is on, or None if it is on a unix domain socket.
+        """
         return self._port
 
+    def get_transport(self):
+        return 'unix' if self._socket_path is not None else 'tcp'
+
+    def get_snapshot_ring(self) -> Optional[SnapshotRing]:
+        """
+        :return: The ring 'meta.state_ref' events refer to, or None if snapshots are sent in the event stream.
+        """
+        return self._snapshot_ring
+
     def get_server_address(self):
-        return f'localhost:{self._port}'
+        return self._address
 
     def make_client(self, token=""):
         return SimulationClient(self._channel, token)
 
 
+class SimulationProcessPool:
+    """
+    Keeps idle, already started simulation processes ready for each simulation binary, so that
+    acquiring a process does not pay for process startup, library loading and the port handshake.
+    Processes are keyed by the resolved path of their simulation binary.
+    """
+    class _Stats:
+        __slots__ = ('warm_acquires', 'cold_acquires', 'recycled', 'discarded',
+                     'spawn_count', 'spawn_time_total', 'tti_count', 'tti_total', 'last_tti')
+
+        def __init__(self):
+            self.warm_acquires = 0
+            self.cold_acquires = 0
+            self.recycled = 0
+            self.discarded = 0
+            self.spawn_count = 0
+            self.spawn_time_total = 0.0
+            self.tti_count = 0
+            self.tti_total = 0.0
+            self.last_tti = None
+
+    @staticmethod
+    def _key(simulation_binary_path):
+        return str(Path(simulation_binary_path).resolve())
+
+    def __init__(self, default_pool_size=1, runtime_dir=None, transport=None, snapshot_slots=0):
+        """
+        :param runtime_dir: The directory started processes create their unix domain sockets and snapshot rings in.
+        :param transport: The transport of started processes, see SimulationProcess.set_default_transport.
+        :param snapshot_slots: The snapshot ring size of started processes, see SimulationProcess.
+        """
+        self.default_pool_size = default_pool_size
+        self.runtime_dir = runtime_dir
+        self.transport = transport
+        self.snapshot_slots = snapshot_slots
+        self._pool_sizes = {}
+        self._idle = defaultdict(deque)
+        self._starting = defaultdict(int)
+        self._refill_threads = set()
+        self._stats = defaultdict(SimulationProcessPool._Stats)
+        self._lock = RLock()
+        self._closed = False
+
+    def get_pool_size(self, simulation_binary_path):
+        with self._lock:
+            return self._pool_sizes.get(self._key(simulation_binary_path), self.default_pool_size)
+
+    def set_pool_size(self, simulation_binary_path, size):
+        """
+        Sets the number of idle processes kept ready for the given binary.
+        Excess idle processes are stopped, and missing ones are started in the background.
+        """
+        if size < 0:
+            raise ValueError("Pool size cannot be negative.")
+
+        key = self._key(simulation_binary_path)
+        with self._lock:
+            self._pool_sizes[key] = size
+            idle = self._idle[key]
+            excess = [idle.popleft() for _ in range(max(0, len(idle) - size))]
+
+        for process, _ in excess:
+            process.stop()
+
+        self._refill(key)
+
+    def prewarm(self, simulation_binary_path):
+        """
+        Starts idle processes for the given binary in the background, up to its pool size.
+        """
+        self._refill(self._key(simulation_binary_path))
+
+    def acquire(self, simulation_binary_path) -> SimulationProcess:
+        """
+        Returns a started simulation process for the given binary. An idle process is used if one
+        is available, otherwise a new process is started. The caller owns the returned process
+        until it is given back with release().
+        """
+        key = self._key(simulation_binary_path)
+        signature = _binary_signature(key)
+        stale = []
+        process = None
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Simulation process pool is closed.")
+
+            idle = self._idle[key]
+            while idle:
+                candidate, candidate_signature = idle.popleft()
+                if candidate_signature == signature and candidate.is_alive():
+                    process = candidate
+                    break
+                stale.append(candidate)
+
+            stats = self._stats[key]
+            stats.discarded += len(stale)
+            if process is not None:
+                stats.warm_acquires += 1
+            else:
+                stats.cold_acquires += 1
+
+        for candidate in stale:
+            candidate.stop()
+
+        if process is None:
+            process = self._spawn(key)
+
+        self._refill(key)
+
+        return process
+
+    def release(self, process: SimulationProcess):
+        """
+        Gives a process back to the pool. The process is reset and kept as an idle process for
+        its binary if the pool for that binary has room, and stopped otherwise. A kept process gets a new
+        owner token, so the owners of the process so far cannot control it once it is acquired again.
+        """
+        key = self._key(process.get_simulation_library_path())
+        signature = _binary_signature(key)
+
+        with self._lock:
+            keep = (not self._closed and
+                    process.is_alive() and
+                    len(self._idle[key]) < self._pool_sizes.get(key, self.default_pool_size))
+
+        if keep:
+            try:
+                client = process.make_client(process.get_owner_token())
+                client.stop_simulation()
+                client.set_editor_token("")
+                process.replace_owner_token(token_hex(32))
+            except RpcError:
+                keep = False
+
+        with self._lock:
+            if keep and not self._closed and len(self._idle[key]) < self._pool_sizes.get(key, self.default_pool_size):
+                self._idle[key].append((process, signature))
+                self._stats[key].recycled += 1
+                return
+            self._stats[key].discarded += 1
+
+        process.stop()
+
+    def record_time_to_interactive(self, simulation_binary_path, seconds):
+        with self._lock:
+            stats = self._stats[self._key(simulation_binary_path)]
+            stats.tti_count += 1
+            stats.tti_total += seconds
+            stats.last_tti = seconds
+
+    def get_metrics(self):
+        """
+        :return: A dict mapping each simulation binary path to a dict of pool metrics for it.
+        Times are in seconds.
+        """
+        with self._lock:
+            metrics = {}
+            for key in set(self._stats) | set(self._idle) | set(self._pool_sizes):
+                stats = self._stats[key]
+                metrics[key] = {
+                    'pool_size': self._pool_sizes.get(key, self.default_pool_size),
+                    'idle': len(self._idle[key]),
+                    'starting': self._starting[key],
+                    'warm_acquires': stats.warm_acquires,
+                    'cold_acquires': stats.cold_acquires,
+                    'recycled': stats.recycled,
+                    'discarded': stats.discarded,
+                    'mean_spawn_time': stats.spawn_time_total / stats.spawn_count if stats.spawn_count else None,
+                    'mean_time_to_interactive': stats.tti_total / stats.tti_count if stats.tti_count else None,
+                    'last_time_to_interactive': stats.last_tti,
+                }
+            return metrics
+
+    def close(self):
+        """
+        Stops all idle processes, and waits for processes still starting in the background so they are
+        stopped too. Processes released after closing are stopped instead of kept.
+        """
+        with self._lock:
+            self._closed = True
+            idle_processes = [process for idle in self._idle.values() for process, _ in idle]
+            self._idle.clear()
+            refill_threads = list(self._refill_threads)
+
+        for process in idle_processes:
+            process.stop()
+
+        for thread in refill_threads:
+            thread.join()
+
+    def _spawn(self, key):
+        start_time = perf_counter()
+        process = SimulationProcess(key, self.runtime_dir, self.transport, self.snapshot_slots)
+        process.start(token_hex(32))
+        spawn_time = perf_counter() - start_time
+
+        with self._lock:
+            stats = self._stats[key]
+            stats.spawn_count += 1
+            stats.spawn_time_total += spawn_time
+
+        return process
+
+    def _refill(self, key):
+        with self._lock:
+            if self._closed:
+                return
+            missing = (self._pool_sizes.get(key, self.default_pool_size)
+                       - len(self._idle[key]) - self._starting[key])
+            if missing <= 0:
+                return
+            self._starting[key] += missing
+
+            for _ in range(missing):
+                thread = Thread(target=self._refill_one, args=(key,), daemon=True)
+                self._refill_threads.add(thread)
+                thread.start()
+
+    def _refill_one(self, key):
+        try:
+            signature = _binary_signature(key)
+            try:
+                process = self._spawn(key)
+            except Exception as e:
+                print(f"LOG: Failed to start pooled simulation process for {key}: {e}")
+                with self._lock:
+                    self._starting[key] -= 1
+                return
+
+            with self._lock:
+                self._starting[key] -= 1
+                if not self._closed and len(self._idle[key]) < self._pool_sizes.get(key, self.default_pool_size):
+                    self._idle[key].append((process, signature))
+                    return
+
+            process.stop()
+        finally:
+            with self._lock:
+                self._refill_threads.discard(current_thread())
+
+
+class ConversionError(RuntimeError):
+    """
+    A single conversion failed. The converter that reported it can still be used.
+    """
+    pass
+
+
+class ConverterWorkerError(RuntimeError):
+    """
+    A converter process failed or stopped responding correctly, and cannot be used anymore.
+    """
+    pass
+
+
+@dataclass(frozen=True)
+class ConversionResult:
+    input_file: str
+    output_file: str
+    error: Optional[str] = None
+
+    def succeeded(self):
+        return self.error is None
+
+
+class ConverterWorker:
+    """
+    A long-lived 'convert' process that handles one file at a time, keeping its simulation libraries
+    loaded between conversions. If no input simulation is given, the worker is a 'create-default'
+    process that writes default states instead.
+    """
+    def __init__(self, input_format, input_sim_path, output_format, output_sim_path=None):
+        self.input_format = input_format
+        self.input_sim_path = input_sim_path
+        self.output_format = output_format
+        self.output_sim_path = output_sim_path
+        self.binary_signature = None
+        self.conversions = 0
+
+        self._process = None
+
+    def __del__(self):
+        self.stop()
+
+    def start(self):
+        args = []
+        args.extend(SimulationProcess.get_simulation_server_command())
+        if self.input_sim_path is None:
+            args.append('create-default')
+            args.extend(('-of', self.output_format))
+            args.extend(('-os', self.output_sim_path))
+            args.append('-ofi')
+        else:
+            args.append('convert')
+            args.extend(('-if', self.input_format))
+            args.extend(('-is', self.input_sim_path))
+            args.extend(('-of', self.output_format))
+            args.append('-iofi')
+            if self.output_sim_path:
+                args.extend(('-os', self.output_sim_path))
+        args.append('-ack')
+
+        self.binary_signature = (_binary_signature(self.input_sim_path) if self.input_sim_path else None,
+                                 _binary_signature(self.output_sim_path) if self.output_sim_path else None)
+        self._process = Popen(args, stdin=PIPE, stdout=PIPE)
+
+    def stop(self):
+        process = self._process
+        if process is None:
+            return
+        self._process = None
+
+        if process.poll() is None:
+            try:
+                process.stdin.write(b"\n")
+                process.stdin.close()
+                process.wait(5)
+            except (OSError, ValueError):
+                pass
+            finally:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+        process.stdout.close()
+
+    def is_alive(self):
+        return self._process is not None and self._process.poll() is None
+
+    def convert(self, input_file=None, output_file=None):
+        """
+        Converts one file. Default state workers take no input file.
+        :return: The converted state as bytes if no output file is given, otherwise None.
+        """
+        process = self._process
+        if process is None:
+            raise ConverterWorkerError("Converter worker is not started.")
+
+        if self.input_sim_path is None:
+            if not output_file:
+                raise ValueError("Default state workers require an output file.")
+            request = f'{output_file}\n'
+        else:
+            if not input_file:
+                raise ValueError("An input file is required.")
+            request = f'{input_file}\n{output_file or ""}\n'
+
+        try:
+            process.stdin.write(request.encode('utf-8'))
+            process.stdin.flush()
+            status = process.stdout.readline()
+        except (OSError, ValueError) as e:
+            raise ConverterWorkerError(f"Converter worker failed: {e}")
+
+        status = status.decode('utf-8').rstrip('\r\n')
+        if not status:
+            raise ConverterWorkerError("Converter worker exited unexpectedly.")
+
+        if status.startswith('error'):
+            raise ConversionError(status[len('error'):].strip() or "File conversion failed.")
+
+        parts = status.split(' ')
+        if parts[0] != 'ok':
+            raise ConverterWorkerError(f"Unexpected converter worker response: {status}")
+
+        self.conversions += 1
+
+        if len(parts) == 1:
+            return None
+
+        length = int(parts[1])
+        data = process.stdout.read(length)
+        if len(data) != length:
+            raise ConverterWorkerError("Converter worker output ended unexpectedly.")
+        return data
+
+
+class ConverterService:
+    """
+    Shares long-lived converter workers between callers and threads. Workers are kept per
+    (input format, input simulation, output format, output simulation) key, and are restarted if they fail.
+    """
+    class _Stats:
+        __slots__ = ('started', 'restarts', 'conversions', 'failures', 'waits')
+
+        def __init__(self):
+            self.started = 0
+            self.restarts = 0
+            self.conversions = 0
+            self.failures = 0
+            self.waits = 0
+
+    @staticmethod
+    def _key(input_format, input_sim_path, output_format, output_sim_path):
+        input_sim = str(Path(input_sim_path).resolve()) if input_sim_path else None
+        output_sim = str(Path(output_sim_path).resolve()) if output_sim_path else input_sim
+        return input_format, input_sim, output_format, output_sim
+
+    def __init__(self, max_workers_per_key=None, max_idle_per_key=2):
+        self.max_workers_per_key = max_workers_per_key or os.cpu_count() or 1
+        self.max_idle_per_key = max_idle_per_key
+        self._idle = defaultdict(list)
+        self._busy = defaultdict(int)
+        self._stats = defaultdict(ConverterService._Stats)
+        self._condition = Condition()
+        self._closed = False
+
+    def convert(self, input_file, input_format, input_sim_path, output_file, output_format, output_sim_path=None):
+        key = self._key(input_format, input_sim_path, output_format, output_sim_path)
+        self._run(key, lambda worker: worker.convert(input_file, output_file))
+
+    def convert_to_bytes(self, input_file, input_format, input_sim_path, output_format, output_sim_path=None):
+        key = self._key(input_format, input_sim_path, output_format, output_sim_path)
+        return self._run(key, lambda worker: worker.convert(input_file))
+
+    def convert_to_json(self, input_file, input_format, input_sim_path, output_sim_path=None):
+        return self.convert_to_bytes(input_file, input_format, input_sim_path, "json", output_sim_path).decode('utf-8')
+
+    def create_default(self, output_file, output_format, output_sim_path):
+        key = self._key(None, None, output_format, output_sim_path)
+        self._run(key, lambda worker: worker.convert(output_file=output_file))
+
+    def convert_many(self, files, input_format, input_sim_path, output_format, output_sim_path=None,
+                     max_workers=None):
+        """
+        Converts many files in parallel, spreading them over up to max_workers converter processes
+        (by default, the per-key worker limit). Each output is written to a temporary file and then
+        moved into place, so an output file is never left partially written.
+        :param files: An iterable of (input_file, output_file) pairs.
+        :return: A generator that yields a ConversionResult for each file as it completes. Failures are
+        reported in the results instead of being raised. Closing the generator early cancels the
+        conversions that have not started yet.
+        """
+        key = self._key(input_format, input_sim_path, output_format, output_sim_path)
+
+        pending = Queue()
+        total = 0
+        for input_file, output_file in files:
+            pending.put((str(input_file), str(output_file)))
+            total += 1
+
+        if total == 0:
+            return
+
+        worker_count = min(max_workers or self.max_workers_per_key, self.max_workers_per_key, total)
+        results = Queue()
+        cancelled = Event()
+
+        def convert_one(worker, input_file, output_file):
+            output_path = Path(output_file)
+            temp_path = output_path.with_name(f'.{output_path.name}.{token_hex(4)}.tmp')
+            try:
+                worker.convert(input_file, str(temp_path))
+                os.replace(temp_path, output_path)
+            except BaseException:
+                try:
+                    temp_path.unlink()
+                except FileNotFoundError:
+                    pass
+                raise
+
+        def next_pair():
+            if cancelled.is_set():
+                return None
+            try:
+                return pending.get_nowait()
+            except Empty:
+                return None
+
+        def run():
+            lease = None
+            worker_error = None
+
+            try:
+                lease = [self._checkout(key)]
+            except Exception as e:
+                worker_error = f"Could not start converter: {e}"
+
+            try:
+                pair = next_pair()
+                while pair is not None:
+                    input_file, output_file = pair
+                    error = worker_error
+                    if error is None:
+                        try:
+                            self._run_on(key, lease,
+                                         lambda worker: convert_one(worker, input_file, output_file))
+                        except (ConversionError, OSError, ValueError) as e:
+                            error = str(e)
+                        except ConverterWorkerError as e:
+                            # The worker could not be recovered, the rest of this thread's files fail too
+                            worker_error = error = str(e)
+                        except Exception as e:
+                            # Every file must get a result, or the consumer waits for it forever
+                            error = str(e) or type(e).__name__
+                    results.put(ConversionResult(input_file, output_file, error))
+                    pair = next_pair()
+            finally:
+                if lease is not None:
+                    self._checkin(key, lease[0])
+
+        threads = [Thread(target=run, daemon=True) for _ in range(worker_count)]
+        for thread in threads:
+            thread.start()
+
+        try:
+            for _ in range(total):
+                yield results.get()
+        finally:
+            cancelled.set()
+            for thread in threads:
+                thread.join()
+
+    @contextmanager
+    def worker(self, input_format, input_sim_path, output_format, output_sim_path=None):
+        """
+        Checks out a worker for exclusive use, for callers that convert many files in a row.
+        The worker is given back to the service when the context exits.
+        """
+        key = self._key(input_format, input_sim_path, output_format, output_sim_path)
+        worker = self._checkout(key)
+        try:
+            yield worker
+        finally:
+            self._checkin(key, worker)
+
+    def get_metrics(self):
+        """
+        :return: A dict mapping each worker key to a dict of metrics for its workers.
+        """
+        with self._condition:
+            metrics = {}
+            for key in set(self._stats) | set(self._idle):
+                input_format, input_sim, output_format, output_sim = key
+                stats = self._stats[key]
+                metrics[key] = {
+                    'input_format': input_format,
+                    'input_sim': input_sim,
+                    'output_format': output_format,
+                    'output_sim': output_sim,
+                    'busy': self._busy[key],
+                    'idle': len(self._idle[key]),
+                    'max_workers': self.max_workers_per_key,
+                    'started': stats.started,
+                    'restarts': stats.restarts,
+                    'conversions': stats.conversions,
+                    'failures': stats.failures,
+                    'waits': stats.waits,
+                }
+            return metrics
+
+    def collect_metrics(self):
+        """
+        A metrics registry collector for the worker pool utilization.
+        :return: The (name, type_name, documentation, samples) of each converter metric.
+        """
+        busy = []
+        idle = []
+        utilization = []
+        for key, key_metrics in self.get_metrics().items():
+            # conversions between simulations (migrations) have their own workers, so both simulations are labels
+            labels = {'input_format': key_metrics['input_format'] or '',
+                      'output_format': key_metrics['output_format'] or '',
+                      'input_simulation': key_metrics['input_sim'] or '',
+                      'simulation': key_metrics['output_sim'] or ''}
+            busy.append(metrics.Sample('converter_workers_busy', labels, key_metrics['busy']))
+            idle.append(metrics.Sample('converter_workers_idle', labels, key_metrics['idle']))
+            utilization.append(metrics.Sample('converter_utilization', labels,
+                                              key_metrics['busy'] / key_metrics['max_workers']))
+        return [
+            ('converter_workers_busy', 'gauge', 'Converter workers currently converting.', busy),
+            ('converter_workers_idle', 'gauge', 'Converter workers waiting for work.', idle),
+            ('converter_utilization', 'gauge', 'Busy converter workers as a fraction of the worker limit.',
+             utilization),
+        ]
+
+    def close(self):
+        """
+        Stops all idle workers. Workers in use are stopped when they are given back.
+        """
+        with self._condition:
+            self._closed = True
+            idle_workers = [worker for workers in self._idle.values() for worker in workers]
+            self._idle.clear()
+            self._condition.notify_all()
+
+        for worker in idle_workers:
+            worker.stop()
+
+    def _run(self, key, action):
+        lease = [self._checkout(key)]
+        try:
+            return self._run_on(key, lease, action)
+        finally:
+            self._checkin(key, lease[0])
+
+    def _run_on(self, key, lease, action):
+        """
+        Runs the action on the leased worker. If the worker has to be replaced, the lease is updated
+        to hold the new worker.
+        """
+        try:
+            try:
+                result = action(lease[0])
+            except ConverterWorkerError:
+                # The worker process is unusable, so it is replaced and the conversion is retried once
+                lease[0].stop()
+                with self._condition:
+                    self._stats[key].restarts += 1
+                lease[0] = self._start_worker(key)
+                result = action(lease[0])
+        except ConversionError:
+            with self._condition:
+                self._stats[key].failures += 1
+            raise
+
+        with self._condition:
+            self._stats[key].conversions += 1
+        return result
+
+    def _start_worker(self, key):
+        input_format, input_sim, output_format, output_sim = key
+        worker = ConverterWorker(input_format,
+                                 input_sim,
+                                 output_format,
+                                 output_sim if output_sim != input_sim else None)
+        worker.start()
+        with self._condition:
+            self._stats[key].started += 1
+        return worker
+
+    def _checkout(self, key):
+        input_format, input_sim, output_format, output_sim = key
+        signature = (_binary_signature(input_sim) if input_sim else None,
+                     _binary_signature(output_sim) if output_sim != input_sim else None)
+        stale = []
+        worker = None
+
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Converter service is closed.")
+
+                idle = self._idle[key]
+                while idle:
+                    candidate = idle.pop()
+                    if candidate.binary_signature == signature and candidate.is_alive():
+                        worker = candidate
+                        break
+                    stale.append(candidate)
+
+                if worker is not None or self._busy[key] < self.max_workers_per_key:
+                    self._busy[key] += 1
+                    break
+
+                self._stats[key].waits += 1
+                self._condition.wait()
+
+        for candidate in stale:
+            candidate.stop()
+
+        if worker is None:
+            try:
+                worker = self._start_worker(key)
+            except Exception:
+                with self._condition:
+                    self._busy[key] -= 1
+                    self._condition.notify()
+                raise
+
+        return worker
+
+    def _checkin(self, key, worker):
+        with self._condition:
+            self._busy[key] -= 1
+            self._condition.notify()
+            keep = (not self._closed and
+                    worker.is_alive() and
+                    len(self._idle[key]) < self.max_idle_per_key)
+            if keep:
+                self._idle[key].append(worker)
+
+        if not keep:
+            worker.stop()
+
+
+class BatchEditError(RuntimeError):
+    """
+    Operations of an edit batch failed.
+    """
+    def __init__(self, errors):
+        self.errors = list(errors)
+        index, message = self.errors[0]
+        super().__init__(f"{len(self.errors)} batch edit operation(s) failed. First failure at operation {index}: {message}")
+
+
 class SimulationClient:
     @staticmethod
     def make_channel(address):
-        return grpc.insecure_channel(address)
+        return grpc.intercept_channel(grpc.insecure_channel(address),
+                                      metrics.ClientMetricsInterceptor(SIMULATION_CLIENT_METRICS))
 
     def __init__(self, channel, token):
         self._channel = channel
+        self._stub = sim_grpc.SimulationStub(channel)
         self.token = token
 
-    def _create_metadata(self, *items):
-        return (('x-user-token', self.token), *items)
+    @property
+    def token(self):
+        return self._token
+
+    @token.setter
+    def token(self, token):
+        self._token = token
+        self._metadata = (('x-user-token', token),)
 
     def start_simulation(self):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.StartSimulationRequest()
-        stub.StartSimulation(request, metadata=self._create_metadata())
+        self._stub.StartSimulation(request, metadata=self._metadata)
 
     def stop_simulation(self):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.StopSimulationRequest()
-        stub.StopSimulation(request, metadata=self._create_metadata())
+        self._stub.StopSimulation(request, metadata=self._metadata)
 
     def is_running(self):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.IsRunningRequest()
-        response = stub.IsRunning(request, metadata=self._create_metadata())
+        response = self._stub.IsRunning(request, metadata=self._metadata)
         return response.running
 
     def get_tick(self):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.GetTickRequest()
-        response = stub.GetTick(request, metadata=self._create_metadata())
+        response = self._stub.GetTick(request, metadata=self._metadata)
         return response.tick
 
     def get_state_json(self):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.GetStateJsonRequest()
-        response = stub.GetStateJson(request, metadata=self._create_metadata())
+        response = self._stub.GetStateJson(request, metadata=self._metadata)
         return response.json, response.tick
 
     def set_state_json(self, state_json: str):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.SetStateJsonRequest(json=state_json)
-        stub.SetStateJson(request, metadata=self._create_metadata())
+        self._stub.SetStateJson(request, metadata=self._metadata)
 
     def create_entity(self):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.CreateEntityRequest()
-        response = stub.CreateEntity(request, metadata=self._create_metadata())
+        response = self._stub.CreateEntity(request, metadata=self._metadata)
         return response.eid
 
     def destroy_entity(self, eid):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.DestroyEntityRequest(eid=eid)
-        stub.DestroyEntity(request, metadata=self._create_metadata())
+        self._stub.DestroyEntity(request, metadata=self._metadata)
 
     def get_all_entities(self):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.GetAllEntitesRequest()
-        response = stub.GetAllEntities(request, metadata=self._create_metadata())
+        response = self._stub.GetAllEntities(request, metadata=self._metadata)
         return response.eids, response.tick
 
     def assign_component(self, eid, com_name):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.AssignComponentRequest(eid=eid, component_name=com_name)
-        stub.AssignComponent(request, metadata=self._create_metadata())
+        self._stub.AssignComponent(request, metadata=self._metadata)
 
     def get_component_json(self, eid, com_name):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.GetComponentJsonRequest(eid=eid, component_name=com_name)
-        response = stub.GetComponentJson(request, metadata=self._create_metadata())
+        response = self._stub.GetComponentJson(request, metadata=self._metadata)
         return response.json, response.tick
 
     def remove_component(self, eid, com_name):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.RemoveComponentRequest(eid=eid, component_name=com_name)
-        stub.RemoveComponent(request, metadata=self._create_metadata())
+        self._stub.RemoveComponent(request, metadata=self._metadata)
 
     def replace_component(self, eid, com_name, state_json):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.ReplaceComponentRequest(eid=eid, component_name=com_name, json=state_json)
-        stub.ReplaceComponent(request, metadata=self._create_metadata())
+        self._stub.ReplaceComponent(request, metadata=self._metadata)
 
     def get_component_names(self):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.GetComponentNamesRequest()
-        response = stub.GetComponentNames(request, metadata=self._create_metadata())
+        response = self._stub.GetComponentNames(request, metadata=self._metadata)
         return response.component_names
 
     def get_entity_component_names(self, eid):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.GetEntityComponentNamesRequest(eid=eid)
-        response = stub.GetEntityComponentNames(request, metadata=self._create_metadata())
+        response = self._stub.GetEntityComponentNames(request, metadata=self._metadata)
         return response.component_names, response.tick
 
+    def get_component_columns(self, columns):
+        """
+        Gets the requested components of every entity that has them, without fetching the whole state.
+        :param columns: A dict mapping component names to a column format, or an iterable of component names
+        to get as JSON. Formats are 'json' (values are the decoded components), 'binary' (values are tuples
+        of floats, one per name in fields; the components must only have numeric fields) and 'eids'
+        (only eids are returned).
+        :return: A dict mapping each component name to a ComponentColumn(eids, fields, values), and the tick.
+        """
+        request = _make_component_columns_request(columns)
+        response = self._stub.GetComponentColumns(request, metadata=self._metadata)
+        return _unpack_component_columns(request, response)
+
+    def subscribe_state_deltas(self, component_names=(), max_rate=10.0):
+        """
+        Follows changes to the simulation's entities and components. See StateMirror to keep a local copy.
+        :param component_names: The components to follow. If empty, every component is followed.
+        :param max_rate: The highest number of deltas per second the server sends.
+        :return: A cancellable iterator of StateDelta messages, the first of which is a full snapshot.
+        """
+        request = sim.SubscribeStateDeltasRequest(component_names=component_names, max_rate=max_rate)
+        return self._stub.SubscribeStateDeltas(request, metadata=self._metadata)
+
     def get_singleton_json(self, singleton_name):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.GetSingletonJsonRequest(singleton_name=singleton_name)
-        response = stub.GetSingletonJson(request, metadata=self._create_metadata())
+        response = self._stub.GetSingletonJson(request, metadata=self._metadata)
         return response.json, response.tick
 
     def set_singleton_json(self, singleton_name, json):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.SetSingletonJsonRequest(singleton_name=singleton_name, json=json)
-        stub.SetSingletonJson(request, metadata=self._create_metadata())
+        self._stub.SetSingletonJson(request, metadata=self._metadata)
 
     def get_singleton_names(self):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.GetSingletonNamesRequest()
-        response = stub.GetSingletonNames(request, metadata=self._create_metadata())
+        response = self._stub.GetSingletonNames(request, metadata=self._metadata)
         return response.singleton_names
 
     class Event:
@@ -301,34 +1411,493 @@ class SimulationClient:
             self.responses.cancel()
 
     def get_event_stream(self):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.GetEventsRequest()
-        return self.EventStreamContext(stub.GetEvents(request, metadata=self._create_metadata()))
+        return self.EventStreamContext(self._stub.GetEvents(request, metadata=self._metadata))
 
     def get_state_binary(self):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.GetStateBinaryRequest()
-        response = stub.GetStateBinary(request, metadata=self._create_metadata())
+        response = self._stub.GetStateBinary(request, metadata=self._metadata)
         return response.binary, response.tick
 
     def set_state_binary(self, state_bin: bytes):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.SetStateBinaryRequest(binary=state_bin)
-        stub.SetStateBinary(request, metadata=self._create_metadata())
+        self._stub.SetStateBinary(request, metadata=self._metadata)
+
+    def get_state_binary_chunked(self, output_file=None, chunk_size=STATE_CHUNK_SIZE):
+        """
+        Gets the state binary as a stream of chunks, so large states are not limited by the message size.
+        :param output_file: A path or binary file object to write the state to as it arrives. If None,
+        the chunks are assembled into a buffer allocated once for the whole state.
+        :return: The state as a bytearray (None if written to output_file), and the tick.
+        """
+        responses = self._stub.GetStateBinaryStream(
+            sim.GetStateBinaryStreamRequest(chunk_size=chunk_size), metadata=self._metadata)
+
+        if output_file is None:
+            return _assemble_state_chunks(responses)
+
+        if isinstance(output_file, (str, Path)):
+            with open(output_file, 'wb') as f:
+                return None, _write_state_chunks(responses, f)
+        return None, _write_state_chunks(responses, output_file)
+
+    def set_state_binary_chunked(self, state, chunk_size=STATE_CHUNK_SIZE):
+        """
+        Sets the state binary, sending it as a stream of chunks.
+        :param state: The state as a bytes-like object, or a path to a file containing it.
+        """
+        if isinstance(state, (str, Path)):
+            with open(state, 'rb') as f:
+                self._stub.SetStateBinaryStream(_file_state_chunks(f, chunk_size), metadata=self._metadata)
+        else:
+            self._stub.SetStateBinaryStream(_buffer_state_chunks(state, chunk_size), metadata=self._metadata)
 
     def run_command(self, args):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.RunCommandRequest(args=args)
-        response = stub.RunCommand(request, metadata=self._create_metadata())
+        response = self._stub.RunCommand(request, metadata=self._metadata)
         return response.err, response.output
 
     def set_editor_token(self, token):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.SetEditorTokenRequest(token=token)
-        stub.SetEditorToken(request, metadata=self._create_metadata())
+        self._stub.SetEditorToken(request, metadata=self._metadata)
+
+    def set_owner_token(self, token):
+        request = sim.SetOwnerTokenRequest(token=token)
+        self._stub.SetOwnerToken(request, metadata=self._metadata)
+
+    def set_snapshot_policy(self, tick_interval=0, time_interval=0.0, bytes_per_hour=0):
+        """
+        Sets when the running simulation publishes state snapshots. A snapshot is taken when any non-zero
+        trigger fires, so leaving every trigger at zero disables snapshots.
+        :param tick_interval: Snapshot ticks that are multiples of this interval.
+        :param time_interval: Snapshot after this many seconds of running since the last snapshot.
+        :param bytes_per_hour: Space snapshots out by running time so they add up to about this many bytes per hour.
+        """
+        policy = sim.SnapshotPolicy(tick_interval=tick_interval, time_interval=time_interval,
+                                    bytes_per_hour=bytes_per_hour)
+        request = sim.SetSnapshotPolicyRequest(policy=policy)
+        self._stub.SetSnapshotPolicy(request, metadata=self._metadata)
 
     def is_editing(self, check_self_only=False):
-        stub = sim_grpc.SimulationStub(self._channel)
         request = sim.IsEditingRequest(check_self_only=check_self_only)
-        response = stub.IsEditing(request, metadata=self._create_metadata())
+        response = self._stub.IsEditing(request, metadata=self._metadata)
         return response.is_editing
+
+    class EntityRef:
+        """
+        Stands in for an entity created in an edit batch, and can be passed as an eid to later operations
+        of the same batch. The eid is filled in once the operation that creates the entity has been sent.
+        """
+        __slots__ = ('eid',)
+
+        def __init__(self):
+            self.eid = None
+
+    class EditBatch:
+        """
+        Buffers edit operations and sends them with the BatchEdit call, chunk_size operations at a time.
+        """
+        def __init__(self, client, chunk_size, stop_on_error):
+            if chunk_size < 1:
+                raise ValueError("Chunk size must be at least 1.")
+
+            self._client = client
+            self._chunk_size = chunk_size
+            self._stop_on_error = stop_on_error
+            self._operations = []
+            self._created_refs = []
+            # refs whose create operation failed, to the index and error of that operation
+            self._failed_refs = {}
+            self._sent_count = 0
+
+            self.created_eids = []
+            self.errors = []
+
+        def create_entity(self):
+            ref = SimulationClient.EntityRef()
+            self._created_refs.append(ref)
+            self._add(sim.EditOperation(create_entity=sim.CreateEntityRequest()))
+            return ref
+
+        def destroy_entity(self, eid):
+            eid, created_entity = self._resolve(eid)
+            self._add(sim.EditOperation(destroy_entity=sim.DestroyEntityRequest(eid=eid),
+                                        created_entity=created_entity))
+
+        def assign_component(self, eid, com_name):
+            eid, created_entity = self._resolve(eid)
+            self._add(sim.EditOperation(assign_component=sim.AssignComponentRequest(eid=eid, component_name=com_name),
+                                        created_entity=created_entity))
+
+        def remove_component(self, eid, com_name):
+            eid, created_entity = self._resolve(eid)
+            self._add(sim.EditOperation(remove_component=sim.RemoveComponentRequest(eid=eid, component_name=com_name),
+                                        created_entity=created_entity))
+
+        def replace_component(self, eid, com_name, state_json):
+            eid, created_entity = self._resolve(eid)
+            request = sim.ReplaceComponentRequest(eid=eid, component_name=com_name, json=state_json)
+            self._add(sim.EditOperation(replace_component=request, created_entity=created_entity))
+
+        def set_singleton_json(self, singleton_name, json):
+            request = sim.SetSingletonJsonRequest(singleton_name=singleton_name, json=json)
+            self._add(sim.EditOperation(set_singleton_json=request))
+
+        def flush(self):
+            """
+            Sends all buffered operations.
+            """
+            if not self._operations:
+                return
+
+            operations = self._operations
+            created_refs = self._created_refs
+            self._operations = []
+            self._created_refs = []
+
+            request = sim.BatchEditRequest(operations=operations, stop_on_error=self._stop_on_error)
+            response = self._client._stub.BatchEdit(request, metadata=self._client._metadata)
+
+            # the server returns one eid per create operation, whether it succeeded or not
+            created_eids = iter(response.created_eids)
+            created_refs = iter(created_refs)
+            for i, (operation, status) in enumerate(zip(operations, response.statuses)):
+                if operation.WhichOneof('operation') == 'create_entity':
+                    ref = next(created_refs)
+                    eid = next(created_eids)
+                    if status.success:
+                        ref.eid = eid
+                        self.created_eids.append(eid)
+                    else:
+                        self._failed_refs[ref] = (self._sent_count + i, status.error)
+                if not status.success:
+                    self.errors.append((self._sent_count + i, status.error))
+
+            self._sent_count += len(operations)
+
+            if self.errors and self._stop_on_error:
+                raise BatchEditError(self.errors)
+
+        def _resolve(self, eid):
+            if not isinstance(eid, SimulationClient.EntityRef):
+                return eid, 0
+            if eid.eid is not None:
+                return eid.eid, 0
+            if eid in self._failed_refs:
+                index, error = self._failed_refs[eid]
+                raise ValueError(f"Entity reference was not created, its create operation {index} failed: {error}")
+            try:
+                return 0, self._created_refs.index(eid) + 1
+            except ValueError:
+                raise ValueError("Entity reference does not belong to this batch.") from None
+
+        def _add(self, operation):
+            self._operations.append(operation)
+            if len(self._operations) >= self._chunk_size:
+                self.flush()
+
+    @contextmanager
+    def batch(self, chunk_size=1000, stop_on_error=True):
+        """
+        Buffers edit calls made on the yielded EditBatch and sends them in chunks with a single BatchEdit
+        call per chunk, instead of one call per edit. Remaining operations are sent when the context exits,
+        unless it exits with an exception.
+        Entities created in the batch are returned as EntityRefs, which can be used as eids in the same batch.
+        :param stop_on_error: If true, a failed operation skips the rest of its chunk, and raises a
+        BatchEditError once the chunk has been sent. Otherwise, failures are collected in the batch's errors.
+        """
+        batch = SimulationClient.EditBatch(self, chunk_size, stop_on_error)
+        yield batch
+        batch.flush()
+
+
+class StateMirror:
+    """
+    A local copy of a simulation's entities and components, kept up to date by applying the deltas of
+    a state delta stream (see SimulationClient.subscribe_state_deltas).
+    Components are stored decoded, in entities: a dict of eid to a dict of component name to component.
+    """
+    def __init__(self):
+        self.lock = RLock()
+        self.tick = None
+        self.entities = {}
+        self.error = None
+
+        self._stream = None
+        self._thread = None
+
+    def apply(self, delta):
+        """
+        Applies a StateDelta message to the mirror.
+        :return: The set of eids that were created, destroyed, or had components change.
+        """
+        touched = set()
+
+        with self.lock:
+            entities = self.entities
+            if delta.snapshot:
+                entities.clear()
+
+            for eid in delta.destroyed_eids:
+                entities.pop(eid, None)
+                touched.add(eid)
+
+            for eid in delta.created_eids:
+                entities.setdefault(eid, {})
+                touched.add(eid)
+
+            for removed in delta.removed_components:
+                components = entities.get(removed.eid)
+                if components is not None:
+                    components.pop(removed.component_name, None)
+                touched.add(removed.eid)
+
+            for value in delta.changed_components:
+                entities.setdefault(value.eid, {})[value.component_name] = json.loads(value.json)
+                touched.add(value.eid)
+
+            self.tick = delta.tick
+
+        return touched
+
+    def get_column(self, component_name):
+        """
+        :return: The sorted eids of the entities that have the component, and their components in the same order.
+        """
+        with self.lock:
+            eids = sorted(eid for eid, components in self.entities.items() if component_name in components)
+            return eids, [self.entities[eid][component_name] for eid in eids]
+
+    def follow(self, client: SimulationClient, component_names=(), max_rate=10.0):
+        """
+        Applies deltas from the client's simulation on a background thread, until stop() is called or
+        the stream ends. If the stream fails, the error is kept in the error attribute.
+        """
+        if self.is_following():
+            raise RuntimeError("State mirror is already following a simulation.")
+
+        self.error = None
+        self._stream = client.subscribe_state_deltas(component_names, max_rate)
+        self._thread = Thread(target=self._follow, args=(self._stream,), daemon=True)
+        self._thread.start()
+
+    def is_following(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def stop(self):
+        if self._stream is not None:
+            self._stream.cancel()
+        if self._thread is not None:
+            self._thread.join()
+        self._stream = None
+        self._thread = None
+
+    def _follow(self, stream):
+        try:
+            for delta in stream:
+                self.apply(delta)
+        except RpcError as e:
+            if e.code() != grpc.StatusCode.CANCELLED:
+                self.error = e
+
+
+class AsyncSimulationClient:
+    """
+    An asyncio version of SimulationClient, built on grpc.aio. Many calls can be in flight at once,
+    for example with asyncio.gather.
+    """
+    @staticmethod
+    def make_channel(address):
+        """
+        Must be called while an event loop is running.
+        """
+        return grpc.aio.insecure_channel(address)
+
+    def __init__(self, channel, token):
+        self._channel = channel
+        self._stub = sim_grpc.SimulationStub(channel)
+        self.token = token
+
+    @property
+    def token(self):
+        return self._token
+
+    @token.setter
+    def token(self, token):
+        self._token = token
+        self._metadata = (('x-user-token', token),)
+
+    async def close(self):
+        await self._channel.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def start_simulation(self):
+        request = sim.StartSimulationRequest()
+        await self._stub.StartSimulation(request, metadata=self._metadata)
+
+    async def stop_simulation(self):
+        request = sim.StopSimulationRequest()
+        await self._stub.StopSimulation(request, metadata=self._metadata)
+
+    async def is_running(self):
+        request = sim.IsRunningRequest()
+        response = await self._stub.IsRunning(request, metadata=self._metadata)
+        return response.running
+
+    async def get_tick(self):
+        request = sim.GetTickRequest()
+        response = await self._stub.GetTick(request, metadata=self._metadata)
+        return response.tick
+
+    async def get_state_json(self):
+        request = sim.GetStateJsonRequest()
+        response = await self._stub.GetStateJson(request, metadata=self._metadata)
+        return response.json, response.tick
+
+    async def set_state_json(self, state_json: str):
+        request = sim.SetStateJsonRequest(json=state_json)
+        await self._stub.SetStateJson(request, metadata=self._metadata)
+
+    async def create_entity(self):
+        request = sim.CreateEntityRequest()
+        response = await self._stub.CreateEntity(request, metadata=self._metadata)
+        return response.eid
+
+    async def destroy_entity(self, eid):
+        request = sim.DestroyEntityRequest(eid=eid)
+        await self._stub.DestroyEntity(request, metadata=self._metadata)
+
+    async def get_all_entities(self):
+        request = sim.GetAllEntitesRequest()
+        response = await self._stub.GetAllEntities(request, metadata=self._metadata)
+        return response.eids, response.tick
+
+    async def assign_component(self, eid, com_name):
+        request = sim.AssignComponentRequest(eid=eid, component_name=com_name)
+        await self._stub.AssignComponent(request, metadata=self._metadata)
+
+    async def get_component_json(self, eid, com_name):
+        request = sim.GetComponentJsonRequest(eid=eid, component_name=com_name)
+        response = await self._stub.GetComponentJson(request, metadata=self._metadata)
+        return response.json, response.tick
+
+    async def remove_component(self, eid, com_name):
+        request = sim.RemoveComponentRequest(eid=eid, component_name=com_name)
+        await self._stub.RemoveComponent(request, metadata=self._metadata)
+
+    async def replace_component(self, eid, com_name, state_json):
+        request = sim.ReplaceComponentRequest(eid=eid, component_name=com_name, json=state_json)
+        await self._stub.ReplaceComponent(request, metadata=self._metadata)
+
+    async def get_component_names(self):
+        request = sim.GetComponentNamesRequest()
+        response = await self._stub.GetComponentNames(request, metadata=self._metadata)
+        return response.component_names
+
+    async def get_entity_component_names(self, eid):
+        request = sim.GetEntityComponentNamesRequest(eid=eid)
+        response = await self._stub.GetEntityComponentNames(request, metadata=self._metadata)
+        return response.component_names, response.tick
+
+    async def get_component_columns(self, columns):
+        request = _make_component_columns_request(columns)
+        response = await self._stub.GetComponentColumns(request, metadata=self._metadata)
+        return _unpack_component_columns(request, response)
+
+    def subscribe_state_deltas(self, component_names=(), max_rate=10.0):
+        """
+        :return: A cancellable async iterator of StateDelta messages, the first of which is a full snapshot.
+        """
+        request = sim.SubscribeStateDeltasRequest(component_names=component_names, max_rate=max_rate)
+        return self._stub.SubscribeStateDeltas(request, metadata=self._metadata)
+
+    async def get_singleton_json(self, singleton_name):
+        request = sim.GetSingletonJsonRequest(singleton_name=singleton_name)
+        response = await self._stub.GetSingletonJson(request, metadata=self._metadata)
+        return response.json, response.tick
+
+    async def set_singleton_json(self, singleton_name, json):
+        request = sim.SetSingletonJsonRequest(singleton_name=singleton_name, json=json)
+        await self._stub.SetSingletonJson(request, metadata=self._metadata)
+
+    async def get_singleton_names(self):
+        request = sim.GetSingletonNamesRequest()
+        response = await self._stub.GetSingletonNames(request, metadata=self._metadata)
+        return response.singleton_names
+
+    async def get_state_binary(self):
+        request = sim.GetStateBinaryRequest()
+        response = await self._stub.GetStateBinary(request, metadata=self._metadata)
+        return response.binary, response.tick
+
+    async def set_state_binary(self, state_bin: bytes):
+        request = sim.SetStateBinaryRequest(binary=state_bin)
+        await self._stub.SetStateBinary(request, metadata=self._metadata)
+
+    async def get_state_binary_chunked(self, chunk_size=STATE_CHUNK_SIZE):
+        """
+        :return: The state as a bytearray assembled from a stream of chunks, and the tick.
+        """
+        call = self._stub.GetStateBinaryStream(
+            sim.GetStateBinaryStreamRequest(chunk_size=chunk_size), metadata=self._metadata)
+
+        assembler = _StateChunkAssembler()
+        async for chunk in call:
+            assembler.add(chunk)
+        return assembler.result()
+
+    async def set_state_binary_chunked(self, state_bin, chunk_size=STATE_CHUNK_SIZE):
+        await self._stub.SetStateBinaryStream(
+            _buffer_state_chunks(state_bin, chunk_size), metadata=self._metadata)
+
+    async def run_command(self, args):
+        request = sim.RunCommandRequest(args=args)
+        response = await self._stub.RunCommand(request, metadata=self._metadata)
+        return response.err, response.output
+
+    async def set_editor_token(self, token):
+        request = sim.SetEditorTokenRequest(token=token)
+        await self._stub.SetEditorToken(request, metadata=self._metadata)
+
+    async def set_owner_token(self, token):
+        request = sim.SetOwnerTokenRequest(token=token)
+        await self._stub.SetOwnerToken(request, metadata=self._metadata)
+
+    async def set_snapshot_policy(self, tick_interval=0, time_interval=0.0, bytes_per_hour=0):
+        policy = sim.SnapshotPolicy(tick_interval=tick_interval, time_interval=time_interval,
+                                    bytes_per_hour=bytes_per_hour)
+        request = sim.SetSnapshotPolicyRequest(policy=policy)
+        await self._stub.SetSnapshotPolicy(request, metadata=self._metadata)
+
+    async def is_editing(self, check_self_only=False):
+        request = sim.IsEditingRequest(check_self_only=check_self_only)
+        response = await self._stub.IsEditing(request, metadata=self._metadata)
+        return response.is_editing
+
+    class EventStreamContext:
+        def __init__(self, call):
+            self.call = call
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            try:
+                response = await self.call.read()
+            except asyncio.CancelledError:
+                raise StopAsyncIteration()
+            if response is grpc.aio.EOF:
+                raise StopAsyncIteration()
+            return response.tick, [SimulationClient.Event(e) for e in response.events]
+
+        def cancel(self):
+            self.call.cancel()
+
+    def get_event_stream(self):
+        request = sim.GetEventsRequest()
+        return self.EventStreamContext(self._stub.GetEvents(request, metadata=self._metadata))
@@ -19,11 +19,41 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   syntax='proto3',
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n\x10simulation.proto\x12\x1cPyGridWorld.SimulationServer\"\x10\n\x0eGetTickRequest\"\x1f\n\x0fGetTickResponse\x12\x0c\n\x04tick\x18\x01 \x01(\x04\"\x15\n\x13GetStateJsonRequest\"2\n\x14GetStateJsonResponse\x12\x0c\n\x04json\x18\x01 \x01(\t\x12\x0c\n\x04tick\x18\x02 \x01(\x04\"#\n\x13SetStateJsonRequest\x12\x0c\n\x04json\x18\x01 \x01(\t\"\x16\n\x14SetStateJsonResponse\"\x15\n\x13\x43reateEntityRequest\"#\n\x14\x43reateEntityResponse\x12\x0b\n\x03\x65id\x18\x01 \x01(\x04\"#\n\x14\x44\x65stroyEntityRequest\x12\x0b\n\x03\x65id\x18\x01 \x01(\x04\"\x17\n\x15\x44\x65stroyEntityResponse\"\x16\n\x14GetAllEntitesRequest\"4\n\x16GetAllEntitiesResponse\x12\x0c\n\x04\x65ids\x18\x01 \x03(\x04\x12\x0c\n\x04tick\x18\x02 \x01(\x04\"\x18\n\x16StartSimulationRequest\"\x19\n\x17StartSimulationResponse\"\x17\n\x15StopSimulationRequest\"\x18\n\x16StopSimulationResponse\"\x12\n\x10IsRunningRequest\"$\n\x11IsRunningResponse\x12\x0f\n\x07running\x18\x01 \x01(\x08\"=\n\x16\x41ssignComponentRequest\x12\x0b\n\x03\x65id\x18\x01 \x01(\x04\x12\x16\n\x0e\x63omponent_name\x18\x02 \x01(\t\"\x19\n\x17\x41ssignComponentResponse\">\n\x17GetComponentJsonRequest\x12\x0b\n\x03\x65id\x18\x01 \x01(\x04\x12\x16\n\x0e\x63omponent_name\x18\x02 \x01(\t\"6\n\x18GetComponentJsonResponse\x12\x0c\n\x04json\x18\x01 \x01(\t\x12\x0c\n\x04tick\x18\x02 \x01(\x04\"=\n\x16RemoveComponentRequest\x12\x0b\n\x03\x65id\x18\x01 \x01(\x04\x12\x16\n\x0e\x63omponent_name\x18\x02 \x01(\t\"\x19\n\x17RemoveComponentResponse\"L\n\x17ReplaceComponentRequest\x12\x0b\n\x03\x65id\x18\x01 \x01(\x04\x12\x16\n\x0e\x63omponent_name\x18\x02 \x01(\t\x12\x0c\n\x04json\x18\x03 \x01(\t\"\x1a\n\x18ReplaceComponentResponse\"\x1a\n\x18GetComponentNamesRequest\"4\n\x19GetComponentNamesResponse\x12\x17\n\x0f\x63omponent_names\x18\x01 \x03(\t\"-\n\x1eGetEntityComponentNamesRequest\x12\x0b\n\x03\x65id\x18\x01 \x01(\x04\"H\n\x1fGetEntityComponentNamesResponse\x12\x17\n\x0f\x63omponent_names\x18\x01 \x03(\t\x12\x0c\n\x04tick\x18\x02 \x01(\x04\"1\n\x17GetSingletonJsonRequest\x12\x16\n\x0esingleton_name\x18\x01 \x01(\t\"6\n\x18GetSingletonJsonResponse\x12\x0c\n\x04json\x18\x01 \x01(\t\x12\x0c\n\x04tick\x18\x02 \x01(\x04\"?\n\x17SetSingletonJsonRequest\x12\x16\n\x0esingleton_name\x18\x01 \x01(\t\x12\x0c\n\x04json\x18\x02 \x01(\t\"\x1a\n\x18SetSingletonJsonResponse\"\x1a\n\x18GetSingletonNamesRequest\"4\n\x19GetSingletonNamesResponse\x12\x17\n\x0fsingleton_names\x18\x01 \x03(\t\"\x12\n\x10GetEventsRequest\"C\n\x0c\x45ventMessage\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x04json\x18\x02 \x01(\tH\x00\x12\r\n\x03\x62in\x18\x03 \x01(\x0cH\x00\x42\x06\n\x04\x64\x61ta\"]\n\x11GetEventsResponse\x12\x0c\n\x04tick\x18\x01 \x01(\x04\x12:\n\x06\x65vents\x18\x02 \x03(\x0b\x32*.PyGridWorld.SimulationServer.EventMessage\"\x17\n\x15GetStateBinaryRequest\"6\n\x16GetStateBinaryResponse\x12\x0e\n\x06\x62inary\x18\x01 \x01(\x0c\x12\x0c\n\x04tick\x18\x02 \x01(\x04\"\'\n\x15SetStateBinaryRequest\x12\x0e\n\x06\x62inary\x18\x01 \x01(\x0c\"\x18\n\x16SetStateBinaryResponse\"!\n\x11RunCommandRequest\x12\x0c\n\x04\x61rgs\x18\x01 \x03(\t\"1\n\x12RunCommandResponse\x12\x0b\n\x03\x65rr\x18\x01 \x01(\t\x12\x0e\n\x06output\x18\x02 \x01(\t\"&\n\x15SetEditorTokenRequest\x12\r\n\x05token\x18\x01 \x01(\t\"\x18\n\x16SetEditorTokenResponse\"+\n\x10IsEditingRequest\x12\x17\n\x0f\x63heck_self_only\x18\x01 \x01(\x08\"\'\n\x11IsEditingResponse\x12\x12\n\nis_editing\x18\x01 \x01(\x08\x32\xb7\x17\n\nSimulation\x12\x66\n\x07GetTick\x12,.PyGridWorld.SimulationServer.GetTickRequest\x1a-.PyGridWorld.SimulationServer.GetTickResponse\x12u\n\x0cGetStateJson\x12\x31.PyGridWorld.SimulationServer.GetStateJsonRequest\x1a\x32.PyGridWorld.SimulationServer.GetStateJsonResponse\x12u\n\x0cSetStateJson\x12\x31.PyGridWorld.SimulationServer.SetStateJsonRequest\x1a\x32.PyGridWorld.SimulationServer.SetStateJsonResponse\x12u\n\x0c\x43reateEntity\x12\x31.PyGridWorld.SimulationServer.CreateEntityRequest\x1a\x32.PyGridWorld.SimulationServer.CreateEntityResponse\x12x\n\rDestroyEntity\x12\x32.PyGridWorld.SimulationServer.DestroyEntityRequest\x1a\x33.PyGridWorld.SimulationServer.DestroyEntityResponse\x12z\n\x0eGetAllEntities\x12\x32.PyGridWorld.SimulationServer.GetAllEntitesRequest\x1a\x34.PyGridWorld.SimulationServer.GetAllEntitiesResponse\x12~\n\x0fStartSimulation\x12\x34.PyGridWorld.SimulationServer.StartSimulationRequest\x1a\x35.PyGridWorld.SimulationServer.StartSimulationResponse\x12{\n\x0eStopSimulation\x12\x33.PyGridWorld.SimulationServer.StopSimulationRequest\x1a\x34.PyGridWorld.SimulationServer.StopSimulationResponse\x12l\n\tIsRunning\x12..PyGridWorld.SimulationServer.IsRunningRequest\x1a/.PyGridWorld.SimulationServer.IsRunningResponse\x12~\n\x0f\x41ssignComponent\x12\x34.PyGridWorld.SimulationServer.AssignComponentRequest\x1a\x35.PyGridWorld.SimulationServer.AssignComponentResponse\x12\x81\x01\n\x10GetComponentJson\x12\x35.PyGridWorld.SimulationServer.GetComponentJsonRequest\x1a\x36.PyGridWorld.SimulationServer.GetComponentJsonResponse\x12~\n\x0fRemoveComponent\x12\x34.PyGridWorld.SimulationServer.RemoveComponentRequest\x1a\x35.PyGridWorld.SimulationServer.RemoveComponentResponse\x12\x81\x01\n\x10ReplaceComponent\x12\x35.PyGridWorld.SimulationServer.ReplaceComponentRequest\x1a\x36.PyGridWorld.SimulationServer.ReplaceComponentResponse\x12\x84\x01\n\x11GetComponentNames\x12\x36.PyGridWorld.SimulationServer.GetComponentNamesRequest\x1a\x37.PyGridWorld.SimulationServer.GetComponentNamesResponse\x12\x96\x01\n\x17GetEntityComponentNames\x12<.PyGridWorld.SimulationServer.GetEntityComponentNamesRequest\x1a=.PyGridWorld.SimulationServer.GetEntityComponentNamesResponse\x12\x81\x01\n\x10GetSingletonJson\x12\x35.PyGridWorld.SimulationServer.GetSingletonJsonRequest\x1a\x36.PyGridWorld.SimulationServer.GetSingletonJsonResponse\x12\x81\x01\n\x10SetSingletonJson\x12\x35.PyGridWorld.SimulationServer.SetSingletonJsonRequest\x1a\x36.PyGridWorld.SimulationServer.SetSingletonJsonResponse\x12\x84\x01\n\x11GetSingletonNames\x12\x36.PyGridWorld.SimulationServer.GetSingletonNamesRequest\x1a\x37.PyGridWorld.SimulationServer.GetSingletonNamesResponse\x12n\n\tGetEvents\x12..PyGridWorld.SimulationServer.GetEventsRequest\x1a/.PyGridWorld.SimulationServer.GetEventsResponse0\x01\x12{\n\x0eGetStateBinary\x12\x33.PyGridWorld.SimulationServer.GetStateBinaryRequest\x1a\x34.PyGridWorld.SimulationServer.GetStateBinaryResponse\x12{\n\x0eSetStateBinary\x12\x33.PyGridWorld.SimulationServer.SetStateBinaryRequest\x1a\x34.PyGridWorld.SimulationServer.SetStateBinaryResponse\x12o\n\nRunCommand\x12/.PyGridWorld.SimulationServer.RunCommandRequest\x1a\x30.PyGridWorld.SimulationServer.RunCommandResponse\x12{\n\x0eSetEditorToken\x12\x33.PyGridWorld.SimulationServer.SetEditorTokenRequest\x1a\x34.PyGridWorld.SimulationServer.SetEditorTokenResponse\x12l\n\tIsEditing\x12..PyGridWorld.SimulationServer.IsEditingRequest\x1a/.PyGridWorld.SimulationServer.IsEditingResponseb\x06proto3'
+  serialized_pb=b'\n\x10simulation.proto\x12\x1cPyGridWorld.SimulationServer\"\x10\n\x0eGetTickRequest\"\x1f\n\x0fGetTickResponse\x12\x0c\n\x04tick\x18\x01 \x01(\x04\"\x15\n\x13GetStateJsonRequest\"2\n\x14GetStateJsonResponse\x12\x0c\n\x04json\x18\x01 \x01(\t\x12\x0c\n\x04tick\x18\x02 \x01(\x04\"#\n\x13SetStateJsonRequest\x12\x0c\n\x04json\x18\x01 \x01(\t\"\x16\n\x14SetStateJsonResponse\"\x15\n\x13\x43reateEntityRequest\"#\n\x14\x43reateEntityResponse\x12\x0b\n\x03\x65id\x18\x01 \x01(\x04\"#\n\x14\x44\x65stroyEntityRequest\x12\x0b\n\x03\x65id\x18\x01 \x01(\x04\"\x17\n\x15\x44\x65stroyEntityResponse\"\x16\n\x14GetAllEntitesRequest\"4\n\x16GetAllEntitiesResponse\x12\x0c\n\x04\x65ids\x18\x01 \x03(\x04\x12\x0c\n\x04tick\x18\x02 \x01(\x04\"\x18\n\x16StartSimulationRequest\"\x19\n\x17StartSimulationResponse\"\x17\n\x15StopSimulationRequest\"\x18\n\x16StopSimulationResponse\"\x12\n\x10IsRunningRequest\"$\n\x11IsRunningResponse\x12\x0f\n\x07running\x18\x01 \x01(\x08\"=\n\x16\x41ssignComponentRequest\x12\x0b\n\x03\x65id\x18\x01 \x01(\x04\x12\x16\n\x0e\x63omponent_name\x18\x02 \x01(\t\"\x19\n\x17\x41ssignComponentResponse\">\n\x17GetComponentJsonRequest\x12\x0b\n\x03\x65id\x18\x01 \x01(\x04\x12\x16\n\x0e\x63omponent_name\x18\x02 \x01(\t\"6\n\x18GetComponentJsonResponse\x12\x0c\n\x04json\x18\x01 \x01(\t\x12\x0c\n\x04tick\x18\x02 \x01(\x04\"=\n\x16RemoveComponentRequest\x12\x0b\n\x03\x65id\x18\x01 \x01(\x04\x12\x16\n\x0e\x63omponent_name\x18\x02 \x01(\t\"\x19\n\x17RemoveComponentResponse\"L\n\x17ReplaceComponentRequest\x12\x0b\n\x03\x65id\x18\x01 \x01(\x04\x12\x16\n\x0e\x63omponent_name\x18\x02 \x01(\t\x12\x0c\n\x04json\x18\x03 \x01(\t\"\x1a\n\x18ReplaceComponentResponse\"\x1a\n\x18GetComponentNamesRequest\"4\n\x19GetComponentNamesResponse\x12\x17\n\x0f\x63omponent_names\x18\x01 \x03(\t\"-\n\x1eGetEntityComponentNamesRequest\x12\x0b\n\x03\x65id\x18\x01 \x01(\x04\"H\n\x1fGetEntityComponentNamesResponse\x12\x17\n\x0f\x63omponent_names\x18\x01 \x03(\t\x12\x0c\n\x04tick\x18\x02 \x01(\x04\"1\n\x17GetSingletonJsonRequest\x12\x16\n\x0esingleton_name\x18\x01 \x01(\t\"6\n\x18GetSingletonJsonResponse\x12\x0c\n\x04json\x18\x01 \x01(\t\x12\x0c\n\x04tick\x18\x02 \x01(\x04\"?\n\x17SetSingletonJsonRequest\x12\x16\n\x0esingleton_name\x18\x01 \x01(\t\x12\x0c\n\x04json\x18\x02 \x01(\t\"\x1a\n\x18SetSingletonJsonResponse\"\x1a\n\x18GetSingletonNamesRequest\"4\n\x19GetSingletonNamesResponse\x12\x17\n\x0fsingleton_names\x18\x01 \x03(\t\"\x12\n\x10GetEventsRequest\"C\n\x0c\x45ventMessage\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x04json\x18\x02 \x01(\tH\x00\x12\r\n\x03\x62in\x18\x03 \x01(\x0cH\x00\x42\x06\n\x04\x64\x61ta\"]\n\x11GetEventsResponse\x12\x0c\n\x04tick\x18\x01 \x01(\x04\x12:\n\x06\x65vents\x18\x02 \x03(\x0b\x32*.PyGridWorld.SimulationServer.EventMessage\"\x17\n\x15GetStateBinaryRequest\"6\n\x16GetStateBinaryResponse\x12\x0e\n\x06\x62inary\x18\x01 \x01(\x0c\x12\x0c\n\x04tick\x18\x02 \x01(\x04\"\'\n\x15SetStateBinaryRequest\x12\x0e\n\x06\x62inary\x18\x01 \x01(\x0c\"\x18\n\x16SetStateBinaryResponse\"!\n\x11RunCommandRequest\x12\x0c\n\x04\x61rgs\x18\x01 \x03(\t\"1\n\x12RunCommandResponse\x12\x0b\n\x03\x65rr\x18\x01 \x01(\t\x12\x0e\n\x06output\x18\x02 \x01(\t\"&\n\x15SetEditorTokenRequest\x12\r\n\x05token\x18\x01 \x01(\t\"\x18\n\x16SetEditorTokenResponse\"%\n\x14SetOwnerTokenRequest\x12\r\n\x05token\x18\x01 \x01(\t\"\x17\n\x15SetOwnerTokenResponse\"+\n\x10IsEditingRequest\x12\x17\n\x0f\x63heck_self_only\x18\x01 \x01(\x08\"\'\n\x11IsEditingResponse\x12\x12\n\nis_editing\x18\x01 \x01(\x08\"\x9b\x04\n\rEditOperation\x12J\n\rcreate_entity\x18\x01 \x01(\x0b\x32\x31.PyGridWorld.SimulationServer.CreateEntityRequestH\x00\x12L\n\x0e\x64\x65stroy_entity\x18\x02 \x01(\x0b\x32\x32.PyGridWorld.SimulationServer.DestroyEntityRequestH\x00\x12P\n\x10\x61ssign_component\x18\x03 \x01(\x0b\x32\x34.PyGridWorld.SimulationServer.AssignComponentRequestH\x00\x12P\n\x10remove_component\x18\x04 \x01(\x0b\x32\x34.PyGridWorld.SimulationServer.RemoveComponentRequestH\x00\x12R\n\x11replace_component\x18\x05 \x01(\x0b\x32\x35.PyGridWorld.SimulationServer.ReplaceComponentRequestH\x00\x12S\n\x12set_singleton_json\x18\x06 \x01(\x0b\x32\x35.PyGridWorld.SimulationServer.SetSingletonJsonRequestH\x00\x12\x16\n\x0e\x63reated_entity\x18\x07 \x01(\rB\x0b\n\toperation\"j\n\x10\x42\x61tchEditRequest\x12?\n\noperations\x18\x01 \x03(\x0b\x32+.PyGridWorld.SimulationServer.EditOperation\x12\x15\n\rstop_on_error\x18\x02 \x01(\x08\",\n\nEditStatus\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"e\n\x11\x42\x61tchEditResponse\x12\x14\n\x0c\x63reated_eids\x18\x01 \x03(\x04\x12:\n\x08statuses\x18\x02 \x03(\x0b\x32(.PyGridWorld.SimulationServer.EditStatus\"\xa8\x01\n\x14\x43omponentColumnQuery\x12\x16\n\x0e\x63omponent_name\x18\x01 \x01(\t\x12I\n\x06\x66ormat\x18\x02 \x01(\x0e\x32\x39.PyGridWorld.SimulationServer.ComponentColumnQuery.Format\"-\n\x06\x46ormat\x12\x08\n\x04JSON\x10\x00\x12\n\n\x06\x42INARY\x10\x01\x12\r\n\tEIDS_ONLY\x10\x02\"a\n\x1aGetComponentColumnsRequest\x12\x43\n\x07\x63olumns\x18\x01 \x03(\x0b\x32\x32.PyGridWorld.SimulationServer.ComponentColumnQuery\"e\n\x0f\x43omponentColumn\x12\x16\n\x0e\x63omponent_name\x18\x01 \x01(\t\x12\x0c\n\x04\x65ids\x18\x02 \x03(\x04\x12\x0c\n\x04json\x18\x03 \x01(\t\x12\x0e\n\x06\x66ields\x18\x04 \x03(\t\x12\x0e\n\x06\x62inary\x18\x05 \x01(\x0c\"k\n\x1bGetComponentColumnsResponse\x12>\n\x07\x63olumns\x18\x01 \x03(\x0b\x32-.PyGridWorld.SimulationServer.ComponentColumn\x12\x0c\n\x04tick\x18\x02 \x01(\x04\"H\n\x1bSubscribeStateDeltasRequest\x12\x17\n\x0f\x63omponent_names\x18\x01 \x03(\t\x12\x10\n\x08max_rate\x18\x02 \x01(\x01\"C\n\x0e\x43omponentValue\x12\x0b\n\x03\x65id\x18\x01 \x01(\x04\x12\x16\n\x0e\x63omponent_name\x18\x02 \x01(\t\x12\x0c\n\x04json\x18\x03 \x01(\t\"7\n\x10RemovedComponent\x12\x0b\n\x03\x65id\x18\x01 \x01(\x04\x12\x16\n\x0e\x63omponent_name\x18\x02 \x01(\t\"\xf0\x01\n\nStateDelta\x12\x0c\n\x04tick\x18\x01 \x01(\x04\x12\x10\n\x08snapshot\x18\x02 \x01(\x08\x12\x14\n\x0c\x63reated_eids\x18\x03 \x03(\x04\x12\x16\n\x0e\x64\x65stroyed_eids\x18\x04 \x03(\x04\x12H\n\x12\x63hanged_components\x18\x05 \x03(\x0b\x32,.PyGridWorld.SimulationServer.ComponentValue\x12J\n\x12removed_components\x18\x06 \x03(\x0b\x32..PyGridWorld.SimulationServer.RemovedComponent\"1\n\x1bGetStateBinaryStreamRequest\x12\x12\n\nchunk_size\x18\x01 \x01(\r\"R\n\x10StateBinaryChunk\x12\x12\n\ntotal_size\x18\x01 \x01(\x04\x12\x0c\n\x04tick\x18\x02 \x01(\x04\x12\x0e\n\x06offset\x18\x03 \x01(\x04\x12\x0c\n\x04\x64\x61ta\x18\x04 \x01(\x0c\"V\n\x0eSnapshotPolicy\x12\x15\n\rtick_interval\x18\x01 \x01(\x04\x12\x15\n\rtime_interval\x18\x02 \x01(\x01\x12\x16\n\x0e\x62ytes_per_hour\x18\x03 \x01(\x04\"X\n\x18SetSnapshotPolicyRequest\x12<\n\x06policy\x18\x01 \x01(\x0b\x32,.PyGridWorld.SimulationServer.SnapshotPolicy\"\x1b\n\x19SetSnapshotPolicyResponse2\xb8\x1e\n\nSimulation\x12\x66\n\x07GetTick\x12,.PyGridWorld.SimulationServer.GetTickRequest\x1a-.PyGridWorld.SimulationServer.GetTickResponse\x12u\n\x0cGetStateJson\x12\x31.PyGridWorld.SimulationServer.GetStateJsonRequest\x1a\x32.PyGridWorld.SimulationServer.GetStateJsonResponse\x12u\n\x0cSetStateJson\x12\x31.PyGridWorld.SimulationServer.SetStateJsonRequest\x1a\x32.PyGridWorld.SimulationServer.SetStateJsonResponse\x12u\n\x0c\x43reateEntity\x12\x31.PyGridWorld.SimulationServer.CreateEntityRequest\x1a\x32.PyGridWorld.SimulationServer.CreateEntityResponse\x12x\n\rDestroyEntity\x12\x32.PyGridWorld.SimulationServer.DestroyEntityRequest\x1a\x33.PyGridWorld.SimulationServer.DestroyEntityResponse\x12z\n\x0eGetAllEntities\x12\x32.PyGridWorld.SimulationServer.GetAllEntitesRequest\x1a\x34.PyGridWorld.SimulationServer.GetAllEntitiesResponse\x12~\n\x0fStartSimulation\x12\x34.PyGridWorld.SimulationServer.StartSimulationRequest\x1a\x35.PyGridWorld.SimulationServer.StartSimulationResponse\x12{\n\x0eStopSimulation\x12\x33.PyGridWorld.SimulationServer.StopSimulationRequest\x1a\x34.PyGridWorld.SimulationServer.StopSimulationResponse\x12l\n\tIsRunning\x12..PyGridWorld.SimulationServer.IsRunningRequest\x1a/.PyGridWorld.SimulationServer.IsRunningResponse\x12~\n\x0f\x41ssignComponent\x12\x34.PyGridWorld.SimulationServer.AssignComponentRequest\x1a\x35.PyGridWorld.SimulationServer.AssignComponentResponse\x12\x81\x01\n\x10GetComponentJson\x12\x35.PyGridWorld.SimulationServer.GetComponentJsonRequest\x1a\x36.PyGridWorld.SimulationServer.GetComponentJsonResponse\x12~\n\x0fRemoveComponent\x12\x34.PyGridWorld.SimulationServer.RemoveComponentRequest\x1a\x35.PyGridWorld.SimulationServer.RemoveComponentResponse\x12\x81\x01\n\x10ReplaceComponent\x12\x35.PyGridWorld.SimulationServer.ReplaceComponentRequest\x1a\x36.PyGridWorld.SimulationServer.ReplaceComponentResponse\x12\x84\x01\n\x11GetComponentNames\x12\x36.PyGridWorld.SimulationServer.GetComponentNamesRequest\x1a\x37.PyGridWorld.SimulationServer.GetComponentNamesResponse\x12\x96\x01\n\x17GetEntityComponentNames\x12<.PyGridWorld.SimulationServer.GetEntityComponentNamesRequest\x1a=.PyGridWorld.SimulationServer.GetEntityComponentNamesResponse\x12\x81\x01\n\x10GetSingletonJson\x12\x35.PyGridWorld.SimulationServer.GetSingletonJsonRequest\x1a\x36.PyGridWorld.SimulationServer.GetSingletonJsonResponse\x12\x81\x01\n\x10SetSingletonJson\x12\x35.PyGridWorld.SimulationServer.SetSingletonJsonRequest\x1a\x36.PyGridWorld.SimulationServer.SetSingletonJsonResponse\x12\x84\x01\n\x11GetSingletonNames\x12\x36.PyGridWorld.SimulationServer.GetSingletonNamesRequest\x1a\x37.PyGridWorld.SimulationServer.GetSingletonNamesResponse\x12n\n\tGetEvents\x12..PyGridWorld.SimulationServer.GetEventsRequest\x1a/.PyGridWorld.SimulationServer.GetEventsResponse0\x01\x12{\n\x0eGetStateBinary\x12\x33.PyGridWorld.SimulationServer.GetStateBinaryRequest\x1a\x34.PyGridWorld.SimulationServer.GetStateBinaryResponse\x12{\n\x0eSetStateBinary\x12\x33.PyGridWorld.SimulationServer.SetStateBinaryRequest\x1a\x34.PyGridWorld.SimulationServer.SetStateBinaryResponse\x12o\n\nRunCommand\x12/.PyGridWorld.SimulationServer.RunCommandRequest\x1a\x30.PyGridWorld.SimulationServer.RunCommandResponse\x12{\n\x0eSetEditorToken\x12\x33.PyGridWorld.SimulationServer.SetEditorTokenRequest\x1a\x34.PyGridWorld.SimulationServer.SetEditorTokenResponse\x12x\n\rSetOwnerToken\x12\x32.PyGridWorld.SimulationServer.SetOwnerTokenRequest\x1a\x33.PyGridWorld.SimulationServer.SetOwnerTokenResponse\x12l\n\tIsEditing\x12..PyGridWorld.SimulationServer.IsEditingRequest\x1a/.PyGridWorld.SimulationServer.IsEditingResponse\x12l\n\tBatchEdit\x12..PyGridWorld.SimulationServer.BatchEditRequest\x1a/.PyGridWorld.SimulationServer.BatchEditResponse\x12\x8a\x01\n\x13GetComponentColumns\x12\x38.PyGridWorld.SimulationServer.GetComponentColumnsRequest\x1a\x39.PyGridWorld.SimulationServer.GetComponentColumnsResponse\x12}\n\x14SubscribeStateDeltas\x12\x39.PyGridWorld.SimulationServer.SubscribeStateDeltasRequest\x1a(.PyGridWorld.SimulationServer.StateDelta0\x01\x12\x83\x01\n\x14GetStateBinaryStream\x12\x39.PyGridWorld.SimulationServer.GetStateBinaryStreamRequest\x1a..PyGridWorld.SimulationServer.StateBinaryChunk0\x01\x12~\n\x14SetStateBinaryStream\x12..PyGridWorld.SimulationServer.StateBinaryChunk\x1a\x34.PyGridWorld.SimulationServer.SetStateBinaryResponse(\x01\x12\x84\x01\n\x11SetSnapshotPolicy\x12\x36.PyGridWorld.SimulationServer.SetSnapshotPolicyRequest\x1a\x37.PyGridWorld.SimulationServer.SetSnapshotPolicyResponseb\x06proto3'
 )
 
 
 
+_COMPONENTCOLUMNQUERY_FORMAT = _descriptor.EnumDescriptor(
+  name='Format',
+  full_name='PyGridWorld.SimulationServer.ComponentColumnQuery.Format',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='JSON', index=0, number=0,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='BINARY', index=1, number=1,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='EIDS_ONLY', index=2, number=2,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=3047,
+  serialized_end=3092,
+)
+_sym_db.RegisterEnumDescriptor(_COMPONENTCOLUMNQUERY_FORMAT)
+
 
 _GETTICKREQUEST = _descriptor.Descriptor(
   name='GetTickRequest',
@@ -1499,6 +1529,63 @@ _SETEDITORTOKENRESPONSE = _descriptor.Descriptor(
 )
 
 
+_SETOWNERTOKENREQUEST = _descriptor.Descriptor(
+  name='SetOwnerTokenRequest',
+  full_name='PyGridWorld.SimulationServer.SetOwnerTokenRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='token', full_name='PyGridWorld.SimulationServer.SetOwnerTokenRequest.token', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1974,
+  serialized_end=2011,
+)
+
+
+_SETOWNERTOKENRESPONSE = _descriptor.Descriptor(
+  name='SetOwnerTokenResponse',
+  full_name='PyGridWorld.SimulationServer.SetOwnerTokenResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2013,
+  serialized_end=2036,
+)
+
+
 _ISEDITINGREQUEST = _descriptor.Descriptor(
   name='IsEditingRequest',
   full_name='PyGridWorld.SimulationServer.IsEditingRequest',
@@ -1526,8 +1613,8 @@ _ISEDITINGREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1974,
-  serialized_end=2017,
+  serialized_start=2038,
+  serialized_end=2081,
 )
 
 
@@ -1558,107 +1645,905 @@ _ISEDITINGRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2019,
-  serialized_end=2058,
+  serialized_start=2083,
+  serialized_end=2122,
 )
 
-_EVENTMESSAGE.oneofs_by_name['data'].fields.append(
-  _EVENTMESSAGE.fields_by_name['json'])
-_EVENTMESSAGE.fields_by_name['json'].containing_oneof = _EVENTMESSAGE.oneofs_by_name['data']
-_EVENTMESSAGE.oneofs_by_name['data'].fields.append(
-  _EVENTMESSAGE.fields_by_name['bin'])
-_EVENTMESSAGE.fields_by_name['bin'].containing_oneof = _EVENTMESSAGE.oneofs_by_name['data']
-_GETEVENTSRESPONSE.fields_by_name['events'].message_type = _EVENTMESSAGE
-DESCRIPTOR.message_types_by_name['GetTickRequest'] = _GETTICKREQUEST
-DESCRIPTOR.message_types_by_name['GetTickResponse'] = _GETTICKRESPONSE
-DESCRIPTOR.message_types_by_name['GetStateJsonRequest'] = _GETSTATEJSONREQUEST
-DESCRIPTOR.message_types_by_name['GetStateJsonResponse'] = _GETSTATEJSONRESPONSE
-DESCRIPTOR.message_types_by_name['SetStateJsonRequest'] = _SETSTATEJSONREQUEST
-DESCRIPTOR.message_types_by_name['SetStateJsonResponse'] = _SETSTATEJSONRESPONSE
-DESCRIPTOR.message_types_by_name['CreateEntityRequest'] = _CREATEENTITYREQUEST
-DESCRIPTOR.message_types_by_name['CreateEntityResponse'] = _CREATEENTITYRESPONSE
-DESCRIPTOR.message_types_by_name['DestroyEntityRequest'] = _DESTROYENTITYREQUEST
-DESCRIPTOR.message_types_by_name['DestroyEntityResponse'] = _DESTROYENTITYRESPONSE
-DESCRIPTOR.message_types_by_name['GetAllEntitesRequest'] = _GETALLENTITESREQUEST
-DESCRIPTOR.message_types_by_name['GetAllEntitiesResponse'] = _GETALLENTITIESRESPONSE
-DESCRIPTOR.message_types_by_name['StartSimulationRequest'] = _STARTSIMULATIONREQUEST
-DESCRIPTOR.message_types_by_name['StartSimulationResponse'] = _STARTSIMULATIONRESPONSE
-DESCRIPTOR.message_types_by_name['StopSimulationRequest'] = _STOPSIMULATIONREQUEST
-DESCRIPTOR.message_types_by_name['StopSimulationResponse'] = _STOPSIMULATIONRESPONSE
-DESCRIPTOR.message_types_by_name['IsRunningRequest'] = _ISRUNNINGREQUEST
-DESCRIPTOR.message_types_by_name['IsRunningResponse'] = _ISRUNNINGRESPONSE
-DESCRIPTOR.message_types_by_name['AssignComponentRequest'] = _ASSIGNCOMPONENTREQUEST
-DESCRIPTOR.message_types_by_name['AssignComponentResponse'] = _ASSIGNCOMPONENTRESPONSE
-DESCRIPTOR.message_types_by_name['GetComponentJsonRequest'] = _GETCOMPONENTJSONREQUEST
-DESCRIPTOR.message_types_by_name['GetComponentJsonResponse'] = _GETCOMPONENTJSONRESPONSE
-DESCRIPTOR.message_types_by_name['RemoveComponentRequest'] = _REMOVECOMPONENTREQUEST
-DESCRIPTOR.message_types_by_name['RemoveComponentResponse'] = _REMOVECOMPONENTRESPONSE
-DESCRIPTOR.message_types_by_name['ReplaceComponentRequest'] = _REPLACECOMPONENTREQUEST
-DESCRIPTOR.message_types_by_name['ReplaceComponentResponse'] = _REPLACECOMPONENTRESPONSE
-DESCRIPTOR.message_types_by_name['GetComponentNamesRequest'] = _GETCOMPONENTNAMESREQUEST
-DESCRIPTOR.message_types_by_name['GetComponentNamesResponse'] = _GETCOMPONENTNAMESRESPONSE
-DESCRIPTOR.message_types_by_name['GetEntityComponentNamesRequest'] = _GETENTITYCOMPONENTNAMESREQUEST
-DESCRIPTOR.message_types_by_name['GetEntityComponentNamesResponse'] = _GETENTITYCOMPONENTNAMESRESPONSE
-DESCRIPTOR.message_types_by_name['GetSingletonJsonRequest'] = _GETSINGLETONJSONREQUEST
-DESCRIPTOR.message_types_by_name['GetSingletonJsonResponse'] = _GETSINGLETONJSONRESPONSE
-DESCRIPTOR.message_types_by_name['SetSingletonJsonRequest'] = _SETSINGLETONJSONREQUEST
-DESCRIPTOR.message_types_by_name['SetSingletonJsonResponse'] = _SETSINGLETONJSONRESPONSE
-DESCRIPTOR.message_types_by_name['GetSingletonNamesRequest'] = _GETSINGLETONNAMESREQUEST
-DESCRIPTOR.message_types_by_name['GetSingletonNamesResponse'] = _GETSINGLETONNAMESRESPONSE
-DESCRIPTOR.message_types_by_name['GetEventsRequest'] = _GETEVENTSREQUEST
-DESCRIPTOR.message_types_by_name['EventMessage'] = _EVENTMESSAGE
-DESCRIPTOR.message_types_by_name['GetEventsResponse'] = _GETEVENTSRESPONSE
-DESCRIPTOR.message_types_by_name['GetStateBinaryRequest'] = _GETSTATEBINARYREQUEST
-DESCRIPTOR.message_types_by_name['GetStateBinaryResponse'] = _GETSTATEBINARYRESPONSE
-DESCRIPTOR.message_types_by_name['SetStateBinaryRequest'] = _SETSTATEBINARYREQUEST
-DESCRIPTOR.message_types_by_name['SetStateBinaryResponse'] = _SETSTATEBINARYRESPONSE
-DESCRIPTOR.message_types_by_name['RunCommandRequest'] = _RUNCOMMANDREQUEST
-DESCRIPTOR.message_types_by_name['RunCommandResponse'] = _RUNCOMMANDRESPONSE
-DESCRIPTOR.message_types_by_name['SetEditorTokenRequest'] = _SETEDITORTOKENREQUEST
-DESCRIPTOR.message_types_by_name['SetEditorTokenResponse'] = _SETEDITORTOKENRESPONSE
-DESCRIPTOR.message_types_by_name['IsEditingRequest'] = _ISEDITINGREQUEST
-DESCRIPTOR.message_types_by_name['IsEditingResponse'] = _ISEDITINGRESPONSE
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
-GetTickRequest = _reflection.GeneratedProtocolMessageType('GetTickRequest', (_message.Message,), {
-  'DESCRIPTOR' : _GETTICKREQUEST,
-  '__module__' : 'simulation_pb2'
-  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.GetTickRequest)
-  })
-_sym_db.RegisterMessage(GetTickRequest)
+_EDITOPERATION = _descriptor.Descriptor(
+  name='EditOperation',
+  full_name='PyGridWorld.SimulationServer.EditOperation',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='create_entity', full_name='PyGridWorld.SimulationServer.EditOperation.create_entity', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='destroy_entity', full_name='PyGridWorld.SimulationServer.EditOperation.destroy_entity', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='assign_component', full_name='PyGridWorld.SimulationServer.EditOperation.assign_component', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='remove_component', full_name='PyGridWorld.SimulationServer.EditOperation.remove_component', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='replace_component', full_name='PyGridWorld.SimulationServer.EditOperation.replace_component', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='set_singleton_json', full_name='PyGridWorld.SimulationServer.EditOperation.set_singleton_json', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='created_entity', full_name='PyGridWorld.SimulationServer.EditOperation.created_entity', index=6,
+      number=7, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='operation', full_name='PyGridWorld.SimulationServer.EditOperation.operation',
+      index=0, containing_type=None,
+      create_key=_descriptor._internal_create_key,
+    fields=[]),
+  ],
+  serialized_start=2125,
+  serialized_end=2664,
+)
 
-GetTickResponse = _reflection.GeneratedProtocolMessageType('GetTickResponse', (_message.Message,), {
-  'DESCRIPTOR' : _GETTICKRESPONSE,
-  '__module__' : 'simulation_pb2'
-  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.GetTickResponse)
-  })
-_sym_db.RegisterMessage(GetTickResponse)
 
-GetStateJsonRequest = _reflection.GeneratedProtocolMessageType('GetStateJsonRequest', (_message.Message,), {
-  'DESCRIPTOR' : _GETSTATEJSONREQUEST,
-  '__module__' : 'simulation_pb2'
-  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.GetStateJsonRequest)
-  })
-_sym_db.RegisterMessage(GetStateJsonRequest)
+_BATCHEDITREQUEST = _descriptor.Descriptor(
+  name='BatchEditRequest',
+  full_name='PyGridWorld.SimulationServer.BatchEditRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='operations', full_name='PyGridWorld.SimulationServer.BatchEditRequest.operations', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='stop_on_error', full_name='PyGridWorld.SimulationServer.BatchEditRequest.stop_on_error', index=1,
+      number=2, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2666,
+  serialized_end=2772,
+)
 
-GetStateJsonResponse = _reflection.GeneratedProtocolMessageType('GetStateJsonResponse', (_message.Message,), {
-  'DESCRIPTOR' : _GETSTATEJSONRESPONSE,
-  '__module__' : 'simulation_pb2'
-  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.GetStateJsonResponse)
-  })
-_sym_db.RegisterMessage(GetStateJsonResponse)
 
-SetStateJsonRequest = _reflection.GeneratedProtocolMessageType('SetStateJsonRequest', (_message.Message,), {
-  'DESCRIPTOR' : _SETSTATEJSONREQUEST,
-  '__module__' : 'simulation_pb2'
-  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.SetStateJsonRequest)
-  })
-_sym_db.RegisterMessage(SetStateJsonRequest)
+_EDITSTATUS = _descriptor.Descriptor(
+  name='EditStatus',
+  full_name='PyGridWorld.SimulationServer.EditStatus',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='success', full_name='PyGridWorld.SimulationServer.EditStatus.success', index=0,
+      number=1, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='PyGridWorld.SimulationServer.EditStatus.error', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2774,
+  serialized_end=2818,
+)
 
-SetStateJsonResponse = _reflection.GeneratedProtocolMessageType('SetStateJsonResponse', (_message.Message,), {
-  'DESCRIPTOR' : _SETSTATEJSONRESPONSE,
-  '__module__' : 'simulation_pb2'
-  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.SetStateJsonResponse)
+
+_BATCHEDITRESPONSE = _descriptor.Descriptor(
+  name='BatchEditResponse',
+  full_name='PyGridWorld.SimulationServer.BatchEditResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='created_eids', full_name='PyGridWorld.SimulationServer.BatchEditResponse.created_eids', index=0,
+      number=1, type=4, cpp_type=4, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='statuses', full_name='PyGridWorld.SimulationServer.BatchEditResponse.statuses', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2820,
+  serialized_end=2921,
+)
+
+
+_COMPONENTCOLUMNQUERY = _descriptor.Descriptor(
+  name='ComponentColumnQuery',
+  full_name='PyGridWorld.SimulationServer.ComponentColumnQuery',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='component_name', full_name='PyGridWorld.SimulationServer.ComponentColumnQuery.component_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='format', full_name='PyGridWorld.SimulationServer.ComponentColumnQuery.format', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _COMPONENTCOLUMNQUERY_FORMAT,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2924,
+  serialized_end=3092,
+)
+
+
+_GETCOMPONENTCOLUMNSREQUEST = _descriptor.Descriptor(
+  name='GetComponentColumnsRequest',
+  full_name='PyGridWorld.SimulationServer.GetComponentColumnsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='columns', full_name='PyGridWorld.SimulationServer.GetComponentColumnsRequest.columns', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3094,
+  serialized_end=3191,
+)
+
+
+_COMPONENTCOLUMN = _descriptor.Descriptor(
+  name='ComponentColumn',
+  full_name='PyGridWorld.SimulationServer.ComponentColumn',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='component_name', full_name='PyGridWorld.SimulationServer.ComponentColumn.component_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='eids', full_name='PyGridWorld.SimulationServer.ComponentColumn.eids', index=1,
+      number=2, type=4, cpp_type=4, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='json', full_name='PyGridWorld.SimulationServer.ComponentColumn.json', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='fields', full_name='PyGridWorld.SimulationServer.ComponentColumn.fields', index=3,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='binary', full_name='PyGridWorld.SimulationServer.ComponentColumn.binary', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3193,
+  serialized_end=3294,
+)
+
+
+_GETCOMPONENTCOLUMNSRESPONSE = _descriptor.Descriptor(
+  name='GetComponentColumnsResponse',
+  full_name='PyGridWorld.SimulationServer.GetComponentColumnsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='columns', full_name='PyGridWorld.SimulationServer.GetComponentColumnsResponse.columns', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='tick', full_name='PyGridWorld.SimulationServer.GetComponentColumnsResponse.tick', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3296,
+  serialized_end=3403,
+)
+
+
+_SUBSCRIBESTATEDELTASREQUEST = _descriptor.Descriptor(
+  name='SubscribeStateDeltasRequest',
+  full_name='PyGridWorld.SimulationServer.SubscribeStateDeltasRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='component_names', full_name='PyGridWorld.SimulationServer.SubscribeStateDeltasRequest.component_names', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max_rate', full_name='PyGridWorld.SimulationServer.SubscribeStateDeltasRequest.max_rate', index=1,
+      number=2, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3405,
+  serialized_end=3477,
+)
+
+
+_COMPONENTVALUE = _descriptor.Descriptor(
+  name='ComponentValue',
+  full_name='PyGridWorld.SimulationServer.ComponentValue',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='eid', full_name='PyGridWorld.SimulationServer.ComponentValue.eid', index=0,
+      number=1, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='component_name', full_name='PyGridWorld.SimulationServer.ComponentValue.component_name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='json', full_name='PyGridWorld.SimulationServer.ComponentValue.json', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3479,
+  serialized_end=3546,
+)
+
+
+_REMOVEDCOMPONENT = _descriptor.Descriptor(
+  name='RemovedComponent',
+  full_name='PyGridWorld.SimulationServer.RemovedComponent',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='eid', full_name='PyGridWorld.SimulationServer.RemovedComponent.eid', index=0,
+      number=1, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='component_name', full_name='PyGridWorld.SimulationServer.RemovedComponent.component_name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3548,
+  serialized_end=3603,
+)
+
+
+_STATEDELTA = _descriptor.Descriptor(
+  name='StateDelta',
+  full_name='PyGridWorld.SimulationServer.StateDelta',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='tick', full_name='PyGridWorld.SimulationServer.StateDelta.tick', index=0,
+      number=1, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='snapshot', full_name='PyGridWorld.SimulationServer.StateDelta.snapshot', index=1,
+      number=2, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='created_eids', full_name='PyGridWorld.SimulationServer.StateDelta.created_eids', index=2,
+      number=3, type=4, cpp_type=4, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='destroyed_eids', full_name='PyGridWorld.SimulationServer.StateDelta.destroyed_eids', index=3,
+      number=4, type=4, cpp_type=4, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='changed_components', full_name='PyGridWorld.SimulationServer.StateDelta.changed_components', index=4,
+      number=5, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='removed_components', full_name='PyGridWorld.SimulationServer.StateDelta.removed_components', index=5,
+      number=6, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3606,
+  serialized_end=3846,
+)
+
+
+_GETSTATEBINARYSTREAMREQUEST = _descriptor.Descriptor(
+  name='GetStateBinaryStreamRequest',
+  full_name='PyGridWorld.SimulationServer.GetStateBinaryStreamRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='chunk_size', full_name='PyGridWorld.SimulationServer.GetStateBinaryStreamRequest.chunk_size', index=0,
+      number=1, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3848,
+  serialized_end=3897,
+)
+
+
+_STATEBINARYCHUNK = _descriptor.Descriptor(
+  name='StateBinaryChunk',
+  full_name='PyGridWorld.SimulationServer.StateBinaryChunk',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='total_size', full_name='PyGridWorld.SimulationServer.StateBinaryChunk.total_size', index=0,
+      number=1, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='tick', full_name='PyGridWorld.SimulationServer.StateBinaryChunk.tick', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='PyGridWorld.SimulationServer.StateBinaryChunk.offset', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='data', full_name='PyGridWorld.SimulationServer.StateBinaryChunk.data', index=3,
+      number=4, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3899,
+  serialized_end=3981,
+)
+
+
+_SNAPSHOTPOLICY = _descriptor.Descriptor(
+  name='SnapshotPolicy',
+  full_name='PyGridWorld.SimulationServer.SnapshotPolicy',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='tick_interval', full_name='PyGridWorld.SimulationServer.SnapshotPolicy.tick_interval', index=0,
+      number=1, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='time_interval', full_name='PyGridWorld.SimulationServer.SnapshotPolicy.time_interval', index=1,
+      number=2, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='bytes_per_hour', full_name='PyGridWorld.SimulationServer.SnapshotPolicy.bytes_per_hour', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3983,
+  serialized_end=4069,
+)
+
+
+_SETSNAPSHOTPOLICYREQUEST = _descriptor.Descriptor(
+  name='SetSnapshotPolicyRequest',
+  full_name='PyGridWorld.SimulationServer.SetSnapshotPolicyRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='policy', full_name='PyGridWorld.SimulationServer.SetSnapshotPolicyRequest.policy', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4071,
+  serialized_end=4159,
+)
+
+
+_SETSNAPSHOTPOLICYRESPONSE = _descriptor.Descriptor(
+  name='SetSnapshotPolicyResponse',
+  full_name='PyGridWorld.SimulationServer.SetSnapshotPolicyResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4161,
+  serialized_end=4188,
+)
+
+_EVENTMESSAGE.oneofs_by_name['data'].fields.append(
+  _EVENTMESSAGE.fields_by_name['json'])
+_EVENTMESSAGE.fields_by_name['json'].containing_oneof = _EVENTMESSAGE.oneofs_by_name['data']
+_EVENTMESSAGE.oneofs_by_name['data'].fields.append(
+  _EVENTMESSAGE.fields_by_name['bin'])
+_EVENTMESSAGE.fields_by_name['bin'].containing_oneof = _EVENTMESSAGE.oneofs_by_name['data']
+_GETEVENTSRESPONSE.fields_by_name['events'].message_type = _EVENTMESSAGE
+_EDITOPERATION.fields_by_name['create_entity'].message_type = _CREATEENTITYREQUEST
+_EDITOPERATION.fields_by_name['destroy_entity'].message_type = _DESTROYENTITYREQUEST
+_EDITOPERATION.fields_by_name['assign_component'].message_type = _ASSIGNCOMPONENTREQUEST
+_EDITOPERATION.fields_by_name['remove_component'].message_type = _REMOVECOMPONENTREQUEST
+_EDITOPERATION.fields_by_name['replace_component'].message_type = _REPLACECOMPONENTREQUEST
+_EDITOPERATION.fields_by_name['set_singleton_json'].message_type = _SETSINGLETONJSONREQUEST
+_EDITOPERATION.oneofs_by_name['operation'].fields.append(
+  _EDITOPERATION.fields_by_name['create_entity'])
+_EDITOPERATION.fields_by_name['create_entity'].containing_oneof = _EDITOPERATION.oneofs_by_name['operation']
+_EDITOPERATION.oneofs_by_name['operation'].fields.append(
+  _EDITOPERATION.fields_by_name['destroy_entity'])
+_EDITOPERATION.fields_by_name['destroy_entity'].containing_oneof = _EDITOPERATION.oneofs_by_name['operation']
+_EDITOPERATION.oneofs_by_name['operation'].fields.append(
+  _EDITOPERATION.fields_by_name['assign_component'])
+_EDITOPERATION.fields_by_name['assign_component'].containing_oneof = _EDITOPERATION.oneofs_by_name['operation']
+_EDITOPERATION.oneofs_by_name['operation'].fields.append(
+  _EDITOPERATION.fields_by_name['remove_component'])
+_EDITOPERATION.fields_by_name['remove_component'].containing_oneof = _EDITOPERATION.oneofs_by_name['operation']
+_EDITOPERATION.oneofs_by_name['operation'].fields.append(
+  _EDITOPERATION.fields_by_name['replace_component'])
+_EDITOPERATION.fields_by_name['replace_component'].containing_oneof = _EDITOPERATION.oneofs_by_name['operation']
+_EDITOPERATION.oneofs_by_name['operation'].fields.append(
+  _EDITOPERATION.fields_by_name['set_singleton_json'])
+_EDITOPERATION.fields_by_name['set_singleton_json'].containing_oneof = _EDITOPERATION.oneofs_by_name['operation']
+_BATCHEDITREQUEST.fields_by_name['operations'].message_type = _EDITOPERATION
+_BATCHEDITRESPONSE.fields_by_name['statuses'].message_type = _EDITSTATUS
+_COMPONENTCOLUMNQUERY.fields_by_name['format'].enum_type = _COMPONENTCOLUMNQUERY_FORMAT
+_COMPONENTCOLUMNQUERY_FORMAT.containing_type = _COMPONENTCOLUMNQUERY
+_GETCOMPONENTCOLUMNSREQUEST.fields_by_name['columns'].message_type = _COMPONENTCOLUMNQUERY
+_GETCOMPONENTCOLUMNSRESPONSE.fields_by_name['columns'].message_type = _COMPONENTCOLUMN
+_STATEDELTA.fields_by_name['changed_components'].message_type = _COMPONENTVALUE
+_STATEDELTA.fields_by_name['removed_components'].message_type = _REMOVEDCOMPONENT
+_SETSNAPSHOTPOLICYREQUEST.fields_by_name['policy'].message_type = _SNAPSHOTPOLICY
+DESCRIPTOR.message_types_by_name['GetTickRequest'] = _GETTICKREQUEST
+DESCRIPTOR.message_types_by_name['GetTickResponse'] = _GETTICKRESPONSE
+DESCRIPTOR.message_types_by_name['GetStateJsonRequest'] = _GETSTATEJSONREQUEST
+DESCRIPTOR.message_types_by_name['GetStateJsonResponse'] = _GETSTATEJSONRESPONSE
+DESCRIPTOR.message_types_by_name['SetStateJsonRequest'] = _SETSTATEJSONREQUEST
+DESCRIPTOR.message_types_by_name['SetStateJsonResponse'] = _SETSTATEJSONRESPONSE
+DESCRIPTOR.message_types_by_name['CreateEntityRequest'] = _CREATEENTITYREQUEST
+DESCRIPTOR.message_types_by_name['CreateEntityResponse'] = _CREATEENTITYRESPONSE
+DESCRIPTOR.message_types_by_name['DestroyEntityRequest'] = _DESTROYENTITYREQUEST
+DESCRIPTOR.message_types_by_name['DestroyEntityResponse'] = _DESTROYENTITYRESPONSE
+DESCRIPTOR.message_types_by_name['GetAllEntitesRequest'] = _GETALLENTITESREQUEST
+DESCRIPTOR.message_types_by_name['GetAllEntitiesResponse'] = _GETALLENTITIESRESPONSE
+DESCRIPTOR.message_types_by_name['StartSimulationRequest'] = _STARTSIMULATIONREQUEST
+DESCRIPTOR.message_types_by_name['StartSimulationResponse'] = _STARTSIMULATIONRESPONSE
+DESCRIPTOR.message_types_by_name['StopSimulationRequest'] = _STOPSIMULATIONREQUEST
+DESCRIPTOR.message_types_by_name['StopSimulationResponse'] = _STOPSIMULATIONRESPONSE
+DESCRIPTOR.message_types_by_name['IsRunningRequest'] = _ISRUNNINGREQUEST
+DESCRIPTOR.message_types_by_name['IsRunningResponse'] = _ISRUNNINGRESPONSE
+DESCRIPTOR.message_types_by_name['AssignComponentRequest'] = _ASSIGNCOMPONENTREQUEST
+DESCRIPTOR.message_types_by_name['AssignComponentResponse'] = _ASSIGNCOMPONENTRESPONSE
+DESCRIPTOR.message_types_by_name['GetComponentJsonRequest'] = _GETCOMPONENTJSONREQUEST
+DESCRIPTOR.message_types_by_name['GetComponentJsonResponse'] = _GETCOMPONENTJSONRESPONSE
+DESCRIPTOR.message_types_by_name['RemoveComponentRequest'] = _REMOVECOMPONENTREQUEST
+DESCRIPTOR.message_types_by_name['RemoveComponentResponse'] = _REMOVECOMPONENTRESPONSE
+DESCRIPTOR.message_types_by_name['ReplaceComponentRequest'] = _REPLACECOMPONENTREQUEST
+DESCRIPTOR.message_types_by_name['ReplaceComponentResponse'] = _REPLACECOMPONENTRESPONSE
+DESCRIPTOR.message_types_by_name['GetComponentNamesRequest'] = _GETCOMPONENTNAMESREQUEST
+DESCRIPTOR.message_types_by_name['GetComponentNamesResponse'] = _GETCOMPONENTNAMESRESPONSE
+DESCRIPTOR.message_types_by_name['GetEntityComponentNamesRequest'] = _GETENTITYCOMPONENTNAMESREQUEST
+DESCRIPTOR.message_types_by_name['GetEntityComponentNamesResponse'] = _GETENTITYCOMPONENTNAMESRESPONSE
+DESCRIPTOR.message_types_by_name['GetSingletonJsonRequest'] = _GETSINGLETONJSONREQUEST
+DESCRIPTOR.message_types_by_name['GetSingletonJsonResponse'] = _GETSINGLETONJSONRESPONSE
+DESCRIPTOR.message_types_by_name['SetSingletonJsonRequest'] = _SETSINGLETONJSONREQUEST
+DESCRIPTOR.message_types_by_name['SetSingletonJsonResponse'] = _SETSINGLETONJSONRESPONSE
+DESCRIPTOR.message_types_by_name['GetSingletonNamesRequest'] = _GETSINGLETONNAMESREQUEST
+DESCRIPTOR.message_types_by_name['GetSingletonNamesResponse'] = _GETSINGLETONNAMESRESPONSE
+DESCRIPTOR.message_types_by_name['GetEventsRequest'] = _GETEVENTSREQUEST
+DESCRIPTOR.message_types_by_name['EventMessage'] = _EVENTMESSAGE
+DESCRIPTOR.message_types_by_name['GetEventsResponse'] = _GETEVENTSRESPONSE
+DESCRIPTOR.message_types_by_name['GetStateBinaryRequest'] = _GETSTATEBINARYREQUEST
+DESCRIPTOR.message_types_by_name['GetStateBinaryResponse'] = _GETSTATEBINARYRESPONSE
+DESCRIPTOR.message_types_by_name['SetStateBinaryRequest'] = _SETSTATEBINARYREQUEST
+DESCRIPTOR.message_types_by_name['SetStateBinaryResponse'] = _SETSTATEBINARYRESPONSE
+DESCRIPTOR.message_types_by_name['RunCommandRequest'] = _RUNCOMMANDREQUEST
+DESCRIPTOR.message_types_by_name['RunCommandResponse'] = _RUNCOMMANDRESPONSE
+DESCRIPTOR.message_types_by_name['SetEditorTokenRequest'] = _SETEDITORTOKENREQUEST
+DESCRIPTOR.message_types_by_name['SetEditorTokenResponse'] = _SETEDITORTOKENRESPONSE
+DESCRIPTOR.message_types_by_name['SetOwnerTokenRequest'] = _SETOWNERTOKENREQUEST
+DESCRIPTOR.message_types_by_name['SetOwnerTokenResponse'] = _SETOWNERTOKENRESPONSE
+DESCRIPTOR.message_types_by_name['IsEditingRequest'] = _ISEDITINGREQUEST
+DESCRIPTOR.message_types_by_name['IsEditingResponse'] = _ISEDITINGRESPONSE
+DESCRIPTOR.message_types_by_name['EditOperation'] = _EDITOPERATION
+DESCRIPTOR.message_types_by_name['BatchEditRequest'] = _BATCHEDITREQUEST
+DESCRIPTOR.message_types_by_name['EditStatus'] = _EDITSTATUS
+DESCRIPTOR.message_types_by_name['BatchEditResponse'] = _BATCHEDITRESPONSE
+DESCRIPTOR.message_types_by_name['ComponentColumnQuery'] = _COMPONENTCOLUMNQUERY
+DESCRIPTOR.message_types_by_name['GetComponentColumnsRequest'] = _GETCOMPONENTCOLUMNSREQUEST
+DESCRIPTOR.message_types_by_name['ComponentColumn'] = _COMPONENTCOLUMN
+DESCRIPTOR.message_types_by_name['GetComponentColumnsResponse'] = _GETCOMPONENTCOLUMNSRESPONSE
+DESCRIPTOR.message_types_by_name['SubscribeStateDeltasRequest'] = _SUBSCRIBESTATEDELTASREQUEST
+DESCRIPTOR.message_types_by_name['ComponentValue'] = _COMPONENTVALUE
+DESCRIPTOR.message_types_by_name['RemovedComponent'] = _REMOVEDCOMPONENT
+DESCRIPTOR.message_types_by_name['StateDelta'] = _STATEDELTA
+DESCRIPTOR.message_types_by_name['GetStateBinaryStreamRequest'] = _GETSTATEBINARYSTREAMREQUEST
+DESCRIPTOR.message_types_by_name['StateBinaryChunk'] = _STATEBINARYCHUNK
+DESCRIPTOR.message_types_by_name['SnapshotPolicy'] = _SNAPSHOTPOLICY
+DESCRIPTOR.message_types_by_name['SetSnapshotPolicyRequest'] = _SETSNAPSHOTPOLICYREQUEST
+DESCRIPTOR.message_types_by_name['SetSnapshotPolicyResponse'] = _SETSNAPSHOTPOLICYRESPONSE
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+GetTickRequest = _reflection.GeneratedProtocolMessageType('GetTickRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETTICKREQUEST,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.GetTickRequest)
+  })
+_sym_db.RegisterMessage(GetTickRequest)
+
+GetTickResponse = _reflection.GeneratedProtocolMessageType('GetTickResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETTICKRESPONSE,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.GetTickResponse)
+  })
+_sym_db.RegisterMessage(GetTickResponse)
+
+GetStateJsonRequest = _reflection.GeneratedProtocolMessageType('GetStateJsonRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETSTATEJSONREQUEST,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.GetStateJsonRequest)
+  })
+_sym_db.RegisterMessage(GetStateJsonRequest)
+
+GetStateJsonResponse = _reflection.GeneratedProtocolMessageType('GetStateJsonResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETSTATEJSONRESPONSE,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.GetStateJsonResponse)
+  })
+_sym_db.RegisterMessage(GetStateJsonResponse)
+
+SetStateJsonRequest = _reflection.GeneratedProtocolMessageType('SetStateJsonRequest', (_message.Message,), {
+  'DESCRIPTOR' : _SETSTATEJSONREQUEST,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.SetStateJsonRequest)
+  })
+_sym_db.RegisterMessage(SetStateJsonRequest)
+
+SetStateJsonResponse = _reflection.GeneratedProtocolMessageType('SetStateJsonResponse', (_message.Message,), {
+  'DESCRIPTOR' : _SETSTATEJSONRESPONSE,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.SetStateJsonResponse)
   })
 _sym_db.RegisterMessage(SetStateJsonResponse)
 
@@ -1949,6 +2834,20 @@ SetEditorTokenResponse = _reflection.GeneratedProtocolMessageType('SetEditorToke
   })
 _sym_db.RegisterMessage(SetEditorTokenResponse)
 
+SetOwnerTokenRequest = _reflection.GeneratedProtocolMessageType('SetOwnerTokenRequest', (_message.Message,), {
+  'DESCRIPTOR' : _SETOWNERTOKENREQUEST,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.SetOwnerTokenRequest)
+  })
+_sym_db.RegisterMessage(SetOwnerTokenRequest)
+
+SetOwnerTokenResponse = _reflection.GeneratedProtocolMessageType('SetOwnerTokenResponse', (_message.Message,), {
+  'DESCRIPTOR' : _SETOWNERTOKENRESPONSE,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.SetOwnerTokenResponse)
+  })
+_sym_db.RegisterMessage(SetOwnerTokenResponse)
+
 IsEditingRequest = _reflection.GeneratedProtocolMessageType('IsEditingRequest', (_message.Message,), {
   'DESCRIPTOR' : _ISEDITINGREQUEST,
   '__module__' : 'simulation_pb2'
@@ -1963,6 +2862,125 @@ IsEditingResponse = _reflection.GeneratedProtocolMessageType('IsEditingResponse'
   })
 _sym_db.RegisterMessage(IsEditingResponse)
 
+EditOperation = _reflection.GeneratedProtocolMessageType('EditOperation', (_message.Message,), {
+  'DESCRIPTOR' : _EDITOPERATION,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.EditOperation)
+  })
+_sym_db.RegisterMessage(EditOperation)
+
+BatchEditRequest = _reflection.GeneratedProtocolMessageType('BatchEditRequest', (_message.Message,), {
+  'DESCRIPTOR' : _BATCHEDITREQUEST,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.BatchEditRequest)
+  })
+_sym_db.RegisterMessage(BatchEditRequest)
+
+EditStatus = _reflection.GeneratedProtocolMessageType('EditStatus', (_message.Message,), {
+  'DESCRIPTOR' : _EDITSTATUS,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.EditStatus)
+  })
+_sym_db.RegisterMessage(EditStatus)
+
+BatchEditResponse = _reflection.GeneratedProtocolMessageType('BatchEditResponse', (_message.Message,), {
+  'DESCRIPTOR' : _BATCHEDITRESPONSE,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.BatchEditResponse)
+  })
+_sym_db.RegisterMessage(BatchEditResponse)
+
+ComponentColumnQuery = _reflection.GeneratedProtocolMessageType('ComponentColumnQuery', (_message.Message,), {
+  'DESCRIPTOR' : _COMPONENTCOLUMNQUERY,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.ComponentColumnQuery)
+  })
+_sym_db.RegisterMessage(ComponentColumnQuery)
+
+GetComponentColumnsRequest = _reflection.GeneratedProtocolMessageType('GetComponentColumnsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETCOMPONENTCOLUMNSREQUEST,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.GetComponentColumnsRequest)
+  })
+_sym_db.RegisterMessage(GetComponentColumnsRequest)
+
+ComponentColumn = _reflection.GeneratedProtocolMessageType('ComponentColumn', (_message.Message,), {
+  'DESCRIPTOR' : _COMPONENTCOLUMN,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.ComponentColumn)
+  })
+_sym_db.RegisterMessage(ComponentColumn)
+
+GetComponentColumnsResponse = _reflection.GeneratedProtocolMessageType('GetComponentColumnsResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETCOMPONENTCOLUMNSRESPONSE,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.GetComponentColumnsResponse)
+  })
+_sym_db.RegisterMessage(GetComponentColumnsResponse)
+
+SubscribeStateDeltasRequest = _reflection.GeneratedProtocolMessageType('SubscribeStateDeltasRequest', (_message.Message,), {
+  'DESCRIPTOR' : _SUBSCRIBESTATEDELTASREQUEST,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.SubscribeStateDeltasRequest)
+  })
+_sym_db.RegisterMessage(SubscribeStateDeltasRequest)
+
+ComponentValue = _reflection.GeneratedProtocolMessageType('ComponentValue', (_message.Message,), {
+  'DESCRIPTOR' : _COMPONENTVALUE,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.ComponentValue)
+  })
+_sym_db.RegisterMessage(ComponentValue)
+
+RemovedComponent = _reflection.GeneratedProtocolMessageType('RemovedComponent', (_message.Message,), {
+  'DESCRIPTOR' : _REMOVEDCOMPONENT,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.RemovedComponent)
+  })
+_sym_db.RegisterMessage(RemovedComponent)
+
+StateDelta = _reflection.GeneratedProtocolMessageType('StateDelta', (_message.Message,), {
+  'DESCRIPTOR' : _STATEDELTA,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.StateDelta)
+  })
+_sym_db.RegisterMessage(StateDelta)
+
+GetStateBinaryStreamRequest = _reflection.GeneratedProtocolMessageType('GetStateBinaryStreamRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETSTATEBINARYSTREAMREQUEST,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.GetStateBinaryStreamRequest)
+  })
+_sym_db.RegisterMessage(GetStateBinaryStreamRequest)
+
+StateBinaryChunk = _reflection.GeneratedProtocolMessageType('StateBinaryChunk', (_message.Message,), {
+  'DESCRIPTOR' : _STATEBINARYCHUNK,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.StateBinaryChunk)
+  })
+_sym_db.RegisterMessage(StateBinaryChunk)
+
+SnapshotPolicy = _reflection.GeneratedProtocolMessageType('SnapshotPolicy', (_message.Message,), {
+  'DESCRIPTOR' : _SNAPSHOTPOLICY,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.SnapshotPolicy)
+  })
+_sym_db.RegisterMessage(SnapshotPolicy)
+
+SetSnapshotPolicyRequest = _reflection.GeneratedProtocolMessageType('SetSnapshotPolicyRequest', (_message.Message,), {
+  'DESCRIPTOR' : _SETSNAPSHOTPOLICYREQUEST,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.SetSnapshotPolicyRequest)
+  })
+_sym_db.RegisterMessage(SetSnapshotPolicyRequest)
+
+SetSnapshotPolicyResponse = _reflection.GeneratedProtocolMessageType('SetSnapshotPolicyResponse', (_message.Message,), {
+  'DESCRIPTOR' : _SETSNAPSHOTPOLICYRESPONSE,
+  '__module__' : 'simulation_pb2'
+  # @@protoc_insertion_point(class_scope:PyGridWorld.SimulationServer.SetSnapshotPolicyResponse)
+  })
+_sym_db.RegisterMessage(SetSnapshotPolicyResponse)
+
 
 
 _SIMULATION = _descriptor.ServiceDescriptor(
@@ -1972,8 +2990,8 @@ _SIMULATION = _descriptor.ServiceDescriptor(
   index=0,
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=2061,
-  serialized_end=5060,
+  serialized_start=4191,
+  serialized_end=8087,
   methods=[
   _descriptor.MethodDescriptor(
     name='GetTick',
@@ -2205,16 +3223,86 @@ _SIMULATION = _descriptor.ServiceDescriptor(
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='SetOwnerToken',
+    full_name='PyGridWorld.SimulationServer.Simulation.SetOwnerToken',
+    index=23,
+    containing_service=None,
+    input_type=_SETOWNERTOKENREQUEST,
+    output_type=_SETOWNERTOKENRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
   _descriptor.MethodDescriptor(
     name='IsEditing',
     full_name='PyGridWorld.SimulationServer.Simulation.IsEditing',
-    index=23,
+    index=24,
     containing_service=None,
     input_type=_ISEDITINGREQUEST,
     output_type=_ISEDITINGRESPONSE,
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='BatchEdit',
+    full_name='PyGridWorld.SimulationServer.Simulation.BatchEdit',
+    index=25,
+    containing_service=None,
+    input_type=_BATCHEDITREQUEST,
+    output_type=_BATCHEDITRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetComponentColumns',
+    full_name='PyGridWorld.SimulationServer.Simulation.GetComponentColumns',
+    index=26,
+    containing_service=None,
+    input_type=_GETCOMPONENTCOLUMNSREQUEST,
+    output_type=_GETCOMPONENTCOLUMNSRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='SubscribeStateDeltas',
+    full_name='PyGridWorld.SimulationServer.Simulation.SubscribeStateDeltas',
+    index=27,
+    containing_service=None,
+    input_type=_SUBSCRIBESTATEDELTASREQUEST,
+    output_type=_STATEDELTA,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetStateBinaryStream',
+    full_name='PyGridWorld.SimulationServer.Simulation.GetStateBinaryStream',
+    index=28,
+    containing_service=None,
+    input_type=_GETSTATEBINARYSTREAMREQUEST,
+    output_type=_STATEBINARYCHUNK,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='SetStateBinaryStream',
+    full_name='PyGridWorld.SimulationServer.Simulation.SetStateBinaryStream',
+    index=29,
+    containing_service=None,
+    input_type=_STATEBINARYCHUNK,
+    output_type=_SETSTATEBINARYRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='SetSnapshotPolicy',
+    full_name='PyGridWorld.SimulationServer.Simulation.SetSnapshotPolicy',
+    index=30,
+    containing_service=None,
+    input_type=_SETSNAPSHOTPOLICYREQUEST,
+    output_type=_SETSNAPSHOTPOLICYRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_SIMULATION)
 
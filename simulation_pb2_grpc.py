@@ -131,11 +131,46 @@ class SimulationStub(object):
                 request_serializer=simulation__pb2.SetEditorTokenRequest.SerializeToString,
                 response_deserializer=simulation__pb2.SetEditorTokenResponse.FromString,
                 )
+        self.SetOwnerToken = channel.unary_unary(
+                '/PyGridWorld.SimulationServer.Simulation/SetOwnerToken',
+                request_serializer=simulation__pb2.SetOwnerTokenRequest.SerializeToString,
+                response_deserializer=simulation__pb2.SetOwnerTokenResponse.FromString,
+                )
         self.IsEditing = channel.unary_unary(
                 '/PyGridWorld.SimulationServer.Simulation/IsEditing',
                 request_serializer=simulation__pb2.IsEditingRequest.SerializeToString,
                 response_deserializer=simulation__pb2.IsEditingResponse.FromString,
                 )
+        self.BatchEdit = channel.unary_unary(
+                '/PyGridWorld.SimulationServer.Simulation/BatchEdit',
+                request_serializer=simulation__pb2.BatchEditRequest.SerializeToString,
+                response_deserializer=simulation__pb2.BatchEditResponse.FromString,
+                )
+        self.GetComponentColumns = channel.unary_unary(
+                '/PyGridWorld.SimulationServer.Simulation/GetComponentColumns',
+                request_serializer=simulation__pb2.GetComponentColumnsRequest.SerializeToString,
+                response_deserializer=simulation__pb2.GetComponentColumnsResponse.FromString,
+                )
+        self.SubscribeStateDeltas = channel.unary_stream(
+                '/PyGridWorld.SimulationServer.Simulation/SubscribeStateDeltas',
+                request_serializer=simulation__pb2.SubscribeStateDeltasRequest.SerializeToString,
+                response_deserializer=simulation__pb2.StateDelta.FromString,
+                )
+        self.GetStateBinaryStream = channel.unary_stream(
+                '/PyGridWorld.SimulationServer.Simulation/GetStateBinaryStream',
+                request_serializer=simulation__pb2.GetStateBinaryStreamRequest.SerializeToString,
+                response_deserializer=simulation__pb2.StateBinaryChunk.FromString,
+                )
+        self.SetStateBinaryStream = channel.stream_unary(
+                '/PyGridWorld.SimulationServer.Simulation/SetStateBinaryStream',
+                request_serializer=simulation__pb2.StateBinaryChunk.SerializeToString,
+                response_deserializer=simulation__pb2.SetStateBinaryResponse.FromString,
+                )
+        self.SetSnapshotPolicy = channel.unary_unary(
+                '/PyGridWorld.SimulationServer.Simulation/SetSnapshotPolicy',
+                request_serializer=simulation__pb2.SetSnapshotPolicyRequest.SerializeToString,
+                response_deserializer=simulation__pb2.SetSnapshotPolicyResponse.FromString,
+                )
 
 
 class SimulationServicer(object):
@@ -281,12 +316,54 @@ class SimulationServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SetOwnerToken(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def IsEditing(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchEdit(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetComponentColumns(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SubscribeStateDeltas(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetStateBinaryStream(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SetStateBinaryStream(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SetSnapshotPolicy(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_SimulationServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -405,11 +482,46 @@ def add_SimulationServicer_to_server(servicer, server):
                     request_deserializer=simulation__pb2.SetEditorTokenRequest.FromString,
                     response_serializer=simulation__pb2.SetEditorTokenResponse.SerializeToString,
             ),
+            'SetOwnerToken': grpc.unary_unary_rpc_method_handler(
+                    servicer.SetOwnerToken,
+                    request_deserializer=simulation__pb2.SetOwnerTokenRequest.FromString,
+                    response_serializer=simulation__pb2.SetOwnerTokenResponse.SerializeToString,
+            ),
             'IsEditing': grpc.unary_unary_rpc_method_handler(
                     servicer.IsEditing,
                     request_deserializer=simulation__pb2.IsEditingRequest.FromString,
                     response_serializer=simulation__pb2.IsEditingResponse.SerializeToString,
             ),
+            'BatchEdit': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchEdit,
+                    request_deserializer=simulation__pb2.BatchEditRequest.FromString,
+                    response_serializer=simulation__pb2.BatchEditResponse.SerializeToString,
+            ),
+            'GetComponentColumns': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetComponentColumns,
+                    request_deserializer=simulation__pb2.GetComponentColumnsRequest.FromString,
+                    response_serializer=simulation__pb2.GetComponentColumnsResponse.SerializeToString,
+            ),
+            'SubscribeStateDeltas': grpc.unary_stream_rpc_method_handler(
+                    servicer.SubscribeStateDeltas,
+                    request_deserializer=simulation__pb2.SubscribeStateDeltasRequest.FromString,
+                    response_serializer=simulation__pb2.StateDelta.SerializeToString,
+            ),
+            'GetStateBinaryStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetStateBinaryStream,
+                    request_deserializer=simulation__pb2.GetStateBinaryStreamRequest.FromString,
+                    response_serializer=simulation__pb2.StateBinaryChunk.SerializeToString,
+            ),
+            'SetStateBinaryStream': grpc.stream_unary_rpc_method_handler(
+                    servicer.SetStateBinaryStream,
+                    request_deserializer=simulation__pb2.StateBinaryChunk.FromString,
+                    response_serializer=simulation__pb2.SetStateBinaryResponse.SerializeToString,
+            ),
+            'SetSnapshotPolicy': grpc.unary_unary_rpc_method_handler(
+                    servicer.SetSnapshotPolicy,
+                    request_deserializer=simulation__pb2.SetSnapshotPolicyRequest.FromString,
+                    response_serializer=simulation__pb2.SetSnapshotPolicyResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'PyGridWorld.SimulationServer.Simulation', rpc_method_handlers)
@@ -813,6 +925,23 @@ class Simulation(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def SetOwnerToken(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/PyGridWorld.SimulationServer.Simulation/SetOwnerToken',
+            simulation__pb2.SetOwnerTokenRequest.SerializeToString,
+            simulation__pb2.SetOwnerTokenResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def IsEditing(request,
             target,
@@ -829,3 +958,105 @@ class Simulation(object):
             simulation__pb2.IsEditingResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def BatchEdit(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/PyGridWorld.SimulationServer.Simulation/BatchEdit',
+            simulation__pb2.BatchEditRequest.SerializeToString,
+            simulation__pb2.BatchEditResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetComponentColumns(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/PyGridWorld.SimulationServer.Simulation/GetComponentColumns',
+            simulation__pb2.GetComponentColumnsRequest.SerializeToString,
+            simulation__pb2.GetComponentColumnsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def SubscribeStateDeltas(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/PyGridWorld.SimulationServer.Simulation/SubscribeStateDeltas',
+            simulation__pb2.SubscribeStateDeltasRequest.SerializeToString,
+            simulation__pb2.StateDelta.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetStateBinaryStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/PyGridWorld.SimulationServer.Simulation/GetStateBinaryStream',
+            simulation__pb2.GetStateBinaryStreamRequest.SerializeToString,
+            simulation__pb2.StateBinaryChunk.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def SetStateBinaryStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(request_iterator, target, '/PyGridWorld.SimulationServer.Simulation/SetStateBinaryStream',
+            simulation__pb2.StateBinaryChunk.SerializeToString,
+            simulation__pb2.SetStateBinaryResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def SetSnapshotPolicy(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/PyGridWorld.SimulationServer.Simulation/SetSnapshotPolicy',
+            simulation__pb2.SetSnapshotPolicyRequest.SerializeToString,
+            simulation__pb2.SetSnapshotPolicyResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -0,0 +1,64 @@
+import json
+import sys
+import zlib
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import SimulationManager as sm
+from simrunner import SimulationProcess
+
+POINT_TICKS = [0, 100, 200]
+# the timeline the project fixture creates, the first of a new project
+TIMELINE_ID = 1
+
+
+def make_point(tick, value=0):
+    """
+    :return: A point in the stand-in simulation's binary format, zlib compressed state JSON.
+    """
+    state = {'tick': tick, 'next_eid': 1, 'entities': {'0': {'Health': {'value': value}}}, 'singletons': {}}
+    return zlib.compress(json.dumps(state).encode('utf-8'))
+
+
+@pytest.fixture
+def simulation_binary(tmp_path):
+    """
+    :return: The path of a simulation binary, run by the stand-in simulation server.
+    """
+    SimulationProcess.set_simulation_server_command([sys.executable, str(ROOT / 'sim_standin.py')])
+
+    # the stand-in server ignores the simulation binary, it only has to exist
+    binary_path = tmp_path / 'simulation.bin'
+    binary_path.write_bytes(b'simulation')
+    return binary_path
+
+
+@pytest.fixture
+def project_dir(tmp_path, simulation_binary):
+    """
+    :return: The directory of a project with the stand-in simulation as its source, and the timeline TIMELINE_ID
+    with points at POINT_TICKS.
+    """
+    project_dir = tmp_path / 'project'
+    project = sm.TimelinesProject.create_new_project(project_dir)
+    try:
+        project.timelines_dir_path.mkdir(exist_ok=True)
+        project.simulation_registry_path.mkdir(exist_ok=True)
+
+        source_path = tmp_path / 'source.json'
+        source_path.write_text(json.dumps({'name': 'standin', 'binary': str(simulation_binary),
+                                           'archive_method': sm.SimulationSource.AM_GIT_ARCHIVE_WORKING}))
+        project.add_simulation_source_path(source_path)
+
+        node = project.create_timeline()
+        project.change_timeline_simulation_provider(node.timeline_id, sm.SimulationSource(source_path))
+        for tick in POINT_TICKS:
+            node.timeline.get_point_file_path(tick).write_bytes(make_point(tick))
+        node.timeline.refresh_tick_list()
+    finally:
+        project.close()
+    return project_dir
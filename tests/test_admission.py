@@ -0,0 +1,88 @@
+"""
+Checks that the timeline server and its AdmissionController admit calls by their budgets.
+"""
+import grpc
+import pytest
+
+import SimulationManager as sm
+import TimelinesService_pb2 as ts
+import TimelinesService_pb2_grpc as ts_grpc
+from conftest import TIMELINE_ID
+from ts_server import AdmissionController, AdmissionPolicy, AdmissionRejected, AsyncServer, Server
+
+
+@pytest.fixture(params=[Server, AsyncServer])
+def stub(request, project_dir):
+    project = sm.TimelinesProject.load_project(project_dir)
+    policy = AdmissionPolicy(interactive_limit=1, long_lived_limit=1, max_queued=0)
+    server = request.param(project, 'localhost:0', admission=policy)
+    server.start()
+    channel = grpc.insecure_channel(f'localhost:{server.port}')
+    try:
+        yield ts_grpc.TimelineServiceStub(channel)
+    finally:
+        channel.close()
+        server.stop()
+        project.close()
+
+
+def test_long_lived_calls_have_their_own_budget(stub):
+    watch = stub.WatchProject(ts.WatchProjectRequest())
+    try:
+        next(watch)
+
+        # the open watch does not hold up interactive calls, but a second watch does not fit
+        request = ts.GetTimelineDetailsRequest(timeline_id=TIMELINE_ID)
+        assert stub.GetTimelineDetails(request).parent_id == 0
+        with pytest.raises(grpc.RpcError) as error:
+            next(stub.WatchProject(ts.WatchProjectRequest()))
+        assert error.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+    finally:
+        watch.cancel()
+
+
+def request_calls(controller, budget_name, method, clients):
+    admitted = []
+    tickets = [controller.request(budget_name, method, client, lambda client=client: admitted.append(client))
+               for client in clients]
+    return tickets, admitted
+
+
+def test_queued_clients_take_turns():
+    controller = AdmissionController(AdmissionPolicy(interactive_limit=1))
+    (running, first, second, other), admitted = request_calls(controller, 'interactive', 'GetTimelines',
+                                                              ['a', 'a', 'a', 'b'])
+
+    assert running.granted and not (first.granted or second.granted or other.granted)
+    controller.release(running)
+    controller.release(first)
+    controller.release(other)
+
+    assert admitted == ['a', 'b', 'a']
+    controller.release(second)
+
+
+def test_full_queue_is_refused():
+    controller = AdmissionController(AdmissionPolicy(bulk_limit=1, max_queued_per_client=1))
+    request_calls(controller, 'bulk', 'GetTimelineData', ['a', 'a'])
+
+    with pytest.raises(AdmissionRejected) as error:
+        controller.request('bulk', 'GetTimelineData', 'a', lambda: None)
+    assert error.value.reason == 'client queue full'
+    assert error.value.retry_after > 0
+    assert controller.request('bulk', 'GetTimelineData', 'b', lambda: None).granted is False
+
+
+def test_withdrawn_call_lets_smaller_calls_in():
+    controller = AdmissionController(AdmissionPolicy(bulk_limit=2))
+    running = controller.request('bulk', 'GetTimelineData', 'a', lambda: None)
+    (json_call,), _ = request_calls(controller, 'bulk', 'GetTimelineJson', ['b'])
+    (data_call,), admitted = request_calls(controller, 'bulk', 'GetTimelineData', ['c'])
+
+    # the JSON call costs 2 and holds the queue until it is withdrawn
+    assert not data_call.granted
+    assert controller.withdraw(json_call)
+    assert admitted == ['c'] and data_call.granted
+    assert not controller.withdraw(data_call)
+    controller.release(data_call)
+    controller.release(running)
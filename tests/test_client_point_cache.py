@@ -0,0 +1,99 @@
+"""
+Checks that points cached by ClientPointCache are used until the timeline's points change.
+"""
+import json
+
+import pytest
+
+import SimulationManager as sm
+from conftest import POINT_TICKS, TIMELINE_ID
+from point_cache import ClientPointCache
+from ts_client import Client
+from ts_server import Server
+
+
+@pytest.fixture
+def project(project_dir):
+    project = sm.TimelinesProject.load_project(project_dir)
+    try:
+        yield project
+    finally:
+        project.close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ClientPointCache(tmp_path / 'client_cache.db')
+    try:
+        yield cache
+    finally:
+        cache.close()
+
+
+@pytest.fixture
+def client(project, cache):
+    server = Server(project, 'localhost:0', admission=None)
+    server.start()
+    try:
+        with Client(f'localhost:{server.port}', cache=cache) as client:
+            yield client
+    finally:
+        server.stop()
+
+
+def read_points(project):
+    timeline = project.get_timeline_node(TIMELINE_ID).timeline
+    return [(tick, timeline.get_point_file_path(tick).read_bytes()) for tick in POINT_TICKS]
+
+
+def test_points_are_served_from_the_cache(project, client, cache):
+    first = list(client.get_timeline_data(TIMELINE_ID, start_tick=0))
+    second = list(client.get_timeline_data(TIMELINE_ID, start_tick=0))
+
+    assert first == second == read_points(project)
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses']) == (len(POINT_TICKS), len(POINT_TICKS))
+
+
+def test_migrated_points_are_fetched_again(project, client, cache, tmp_path):
+    list(client.get_timeline_data(TIMELINE_ID, start_tick=0))
+    commit_timestamp = client.get_timeline_details(TIMELINE_ID).last_commit_timestamp
+
+    binary_path = tmp_path / 'simulation_v2.bin'
+    binary_path.write_bytes(b'simulation v2')
+    source_path = tmp_path / 'source_v2.json'
+    source_path.write_text(json.dumps({'name': 'standin v2', 'binary': str(binary_path),
+                                       'archive_method': sm.SimulationSource.AM_GIT_ARCHIVE_WORKING}))
+    project.change_timeline_simulation_provider(TIMELINE_ID, sm.SimulationSource(source_path),
+                                                scope='timeline')
+
+    assert client.get_timeline_details(TIMELINE_ID).last_commit_timestamp != commit_timestamp
+    assert list(client.get_timeline_data(TIMELINE_ID, start_tick=0)) == read_points(project)
+    assert cache.get_stats()['misses'] == 2 * len(POINT_TICKS)
+
+
+def test_least_recently_used_points_are_evicted(tmp_path):
+    cache = ClientPointCache(tmp_path / 'evicting.db', max_bytes=3500, compress=False)
+    try:
+        for tick in range(3):
+            cache.put('server', 1, 'commit', 'data', tick, bytes(1000))
+        cache.get_many('server', 1, 'commit', 'data', [0])
+        cache.put('server', 1, 'commit', 'data', 3, bytes(1000))
+
+        assert sorted(cache.get_many('server', 1, 'commit', 'data', range(4))) == [0, 2, 3]
+        assert cache.get_stats()['evictions'] == 1
+    finally:
+        cache.close()
+
+
+def test_older_commits_are_dropped(tmp_path):
+    cache = ClientPointCache(tmp_path / 'commits.db')
+    try:
+        cache.put('server', 1, 'first', 'data', 0, b'first')
+        cache.put('server', 2, 'first', 'data', 0, b'other timeline')
+
+        assert cache.get_many('server', 1, 'second', 'data', [0]) == {}
+        assert cache.get_many('server', 1, 'first', 'data', [0]) == {}
+        assert cache.get_many('server', 2, 'first', 'data', [0]) == {0: b'other timeline'}
+    finally:
+        cache.close()
@@ -0,0 +1,111 @@
+"""
+Runs SimulationClient.batch against the stand-in simulation service, served in process.
+"""
+from concurrent import futures
+
+import grpc
+import pytest
+
+import simulation_pb2_grpc as sim_grpc
+from sim_standin import StandInSimulation, StandInService
+from simrunner import SimulationClient, BatchEditError
+
+OWNER_TOKEN = 'owner'
+EDITOR_TOKEN = 'editor'
+
+
+@pytest.fixture
+def simulation():
+    return StandInSimulation()
+
+
+@pytest.fixture
+def client(simulation):
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    sim_grpc.add_SimulationServicer_to_server(StandInService(simulation, OWNER_TOKEN), server)
+    port = server.add_insecure_port('localhost:0')
+    server.start()
+    channel = grpc.insecure_channel(f'localhost:{port}')
+    try:
+        SimulationClient(channel, OWNER_TOKEN).set_editor_token(EDITOR_TOKEN)
+        yield SimulationClient(channel, EDITOR_TOKEN)
+    finally:
+        channel.close()
+        server.stop(0).wait()
+
+
+def test_batch_edits_created_entities(client):
+    with client.batch() as batch:
+        first = batch.create_entity()
+        second = batch.create_entity()
+        batch.assign_component(first, 'Position')
+        batch.assign_component(second, 'Health')
+        batch.replace_component(second, 'Health', '{"value": 5}')
+        batch.set_singleton_json('World', '{"size": 3}')
+
+    assert batch.errors == []
+    assert batch.created_eids == [first.eid, second.eid]
+    assert sorted(client.get_all_entities()[0]) == sorted(batch.created_eids)
+    assert client.get_entity_component_names(first.eid)[0] == ['Position']
+    assert client.get_component_json(second.eid, 'Health')[0] == '{"value": 5}'
+    assert client.get_singleton_json('World')[0] == '{"size": 3}'
+
+
+def test_batch_chunks_resolve_earlier_refs(client):
+    with client.batch(chunk_size=2) as batch:
+        refs = [batch.create_entity() for _ in range(3)]
+        for ref in refs:
+            batch.assign_component(ref, 'Position')
+
+    assert batch.errors == []
+    for ref in refs:
+        assert client.get_entity_component_names(ref.eid)[0] == ['Position']
+
+
+def test_failed_create_does_not_shift_later_refs(client, simulation):
+    create_entity = simulation.create_entity
+    calls = []
+
+    def create_entity_failing_first():
+        calls.append(None)
+        if len(calls) == 1:
+            raise ValueError("No room for entities.")
+        return create_entity()
+
+    simulation.create_entity = create_entity_failing_first
+
+    with client.batch(stop_on_error=False) as batch:
+        failed = batch.create_entity()
+        created = batch.create_entity()
+        batch.assign_component(created, 'Position')
+        batch.assign_component(failed, 'Health')
+
+    assert failed.eid is None
+    assert batch.created_eids == [created.eid]
+    assert [index for index, _ in batch.errors] == [0, 3]
+    assert client.get_entity_component_names(created.eid)[0] == ['Position']
+
+
+def test_stop_on_error_skips_rest_of_chunk(client):
+    with pytest.raises(BatchEditError):
+        with client.batch() as batch:
+            batch.destroy_entity(12345)
+            skipped = batch.create_entity()
+
+    assert skipped.eid is None
+    assert [index for index, _ in batch.errors] == [0, 1]
+    assert client.get_all_entities()[0] == []
+
+
+def test_ref_to_failed_create_names_the_failure(client, simulation):
+    def create_entity_failing():
+        raise ValueError("No room for entities.")
+
+    simulation.create_entity = create_entity_failing
+
+    with client.batch(chunk_size=1, stop_on_error=False) as batch:
+        failed = batch.create_entity()
+        with pytest.raises(ValueError, match="create operation 0 failed.*No room for entities"):
+            batch.assign_component(failed, 'Health')
+
+    assert [index for index, _ in batch.errors] == [0]
@@ -0,0 +1,61 @@
+"""
+Checks PointJsonCache entries, which are shared by identical points, and the file hashes they are keyed by.
+"""
+import os
+
+import pytest
+
+from point_cache import PointJsonCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = PointJsonCache(tmp_path / 'point_json.db')
+    try:
+        yield cache
+    finally:
+        cache.close()
+
+
+def convert_to(json):
+    converted = []
+
+    def convert():
+        converted.append(json)
+        return json
+    return convert, converted
+
+
+def test_shared_entries_stay_until_no_timeline_uses_them(cache, tmp_path):
+    point_path = tmp_path / 'point'
+    point_path.write_bytes(b'point')
+    binary_path = tmp_path / 'simulation'
+    binary_path.write_bytes(b'simulation')
+    convert, converted = convert_to('{"shared": true}')
+
+    cache.get_or_convert(point_path, binary_path, convert, timeline_id=1)
+    cache.get_or_convert(point_path, binary_path, convert, timeline_id=2)
+    cache.invalidate_timeline(1)
+
+    assert cache.get_or_convert(point_path, binary_path, convert, timeline_id=2) == '{"shared": true}'
+    assert converted == ['{"shared": true}']
+
+    cache.invalidate_timeline(2)
+
+    assert cache.get_stats()['entry_count'] == 0
+    assert cache.get_stats()['invalidations'] == 1
+
+
+def test_replaced_file_is_hashed_again(tmp_path, cache):
+    point_path = tmp_path / 'point'
+    point_path.write_bytes(b'first')
+    stat = os.stat(point_path)
+    first_hash = cache.file_hash(point_path)
+
+    # the same size and modification time, as a migrated point replaced within the timestamp resolution
+    staged_path = tmp_path / 'point.migrating'
+    staged_path.write_bytes(b'other')
+    os.utime(staged_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(staged_path, point_path)
+
+    assert cache.file_hash(point_path) != first_hash
@@ -0,0 +1,44 @@
+"""
+Runs a ShardedServer with two workers over a project, through ts_client.
+"""
+import sys
+
+import pytest
+
+from conftest import ROOT
+from ts_client import Client, RpcError, StatusCode
+from ts_shard import ShardedServer, owner_of
+
+
+@pytest.fixture
+def client(project_dir):
+    server = ShardedServer(project_dir, 'localhost:0', 2, [sys.executable, str(ROOT / 'sim_standin.py')])
+    server.start()
+    try:
+        with Client(f'localhost:{server.port}') as client:
+            yield client
+    finally:
+        server.stop()
+
+
+def test_timelines_are_routed_to_their_owners(client):
+    created = [client.create_timeline(None, None) for _ in range(4)]
+
+    assert {owner_of(timeline_id, 2) for timeline_id in created} == {0, 1}
+    assert set(created) <= set(client.get_timelines())
+    for timeline_id in created:
+        assert client.get_timeline_details(timeline_id).parent_id == 0
+
+
+def test_delete_reaches_every_worker_quietly(client, capsys):
+    created = [client.create_timeline(None, None) for _ in range(2)]
+    capsys.readouterr()
+
+    for timeline_id in created:
+        client.delete_timeline(timeline_id)
+
+    assert not set(created) & set(client.get_timelines())
+    assert 'could not drop' not in capsys.readouterr().out
+    with pytest.raises(RpcError) as error:
+        client.delete_timeline(created[0])
+    assert error.value.code() == StatusCode.INVALID_ARGUMENT
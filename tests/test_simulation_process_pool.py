@@ -0,0 +1,83 @@
+"""
+Acquires and releases stand-in simulation processes through SimulationProcessPool.
+"""
+import grpc
+import pytest
+
+import SimulationManager as sm
+from conftest import TIMELINE_ID
+from simrunner import SimulationProcessPool, RpcError
+
+
+class RecordingPool(SimulationProcessPool):
+    """
+    A pool that remembers every process it handed out. It does not start idle processes in the background,
+    so the only idle processes are the ones released by the test.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.acquired = []
+
+    def acquire(self, simulation_binary_path):
+        process = super().acquire(simulation_binary_path)
+        self.acquired.append(process)
+        return process
+
+    def _refill(self, key):
+        pass
+
+
+@pytest.fixture
+def pool():
+    pool = RecordingPool(default_pool_size=0)
+    try:
+        yield pool
+    finally:
+        pool.close()
+
+
+def test_released_process_is_reused_with_a_new_owner_token(pool, simulation_binary):
+    pool.set_pool_size(simulation_binary, 1)
+    process = pool.acquire(simulation_binary)
+    old_token = process.get_owner_token()
+    old_owner = process.make_client(old_token)
+    old_owner.set_editor_token('editor')
+
+    pool.release(process)
+
+    assert pool.acquire(simulation_binary) is process
+    assert process.get_owner_token() != old_token
+    with pytest.raises(RpcError) as error:
+        old_owner.set_editor_token('editor')
+    assert error.value.code() == grpc.StatusCode.PERMISSION_DENIED
+    assert not process.make_client(process.get_owner_token()).is_editing()
+
+    metrics = pool.get_metrics()[str(simulation_binary.resolve())]
+    assert (metrics['recycled'], metrics['warm_acquires']) == (1, 1)
+    pool.release(process)
+
+
+def test_released_process_is_stopped_without_room(pool, simulation_binary):
+    process = pool.acquire(simulation_binary)
+
+    pool.release(process)
+
+    assert not process.is_alive()
+    assert pool.get_metrics()[str(simulation_binary.resolve())]['discarded'] == 1
+
+
+def test_failed_start_stops_the_process(pool, project_dir):
+    project = sm.TimelinesProject.load_project(project_dir)
+    try:
+        timeline = project.get_timeline_node(TIMELINE_ID).timeline
+        timeline.get_point_file_path(timeline.head()).write_bytes(b'not a point')
+        simulation = sm.TimelineSimulation(timeline, pool)
+
+        with pytest.raises(RpcError):
+            simulation.start_process()
+
+        assert len(pool.acquired) == 1
+        assert not pool.acquired[0].is_alive()
+        assert not simulation.is_process_running()
+    finally:
+        project.close()
@@ -0,0 +1,28 @@
+from bisect import bisect_left, bisect_right
+
+
+def select_ticks(tick_list, start_tick, end_tick=-1, stride=0, max_count=0):
+    """
+    Selects ticks from a sorted tick list.
+    :param start_tick: The first tick of the range.
+    :param end_tick: The last tick of the range, or -1 for the rest of the list.
+    :param stride: If greater than one, only every stride-th tick of the range is selected.
+    :param max_count: If non-zero, at most this many evenly spaced ticks are selected,
+    including the first and last of the range.
+    :return: The list of selected ticks, in order.
+    """
+    start = bisect_left(tick_list, start_tick)
+    end = len(tick_list) if end_tick == -1 else bisect_right(tick_list, end_tick)
+    ticks = tick_list[start:end]
+
+    if stride > 1:
+        ticks = ticks[::stride]
+
+    if max_count and len(ticks) > max_count:
+        if max_count == 1:
+            ticks = ticks[:1]
+        else:
+            last = len(ticks) - 1
+            ticks = [ticks[i * last // (max_count - 1)] for i in range(max_count)]
+
+    return ticks
@@ -1,9 +1,16 @@
+import asyncio
 import grpc
+import grpc.aio
+import traceback
+import zlib
 
 import TimelinesService_pb2 as ts
 import TimelinesService_pb2_grpc as ts_grpc
-from collections import namedtuple
+from ticks import select_ticks
+from collections import namedtuple, deque
+from concurrent.futures import ThreadPoolExecutor
 from queue import Queue
+from threading import Thread, Lock, Event as ThreadEvent
 
 
 Event = namedtuple('Event', 'name, json')
@@ -11,6 +18,173 @@ Command = ts.EditSimulationRequest.Command
 RpcError = grpc.RpcError
 StatusCode = grpc.StatusCode
 TimelineDetails = namedtuple('TimelineDetails', 'parent_id, head_tick, last_commit_timestamp, tags')
+TimelineNodeDetails = namedtuple('TimelineNodeDetails', 'timeline_id, parent_id, head_tick, tags, tick_count, '
+                                                        'last_commit_timestamp, simulation_running')
+ChangeType = ts.ProjectChange.Type
+ProjectChange = namedtuple('ProjectChange', 'sequence, type, timeline_id, node, tick, deleted_timeline_ids')
+StartedSimulation = namedtuple('StartedSimulation', 'timeline_id, address, token, error')
+CacheStats = namedtuple('CacheStats', 'hits, misses, evictions, invalidations, entry_count, stored_bytes, max_bytes')
+MetricSample = namedtuple('MetricSample', 'name, labels, value')
+TimelineFetch = namedtuple('TimelineFetch', 'timeline_id, points, error')
+
+
+def get_retry_after(error: grpc.RpcError):
+    """
+    :return: The seconds the server suggested waiting before retrying a call it refused because it was busy,
+    or None if it did not suggest a delay.
+    """
+    if error.code() != grpc.StatusCode.RESOURCE_EXHAUSTED:
+        return None
+    for key, value in error.trailing_metadata() or ():
+        if key == 'grpc-retry-pushback-ms':
+            return int(value) / 1000
+    return None
+
+
+def _make_node_details(node):
+    return TimelineNodeDetails(timeline_id=node.timeline_id,
+                               parent_id=node.parent_id,
+                               head_tick=node.head_tick,
+                               tags=tuple(node.tags),
+                               tick_count=node.tick_count,
+                               last_commit_timestamp=node.last_commit_timestamp,
+                               simulation_running=node.simulation_running)
+
+
+def _read_timeline_tree(stub, batch_size=None):
+    request = ts.GetTimelineTreeRequest(batch_size=batch_size or 0)
+
+    nodes = []
+    for response in stub.GetTimelineTree(request):
+        nodes.extend(_make_node_details(node) for node in response.nodes)
+    return nodes
+
+
+def _compression_metadata(compression):
+    if compression is None:
+        return ()
+    return (('x-response-compression', compression),)
+
+
+def _timelines_request(parent_id, head_tick, tags, exclude_tags):
+    if parent_id is None:
+        parent_id = -1
+
+    if tags is None:
+        tags = ()
+
+    if head_tick is None:
+        head_tick = -1
+
+    if exclude_tags is None:
+        exclude_tags = ()
+
+    request = ts.TimelinesRequest()
+    request.tags[:] = tags
+    request.parent_id = parent_id
+    request.head_tick = head_tick
+    request.exclude_tags[:] = exclude_tags
+    return request
+
+
+def _timeline_data_request(timeline_id, ticks, start_tick, end_tick, stride, max_count):
+    if ticks is not None:
+        tick_list = ts.TickList(ticks=ticks)
+        return ts.TimelineDataRequest(timeline_id=timeline_id, tick_list=tick_list)
+    elif start_tick is not None:
+        if end_tick is None:
+            end_tick = -1
+        tick_range = ts.TickRange(start_tick=start_tick, end_tick=end_tick)
+        return ts.TimelineDataRequest(timeline_id=timeline_id, tick_range=tick_range,
+                                      stride=stride or 0, max_count=max_count or 0)
+    else:
+        raise ValueError("Parameters incorrect.")
+
+
+def _timeline_json_request(timeline_id, ticks, start_tick, end_tick, compressed_json):
+    if ticks is not None:
+        tick_list = ts.TickList(ticks=ticks)
+        request = ts.TimelineJsonRequest(timeline_id=timeline_id, tick_list=tick_list)
+    elif start_tick is not None:
+        if end_tick is None:
+            end_tick = -1
+        tick_range = ts.TickRange(start_tick=start_tick, end_tick=end_tick)
+        request = ts.TimelineJsonRequest(timeline_id=timeline_id, tick_range=tick_range)
+    else:
+        raise ValueError("Parameters incorrect.")
+    request.compressed_json = compressed_json
+    return request
+
+
+def _for_timeline(request, timeline_id):
+    """
+    :return: A copy of a timeline request, for the given timeline.
+    """
+    timeline_request = type(request)()
+    timeline_request.CopyFrom(request)
+    timeline_request.timeline_id = timeline_id
+    return timeline_request
+
+
+def _point_json(response):
+    """
+    :return: The (tick, json) of a TimelineJsonResponse.
+    """
+    if response.json_zlib:
+        return response.tick, zlib.decompress(response.json_zlib).decode('utf-8')
+    else:
+        return response.tick, response.json
+
+
+def _timeline_events_request(timeline_id, start_tick, end_tick, filters):
+    tick_range = ts.TickRange(start_tick=start_tick, end_tick=end_tick)
+    request = ts.TimelineEventsRequest(timeline_id=timeline_id, tick_range=tick_range)
+    if filters is not None:
+        request.filters[:] = filters
+    return request
+
+
+def _tick_events(response):
+    """
+    :return: The (tick, events) of a TimelineEventsResponse.
+    """
+    events = []
+    for e in response.events:
+        events.append(Event(e.name, e.json))
+
+    return response.tick, events
+
+
+def _create_timeline_request(source_timeline_id, source_tick):
+    if source_timeline_id is not None and source_tick is None:
+        raise ValueError("source_tick must be provided if source_timeline_id is provided.")
+
+    if source_timeline_id is None:
+        source_timeline_id = 0
+        source_tick = -1
+
+    return ts.CreateTimelineRequest(source_timeline_id=source_timeline_id, source_tick=source_tick)
+
+
+def _make_timeline_details(response):
+    return TimelineDetails(parent_id=response.parent_id,
+                           head_tick=response.head_tick,
+                           last_commit_timestamp=response.last_commit_timestamp,
+                           tags=tuple(response.tags))
+
+
+def _make_cache_stats(response):
+    return CacheStats(hits=response.hits,
+                      misses=response.misses,
+                      evictions=response.evictions,
+                      invalidations=response.invalidations,
+                      entry_count=response.entry_count,
+                      stored_bytes=response.stored_bytes,
+                      max_bytes=response.max_bytes)
+
+
+def _make_metric_samples(response):
+    return [MetricSample(sample.name, dict(sample.labels), sample.value) for sample in response.samples]
 
 
 class EditorContext:
@@ -67,13 +241,242 @@ class EditorContext:
         return response.success, response.result
 
 
+class ProjectReplica:
+    """
+    A local copy of the timeline metadata of a project, kept up to date on a background thread from the
+    server's WatchProject stream. The stream is resumed after the last change seen when it is interrupted,
+    and the whole project is loaded again with GetTimelineTree when it cannot be resumed.
+    """
+    def __init__(self, channel, on_change=None, retry_interval=1.0):
+        """
+        :param on_change: Called on the replica's thread with each ProjectChange once it is applied,
+        or with None once the whole project has been loaded.
+        :param retry_interval: Seconds to wait before watching again after the server could not be reached.
+        """
+        self._stub = ts_grpc.TimelineServiceStub(channel)
+        self._on_change = on_change
+        self._retry_interval = retry_interval
+
+        self._lock = Lock()
+        self._nodes = {}
+        self._log_id = ''
+        self._sequence = 0
+        self._responses = None
+
+        self._closed = ThreadEvent()
+        self._synced = ThreadEvent()
+        self._thread = Thread(target=self._run, name='project-replica', daemon=True)
+        self._thread.start()
+
+    def get_nodes(self):
+        """
+        :return: A dict of timeline id to TimelineNodeDetails for every timeline in the project.
+        """
+        with self._lock:
+            return dict(self._nodes)
+
+    def get_node(self, timeline_id):
+        """
+        :return: The TimelineNodeDetails of the timeline, or None if it is not in the project.
+        """
+        with self._lock:
+            return self._nodes.get(timeline_id)
+
+    def wait_synced(self, timeout=None):
+        """
+        Waits until the project has been loaded.
+        :return: True if the project has been loaded, False if the timeout passed first.
+        """
+        return self._synced.wait(timeout)
+
+    def close(self):
+        self._closed.set()
+        with self._lock:
+            responses = self._responses
+        if responses is not None:
+            responses.cancel()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _run(self):
+        while not self._closed.is_set():
+            try:
+                self._watch()
+            except grpc.RpcError as e:
+                if self._closed.is_set():
+                    return
+                if e.code() == grpc.StatusCode.OUT_OF_RANGE:
+                    # the changes since the last one seen are gone, so start over
+                    self._log_id = ''
+                    continue
+            except Exception:
+                if self._closed.is_set():
+                    return
+                # a change could not be applied, so the copy may be missing it; load the whole project again
+                print("LOG: Project replica failed to apply changes, reloading the project.")
+                traceback.print_exc()
+                self._log_id = ''
+            self._closed.wait(self._retry_interval)
+
+    def _notify(self, change):
+        try:
+            self._on_change(change)
+        except Exception:
+            print("LOG: Project replica change callback failed.")
+            traceback.print_exc()
+
+    def _watch(self):
+        request = ts.WatchProjectRequest(log_id=self._log_id, after_sequence=self._sequence)
+        responses = self._stub.WatchProject(request)
+        with self._lock:
+            self._responses = responses
+        if self._closed.is_set():
+            responses.cancel()
+
+        first_response = next(responses, None)
+        if first_response is None:
+            return
+
+        if first_response.log_id != self._log_id:
+            # a new watch; changes from here on are applied over a fresh copy of the project
+            nodes = {node.timeline_id: node for node in _read_timeline_tree(self._stub)}
+            with self._lock:
+                self._nodes = nodes
+            self._log_id = first_response.log_id
+            self._sequence = first_response.last_sequence
+            if self._on_change is not None:
+                self._notify(None)
+        self._synced.set()
+
+        for response in responses:
+            changes = [ProjectChange(sequence=change.sequence,
+                                     type=change.type,
+                                     timeline_id=change.timeline_id,
+                                     node=_make_node_details(change.node) if change.HasField('node') else None,
+                                     tick=change.tick,
+                                     deleted_timeline_ids=tuple(change.deleted_timeline_ids))
+                       for change in response.changes]
+
+            with self._lock:
+                for change in changes:
+                    if change.type == ChangeType.TIMELINE_DELETED:
+                        for timeline_id in change.deleted_timeline_ids:
+                            self._nodes.pop(timeline_id, None)
+                    else:
+                        self._nodes[change.timeline_id] = change.node
+            self._sequence = response.last_sequence
+
+            if self._on_change is not None:
+                for change in changes:
+                    self._notify(change)
+
+
+class PointPrefetcher:
+    """
+    Iterates over points of a timeline in order, while the points after them are fetched, and optionally parsed,
+    in the background. Up to `ahead` requests of `chunk_size` ticks are in flight at once, and a chunk is only
+    requested once the consumer has taken one, so at most ahead * chunk_size points are buffered.
+    Close the prefetcher, or use it as a context manager, to stop fetching if not iterating to the end.
+    """
+    def __init__(self, fetch_chunk, ticks, ahead=4, chunk_size=4, parse=None, parse_executor=None):
+        """
+        :param fetch_chunk: Called on a background thread with a list of ticks, returns their (tick, point) pairs.
+        :param parse: If given, called with each point, and its result is yielded in place of the point.
+        :param parse_executor: An executor to parse the points in, such as a ProcessPoolExecutor for parsing
+        that holds the GIL. If None, points are parsed on the thread that fetched them. Not shut down here.
+        """
+        if ahead < 1 or chunk_size < 1:
+            raise ValueError("ahead and chunk_size must be at least 1.")
+        self._fetch_chunk = fetch_chunk
+        self._parse = parse
+        self._parse_executor = parse_executor
+        self._chunks = iter([ticks[i:i + chunk_size] for i in range(0, len(ticks), chunk_size)])
+        self._executor = ThreadPoolExecutor(max_workers=ahead, thread_name_prefix='ts-prefetch')
+        self._pending = deque()
+        self._current = iter(())
+
+        for _ in range(ahead):
+            self._request_next_chunk()
+
+    def _request_next_chunk(self):
+        chunk = next(self._chunks, None)
+        if chunk is not None:
+            self._pending.append(self._executor.submit(self._fetch, chunk))
+
+    def _fetch(self, chunk):
+        points = self._fetch_chunk(chunk)
+        if self._parse is None:
+            return list(points)
+        if self._parse_executor is None:
+            return [(tick, self._parse(point)) for tick, point in points]
+        return [(tick, self._parse_executor.submit(self._parse, point)) for tick, point in points]
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while True:
+            item = next(self._current, None)
+            if item is not None:
+                tick, point = item
+                if self._parse_executor is not None:
+                    point = self._result(point)
+                return tick, point
+
+            if not self._pending:
+                self.close()
+                raise StopIteration
+            self._current = iter(self._result(self._pending.popleft()))
+            self._request_next_chunk()
+
+    def _result(self, future):
+        try:
+            return future.result()
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        for chunk in self._pending:
+            chunk.cancel()
+        self._pending.clear()
+        self._chunks = iter(())
+        self._current = iter(())
+        self._executor.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
 class Client:
-    def __init__(self, address):
+    def __init__(self, address, compression=None, cache=None):
+        """
+        :param address: The address of the timeline service.
+        :param compression: The compression the server uses for the responses of the bulk data calls,
+        one of 'gzip', 'deflate' or 'none'. Can be overridden per call. Uses the server default if None.
+        :param cache: A point_cache.ClientPointCache that get_timeline_data and get_timeline_json read points from,
+        and store the points they fetch in. Each call checks the timeline's last commit with GetTimelineDetails,
+        so cached points of a timeline whose head was committed again are not used.
+        """
         self._address = address
         self._channel = None
+        self._compression = compression
+        self._cache = cache
+
+    def _compression_metadata(self, compression):
+        return _compression_metadata(compression if compression is not None else self._compression)
 
     def open(self):
-        self._channel = grpc.insecure_channel(self._address)
+        # a connection of its own, so the server's admission queues tell this client apart from others in the process
+        self._channel = grpc.insecure_channel(self._address, options=[('grpc.use_local_subchannel_pool', 1)])
         grpc.channel_ready_future(self._channel).result()
 
     def close(self):
@@ -89,25 +492,7 @@ class Client:
 
     def get_timelines(self, *, parent_id=None, head_tick=None, tags=None, exclude_tags=None):
         stub = ts_grpc.TimelineServiceStub(self._channel)
-
-        if parent_id is None:
-            parent_id = -1
-
-        if tags is None:
-            tags = ()
-
-        if head_tick is None:
-            head_tick = -1
-
-        if exclude_tags is None:
-            exclude_tags = ()
-
-        request = ts.TimelinesRequest()
-        request.tags[:] = tags
-        request.parent_id = parent_id
-        request.head_tick = head_tick
-        request.exclude_tags[:] = exclude_tags
-
+        request = _timelines_request(parent_id, head_tick, tags, exclude_tags)
         response = stub.GetTimelines(request)
         return list(response.timeline_ids)
 
@@ -116,50 +501,135 @@ class Client:
         response = stub.GetTimelineTicks(ts.TimelineTicksRequest(timeline_id=timeline_id))
         return list(response.tick_list.ticks)
 
-    def get_timeline_data(self, timeline_id, *, ticks=None, start_tick=None, end_tick=None):
+    def get_timeline_data(self, timeline_id, *, ticks=None, start_tick=None, end_tick=None, stride=None,
+                          max_count=None, compression=None):
+        """
+        Streams the point data of a timeline, either for the given ticks or for the ticks in a range.
+        :param stride: With a range, only every stride-th tick of the range is sent.
+        :param max_count: With a range, at most this many evenly spaced ticks of the range are sent.
+        :param compression: Overrides the client's response compression for this call.
+        :return: A generator of (tick, data) pairs.
+        """
         stub = ts_grpc.TimelineServiceStub(self._channel)
-        request = None
-        if ticks is not None:
-            tick_list = ts.TickList(ticks=ticks)
-            request = ts.TimelineDataRequest(timeline_id=timeline_id, tick_list=tick_list)
-        elif start_tick is not None:
-            tick_range = ts.TickRange(start_tick=start_tick, end_tick=end_tick)
-            request = ts.TimelineDataRequest(timeline_id=timeline_id, tick_range=tick_range)
-        responses = stub.GetTimelineData(request)
+        request = _timeline_data_request(timeline_id, ticks, start_tick, end_tick, stride, max_count)
+        metadata = self._compression_metadata(compression)
+
+        if self._cache is not None:
+            def fetch(missing_ticks):
+                missing_request = _timeline_data_request(timeline_id, missing_ticks, None, None, None, None)
+                for response in stub.GetTimelineData(missing_request, metadata=metadata):
+                    yield response.tick, response.data
+
+            ticks = self._resolve_ticks(timeline_id, ticks, start_tick, end_tick, stride, max_count)
+            yield from self._cached_points(timeline_id, ticks, 'data', fetch, bytes, bytes)
+            return
+
+        responses = stub.GetTimelineData(request, metadata=metadata)
         for response in responses:
             yield response.tick, response.data
 
-    def get_timeline_json(self, timeline_id, *, ticks=None, start_tick=None, end_tick=None):
+    def get_timeline_json(self, timeline_id, *, ticks=None, start_tick=None, end_tick=None, compressed_json=False,
+                          compression=None):
+        """
+        Streams the JSON of a timeline's points, either for the given ticks or for the ticks in a range.
+        :param compressed_json: If true, the server sends the JSON zlib compressed as stored in its cache,
+        and it is decompressed here. Usually better than response compression, which compresses it again.
+        :param compression: Overrides the client's response compression for this call.
+        :return: A generator of (tick, json) pairs.
+        """
         stub = ts_grpc.TimelineServiceStub(self._channel)
+        request = _timeline_json_request(timeline_id, ticks, start_tick, end_tick, compressed_json)
+        metadata = self._compression_metadata(compression)
+
+        if self._cache is not None:
+            def fetch(missing_ticks):
+                missing_request = _timeline_json_request(timeline_id, missing_ticks, None, None, compressed_json)
+                for response in stub.GetTimelineJson(missing_request, metadata=metadata):
+                    yield _point_json(response)
+
+            ticks = self._resolve_ticks(timeline_id, ticks, start_tick, end_tick, None, None)
+            yield from self._cached_points(timeline_id, ticks, 'json', fetch,
+                                           lambda json: json.encode('utf-8'), lambda data: data.decode('utf-8'))
+            return
+
+        responses = stub.GetTimelineJson(request, metadata=metadata)
+        for response in responses:
+            yield _point_json(response)
+
+    def prefetch_timeline_data(self, timeline_id, *, ticks=None, start_tick=None, end_tick=None, stride=None,
+                               max_count=None, ahead=4, chunk_size=4, parse=None, parse_executor=None,
+                               compression=None):
+        """
+        As get_timeline_data, but the points are fetched ahead of the consumer by a PointPrefetcher.
+        :param ahead: The most requests in flight at once.
+        :param chunk_size: The ticks fetched by each request.
+        :param parse: If given, called with each point's data, and its result is yielded in place of the data.
+        :param parse_executor: As PointPrefetcher.
+        :return: A PointPrefetcher of (tick, data) pairs, or (tick, parse(data)) pairs.
+        """
+        ticks = self._resolve_ticks(timeline_id, ticks, start_tick, end_tick, stride, max_count)
+        return PointPrefetcher(lambda chunk: self.get_timeline_data(timeline_id, ticks=chunk, compression=compression),
+                               ticks, ahead, chunk_size, parse, parse_executor)
+
+    def prefetch_timeline_json(self, timeline_id, *, ticks=None, start_tick=None, end_tick=None, ahead=4,
+                               chunk_size=4, parse=None, parse_executor=None, compressed_json=False, compression=None):
+        """
+        As get_timeline_json, but the points are fetched ahead of the consumer by a PointPrefetcher.
+        :param parse: If given, called with each point's JSON, such as json.loads, and its result is yielded in
+        place of the JSON.
+        :return: A PointPrefetcher of (tick, json) pairs, or (tick, parse(json)) pairs.
+        """
+        ticks = self._resolve_ticks(timeline_id, ticks, start_tick, end_tick, None, None)
+        return PointPrefetcher(lambda chunk: self.get_timeline_json(timeline_id, ticks=chunk,
+                                                                    compressed_json=compressed_json,
+                                                                    compression=compression),
+                               ticks, ahead, chunk_size, parse, parse_executor)
+
+    def _resolve_ticks(self, timeline_id, ticks, start_tick, end_tick, stride, max_count):
+        """
+        :return: The ticks a call for either the given ticks or a range of ticks is for.
+        """
         if ticks is not None:
-            tick_list = ts.TickList(ticks=ticks)
-            request = ts.TimelineJsonRequest(timeline_id=timeline_id, tick_list=tick_list)
-        elif start_tick is not None:
-            if end_tick is None:
-                end_tick = -1
-            tick_range = ts.TickRange(start_tick=start_tick, end_tick=end_tick)
-            request = ts.TimelineJsonRequest(timeline_id=timeline_id, tick_range=tick_range)
-        else:
+            return list(ticks)
+        if start_tick is None:
             raise ValueError("Parameters incorrect.")
-        responses = stub.GetTimelineJson(request)
-        for response in responses:
-            yield response.tick, response.json
-
-    def get_timeline_events(self, timeline_id, *, start_tick=0, end_tick=-1, filters=None):
+        if end_tick is None:
+            end_tick = -1
+        return select_ticks(self.get_timeline_ticks(timeline_id), start_tick, end_tick, stride or 0, max_count or 0)
+
+    def _cached_points(self, timeline_id, ticks, format, fetch, encode, decode):
+        """
+        Gets the points of a timeline from the cache, fetching only the ones it does not have.
+        :param fetch: Called with the missing ticks, returns a generator of their (tick, point) pairs in order.
+        :param encode: Converts a point to the bytes stored in the cache, decode converts them back.
+        :return: A generator of (tick, point) pairs for the given ticks, in order.
+        """
+        commit_timestamp = self.get_timeline_details(timeline_id).last_commit_timestamp
+        cached = self._cache.get_many(self._address, timeline_id, commit_timestamp, format, ticks)
+        missing_ticks = [tick for tick in ticks if tick not in cached]
+        fetched = fetch(missing_ticks) if missing_ticks else iter(())
+
+        for tick in ticks:
+            data = cached.get(tick)
+            if data is not None:
+                yield tick, decode(data)
+            else:
+                fetched_tick, point = next(fetched, (None, None))
+                if fetched_tick != tick:
+                    raise RuntimeError(f"The server did not return the point at tick {tick} of timeline {timeline_id}.")
+                self._cache.put(self._address, timeline_id, commit_timestamp, format, tick, encode(point))
+                yield tick, point
+
+        if missing_ticks and self.get_timeline_details(timeline_id).last_commit_timestamp != commit_timestamp:
+            # the head was committed again while fetching, so the stored points may be from either commit
+            self._cache.invalidate_timeline(self._address, timeline_id, commit_timestamp)
+
+    def get_timeline_events(self, timeline_id, *, start_tick=0, end_tick=-1, filters=None, compression=None):
         stub = ts_grpc.TimelineServiceStub(self._channel)
-        tick_range = ts.TickRange(start_tick=start_tick, end_tick=end_tick)
-        request = ts.TimelineEventsRequest(timeline_id=timeline_id, tick_range=tick_range)
-        if filters is not None:
-            request.filters[:] = filters
-
-        responses = stub.GetTimelineEvents(request)
+        request = _timeline_events_request(timeline_id, start_tick, end_tick, filters)
+        responses = stub.GetTimelineEvents(request, metadata=self._compression_metadata(compression))
         for response in responses:
-            tick = response.tick
-            events = []
-            for e in response.events:
-                events.append(Event(e.name, e.json))
-
-            yield tick, events
+            yield _tick_events(response)
 
     def get_or_start_simulation(self, timeline_id, tick=None):
         stub = ts_grpc.TimelineServiceStub(self._channel)
@@ -172,6 +642,20 @@ class Client:
         response = stub.GetOrStartSimulation(request)
         return response.address, response.token
 
+    def get_or_start_simulations(self, timeline_ids, max_concurrent=None):
+        """
+        Gets or starts the simulations of many timelines at once.
+        :param max_concurrent: The most simulations the server starts at once. Uses the server default if None.
+        :return: A generator of StartedSimulation(timeline_id, address, token, error), in the order the
+        simulations become ready. error is None unless the simulation could not be started.
+        """
+        stub = ts_grpc.TimelineServiceStub(self._channel)
+
+        request = ts.GetOrStartSimulationsRequest(timeline_ids=timeline_ids, max_concurrent=max_concurrent or 0)
+
+        for response in stub.GetOrStartSimulations(request):
+            yield StartedSimulation(response.timeline_id, response.address, response.token, response.error or None)
+
     def stop_simulation(self, timeline_id):
         stub = ts_grpc.TimelineServiceStub(self._channel)
         request = ts.StopSimulationRequest(timeline_id=timeline_id)
@@ -194,15 +678,7 @@ class Client:
 
     def create_timeline(self, source_timeline_id=None, source_tick=None):
         stub = ts_grpc.TimelineServiceStub(self._channel)
-
-        if source_timeline_id is not None and source_tick is None:
-            raise ValueError("source_tick must be provided if source_timeline_id is provided.")
-
-        if source_timeline_id is None:
-            source_timeline_id = 0
-            source_tick = -1
-
-        request = ts.CreateTimelineRequest(source_timeline_id=source_timeline_id, source_tick=source_tick)
+        request = _create_timeline_request(source_timeline_id, source_tick)
         response = stub.CreateTimeline(request)
         return response.created_timeline_id
 
@@ -227,9 +703,309 @@ class Client:
         stub = ts_grpc.TimelineServiceStub(self._channel)
         request = ts.GetTimelineDetailsRequest(timeline_id=timeline_id)
         response = stub.GetTimelineDetails(request)
+        return _make_timeline_details(response)
+
+    def get_timeline_details_batch(self, timeline_ids):
+        """
+        :return: A list of TimelineNodeDetails for the given timelines, in the same order.
+        """
+        stub = ts_grpc.TimelineServiceStub(self._channel)
+        request = ts.GetTimelineDetailsBatchRequest(timeline_ids=timeline_ids)
+        response = stub.GetTimelineDetailsBatch(request)
+
+        return [_make_node_details(node) for node in response.nodes]
+
+    def get_timeline_tree(self, batch_size=None):
+        """
+        :return: A list of TimelineNodeDetails for every timeline in the project. Every node comes after its parent.
+        """
+        stub = ts_grpc.TimelineServiceStub(self._channel)
+        return _read_timeline_tree(stub, batch_size)
+
+    def watch_project(self, on_change=None):
+        """
+        :return: A ProjectReplica of the project's timeline metadata, kept up to date in the background.
+        """
+        return ProjectReplica(self._channel, on_change)
+
+    def get_cache_stats(self):
+        stub = ts_grpc.TimelineServiceStub(self._channel)
+        response = stub.GetCacheStats(ts.GetCacheStatsRequest())
+        return _make_cache_stats(response)
+
+    def get_metrics(self):
+        """
+        :return: A list of MetricSample for the server's metrics.
+        """
+        stub = ts_grpc.TimelineServiceStub(self._channel)
+        response = stub.GetMetrics(ts.GetMetricsRequest())
+        return _make_metric_samples(response)
+
+    def get_metrics_text(self):
+        """
+        :return: The server's metrics in the Prometheus text format.
+        """
+        stub = ts_grpc.TimelineServiceStub(self._channel)
+        return stub.GetMetrics(ts.GetMetricsRequest(prometheus_text=True)).prometheus_text
+
+
+class AsyncClient:
+    """
+    The timeline service client on grpc.aio, with the same calls as Client as coroutines and async generators.
+    Editing and watching the project are only available on Client.
+
+    The get_many_* calls fetch from many timelines at once, so a sweep is not fetched one round trip at a time.
+    """
+    def __init__(self, address, compression=None, busy_retries=5):
+        """
+        :param compression: As Client.
+        :param busy_retries: How many times the get_many_* calls retry a timeline the server refused because it
+        was busy, after the delay the server suggested.
+        """
+        self._address = address
+        self._channel = None
+        self._stub = None
+        self._compression = compression
+        self._busy_retries = busy_retries
+
+    def _compression_metadata(self, compression):
+        return _compression_metadata(compression if compression is not None else self._compression)
 
-        return TimelineDetails(parent_id=response.parent_id,
-                               head_tick=response.head_tick,
-                               last_commit_timestamp=response.last_commit_timestamp,
-                               tags=tuple(response.tags))
+    async def open(self):
+        # a connection of its own, as in Client.open
+        self._channel = grpc.aio.insecure_channel(self._address, options=[('grpc.use_local_subchannel_pool', 1)])
+        self._stub = ts_grpc.TimelineServiceStub(self._channel)
+        await self._channel.channel_ready()
+
+    async def close(self):
+        await self._channel.close()
+        self._channel = None
+        self._stub = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def get_timelines(self, *, parent_id=None, head_tick=None, tags=None, exclude_tags=None):
+        request = _timelines_request(parent_id, head_tick, tags, exclude_tags)
+        response = await self._stub.GetTimelines(request)
+        return list(response.timeline_ids)
+
+    async def get_timeline_ticks(self, timeline_id):
+        response = await self._stub.GetTimelineTicks(ts.TimelineTicksRequest(timeline_id=timeline_id))
+        return list(response.tick_list.ticks)
+
+    async def get_timeline_data(self, timeline_id, *, ticks=None, start_tick=None, end_tick=None, stride=None,
+                                max_count=None, compression=None):
+        """
+        As Client.get_timeline_data.
+        :return: An async generator of (tick, data) pairs.
+        """
+        request = _timeline_data_request(timeline_id, ticks, start_tick, end_tick, stride, max_count)
+        async for point in self._timeline_data(request, compression):
+            yield point
+
+    async def _timeline_data(self, request, compression):
+        async for response in self._stub.GetTimelineData(request, metadata=self._compression_metadata(compression)):
+            yield response.tick, response.data
+
+    async def get_timeline_json(self, timeline_id, *, ticks=None, start_tick=None, end_tick=None,
+                                compressed_json=False, compression=None):
+        """
+        As Client.get_timeline_json.
+        :return: An async generator of (tick, json) pairs.
+        """
+        request = _timeline_json_request(timeline_id, ticks, start_tick, end_tick, compressed_json)
+        async for point in self._timeline_json(request, compression):
+            yield point
+
+    async def _timeline_json(self, request, compression):
+        async for response in self._stub.GetTimelineJson(request, metadata=self._compression_metadata(compression)):
+            yield _point_json(response)
+
+    async def get_timeline_events(self, timeline_id, *, start_tick=0, end_tick=-1, filters=None, compression=None):
+        request = _timeline_events_request(timeline_id, start_tick, end_tick, filters)
+        async for tick_events in self._timeline_events(request, compression):
+            yield tick_events
+
+    async def _timeline_events(self, request, compression):
+        async for response in self._stub.GetTimelineEvents(request,
+                                                           metadata=self._compression_metadata(compression)):
+            yield _tick_events(response)
+
+    async def get_many_timeline_data(self, timeline_ids, *, max_concurrent=8, ticks=None, start_tick=None,
+                                     end_tick=None, stride=None, max_count=None, compression=None):
+        """
+        Fetches the point data of many timelines at once.
+        The ticks or range to fetch from every timeline are given as for get_timeline_data. They are checked once,
+        before anything is fetched, so incorrect ones raise a ValueError instead of failing every timeline.
+        :param max_concurrent: The most timelines fetched at once.
+        :return: An async generator of TimelineFetch(timeline_id, points, error) in the order the timelines finish,
+        where points is a list of (tick, data) pairs. error is the grpc.RpcError if the timeline could not be
+        fetched, or None.
+        """
+        request = _timeline_data_request(0, ticks, start_tick, end_tick, stride, max_count)
+
+        def fetch(timeline_id):
+            return self._timeline_data(_for_timeline(request, timeline_id), compression)
+
+        async for result in self._fetch_many(timeline_ids, max_concurrent, fetch):
+            yield result
+
+    async def get_many_timeline_json(self, timeline_ids, *, max_concurrent=8, ticks=None, start_tick=None,
+                                     end_tick=None, compressed_json=False, compression=None):
+        """
+        As get_many_timeline_data, for the JSON of the points as get_timeline_json.
+        """
+        request = _timeline_json_request(0, ticks, start_tick, end_tick, compressed_json)
+
+        def fetch(timeline_id):
+            return self._timeline_json(_for_timeline(request, timeline_id), compression)
+
+        async for result in self._fetch_many(timeline_ids, max_concurrent, fetch):
+            yield result
+
+    async def get_many_timeline_events(self, timeline_ids, *, max_concurrent=8, start_tick=0, end_tick=-1,
+                                       filters=None, compression=None):
+        """
+        As get_many_timeline_data, for the events of the timelines as get_timeline_events.
+        """
+        request = _timeline_events_request(0, start_tick, end_tick, filters)
+
+        def fetch(timeline_id):
+            return self._timeline_events(_for_timeline(request, timeline_id), compression)
+
+        async for result in self._fetch_many(timeline_ids, max_concurrent, fetch):
+            yield result
+
+    async def _fetch_many(self, timeline_ids, max_concurrent, fetch):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1.")
+        timeline_ids = list(timeline_ids)
+        pending_ids = iter(timeline_ids)
+        results = asyncio.Queue()
+
+        async def fetch_pending():
+            for timeline_id in pending_ids:
+                await results.put(await self._fetch_one(timeline_id, fetch))
+
+        tasks = [asyncio.create_task(fetch_pending()) for _ in range(min(max_concurrent, len(timeline_ids)))]
+        running = list(tasks)
+        try:
+            for _ in timeline_ids:
+                result = asyncio.ensure_future(results.get())
+                while not result.done():
+                    # a fetcher that failed will not put its results, so waiting on the queue alone could hang
+                    await asyncio.wait([result, *running], return_when=asyncio.FIRST_COMPLETED)
+                    for task in running:
+                        if task.done() and task.exception() is not None:
+                            result.cancel()
+                            raise task.exception()
+                    running = [task for task in running if not task.done()]
+                yield result.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch_one(self, timeline_id, fetch):
+        retries = self._busy_retries
+        while True:
+            try:
+                return TimelineFetch(timeline_id, [item async for item in fetch(timeline_id)], None)
+            except grpc.aio.AioRpcError as e:
+                retry_after = get_retry_after(e)
+                if retry_after is None or retries <= 0:
+                    return TimelineFetch(timeline_id, None, e)
+                retries -= 1
+                await asyncio.sleep(retry_after)
+
+    async def get_or_start_simulation(self, timeline_id, tick=None):
+        if tick is None:
+            tick = -1
+
+        request = ts.GetOrStartSimulationRequest(timeline_id=timeline_id, tick=tick)
+        response = await self._stub.GetOrStartSimulation(request)
+        return response.address, response.token
+
+    async def get_or_start_simulations(self, timeline_ids, max_concurrent=None):
+        """
+        As Client.get_or_start_simulations.
+        :return: An async generator of StartedSimulation.
+        """
+        request = ts.GetOrStartSimulationsRequest(timeline_ids=timeline_ids, max_concurrent=max_concurrent or 0)
+        async for response in self._stub.GetOrStartSimulations(request):
+            yield StartedSimulation(response.timeline_id, response.address, response.token, response.error or None)
+
+    async def stop_simulation(self, timeline_id):
+        await self._stub.StopSimulation(ts.StopSimulationRequest(timeline_id=timeline_id))
+
+    async def move_to_tick(self, timeline_id, tick):
+        await self._stub.MoveSimToTick(ts.MoveSimToTickRequest(timeline_id=timeline_id, tick=tick))
+
+    async def modify_timeline_tags(self, timeline_id, *, tags_to_add=(), tags_to_remove=()):
+        request = ts.ModifyTimelineTagsRequest(timeline_id=timeline_id)
+        request.tags_to_add[:] = tags_to_add
+        request.tags_to_remove[:] = tags_to_remove
+        await self._stub.ModifyTimelineTags(request)
+
+    async def create_timeline(self, source_timeline_id=None, source_tick=None):
+        request = _create_timeline_request(source_timeline_id, source_tick)
+        response = await self._stub.CreateTimeline(request)
+        return response.created_timeline_id
+
+    async def clone_timeline(self, source_timeline_id):
+        request = ts.CreateTimelineRequest(source_timeline_id=source_timeline_id)
+        response = await self._stub.CloneTimeline(request)
+        return response.created_timeline_id
+
+    async def create_timeline_from_simulation(self, source_timeline_id, as_sibling=False):
+        request = ts.CreateTimelineFromSimulationRequest(source_timeline_id=source_timeline_id, as_sibling=as_sibling)
+        response = await self._stub.CreateTimelineFromSimulation(request)
+        return response.created_timeline_id
 
+    async def delete_timeline(self, timeline_id):
+        await self._stub.DeleteTimeline(ts.DeleteTimelineRequest(timeline_id=timeline_id))
+
+    async def get_timeline_details(self, timeline_id):
+        response = await self._stub.GetTimelineDetails(ts.GetTimelineDetailsRequest(timeline_id=timeline_id))
+        return _make_timeline_details(response)
+
+    async def get_timeline_details_batch(self, timeline_ids):
+        """
+        :return: A list of TimelineNodeDetails for the given timelines, in the same order.
+        """
+        request = ts.GetTimelineDetailsBatchRequest(timeline_ids=timeline_ids)
+        response = await self._stub.GetTimelineDetailsBatch(request)
+        return [_make_node_details(node) for node in response.nodes]
+
+    async def get_timeline_tree(self, batch_size=None):
+        """
+        :return: A list of TimelineNodeDetails for every timeline in the project. Every node comes after its parent.
+        """
+        request = ts.GetTimelineTreeRequest(batch_size=batch_size or 0)
+        nodes = []
+        async for response in self._stub.GetTimelineTree(request):
+            nodes.extend(_make_node_details(node) for node in response.nodes)
+        return nodes
+
+    async def get_cache_stats(self):
+        response = await self._stub.GetCacheStats(ts.GetCacheStatsRequest())
+        return _make_cache_stats(response)
+
+    async def get_metrics(self):
+        """
+        :return: A list of MetricSample for the server's metrics.
+        """
+        response = await self._stub.GetMetrics(ts.GetMetricsRequest())
+        return _make_metric_samples(response)
+
+    async def get_metrics_text(self):
+        """
+        :return: The server's metrics in the Prometheus text format.
+        """
+        response = await self._stub.GetMetrics(ts.GetMetricsRequest(prometheus_text=True))
+        return response.prometheus_text
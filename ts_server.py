@@ -1,19 +1,629 @@
+import asyncio
 import grpc
+from collections import deque
 from concurrent import futures
-
+from dataclasses import dataclass, field
+from queue import Queue, Empty, Full
+from secrets import token_hex
+from threading import Thread, Event, Condition, RLock
+from time import perf_counter
+from typing import Mapping, Optional
+
+import metrics
 import SimulationManager as sm
-import simrunner as sr
 import TimelinesService_pb2 as ts
 import TimelinesService_pb2_grpc as ts_grpc
+from ticks import select_ticks
 
 import traceback
 
 Command = ts.EditSimulationRequest.Command
+ChangeType = ts.ProjectChange.Type
+
+POINT_READ_AHEAD = 4
+# how often a point reader blocked on a full queue checks whether its consumer stopped, in seconds
+POINT_READER_POLL = 0.1
+
+RPC_METRICS = metrics.RpcMetrics('ts_server')
+
+RESPONSE_COMPRESSION = {
+    'none': grpc.Compression.NoCompression,
+    'deflate': grpc.Compression.Deflate,
+    'gzip': grpc.Compression.Gzip,
+}
+
+
+def set_response_compression(context):
+    """
+    Compresses the responses of a call with the algorithm named by its x-response-compression metadata, if any.
+    """
+    for key, value in context.invocation_metadata():
+        if key == 'x-response-compression':
+            compression = RESPONSE_COMPRESSION.get(value)
+            if compression is None:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(f'Unknown response compression: {value}')
+                raise ValueError(f'Unknown response compression: {value}')
+            context.set_compression(compression)
+
+
+def read_points_ahead(timeline, ticks, read_ahead=POINT_READ_AHEAD):
+    """
+    Reads the point files of a timeline on a reader thread, staying up to read_ahead points ahead of the consumer.
+    :return: A generator that yields (tick, data) for each tick, in order. Closing it stops the reader.
+    """
+    loaded = Queue(maxsize=read_ahead)
+    stopped = Event()
+
+    def put(item):
+        """
+        :return: False if the consumer stopped before the item could be queued.
+        """
+        while not stopped.is_set():
+            try:
+                loaded.put(item, timeout=POINT_READER_POLL)
+                return True
+            except Full:
+                pass
+        return False
+
+    def read():
+        try:
+            for tick in ticks:
+                if stopped.is_set():
+                    return
+                with timeline.get_point_file_path(tick).open('rb') as point_file:
+                    data = point_file.read()
+                if not put((tick, data)):
+                    return
+        except Exception as e:
+            put(e)
+        else:
+            put(None)
+
+    Thread(target=read, name='point-reader', daemon=True).start()
+
+    try:
+        while True:
+            item = loaded.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+        try:
+            while True:
+                loaded.get_nowait()
+        except Empty:
+            pass
+
+
+def make_node_details(project: sm.TimelinesProject, node: sm.TimelineNode):
+    timeline = node.timeline
+    tick_list = timeline.tick_list
+    last_commit_timestamp, = timeline.get_last_commit_details()
+    return ts.TimelineNodeDetails(timeline_id=node.timeline_id,
+                                  parent_id=node.parent_node.timeline_id or 0,
+                                  head_tick=tick_list[0],
+                                  tags=timeline.get_tags(),
+                                  tick_count=len(tick_list),
+                                  last_commit_timestamp=last_commit_timestamp,
+                                  simulation_running=project.get_simulation(node.timeline_id) is not None)
+
+
+BULK_METHODS = frozenset({'GetTimelineData', 'GetTimelineJson', 'GetTimelineEvents', 'GetTimelineTree'})
+# long-lived calls that mostly wait, counted apart so they do not hold the interactive budget while they are open
+LONG_LIVED_METHODS = frozenset({'WatchProject', 'EditSimulation'})
+UNBUDGETED_METHODS = frozenset({'GetMetrics'})
+
+ADMISSION_WAIT_SECONDS = metrics.REGISTRY.histogram('ts_server_admission_wait_seconds',
+                                                    'Time calls waited in the admission queue.', ('budget',))
+ADMISSION_QUEUED = metrics.REGISTRY.gauge('ts_server_admission_queued', 'Calls waiting for admission.', ('budget',))
+ADMISSION_IN_USE = metrics.REGISTRY.gauge('ts_server_admission_in_use', 'Budget cost used by admitted calls.',
+                                          ('budget',))
+ADMISSION_REJECTED = metrics.REGISTRY.counter('ts_server_admission_rejected', 'Calls refused admission.',
+                                              ('budget', 'reason'))
+
+
+@dataclass(frozen=True)
+class AdmissionPolicy:
+    """
+    The concurrency budgets of the timeline server. Bulk calls (point data, JSON, events and the timeline tree),
+    long-lived calls (project watches and simulation edits) and interactive calls (everything else) each have
+    a budget of cost units, and a call waits in a queue until its cost fits.
+    Queued calls of different clients are admitted in turn, so one client cannot starve the others.
+    """
+    interactive_limit: int = 16
+    bulk_limit: int = 4
+    long_lived_limit: int = 16
+    # queued calls per client and per budget, further calls are refused immediately
+    max_queued_per_client: int = 4
+    max_queued: int = 16
+    # seconds a call can wait in the queue before it is refused
+    max_queue_wait: float = 10.0
+    # the cost of each method, 1 if not listed. JSON can start converters, so it costs more than plain data
+    method_costs: Mapping[str, int] = field(default_factory=lambda: {'GetTimelineJson': 2})
+
+    def __post_init__(self):
+        if self.interactive_limit < 1 or self.bulk_limit < 1 or self.long_lived_limit < 1:
+            raise ValueError("Admission budgets must be at least 1.")
+        if self.max_queued_per_client < 0 or self.max_queued < 0 or self.max_queue_wait < 0:
+            raise ValueError("Admission queue limits cannot be negative.")
+
+    def max_active_calls(self):
+        """
+        :return: The most calls that can be admitted or queued at once, not counting unbudgeted calls.
+        """
+        return self.interactive_limit + self.bulk_limit + self.long_lived_limit + 3 * self.max_queued
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, budget, reason, retry_after):
+        self.budget = budget
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(f"Server busy: {budget} calls {reason}, retry after {retry_after:.1f}s.")
+
+
+class _AdmissionTicket:
+    __slots__ = ('budget', 'client', 'cost', 'notify', 'granted', 'queued_at', 'admitted_at')
+
+    def __init__(self, budget, client, cost, notify):
+        self.budget = budget
+        self.client = client
+        self.cost = cost
+        self.notify = notify
+        self.granted = False
+        self.queued_at = perf_counter()
+        self.admitted_at = None
+
+
+class _AdmissionBudget:
+    def __init__(self, name, limit):
+        self.name = name
+        self.limit = limit
+        self.used = 0
+        self.queued = 0
+        # client -> queued tickets, in the order the clients take turns
+        self.queues = {}
+        self.average_hold = 0.0
+        self.wait_seconds = ADMISSION_WAIT_SECONDS.labels(name)
+        self.queued_gauge = ADMISSION_QUEUED.labels(name)
+        self.in_use_gauge = ADMISSION_IN_USE.labels(name)
+
+
+class AdmissionController:
+    """
+    Admits calls according to an AdmissionPolicy. Queued calls are woken through the notify callback of their
+    ticket, which is called with the controller's lock held, so it must only signal the waiter.
+    """
+    def __init__(self, policy: AdmissionPolicy = None):
+        self.policy = policy or AdmissionPolicy()
+        self._lock = RLock()
+        self._budgets = {
+            'interactive': _AdmissionBudget('interactive', self.policy.interactive_limit),
+            'bulk': _AdmissionBudget('bulk', self.policy.bulk_limit),
+            'long_lived': _AdmissionBudget('long_lived', self.policy.long_lived_limit),
+        }
+
+    def budget_for(self, method):
+        """
+        :param method: The short name of an RPC method.
+        :return: The name of the budget the method is admitted by, or None if it is not budgeted.
+        """
+        if method in UNBUDGETED_METHODS:
+            return None
+        if method in LONG_LIVED_METHODS:
+            return 'long_lived'
+        return 'bulk' if method in BULK_METHODS else 'interactive'
+
+    def request(self, budget_name, method, client, notify):
+        """
+        Admits a call right away if its budget allows it, or queues it.
+        :param client: Identifies the caller, queued calls of different clients take turns.
+        :param notify: Called once the queued call is admitted.
+        :return: A ticket, which is granted if the call was admitted right away.
+        :raises AdmissionRejected: If the queue has no room for the call.
+        """
+        budget = self._budgets[budget_name]
+        cost = min(self.policy.method_costs.get(method, 1), budget.limit)
+        ticket = _AdmissionTicket(budget, client, cost, notify)
+        with self._lock:
+            if not budget.queues and budget.used + cost <= budget.limit:
+                self._grant(ticket)
+                return ticket
+
+            queue = budget.queues.get(client)
+            if budget.queued >= self.policy.max_queued:
+                self._reject(budget, 'queue full')
+            if queue is not None and len(queue) >= self.policy.max_queued_per_client:
+                self._reject(budget, 'client queue full')
+
+            if queue is None:
+                queue = budget.queues[client] = deque()
+            queue.append(ticket)
+            budget.queued += 1
+            budget.queued_gauge.set(budget.queued)
+            return ticket
+
+    def withdraw(self, ticket):
+        """
+        Gives up on a queued call that has not been admitted in time, or was cancelled.
+        :return: True if the call was withdrawn, False if it had already been admitted.
+        """
+        with self._lock:
+            if ticket.granted:
+                return False
+            budget = ticket.budget
+            queue = budget.queues[ticket.client]
+            queue.remove(ticket)
+            if not queue:
+                del budget.queues[ticket.client]
+            budget.queued -= 1
+            budget.queued_gauge.set(budget.queued)
+            # a withdrawn call at the head of the queue may have been holding back smaller ones
+            self._grant_queued(budget)
+            return True
+
+    def timed_out(self, ticket):
+        """
+        :raises AdmissionRejected: For a call withdrawn after waiting max_queue_wait.
+        """
+        with self._lock:
+            self._reject(ticket.budget, 'waited too long')
+
+    def release(self, ticket):
+        """
+        Ends an admitted call, letting queued calls in.
+        """
+        with self._lock:
+            budget = ticket.budget
+            budget.used -= ticket.cost
+            budget.in_use_gauge.set(budget.used)
+            hold = perf_counter() - ticket.admitted_at
+            budget.average_hold = hold if not budget.average_hold else 0.9 * budget.average_hold + 0.1 * hold
+            self._grant_queued(budget)
+
+    def _grant(self, ticket):
+        budget = ticket.budget
+        budget.used += ticket.cost
+        budget.in_use_gauge.set(budget.used)
+        ticket.granted = True
+        ticket.admitted_at = perf_counter()
+        budget.wait_seconds.observe(ticket.admitted_at - ticket.queued_at)
+
+    def _grant_queued(self, budget):
+        while budget.queues:
+            client, queue = next(iter(budget.queues.items()))
+            ticket = queue[0]
+            if budget.used + ticket.cost > budget.limit:
+                return
+            queue.popleft()
+            budget.queued -= 1
+            budget.queued_gauge.set(budget.queued)
+            # the client goes to the back of the turn order
+            del budget.queues[client]
+            if queue:
+                budget.queues[client] = queue
+            self._grant(ticket)
+            ticket.notify()
+
+    def _reject(self, budget, reason):
+        ADMISSION_REJECTED.labels(budget.name, reason).inc()
+        # roughly how long until the calls ahead have been served
+        retry_after = max(0.1, budget.average_hold * (budget.queued + 1) / budget.limit)
+        raise AdmissionRejected(budget.name, reason, retry_after)
+
+
+def _admission_client(context):
+    for key, value in context.invocation_metadata():
+        if key == 'x-client-id':
+            return value
+    return context.peer()
+
+
+def _rejection_details(context, e: AdmissionRejected):
+    context.set_trailing_metadata((('grpc-retry-pushback-ms', str(int(e.retry_after * 1000))),))
+    return grpc.StatusCode.RESOURCE_EXHAUSTED, str(e)
+
+
+class AdmissionInterceptor(grpc.ServerInterceptor):
+    """
+    Applies an AdmissionController to the calls of a grpc.server. Refused calls end with RESOURCE_EXHAUSTED,
+    with the suggested retry delay in the grpc-retry-pushback-ms trailing metadata.
+    """
+    def __init__(self, controller: AdmissionController):
+        self.controller = controller
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        method = handler_call_details.method.rpartition('/')[2]
+        budget_name = self.controller.budget_for(method)
+        if handler is None or budget_name is None:
+            return handler
+        controller = self.controller
+        behavior = handler.unary_unary or handler.unary_stream or handler.stream_unary or handler.stream_stream
+
+        def admit(context):
+            admitted = Event()
+            try:
+                ticket = controller.request(budget_name, method, _admission_client(context), admitted.set)
+                if not ticket.granted:
+                    # a cancelled call stops waiting too
+                    context.add_callback(admitted.set)
+                    admitted.wait(controller.policy.max_queue_wait)
+                    if controller.withdraw(ticket):
+                        if context.is_active():
+                            controller.timed_out(ticket)
+                        context.abort(grpc.StatusCode.CANCELLED, 'Cancelled while waiting for admission.')
+                return ticket
+            except AdmissionRejected as e:
+                context.abort(*_rejection_details(context, e))
+
+        def unary_response(request, context):
+            ticket = admit(context)
+            try:
+                return behavior(request, context)
+            finally:
+                controller.release(ticket)
+
+        def stream_response(request, context):
+            ticket = admit(context)
+            try:
+                yield from behavior(request, context)
+            finally:
+                controller.release(ticket)
+
+        return metrics.replace_handler_behavior(handler, unary_unary=unary_response, unary_stream=stream_response,
+                                                stream_unary=unary_response, stream_stream=stream_response)
+
+
+class AsyncAdmissionInterceptor(grpc.aio.ServerInterceptor):
+    """
+    Applies an AdmissionController to the calls of a grpc.aio server, the same way as AdmissionInterceptor.
+    """
+    def __init__(self, controller: AdmissionController):
+        self.controller = controller
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        method = handler_call_details.method.rpartition('/')[2]
+        budget_name = self.controller.budget_for(method)
+        if handler is None or budget_name is None:
+            return handler
+        controller = self.controller
+        behavior = handler.unary_unary or handler.unary_stream or handler.stream_unary or handler.stream_stream
+
+        async def admit(context):
+            loop = asyncio.get_running_loop()
+            admitted = loop.create_future()
+
+            def notify():
+                loop.call_soon_threadsafe(lambda: admitted.done() or admitted.set_result(None))
+
+            try:
+                ticket = controller.request(budget_name, method, _admission_client(context), notify)
+                if not ticket.granted:
+                    try:
+                        await asyncio.wait_for(admitted, controller.policy.max_queue_wait)
+                    except asyncio.TimeoutError:
+                        pass
+                    except asyncio.CancelledError:
+                        if not controller.withdraw(ticket):
+                            controller.release(ticket)
+                        raise
+                    if controller.withdraw(ticket):
+                        controller.timed_out(ticket)
+                return ticket
+            except AdmissionRejected as e:
+                await context.abort(*_rejection_details(context, e))
+
+        async def unary_response(request, context):
+            ticket = await admit(context)
+            try:
+                return await behavior(request, context)
+            finally:
+                controller.release(ticket)
+
+        async def stream_response(request, context):
+            ticket = await admit(context)
+            try:
+                async for response in behavior(request, context):
+                    yield response
+            finally:
+                controller.release(ticket)
+
+        return metrics.replace_handler_behavior(handler, unary_unary=unary_response, unary_stream=stream_response,
+                                                stream_unary=unary_response, stream_stream=stream_response)
+
+
+class ProjectChangeLog:
+    """
+    Records changes to a project's timelines and simulations, driven by the project's signals.
+    Changes are numbered in order, and the most recent ones are kept so a watcher can resume after
+    the last change it has seen.
+    """
+    def __init__(self, project: Optional[sm.TimelinesProject], max_changes=10000):
+        """
+        :param project: The project to record the changes of, or None for a log that is only fed through record.
+        """
+        self._project = project
+        # identifies this log, so a watcher cannot resume with sequence numbers from another one
+        self.log_id = token_hex(8)
+
+        self._changes = deque(maxlen=max_changes)
+        self._last_sequence = 0
+        self._condition = Condition()
+        self._async_waiters = {}
+
+        if project is not None:
+            project.timeline_created.connect(self._on_timeline_created)
+            project.timeline_deleted.connect(self._on_timeline_deleted)
+            project.tags_changed.connect(self._on_tags_changed)
+            project.point_added.connect(self._on_point_added)
+            project.simulation_started.connect(self._on_simulation_started)
+            project.simulation_stopped.connect(self._on_simulation_stopped)
+
+    def last_sequence(self):
+        with self._condition:
+            return self._last_sequence
+
+    def changes_after(self, sequence, max_count=1000):
+        """
+        :return: Up to max_count of the changes after the given sequence number, in order.
+        :raises LookupError: If changes after the sequence number are no longer kept.
+        """
+        with self._condition:
+            return self._changes_after(sequence, max_count)
+
+    def wait_for_changes(self, sequence, timeout, max_count=1000):
+        """
+        Waits until there are changes after the given sequence number, or the timeout passes.
+        :return: As changes_after. Empty if the timeout passed.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._last_sequence > sequence, timeout)
+            return self._changes_after(sequence, max_count)
+
+    def add_async_waiter(self):
+        """
+        :return: An asyncio.Event that is set on the running loop whenever a change is recorded.
+        """
+        waiter = asyncio.Event()
+        with self._condition:
+            self._async_waiters[waiter] = asyncio.get_running_loop()
+        return waiter
+
+    def remove_async_waiter(self, waiter):
+        with self._condition:
+            self._async_waiters.pop(waiter, None)
+
+    def reset(self):
+        """
+        Starts a new log, for when changes have been missed. Watchers of the old log have to start over.
+        """
+        with self._condition:
+            self.log_id = token_hex(8)
+            self._changes.clear()
+            # past the sequence of every watcher, so waiting watchers find their changes gone
+            self._last_sequence += 1
+            self._condition.notify_all()
+        self._notify_async_waiters()
+
+    def _changes_after(self, sequence, max_count):
+        if sequence > self._last_sequence:
+            raise LookupError(f'Sequence {sequence} is past the last change.')
+        first_sequence = self._last_sequence - len(self._changes) + 1
+        if sequence + 1 < first_sequence:
+            raise LookupError(f'Changes after sequence {sequence} are no longer kept.')
+        start = sequence + 1 - first_sequence
+        return [self._changes[i] for i in range(start, min(len(self._changes), start + max_count))]
+
+    def record(self, change_type, timeline_id, node=None, tick=0, deleted_timeline_ids=()):
+        """
+        :param node: The ts.TimelineNodeDetails of the timeline after the change, if it still exists.
+        """
+        with self._condition:
+            self._last_sequence += 1
+            self._changes.append(ts.ProjectChange(sequence=self._last_sequence,
+                                                  type=change_type,
+                                                  timeline_id=timeline_id,
+                                                  node=node,
+                                                  tick=tick,
+                                                  deleted_timeline_ids=deleted_timeline_ids))
+            self._condition.notify_all()
+        self._notify_async_waiters()
+
+    def _notify_async_waiters(self):
+        with self._condition:
+            async_waiters = list(self._async_waiters.items())
+
+        for waiter, loop in async_waiters:
+            try:
+                loop.call_soon_threadsafe(waiter.set)
+            except RuntimeError:
+                # the loop has been closed
+                self.remove_async_waiter(waiter)
+
+    def _record_node(self, change_type, timeline_node, tick=0):
+        node = make_node_details(self._project, timeline_node)
+        self.record(change_type, timeline_node.timeline_id, node, tick)
+
+    def _on_timeline_created(self, timeline_node):
+        self._record_node(ChangeType.TIMELINE_CREATED, timeline_node)
+
+    def _on_timeline_deleted(self, timeline_node):
+        deleted_ids = []
+        sm.TimelineNode.traverse(timeline_node, lambda node: deleted_ids.append(node.timeline_id))
+        self.record(ChangeType.TIMELINE_DELETED, timeline_node.timeline_id, deleted_timeline_ids=deleted_ids)
+
+    def _on_tags_changed(self, timeline_node):
+        self._record_node(ChangeType.TAGS_CHANGED, timeline_node)
+
+    def _on_point_added(self, timeline_node, tick):
+        self._record_node(ChangeType.POINT_ADDED, timeline_node, tick)
+
+    def _on_simulation_started(self, simulation, timeline_node):
+        self._record_node(ChangeType.SIMULATION_STARTED, timeline_node)
+
+    def _on_simulation_stopped(self, simulation, timeline_node):
+        self._record_node(ChangeType.SIMULATION_STOPPED, timeline_node)
+
+
+def start_watch(change_log: ProjectChangeLog, request, context):
+    """
+    Checks where a WatchProject call resumes.
+    :return: The sequence number of the last change seen by the watcher.
+    """
+    if not request.log_id:
+        return change_log.last_sequence()
+
+    try:
+        if request.log_id != change_log.log_id:
+            raise LookupError('Changes are from a different log.')
+        change_log.changes_after(request.after_sequence, max_count=0)
+    except LookupError as e:
+        context.set_code(grpc.StatusCode.OUT_OF_RANGE)
+        context.set_details(str(e))
+        raise
+    return request.after_sequence
+
+
+async def watch_change_log(change_log: ProjectChangeLog, request, context):
+    """
+    Serves a WatchProject call from a change log on a grpc.aio server.
+    """
+    try:
+        sequence = start_watch(change_log, request, context)
+    except LookupError as e:
+        await context.abort(grpc.StatusCode.OUT_OF_RANGE, str(e))
+
+    waiter = change_log.add_async_waiter()
+    try:
+        yield ts.WatchProjectResponse(log_id=change_log.log_id, last_sequence=sequence)
+
+        while True:
+            waiter.clear()
+            try:
+                changes = change_log.changes_after(sequence)
+            except LookupError as e:
+                await context.abort(grpc.StatusCode.OUT_OF_RANGE, str(e))
+            if changes:
+                sequence = changes[-1].sequence
+                yield ts.WatchProjectResponse(log_id=change_log.log_id, last_sequence=sequence,
+                                              changes=changes)
+            else:
+                await waiter.wait()
+    finally:
+        change_log.remove_async_waiter(waiter)
 
 
 class Service(ts_grpc.TimelineServiceServicer):
     def __init__(self, project: sm.TimelinesProject):
         self._project = project
+        self.change_log = ProjectChangeLog(project)
 
     def GetTimelines(self, request, context):
         tags = request.tags
@@ -48,6 +658,7 @@ class Service(ts_grpc.TimelineServiceServicer):
     def GetTimelineData(self, request, context):
         timeline_id = request.timeline_id
         tick_option = request.WhichOneof('tick_option')
+        set_response_compression(context)
 
         try:
             node = self._project.get_timeline_node(timeline_id)
@@ -67,13 +678,20 @@ class Service(ts_grpc.TimelineServiceServicer):
                 with point.point_file_path().open('rb') as point_file:
                     yield ts.TimelineDataResponse(tick=tick, data=point_file.read())
         elif tick_option == 'tick_range':
-            context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-            context.set_details('tick_range option not implemented')
-            raise NotImplementedError('tick_range option not implemented')
+            ticks = select_ticks(node.timeline.tick_list,
+                                 request.tick_range.start_tick,
+                                 request.tick_range.end_tick,
+                                 request.stride,
+                                 request.max_count)
+
+            for tick, data in read_points_ahead(node.timeline, ticks):
+                yield ts.TimelineDataResponse(tick=tick, data=data)
 
     def GetTimelineJson(self, request, context):
         timeline_id = request.timeline_id
         tick_option = request.WhichOneof('tick_option')
+        compressed_json = request.compressed_json
+        set_response_compression(context)
 
         try:
             node = self._project.get_timeline_node(timeline_id)
@@ -82,11 +700,24 @@ class Service(ts_grpc.TimelineServiceServicer):
             context.set_details('Timeline ID not found.')
             raise ValueError('Timeline ID not found.')
 
-        converter_generator = sr.SimulationProcess.convert_multiple_generator(
-            "binary",
-            str(node.timeline.get_simulation_binary_path()),
-            "json")
-        converter_generator.send(None)
+        converter_service = self._project.converter_service
+        point_json_cache = self._project.point_json_cache
+        simulation_binary_path = str(node.timeline.get_simulation_binary_path())
+
+        def get_json(point):
+            point_file_path = str(point.point_file_path())
+            return point_json_cache.get_or_convert(
+                point_file_path,
+                simulation_binary_path,
+                lambda: converter_service.convert_to_json(point_file_path, "binary", simulation_binary_path),
+                timeline_id,
+                compressed_json)
+
+        def make_response(tick, json):
+            if compressed_json:
+                return ts.TimelineJsonResponse(tick=tick, json_zlib=json)
+            else:
+                return ts.TimelineJsonResponse(tick=tick, json=json)
 
         if tick_option == 'tick_list':
             for tick in request.tick_list.ticks:
@@ -96,8 +727,8 @@ class Service(ts_grpc.TimelineServiceServicer):
                     context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
                     context.set_details(f'tick {tick} not found.')
                     raise ValueError(f'tick {tick} not found.')
-                json = converter_generator.send(str(point.point_file_path()))
-                yield ts.TimelineJsonResponse(tick=tick, json=json)
+                json = get_json(point)
+                yield make_response(tick, json)
         elif tick_option == 'tick_range':
             timeline = node.timeline
             start_tick = request.tick_range.start_tick
@@ -109,16 +740,12 @@ class Service(ts_grpc.TimelineServiceServicer):
                 if end_tick != -1 and tick > end_tick:
                     break
                 point = node.point(tick)
-                json = converter_generator.send(str(point.point_file_path()))
-                yield ts.TimelineJsonResponse(tick=tick, json=json)
-
-        try:
-            converter_generator.send(None)
-        except StopIteration:
-            pass
+                json = get_json(point)
+                yield make_response(tick, json)
 
     def GetTimelineEvents(self, request, context):
         timeline_id = request.timeline_id
+        set_response_compression(context)
 
         try:
             node = self._project.get_timeline_node(timeline_id)
@@ -162,6 +789,25 @@ class Service(ts_grpc.TimelineServiceServicer):
 
         return ts.GetOrStartSimulationResponse(address=address, token=token)
 
+    def GetOrStartSimulations(self, request, context):
+        max_concurrent = request.max_concurrent or 8
+        results = self._project.start_simulations(request.timeline_ids, max_concurrent)
+
+        try:
+            for result in results:
+                if not context.is_active():
+                    break
+
+                if result.succeeded():
+                    address, token = result.simulation.make_connection_parameters()
+                    yield ts.GetOrStartSimulationsResponse(timeline_id=result.timeline_id,
+                                                           address=address,
+                                                           token=token)
+                else:
+                    yield ts.GetOrStartSimulationsResponse(timeline_id=result.timeline_id, error=result.error)
+        finally:
+            results.close()
+
     def StopSimulation(self, request, context):
         timeline_id = request.timeline_id
 
@@ -285,7 +931,12 @@ class Service(ts_grpc.TimelineServiceServicer):
     def DeleteTimeline(self, request, context):
         timeline_id = request.timeline_id
 
-        node_to_delete = self._project.get_timeline_node(timeline_id)
+        try:
+            node_to_delete = self._project.get_timeline_node(timeline_id)
+        except LookupError:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details('Timeline ID not found.')
+            raise ValueError('Timeline ID not found.')
 
         if node_to_delete.child_nodes:
             raise RuntimeError("Unable to delete node with children. Delete children first.")
@@ -317,19 +968,415 @@ class Service(ts_grpc.TimelineServiceServicer):
 
         return response
 
+    def GetTimelineDetailsBatch(self, request, context):
+        response = ts.GetTimelineDetailsBatchResponse()
+
+        for timeline_id in request.timeline_ids:
+            try:
+                node = self._project.get_timeline_node(timeline_id)
+            except LookupError:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(f'Timeline ID {timeline_id} not found.')
+                raise ValueError(f'Timeline ID {timeline_id} not found.')
+            response.nodes.append(make_node_details(self._project, node))
+
+        return response
+
+    def GetTimelineTree(self, request, context):
+        batch_size = request.batch_size or 1000
+
+        response = ts.GetTimelineTreeResponse()
+        # depth first from the root, so every node is sent after its parent
+        pending_nodes = self._project.root_node.child_nodes[::-1]
+        while pending_nodes:
+            node = pending_nodes.pop()
+            response.nodes.append(make_node_details(self._project, node))
+            if len(response.nodes) >= batch_size:
+                yield response
+                response = ts.GetTimelineTreeResponse()
+            pending_nodes.extend(node.child_nodes[::-1])
+
+        if response.nodes:
+            yield response
+
+    def WatchProject(self, request, context):
+        change_log = self.change_log
+        sequence = start_watch(change_log, request, context)
+
+        yield ts.WatchProjectResponse(log_id=change_log.log_id, last_sequence=sequence)
+
+        while context.is_active():
+            try:
+                changes = change_log.wait_for_changes(sequence, timeout=1.0)
+            except LookupError as e:
+                context.set_code(grpc.StatusCode.OUT_OF_RANGE)
+                context.set_details(str(e))
+                raise
+            if changes:
+                sequence = changes[-1].sequence
+                yield ts.WatchProjectResponse(log_id=change_log.log_id, last_sequence=sequence, changes=changes)
+
+    def GetCacheStats(self, request, context):
+        stats = self._project.point_json_cache.get_stats()
+        return ts.GetCacheStatsResponse(**stats)
+
+    def GetMetrics(self, request, context):
+        registry = metrics.REGISTRY
+        families = registry.collect()
+        response = ts.GetMetricsResponse()
+        for _, _, _, samples in families:
+            for sample in samples:
+                response.samples.add(name=sample.name, labels=sample.labels, value=sample.value)
+        if request.prometheus_text:
+            response.prometheus_text = registry.render_prometheus(families)
+        return response
+
+
+_STREAM_END = object()
+
+
+class _CancellableExecutor(futures.ThreadPoolExecutor):
+    """
+    A thread pool that can cancel the work still queued when it is shut down, as shutdown(cancel_futures=True)
+    does from Python 3.9 on.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending = set()
+        self._pending_lock = RLock()
+
+    def submit(self, fn, *args, **kwargs):
+        future = super().submit(fn, *args, **kwargs)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard_pending)
+        return future
+
+    def _discard_pending(self, future):
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    def shutdown_cancelling(self):
+        """
+        Shuts the pool down without waiting, cancelling the work that has not started yet.
+        """
+        self.shutdown(wait=False)
+        with self._pending_lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.cancel()
+
+
+class AsyncService(ts_grpc.TimelineServiceServicer):
+    """
+    The timeline service for grpc.aio servers.
+
+    Calls are handled on the event loop, and the blocking project work behind them is run by a Service on
+    bounded executors: one for unary disk and SQLite access, one for producing the responses of data,
+    JSON, event and timeline tree streams, and one for simulation process work. A stream only holds a thread while its
+    next response is being produced, so slow or idle streams do not hold up other calls, and busy streams
+    do not queue ahead of unary calls.
+    """
+    def __init__(self, project: sm.TimelinesProject, io_workers=8, stream_workers=8, simulation_workers=4):
+        self._project = project
+        self._service = Service(project)
+        self._io_executor = _CancellableExecutor(max_workers=io_workers, thread_name_prefix='ts-io')
+        self._stream_executor = _CancellableExecutor(max_workers=stream_workers, thread_name_prefix='ts-stream')
+        self._simulation_executor = _CancellableExecutor(max_workers=simulation_workers,
+                                                         thread_name_prefix='ts-simulation')
+
+    def close(self):
+        self._io_executor.shutdown_cancelling()
+        self._stream_executor.shutdown_cancelling()
+        self._simulation_executor.shutdown_cancelling()
+
+    @staticmethod
+    async def _run(executor, fn, *args):
+        return await asyncio.wrap_future(executor.submit(fn, *args))
+
+    @staticmethod
+    async def _abort_with_set_status(context):
+        # grpc.aio replaces the details of a call that raised, so end it with the status the handler set
+        code = context.code()
+        if code is not None and code != grpc.StatusCode.OK:
+            await context.abort(code, context.details() or '')
+
+    async def _call(self, executor, handler, request, context):
+        try:
+            return await self._run(executor, handler, request, context)
+        except Exception:
+            await self._abort_with_set_status(context)
+            raise
+
+    async def _stream(self, executor, handler, request, context):
+        try:
+            async for response in self._iterate(executor, handler(request, context)):
+                yield response
+        except Exception:
+            await self._abort_with_set_status(context)
+            raise
+
+    @staticmethod
+    async def _iterate(executor, generator):
+        """
+        Iterates a blocking generator, producing each item on the executor.
+        The generator is closed on the executor once the iteration ends or is cancelled.
+        """
+        work = None
+        try:
+            while True:
+                work = executor.submit(next, generator, _STREAM_END)
+                item = await asyncio.wrap_future(work)
+                if item is _STREAM_END:
+                    return
+                yield item
+        finally:
+            if work is not None and not work.done():
+                # the generator is still running on the executor; close it there once it yields
+                work.add_done_callback(lambda _: generator.close())
+            else:
+                await asyncio.wrap_future(executor.submit(generator.close))
+
+    async def GetTimelines(self, request, context):
+        return await self._call(self._io_executor, self._service.GetTimelines, request, context)
+
+    async def GetTimelineTicks(self, request, context):
+        return await self._call(self._io_executor, self._service.GetTimelineTicks, request, context)
+
+    async def GetTimelineData(self, request, context):
+        async for response in self._stream(self._stream_executor, self._service.GetTimelineData, request, context):
+            yield response
+
+    async def GetTimelineJson(self, request, context):
+        async for response in self._stream(self._stream_executor, self._service.GetTimelineJson, request, context):
+            yield response
+
+    async def GetTimelineEvents(self, request, context):
+        async for response in self._stream(self._stream_executor, self._service.GetTimelineEvents, request, context):
+            yield response
+
+    async def GetOrStartSimulation(self, request, context):
+        return await self._call(self._simulation_executor, self._service.GetOrStartSimulation, request, context)
+
+    async def GetOrStartSimulations(self, request, context):
+        max_concurrent = request.max_concurrent or 8
+        results = self._project.start_simulations(list(request.timeline_ids), max_concurrent)
+
+        # a cancelled call cancels the iteration, which closes the results
+        async for result in self._iterate(self._simulation_executor, results):
+            if result.succeeded():
+                address, token = result.simulation.make_connection_parameters()
+                yield ts.GetOrStartSimulationsResponse(timeline_id=result.timeline_id,
+                                                       address=address,
+                                                       token=token)
+            else:
+                yield ts.GetOrStartSimulationsResponse(timeline_id=result.timeline_id, error=result.error)
+
+    async def StopSimulation(self, request, context):
+        return await self._call(self._simulation_executor, self._service.StopSimulation, request, context)
+
+    async def MoveSimToTick(self, request, context):
+        return await self._call(self._simulation_executor, self._service.MoveSimToTick, request, context)
+
+    async def EditSimulation(self, request_iterator, context):
+        first_request = await request_iterator.__anext__()
+
+        timeline_id = first_request.timeline_id
+        command = first_request.command
+        metadata = {k: v for k, v in context.invocation_metadata()}
+        token = metadata['x-user-token']
+
+        if command != Command.START:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "First edit command must be START.")
+
+        timeline_sim = self._project.get_simulation(timeline_id)
+
+        if timeline_sim is None:
+            await context.abort(grpc.StatusCode.FAILED_PRECONDITION, "Simulation is not running.")
+
+        executor = self._simulation_executor
+
+        try:
+            await self._run(executor, timeline_sim.start_editing, token)
+            try:
+                yield ts.EditSimulationResponse(success=True)
+
+                async for request in request_iterator:
+                    command = request.command
+
+                    if command == Command.START:
+                        yield ts.EditSimulationResponse(success=False, result="Editing already started.")
+                    elif command == Command.END:
+                        break
+                    elif command == Command.DISCARD:
+                        await self._run(executor, timeline_sim.discard_edits, token)
+                        yield ts.EditSimulationResponse(success=True)
+                    elif command == Command.COMMIT:
+                        await self._run(executor, timeline_sim.commit_edits, token)
+                        yield ts.EditSimulationResponse(success=True)
+                    else:
+                        yield ts.EditSimulationResponse(success=False, result=f"Unknown command: {command}")
+            finally:
+                # also reached when the editing has been cancelled
+                await self._run(executor, timeline_sim.end_editing, token)
+        except Exception as e:
+            traceback.print_exc()
+            await context.abort(grpc.StatusCode.INTERNAL, "Editing ended due to exception.\n" + str(e))
+        else:
+            yield ts.EditSimulationResponse(success=True, result="Editing ended.")
+
+    async def ModifyTimelineTags(self, request, context):
+        return await self._call(self._io_executor, self._service.ModifyTimelineTags, request, context)
+
+    async def CreateTimeline(self, request, context):
+        return await self._call(self._io_executor, self._service.CreateTimeline, request, context)
+
+    async def CloneTimeline(self, request, context):
+        return await self._call(self._io_executor, self._service.CloneTimeline, request, context)
+
+    async def CreateTimelineFromSimulation(self, request, context):
+        return await self._call(self._simulation_executor, self._service.CreateTimelineFromSimulation,
+                                request, context)
+
+    async def DeleteTimeline(self, request, context):
+        return await self._call(self._io_executor, self._service.DeleteTimeline, request, context)
+
+    async def GetTimelineDetails(self, request, context):
+        return await self._call(self._io_executor, self._service.GetTimelineDetails, request, context)
+
+    async def GetTimelineDetailsBatch(self, request, context):
+        return await self._call(self._io_executor, self._service.GetTimelineDetailsBatch, request, context)
+
+    async def GetTimelineTree(self, request, context):
+        async for response in self._stream(self._stream_executor, self._service.GetTimelineTree, request, context):
+            yield response
+
+    async def WatchProject(self, request, context):
+        async for response in watch_change_log(self._service.change_log, request, context):
+            yield response
+
+    async def GetCacheStats(self, request, context):
+        return await self._call(self._io_executor, self._service.GetCacheStats, request, context)
+
+    async def GetMetrics(self, request, context):
+        return await self._call(self._io_executor, self._service.GetMetrics, request, context)
+
+
+def _make_metrics_endpoint(metrics_port):
+    if metrics_port is None:
+        return None
+    return metrics.MetricsEndpoint(metrics.REGISTRY, ('127.0.0.1', metrics_port))
+
 
 class Server:
-    def __init__(self, project_to_serve, address='[::]:4969'):
-        server = grpc.server(futures.ThreadPoolExecutor(max_workers=5))
+    def __init__(self, project_to_serve, address='[::]:4969', metrics_port=None,
+                 admission: Optional[AdmissionPolicy] = AdmissionPolicy()):
+        """
+        :param metrics_port: If given, the metrics are also served in the Prometheus text format on this local port.
+        :param admission: The budgets calls are admitted by, or None to admit every call.
+        """
+        interceptors = [metrics.ServerMetricsInterceptor(RPC_METRICS)]
+        max_workers = 5
+        if admission is not None:
+            interceptors.append(AdmissionInterceptor(AdmissionController(admission)))
+            # queued calls hold a thread while they wait, and long-lived calls for as long as they are open,
+            # so there must be one for every call the budgets allow
+            max_workers += admission.max_active_calls()
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers), interceptors=interceptors)
         self.server = server
         ts_grpc.add_TimelineServiceServicer_to_server(Service(project_to_serve), server)
-        server.add_insecure_port(address)
+        self.port = server.add_insecure_port(address)
+        self.metrics_endpoint = _make_metrics_endpoint(metrics_port)
 
     def start(self):
         self.server.start()
+        if self.metrics_endpoint is not None:
+            self.metrics_endpoint.start()
+
+    def stop(self, grace=0):
+        # grpc only starts the shutdown, wait for the calls to be cancelled before the project is closed
+        self.server.stop(grace).wait()
+        if self.metrics_endpoint is not None:
+            self.metrics_endpoint.stop()
+            self.metrics_endpoint = None
+
+    def __del__(self):
+        self.stop()
+
+
+class AsyncServer:
+    """
+    Serves the timeline service with AsyncService on a grpc.aio server.
+    The server runs on an event loop in its own thread, so it is started and stopped the same way as Server.
+    """
+    def __init__(self, project_to_serve, address='[::]:4969', io_workers=8, stream_workers=8, simulation_workers=4,
+                 metrics_port=None, admission: Optional[AdmissionPolicy] = AdmissionPolicy()):
+        if admission is not None:
+            # the streams run on the stream pool are the bulk calls, give every admitted one a thread
+            stream_workers = max(stream_workers, admission.bulk_limit)
+        self._service = AsyncService(project_to_serve, io_workers, stream_workers, simulation_workers)
+        self._address = address
+        self._interceptors = [metrics.AsyncServerMetricsInterceptor(RPC_METRICS)]
+        if admission is not None:
+            self._interceptors.append(AsyncAdmissionInterceptor(AdmissionController(admission)))
+        self.metrics_endpoint = _make_metrics_endpoint(metrics_port)
+        self._loop = None
+        self._thread = None
+        self.server = None
+        self.port = None
+
+    def start(self):
+        if self._thread is not None:
+            raise RuntimeError("Server already started.")
+
+        loop = asyncio.new_event_loop()
+        thread = Thread(target=loop.run_forever, name='ts-aio-server', daemon=True)
+        thread.start()
+
+        async def serve():
+            server = grpc.aio.server(interceptors=self._interceptors)
+            ts_grpc.add_TimelineServiceServicer_to_server(self._service, server)
+            port = server.add_insecure_port(self._address)
+            await server.start()
+            return server, port
+
+        try:
+            self.server, self.port = asyncio.run_coroutine_threadsafe(serve(), loop).result()
+        except BaseException:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+            raise
+
+        self._loop = loop
+        self._thread = thread
+        if self.metrics_endpoint is not None:
+            self.metrics_endpoint.start()
 
     def stop(self, grace=0):
-        self.server.stop(grace)
+        if self._thread is None:
+            return
+
+        async def shutdown():
+            await self.server.stop(grace)
+            # let the cancelled calls finish closing their streams before the loop stops
+            calls = asyncio.all_tasks() - {asyncio.current_task()}
+            if calls:
+                await asyncio.wait(calls, timeout=5)
+            await loop.shutdown_asyncgens()
+
+        loop = self._loop
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+        loop.close()
+        self._service.close()
+        if self.metrics_endpoint is not None:
+            self.metrics_endpoint.stop()
+            self.metrics_endpoint = None
+
+        self._loop = None
+        self._thread = None
 
     def __del__(self):
         self.stop()
@@ -0,0 +1,698 @@
+"""
+A sharded deployment of the timeline service, which spreads one project over several worker processes.
+
+Each worker loads the timelines it owns, the ones where timeline_id % worker_count is its index (and their
+ancestors), and serves them with an AsyncServer. A worker only gives the timelines it creates ids it owns, so the
+timeline, its simulation, its databases and its derived timelines are all handled by one process. A router in
+front forwards each call to the owner of its timeline, and answers tree-wide queries from a catalog merged from
+the WatchProject streams of the workers.
+
+To serve a project from 4 workers:
+    python ts_shard.py PROJECT --workers 4
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from collections import namedtuple
+from itertools import count
+from pathlib import Path
+from threading import Thread, RLock
+
+import grpc
+import grpc.aio
+from google.protobuf import descriptor_pb2
+
+import metrics
+import SimulationManager as sm
+import TimelinesService_pb2 as ts
+from point_cache import PointJsonCache
+from simrunner import SimulationProcess
+from ts_client import ProjectReplica, ChangeType
+from ts_server import AsyncServer, ProjectChangeLog, RPC_METRICS, set_response_compression, \
+    watch_change_log
+
+SERVICE = ts.DESCRIPTOR.services_by_name['TimelineService']
+
+RpcMethod = namedtuple('RpcMethod', 'name, request_type, response_type, client_streaming, server_streaming')
+
+
+def _service_methods():
+    # the streaming flags are read from the descriptor proto, older protobuf runtimes leave them off the descriptors
+    service_proto = descriptor_pb2.ServiceDescriptorProto()
+    SERVICE.CopyToProto(service_proto)
+    return {method_proto.name: RpcMethod(method_proto.name,
+                                         getattr(ts, method.input_type.name),
+                                         getattr(ts, method.output_type.name),
+                                         method_proto.client_streaming,
+                                         method_proto.server_streaming)
+            for method, method_proto in zip(SERVICE.methods, service_proto.method)}
+
+
+METHODS = _service_methods()
+
+# calls forwarded to the owner of a timeline, by the request field holding the timeline id
+FORWARDED_METHODS = {
+    'GetTimelineTicks': 'timeline_id',
+    'GetTimelineData': 'timeline_id',
+    'GetTimelineJson': 'timeline_id',
+    'GetTimelineEvents': 'timeline_id',
+    'GetOrStartSimulation': 'timeline_id',
+    'StopSimulation': 'timeline_id',
+    'MoveSimToTick': 'timeline_id',
+    'ModifyTimelineTags': 'timeline_id',
+    'GetTimelineDetails': 'timeline_id',
+    'CreateTimeline': 'source_timeline_id',
+    'CloneTimeline': 'source_timeline_id',
+    'CreateTimelineFromSimulation': 'source_timeline_id',
+}
+
+# bulk responses, which are relayed as they were serialized by the worker
+RAW_RESPONSE_METHODS = frozenset({'GetTimelineData', 'GetTimelineJson', 'GetTimelineEvents'})
+
+# how long a call that changes the project waits for the change to reach the catalog, so that the caller
+# sees its own change in the tree-wide queries that follow
+CATALOG_WAIT = 5.0
+
+
+def owner_of(timeline_id, worker_count):
+    """
+    :return: The index of the worker that owns the timeline.
+    """
+    return timeline_id % worker_count
+
+
+def serve_worker(project_dir, index, worker_count, simulation_server_command=None):
+    """
+    Serves one shard of a project until stdin is closed. The port is written to stdout once serving.
+    """
+    if simulation_server_command is not None:
+        SimulationProcess.set_simulation_server_command(simulation_server_command)
+
+    project = sm.TimelinesProject.load_project(project_dir)
+    project.set_timeline_id_shard(index, worker_count)
+    # copies of the other workers' timelines would go stale as they change them
+    project.unload_timelines(lambda timeline_id: owner_of(timeline_id, worker_count) == index)
+    # JSON for a timeline is always converted by its owner, so each worker caches its own
+    project.point_json_cache.close()
+    project.point_json_cache = PointJsonCache(project.root_dir_path / 'cache' / f'point_json_{index}.db')
+
+    server = AsyncServer(project, 'localhost:0')
+    try:
+        server.start()
+        print(server.port, flush=True)
+        sys.stdin.read()
+    finally:
+        server.stop()
+        project.close()
+
+
+def _node_message(node):
+    return ts.TimelineNodeDetails(**node._asdict())
+
+
+class ShardCatalog:
+    """
+    The timelines of the whole project, merged from a ProjectReplica of each worker. Each worker is trusted only
+    for the timelines it owns. Every change is also recorded in change_log, so the router can serve WatchProject.
+    """
+    def __init__(self, channels):
+        self.worker_count = len(channels)
+        self.change_log = ProjectChangeLog(None)
+
+        self._lock = RLock()
+        self._nodes = {}
+        self._replicas = []
+        # the replicas report changes from their own threads, which wait here until every replica exists
+        with self._lock:
+            for index, channel in enumerate(channels):
+                on_change = (lambda change, index=index: self._on_change(index, change))
+                self._replicas.append(ProjectReplica(channel, on_change))
+
+    def wait_synced(self, timeout=None):
+        return all(replica.wait_synced(timeout) for replica in self._replicas)
+
+    def get_nodes(self):
+        """
+        :return: A dict of timeline id to TimelineNodeDetails for every timeline in the project.
+        """
+        with self._lock:
+            return dict(self._nodes)
+
+    def get_node(self, timeline_id):
+        with self._lock:
+            return self._nodes.get(timeline_id)
+
+    def close(self):
+        for replica in self._replicas:
+            replica.close()
+
+    def _owned(self, timeline_id, index):
+        return owner_of(timeline_id, self.worker_count) == index
+
+    def _on_change(self, index, change):
+        with self._lock:
+            if change is None:
+                # the worker's timelines were loaded again, so changes may have been missed
+                nodes = self._replicas[index].get_nodes()
+                self._nodes = {timeline_id: node for timeline_id, node in self._nodes.items()
+                               if not self._owned(timeline_id, index)}
+                self._nodes.update((timeline_id, node) for timeline_id, node in nodes.items()
+                                   if self._owned(timeline_id, index))
+                self.change_log.reset()
+                return
+
+            if not self._owned(change.timeline_id, index):
+                return
+
+            if change.type == ChangeType.TIMELINE_DELETED:
+                deleted_ids = [timeline_id for timeline_id in change.deleted_timeline_ids
+                               if self._owned(timeline_id, index)]
+                for timeline_id in deleted_ids:
+                    self._nodes.pop(timeline_id, None)
+                self.change_log.record(change.type, change.timeline_id, deleted_timeline_ids=deleted_ids)
+            else:
+                self._nodes[change.timeline_id] = change.node
+                self.change_log.record(change.type, change.timeline_id, _node_message(change.node), change.tick)
+
+
+def _forwarded_metadata(context):
+    # the router compresses the responses to the caller itself
+    metadata = [(key, value) for key, value in context.invocation_metadata()
+                if key.startswith('x-') and key != 'x-response-compression']
+    if not any(key == 'x-client-id' for key, _ in metadata):
+        # so the workers' admission queues still tell the callers apart
+        metadata.append(('x-client-id', context.peer()))
+    return tuple(metadata)
+
+
+async def _abort_forwarded(context, error: grpc.aio.AioRpcError):
+    await context.abort(error.code(), error.details() or '', error.trailing_metadata() or ())
+
+
+def _created_check(request, response):
+    return lambda nodes: response.created_timeline_id in nodes
+
+
+def _tags_check(request, response):
+    def check(nodes):
+        node = nodes.get(request.timeline_id)
+        return (node is None or
+                (set(request.tags_to_add) <= set(node.tags) and not set(request.tags_to_remove) & set(node.tags)))
+    return check
+
+
+def _started_check(request, response):
+    def check(nodes):
+        node = nodes.get(request.timeline_id)
+        return node is None or node.simulation_running
+    return check
+
+
+def _stopped_check(request, response):
+    def check(nodes):
+        node = nodes.get(request.timeline_id)
+        return node is None or not node.simulation_running
+    return check
+
+
+MUTATION_CHECKS = {
+    'CreateTimeline': _created_check,
+    'CloneTimeline': _created_check,
+    'CreateTimelineFromSimulation': _created_check,
+    'ModifyTimelineTags': _tags_check,
+    'GetOrStartSimulation': _started_check,
+    'StopSimulation': _stopped_check,
+}
+
+
+class ShardRouter:
+    """
+    Routes the calls of the timeline service to the workers. Must be created on the event loop it serves on.
+    """
+    def __init__(self, worker_addresses, catalog: ShardCatalog):
+        self._catalog = catalog
+        self._worker_count = len(worker_addresses)
+        self._channels = [grpc.aio.insecure_channel(address) for address in worker_addresses]
+        self._callables = {}
+        self._next_root_worker = count()
+
+    async def close(self):
+        for channel in self._channels:
+            await channel.close()
+
+    def make_handler(self):
+        """
+        :return: A generic RPC handler for every method of the timeline service.
+        """
+        handlers = {}
+        for name, method in METHODS.items():
+            behavior = getattr(self, name, None)
+            if behavior is None:
+                field = FORWARDED_METHODS.get(name)
+                if field is None:
+                    raise RuntimeError(f"The router does not know how to serve {name}.")
+                if method.server_streaming:
+                    behavior = self._stream_forwarder(name, field)
+                else:
+                    behavior = self._unary_forwarder(name, field)
+
+            deserializer = method.request_type.FromString
+            serializer = None if name in RAW_RESPONSE_METHODS else method.response_type.SerializeToString
+            if method.client_streaming:
+                handlers[name] = grpc.stream_stream_rpc_method_handler(behavior, deserializer, serializer)
+            elif method.server_streaming:
+                handlers[name] = grpc.unary_stream_rpc_method_handler(behavior, deserializer, serializer)
+            else:
+                handlers[name] = grpc.unary_unary_rpc_method_handler(behavior, deserializer, serializer)
+        return grpc.method_handlers_generic_handler(SERVICE.full_name, handlers)
+
+    def _callable(self, worker, name):
+        """
+        :return: The multi-callable for a method on a worker.
+        """
+        key = (worker, name)
+        multi_callable = self._callables.get(key)
+        if multi_callable is None:
+            method = METHODS[name]
+            serializer = method.request_type.SerializeToString
+            deserializer = None if name in RAW_RESPONSE_METHODS else method.response_type.FromString
+            path = f'/{SERVICE.full_name}/{name}'
+            channel = self._channels[worker]
+            if method.client_streaming:
+                multi_callable = channel.stream_stream(path, serializer, deserializer)
+            elif method.server_streaming:
+                multi_callable = channel.unary_stream(path, serializer, deserializer)
+            else:
+                multi_callable = channel.unary_unary(path, serializer, deserializer)
+            self._callables[key] = multi_callable
+        return multi_callable
+
+    def _route(self, timeline_id):
+        if timeline_id <= 0:
+            # a new timeline at the root can go anywhere, so spread them over the workers
+            return next(self._next_root_worker) % self._worker_count
+        return owner_of(timeline_id, self._worker_count)
+
+    async def _wait_for_catalog(self, check):
+        change_log = self._catalog.change_log
+        waiter = change_log.add_async_waiter()
+
+        async def wait():
+            while not check(self._catalog.get_nodes()):
+                await waiter.wait()
+                waiter.clear()
+
+        try:
+            await asyncio.wait_for(wait(), CATALOG_WAIT)
+        except asyncio.TimeoutError:
+            print("LOG: A change made through the router did not reach its catalog in time.")
+        finally:
+            change_log.remove_async_waiter(waiter)
+
+    def _unary_forwarder(self, name, field):
+        mutation_check = MUTATION_CHECKS.get(name)
+
+        async def forward(request, context):
+            worker = self._route(getattr(request, field))
+            try:
+                response = await self._callable(worker, name)(request, metadata=_forwarded_metadata(context),
+                                                              timeout=context.time_remaining())
+            except grpc.aio.AioRpcError as e:
+                await _abort_forwarded(context, e)
+            if mutation_check is not None:
+                await self._wait_for_catalog(mutation_check(request, response))
+            return response
+
+        return forward
+
+    def _stream_forwarder(self, name, field):
+        async def forward(request, context):
+            if name in RAW_RESPONSE_METHODS:
+                try:
+                    set_response_compression(context)
+                except ValueError as e:
+                    await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+
+            worker = self._route(getattr(request, field))
+            call = self._callable(worker, name)(request, metadata=_forwarded_metadata(context),
+                                                timeout=context.time_remaining())
+            try:
+                async for response in call:
+                    yield response
+            except grpc.aio.AioRpcError as e:
+                await _abort_forwarded(context, e)
+            finally:
+                call.cancel()
+
+        return forward
+
+    async def GetTimelines(self, request, context):
+        parent_id = None if request.parent_id == -1 else request.parent_id
+        head_tick = None if request.head_tick == -1 else request.head_tick
+        tags = set(request.tags)
+        exclude_tags = set(request.exclude_tags)
+
+        nodes = self._catalog.get_nodes()
+        if parent_id is not None and parent_id not in nodes:
+            # nonexistent parent
+            return ts.TimelinesResponse()
+
+        timeline_ids = [node.timeline_id for node in nodes.values()
+                        if (parent_id is None or node.parent_id == parent_id) and
+                        (head_tick is None or node.head_tick == head_tick) and
+                        tags <= set(node.tags) and
+                        not exclude_tags & set(node.tags)]
+        return ts.TimelinesResponse(timeline_ids=timeline_ids)
+
+    async def GetTimelineDetailsBatch(self, request, context):
+        nodes = self._catalog.get_nodes()
+        response = ts.GetTimelineDetailsBatchResponse()
+        for timeline_id in request.timeline_ids:
+            node = nodes.get(timeline_id)
+            if node is None:
+                await context.abort(grpc.StatusCode.INVALID_ARGUMENT, f'Timeline ID {timeline_id} not found.')
+            response.nodes.append(_node_message(node))
+        return response
+
+    async def GetTimelineTree(self, request, context):
+        batch_size = request.batch_size or 1000
+
+        child_ids = {}
+        for timeline_id, node in sorted(self._catalog.get_nodes().items()):
+            child_ids.setdefault(node.parent_id, []).append(node)
+
+        response = ts.GetTimelineTreeResponse()
+        # depth first from the root, so every node is sent after its parent
+        pending_nodes = child_ids.get(0, [])[::-1]
+        while pending_nodes:
+            node = pending_nodes.pop()
+            response.nodes.append(_node_message(node))
+            if len(response.nodes) >= batch_size:
+                yield response
+                response = ts.GetTimelineTreeResponse()
+            pending_nodes.extend(child_ids.get(node.timeline_id, [])[::-1])
+
+        if response.nodes:
+            yield response
+
+    async def WatchProject(self, request, context):
+        async for response in watch_change_log(self._catalog.change_log, request, context):
+            yield response
+
+    async def DeleteTimeline(self, request, context):
+        timeline_id = request.timeline_id
+        nodes = self._catalog.get_nodes()
+        if timeline_id not in nodes:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, 'Timeline ID not found.')
+        if any(node.parent_id == timeline_id for node in nodes.values()):
+            await context.abort(grpc.StatusCode.FAILED_PRECONDITION,
+                                'Unable to delete node with children. Delete children first.')
+
+        metadata = _forwarded_metadata(context)
+        owner = owner_of(timeline_id, self._worker_count)
+        try:
+            response = await self._callable(owner, 'DeleteTimeline')(request, metadata=metadata)
+        except grpc.aio.AioRpcError as e:
+            await _abort_forwarded(context, e)
+
+        # the other workers may have loaded the timeline as an ancestor of their own, and only drop it since its
+        # data is gone already; most never loaded it
+        others = [worker for worker in range(self._worker_count) if worker != owner]
+        results = await asyncio.gather(*(self._callable(worker, 'DeleteTimeline')(request, metadata=metadata)
+                                         for worker in others), return_exceptions=True)
+        for worker, result in zip(others, results):
+            if (isinstance(result, grpc.aio.AioRpcError) and
+                    result.code() == grpc.StatusCode.INVALID_ARGUMENT):
+                # the worker does not have the timeline
+                continue
+            if isinstance(result, Exception):
+                print(f"LOG: Worker {worker} could not drop deleted timeline {timeline_id}, "
+                      f"its copy may be stale: {result!r}")
+
+        await self._wait_for_catalog(lambda nodes: timeline_id not in nodes)
+        return response
+
+    async def GetOrStartSimulations(self, request, context):
+        timeline_ids_by_worker = {}
+        for timeline_id in request.timeline_ids:
+            timeline_ids_by_worker.setdefault(owner_of(timeline_id, self._worker_count), []).append(timeline_id)
+
+        metadata = _forwarded_metadata(context)
+        results = asyncio.Queue()
+
+        async def start_on(worker, timeline_ids):
+            worker_request = ts.GetOrStartSimulationsRequest(timeline_ids=timeline_ids,
+                                                             max_concurrent=request.max_concurrent)
+            try:
+                async for response in self._callable(worker, 'GetOrStartSimulations')(worker_request,
+                                                                                      metadata=metadata):
+                    await results.put(response)
+            except grpc.aio.AioRpcError as e:
+                error = f'Worker {worker} failed: {e.details()}'
+                for timeline_id in timeline_ids:
+                    await results.put(ts.GetOrStartSimulationsResponse(timeline_id=timeline_id, error=error))
+
+        tasks = [asyncio.create_task(start_on(worker, timeline_ids))
+                 for worker, timeline_ids in timeline_ids_by_worker.items()]
+        try:
+            started_ids = set()
+            for _ in range(len(request.timeline_ids)):
+                response = await results.get()
+                if not response.error:
+                    started_ids.add(response.timeline_id)
+                yield response
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        await self._wait_for_catalog(
+            lambda nodes: all(timeline_id not in nodes or nodes[timeline_id].simulation_running
+                              for timeline_id in started_ids))
+
+    async def EditSimulation(self, request_iterator, context):
+        first_request = await request_iterator.__anext__()
+
+        async def requests():
+            yield first_request
+            async for edit_request in request_iterator:
+                yield edit_request
+
+        worker = owner_of(first_request.timeline_id, self._worker_count)
+        call = self._callable(worker, 'EditSimulation')(requests(), metadata=_forwarded_metadata(context))
+        try:
+            async for response in call:
+                yield response
+        except grpc.aio.AioRpcError as e:
+            await _abort_forwarded(context, e)
+        finally:
+            call.cancel()
+
+    async def GetCacheStats(self, request, context):
+        responses = await asyncio.gather(*(self._callable(worker, 'GetCacheStats')(request)
+                                           for worker in range(self._worker_count)))
+        total = ts.GetCacheStatsResponse()
+        for response in responses:
+            for field in ts.GetCacheStatsResponse.DESCRIPTOR.fields:
+                setattr(total, field.name, getattr(total, field.name) + getattr(response, field.name))
+        return total
+
+    async def GetMetrics(self, request, context):
+        worker_responses = await asyncio.gather(*(self._callable(worker, 'GetMetrics')(ts.GetMetricsRequest())
+                                                  for worker in range(self._worker_count)))
+
+        samples = [metrics.Sample(sample.name, {**sample.labels, 'shard': 'router'}, sample.value)
+                   for sample in metrics.REGISTRY.samples()]
+        for worker, worker_response in enumerate(worker_responses):
+            samples.extend(metrics.Sample(sample.name, {**sample.labels, 'shard': str(worker)}, sample.value)
+                           for sample in worker_response.samples)
+
+        response = ts.GetMetricsResponse()
+        for sample in samples:
+            response.samples.add(name=sample.name, labels=sample.labels, value=sample.value)
+        if request.prometheus_text:
+            response.prometheus_text = metrics.render_samples(samples)
+        return response
+
+
+class ShardedServer:
+    """
+    Serves a project from worker processes behind a router. The router runs on an event loop in its own thread,
+    so the server is started and stopped the same way as Server.
+    """
+    def __init__(self, project_dir, address='[::]:4969', worker_count=2, simulation_server_command=None,
+                 metrics_port=None, startup_timeout=60.0):
+        """
+        :param simulation_server_command: Passed to SimulationProcess.set_simulation_server_command in the workers.
+        :param metrics_port: If given, the router's metrics are also served in the Prometheus text format on this
+        local port. GetMetrics returns the metrics of the workers too.
+        """
+        self.project_dir = Path(project_dir)
+        self.worker_count = worker_count
+        self._address = address
+        self._simulation_server_command = simulation_server_command
+        self._startup_timeout = startup_timeout
+        self.metrics_endpoint = None if metrics_port is None else metrics.MetricsEndpoint(
+            metrics.REGISTRY, ('127.0.0.1', metrics_port))
+
+        self._workers = []
+        self._worker_channels = []
+        self._catalog = None
+        self._router = None
+        self._loop = None
+        self._thread = None
+        self.server = None
+        self.port = None
+
+        if worker_count < 1:
+            raise ValueError("A sharded server needs at least one worker.")
+
+    def start(self):
+        if self._thread is not None:
+            raise RuntimeError("Server already started.")
+
+        try:
+            worker_addresses = [f'localhost:{port}' for port in self._start_workers()]
+            self._worker_channels = [grpc.insecure_channel(address) for address in worker_addresses]
+            self._catalog = ShardCatalog(self._worker_channels)
+            if not self._catalog.wait_synced(self._startup_timeout):
+                raise RuntimeError("Timed out loading the timelines of the workers.")
+
+            loop = asyncio.new_event_loop()
+            thread = Thread(target=loop.run_forever, name='ts-shard-router', daemon=True)
+            thread.start()
+            self._loop = loop
+            self._thread = thread
+
+            async def serve():
+                self._router = ShardRouter(worker_addresses, self._catalog)
+                server = grpc.aio.server(interceptors=[metrics.AsyncServerMetricsInterceptor(RPC_METRICS)])
+                server.add_generic_rpc_handlers((self._router.make_handler(),))
+                port = server.add_insecure_port(self._address)
+                await server.start()
+                return server, port
+
+            self.server, self.port = asyncio.run_coroutine_threadsafe(serve(), loop).result()
+        except BaseException:
+            self.stop()
+            raise
+
+        if self.metrics_endpoint is not None:
+            self.metrics_endpoint.start()
+
+    def _start_workers(self):
+        """
+        :return: The port of each worker.
+        """
+        script = Path(__file__).resolve()
+        for index in range(self.worker_count):
+            command = [sys.executable, str(script), str(self.project_dir),
+                       '--worker', str(index), '--workers', str(self.worker_count)]
+            if self._simulation_server_command is not None:
+                command += ['--simulation-server-command', json.dumps(list(self._simulation_server_command))]
+            # unbuffered, so the worker's log lines are forwarded as they are written
+            env = {**os.environ, 'PYTHONUNBUFFERED': '1'}
+            self._workers.append(subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+                                                  env=env))
+
+        ports = []
+        for index, worker in enumerate(self._workers):
+            line = worker.stdout.readline()
+            # anything the worker logged before it started serving
+            while line and not line.strip().isdigit():
+                print(f"[worker {index}] {line}", end='')
+                line = worker.stdout.readline()
+            if not line:
+                raise RuntimeError(f"Worker {index} exited before it started serving.")
+            ports.append(int(line))
+            Thread(target=self._forward_output, args=(index, worker), daemon=True).start()
+        return ports
+
+    @staticmethod
+    def _forward_output(index, worker):
+        for line in worker.stdout:
+            print(f"[worker {index}] {line}", end='')
+
+    def stop(self, grace=0):
+        if self.metrics_endpoint is not None:
+            self.metrics_endpoint.stop()
+            self.metrics_endpoint = None
+
+        if self._thread is not None:
+            loop = self._loop
+
+            async def shutdown():
+                if self.server is not None:
+                    await self.server.stop(grace)
+                if self._router is not None:
+                    await self._router.close()
+                # let the cancelled calls finish closing their streams before the loop stops
+                calls = asyncio.all_tasks() - {asyncio.current_task()}
+                if calls:
+                    await asyncio.wait(calls, timeout=5)
+                await loop.shutdown_asyncgens()
+
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            self._thread.join()
+            loop.close()
+            self._loop = None
+            self._thread = None
+            self._router = None
+            self.server = None
+
+        if self._catalog is not None:
+            self._catalog.close()
+            self._catalog = None
+        for channel in self._worker_channels:
+            channel.close()
+        self._worker_channels = []
+
+        # closing stdin tells a worker to stop its simulations and exit
+        for worker in self._workers:
+            worker.stdin.close()
+        for worker in self._workers:
+            try:
+                worker.wait(30)
+            except subprocess.TimeoutExpired:
+                print(f"LOG: Killing timeline worker {worker.pid}, it did not stop in time.")
+                worker.kill()
+                worker.wait()
+        self._workers = []
+
+    def __del__(self):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('project', type=Path, help='The project directory.')
+    parser.add_argument('--workers', type=int, default=2, help='The number of worker processes.')
+    parser.add_argument('--address', default='[::]:4969', help='The address the router listens on.')
+    parser.add_argument('--metrics-port', type=int, help='A local port to serve the router metrics on.')
+    parser.add_argument('--simulation-server-command', type=json.loads,
+                        help='The simulation server command, as a JSON list.')
+    parser.add_argument('--worker', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        serve_worker(args.project, args.worker, args.workers, args.simulation_server_command)
+        return
+
+    server = ShardedServer(args.project, args.address, args.workers, args.simulation_server_command,
+                           args.metrics_port)
+    server.start()
+    print(f"LOG: Serving {args.project} from {args.workers} workers on port {server.port}.")
+    try:
+        while True:
+            input()
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()